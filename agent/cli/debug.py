@@ -357,23 +357,14 @@ def _manifest_display_name(key: str) -> str:
 
 def _file_infos_to_hash_input_lines(file_infos: List) -> List[str]:
     """
-    Convert FileInfo objects to the exact canonical lines used by _compute_file_list_hash.
+    Convert FileInfo objects to the (path, size, mtime) entries hashed by _compute_file_list_hash.
 
     Each line is "path|size|mtime" where mtime is the integer timestamp.
-    Lines are sorted by path (same ordering as the hash function).
+    Lines are sorted by path; the hash itself digests them per directory.
     """
-    from datetime import datetime as _dt
-
-    tuples = []
-    for info in file_infos:
-        mtime = 0
-        if info.last_modified:
-            try:
-                dt = _dt.fromisoformat(info.last_modified.replace("Z", "+00:00"))
-                mtime = int(dt.timestamp())
-            except (ValueError, AttributeError):
-                pass
-        tuples.append((info.path, info.size, mtime))
+    from src.input_state import parse_last_modified
+
+    tuples = [(info.path, info.size, parse_last_modified(info.last_modified)) for info in file_infos]
 
     tuples.sort(key=lambda f: f[0])
     return [f"{path}|{size}|{mtime}" for path, size, mtime in tuples]
@@ -488,7 +479,7 @@ def _write_dump_file(
     w()
     w(f"**Hash:** `{file_hash_a}`")
     w()
-    w("Each line is `path|size|mtime_timestamp` (sorted by path).")
+    w("Each line is `path|size|mtime_timestamp` (sorted by path, hashed per directory).")
     w()
     w("```")
     for line in hash_input_a:
@@ -7,6 +7,8 @@ Issue #90 - Distributed Agent Architecture (Phase 3)
 Task: T041
 """
 
+import multiprocessing
+
 import click
 
 from src import __version__
@@ -96,4 +98,6 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # Worker processes of a frozen binary re-run this entry point
+    multiprocessing.freeze_support()
     main()
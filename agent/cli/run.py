@@ -616,17 +616,13 @@ def _run_photostats(
         pairing.get("orphaned_xmp", [])
     )
 
-    # Compute storage_by_type from file_sizes (sum of per-file sizes per extension)
-    storage_by_type = {
-        ext: sum(sizes)
-        for ext, sizes in stats.get("file_sizes", {}).items()
-    }
-
     results = {
         "total_files": stats.get("total_files", 0),
         "total_size": stats.get("total_size", 0),
         "file_counts": stats.get("file_counts", {}),
-        "storage_by_type": storage_by_type,
+        "storage_by_type": stats.get("storage_by_type", {}),
+        "size_stats": stats.get("size_stats", {}),
+        "image_size_stats": stats.get("image_size_stats", {}),
         "orphaned_images": pairing.get("orphaned_images", []),
         "orphaned_xmp": pairing.get("orphaned_xmp", []),
         "files_scanned": stats.get("total_files", 0),
@@ -11,21 +11,34 @@ Architecture:
     Remote: S3/GCS/SMB → FileInfo → Shared Analyzer → Results
 
 Modules:
-    - photo_pairing_analyzer: build_imagegroups(), calculate_analytics()
+    - photo_pairing_analyzer: build_imagegroups(), calculate_analytics(),
+      ExternalImageGroups (out-of-core ImageGroups)
     - photostats_analyzer: analyze_pairing(), calculate_stats()
-    - pipeline_analyzer: run_pipeline_validation(), flatten_imagegroups_to_specific_images()
-    - inventory_parser: parse_s3_manifest(), parse_gcs_manifest(), extract_folders()
+    - pipeline_analyzer: run_pipeline_validation(), iter_validation_results(),
+      get_pipeline_plan(), flatten_imagegroups_to_specific_images()
+    - fused_analyzer: ListingIndex (one listing pass shared by the PhotoStats analyses)
+    - inventory_parser: parse_s3_manifest(), parse_gcs_manifest(), extract_folders(),
+      InventoryTable (columnar entries from read_*_table(), summarize_folders())
 """
 
-from src.analysis.photo_pairing_analyzer import build_imagegroups, calculate_analytics
+from src.analysis.photo_pairing_analyzer import (
+    build_imagegroups,
+    calculate_analytics,
+    ExternalImageGroups,
+    EXTERNAL_SORT_MIN_FILES,
+)
 from src.analysis.photostats_analyzer import analyze_pairing, calculate_stats
 from src.analysis.pipeline_analyzer import (
     run_pipeline_validation,
+    iter_validation_results,
+    get_pipeline_plan,
     flatten_imagegroups_to_specific_images,
     add_metadata_files,
 )
+from src.analysis.fused_analyzer import ListingIndex
 from src.analysis.inventory_parser import (
     InventoryEntry,
+    InventoryTable,
     S3Manifest,
     S3ManifestFile,
     GCSManifest,
@@ -34,24 +47,35 @@ from src.analysis.inventory_parser import (
     parse_s3_csv_stream,
     parse_gcs_csv_stream,
     parse_parquet_stream,
+    read_s3_csv_table,
+    read_gcs_csv_table,
+    read_parquet_table,
     extract_folders,
     extract_folders_from_entries,
     count_files_by_folder,
+    summarize_folders,
 )
 
 __all__ = [
     # Photo Pairing
     "build_imagegroups",
     "calculate_analytics",
+    "ExternalImageGroups",
+    "EXTERNAL_SORT_MIN_FILES",
     # PhotoStats
     "analyze_pairing",
     "calculate_stats",
     # Pipeline Validation
     "run_pipeline_validation",
+    "iter_validation_results",
+    "get_pipeline_plan",
     "flatten_imagegroups_to_specific_images",
     "add_metadata_files",
+    # Fused analysis
+    "ListingIndex",
     # Inventory Parser
     "InventoryEntry",
+    "InventoryTable",
     "S3Manifest",
     "S3ManifestFile",
     "GCSManifest",
@@ -60,7 +84,11 @@ __all__ = [
     "parse_s3_csv_stream",
     "parse_gcs_csv_stream",
     "parse_parquet_stream",
+    "read_s3_csv_table",
+    "read_gcs_csv_table",
+    "read_parquet_table",
     "extract_folders",
     "extract_folders_from_entries",
     "count_files_by_folder",
+    "summarize_folders",
 ]
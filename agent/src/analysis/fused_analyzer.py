@@ -0,0 +1,176 @@
+"""
+Fused single-pass analysis over one file listing.
+
+PhotoStats needs the same per-file facts (name, stem, lowercase
+extension, size) for its counts and its pairing check. Run separately,
+each walks the full listing and re-derives them from the path on every
+FileInfo property access. ListingIndex keeps the listing once, as a
+compact FileTable, and serves both from it.
+
+Key Concepts:
+    - Listing: the FileTable (a streamed listing is collected into one)
+    - Size histograms: one SizeHistogram per extension (counts/storage)
+    - Stem groups: (path, extension) by stem (pairing)
+
+Each of these is built on first use, so a caller only pays for what it
+reads.
+
+Results are identical to calling the per-tool analyzers on the same list.
+
+Example:
+    >>> index = ListingIndex(adapter.list_files_with_metadata(location))
+    >>> stats = index.calculate_stats({'.dng'}, {'.xmp'})
+    >>> pairing = index.analyze_pairing({'.dng'}, {'.xmp'}, {'.dng'})
+"""
+
+from array import array
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from src.analysis.photostats_analyzer import (
+    SizeHistogram,
+    pairing_from_stem_groups,
+    stats_from_size_histograms,
+)
+from src.remote.base import FileInfo, FileTable, iter_file_rows
+
+
+class StemGroups(Mapping):
+    """
+    Read-only mapping of stem -> (path, extension) pairs, in listing order.
+
+    Stores the last row of each stem and, per file, a link to the previous
+    row with the same stem (8 bytes per file), instead of a (path,
+    extension) tuple per file; a group's pairs are built when it is read.
+    Stems iterate in order of first appearance, like a dict filled in
+    listing order.
+    """
+
+    def __init__(self, files: Sequence[FileInfo]):
+        """
+        Group a listing by stem.
+
+        Args:
+            files: FileTable or list of FileInfo (indexed to build groups)
+        """
+        self._files = files
+        last_rows: Dict[str, int] = {}
+        previous_rows = array("q")
+        for row, (_path, _name, stem, _ext, _size) in enumerate(iter_file_rows(files)):
+            previous_rows.append(last_rows.get(stem, -1))
+            last_rows[stem] = row
+        self._last_rows = last_rows
+        self._previous_rows = previous_rows
+
+    def __getitem__(self, stem: str) -> List[Tuple[str, str]]:
+        row = self._last_rows[stem]
+        rows = []
+        while row >= 0:
+            rows.append(row)
+            row = self._previous_rows[row]
+        group = []
+        for row in reversed(rows):
+            file_info = self._files[row]
+            group.append((file_info.path, file_info.extension))
+        return group
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._last_rows)
+
+    def __len__(self) -> int:
+        return len(self._last_rows)
+
+
+class ListingIndex:
+    """
+    One pass over a file listing, shared by the PhotoStats analyses.
+
+    Attributes:
+        file_count: Number of files in the listing
+        size_histograms: Extension -> SizeHistogram, in listing order
+            (built on first access)
+        stem_groups: StemGroups (stem -> (path, extension) pairs, in
+            listing order; built on first access)
+    """
+
+    def __init__(self, files: Iterable[FileInfo]):
+        """
+        Index a file listing.
+
+        Args:
+            files: FileInfo objects (local or remote listing, or cached
+                inventory FileInfo). A FileTable or list is kept as is;
+                any other iterable (e.g. a streamed listing) is collected
+                into a FileTable (without modification times). Tables are
+                read column-wise.
+        """
+        if not isinstance(files, (FileTable, list, tuple)):
+            # Modification times are not needed by any tool
+            table = FileTable()
+            table.append_rows((f.path, f.size, None) for f in files)
+            files = table
+        self._files = files
+        self.file_count = len(files)
+        self._size_histograms: Optional[Dict[str, SizeHistogram]] = None
+        self._stem_groups: Optional[StemGroups] = None
+
+    @property
+    def size_histograms(self) -> Dict[str, SizeHistogram]:
+        """Extension -> SizeHistogram, in listing order."""
+        if self._size_histograms is None:
+            size_histograms: Dict[str, SizeHistogram] = {}
+            for _path, _name, _stem, ext, size in iter_file_rows(self._files):
+                histogram = size_histograms.get(ext)
+                if histogram is None:
+                    histogram = size_histograms[ext] = SizeHistogram()
+                histogram.add(size)
+            self._size_histograms = size_histograms
+        return self._size_histograms
+
+    @property
+    def stem_groups(self) -> StemGroups:
+        """Stem -> (path, extension) pairs, in listing order."""
+        if self._stem_groups is None:
+            self._stem_groups = StemGroups(self._files)
+        return self._stem_groups
+
+    def iter_entries(self) -> Iterator[Tuple[str, str, str, str]]:
+        """Iterate (path, name, stem, extension) per file, in listing order."""
+        for path, name, stem, ext, _size in iter_file_rows(self._files):
+            yield path, name, stem, ext
+
+    def count_files(self, extensions: Set[str]) -> int:
+        """
+        Count the files with one of the given extensions.
+
+        Args:
+            extensions: Set of extensions (any case)
+
+        Returns:
+            Number of matching files
+        """
+        exts = {ext.lower() for ext in extensions}
+        return sum(
+            histogram.count for ext, histogram in self.size_histograms.items() if ext in exts
+        )
+
+    def calculate_stats(
+        self,
+        photo_extensions: Set[str],
+        metadata_extensions: Set[str]
+    ) -> Dict[str, Any]:
+        """Same as photostats_analyzer.calculate_stats() on the listing."""
+        return stats_from_size_histograms(
+            self.size_histograms, photo_extensions, metadata_extensions
+        )
+
+    def analyze_pairing(
+        self,
+        photo_extensions: Set[str],
+        metadata_extensions: Set[str],
+        require_sidecar: Set[str]
+    ) -> Dict[str, Any]:
+        """Same as photostats_analyzer.analyze_pairing() on the listing."""
+        return pairing_from_stem_groups(
+            self.stem_groups, photo_extensions, metadata_extensions, require_sidecar
+        )
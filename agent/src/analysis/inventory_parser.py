@@ -11,23 +11,29 @@ Key Concepts:
     - Manifest: JSON file describing inventory report structure
     - Data Files: CSV or Parquet files containing file metadata
     - InventoryEntry: Unified format for file metadata across providers
+    - InventoryTable: InventoryEntry columns in a pyarrow Table; data files
+      are parsed into it with the pyarrow CSV and Parquet readers
     - Folder Extraction: Single-pass algorithm with set deduplication
 """
 
-import csv
+import bisect
 import gzip
 import io
 import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, BinaryIO, Dict, Generator, Iterable, List, Optional, Set, Union
+from typing import Any, BinaryIO, Dict, Generator, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 logger = logging.getLogger("shuttersense.agent.analysis.inventory_parser")
 
 
 # Constants for streaming processing
 CHUNK_SIZE = 100_000  # Process 100k rows at a time for memory efficiency
+CSV_BLOCK_SIZE = 16 * 1024 * 1024  # Bytes per pyarrow CSV record batch
+
+# GCS Storage Insights CSV columns (header row)
+GCS_CSV_COLUMNS = ["name", "size", "updated", "etag", "storageClass"]
 
 
 class PrependStream:
@@ -138,6 +144,190 @@ class InventoryEntry:
     storage_class: Optional[str] = None
 
 
+def _import_pyarrow() -> Tuple[Any, Any]:
+    """Import pyarrow and pyarrow.compute for columnar inventory parsing."""
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for inventory parsing. "
+            "Install with: pip install pyarrow"
+        ) from e
+    return pa, pc
+
+
+def _inventory_schema(pa: Any) -> Any:
+    """Arrow schema of InventoryTable (the InventoryEntry fields)."""
+    return pa.schema([
+        ("key", pa.string()),
+        ("size", pa.int64()),
+        ("last_modified", pa.string()),
+        ("etag", pa.string()),
+        ("storage_class", pa.string()),
+    ])
+
+
+class InventoryTable:
+    """
+    Inventory entries stored column-wise in a pyarrow Table.
+
+    Holds the InventoryEntry fields as Arrow columns, so multi-million row
+    inventories are parsed, filtered and summarized with Arrow kernels.
+    Python objects are only created when entries are iterated or indexed.
+
+    A table sorted by key (sort_by_key()) finds key prefixes by binary
+    search, so matching many collection folders does not rescan the table.
+
+    Usage:
+        >>> entries = read_s3_csv_table(data, manifest.schema_fields)
+        >>> folders, folder_stats = summarize_folders(entries)
+        >>> for entry in entries.filter_prefix("2020/vacation/"):
+        ...     print(entry.key, entry.size)
+    """
+
+    def __init__(self, table: Any = None, sorted_by_key: bool = False):
+        """
+        Wrap a pyarrow Table with the InventoryTable schema.
+
+        Args:
+            table: pyarrow Table (None for an empty inventory)
+            sorted_by_key: Whether the rows are already sorted by key
+        """
+        pa, _ = _import_pyarrow()
+        self.table = table if table is not None else _inventory_schema(pa).empty_table()
+        self.sorted_by_key = sorted_by_key
+        self._keys: Any = None  # Contiguous key array for binary search
+
+    @classmethod
+    def from_batches(cls, batches: List[Any]) -> "InventoryTable":
+        """Build a table from record batches with the InventoryTable schema."""
+        pa, _ = _import_pyarrow()
+        return cls(pa.Table.from_batches(batches, schema=_inventory_schema(pa)))
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[InventoryEntry]) -> "InventoryTable":
+        """Build a table from InventoryEntry objects."""
+        pa, _ = _import_pyarrow()
+        columns: Dict[str, List[Any]] = {name: [] for name in _inventory_schema(pa).names}
+        for entry in entries:
+            columns["key"].append(entry.key)
+            columns["size"].append(entry.size)
+            columns["last_modified"].append(entry.last_modified)
+            columns["etag"].append(entry.etag)
+            columns["storage_class"].append(entry.storage_class)
+        return cls(pa.Table.from_pydict(columns, schema=_inventory_schema(pa)))
+
+    @classmethod
+    def concat(cls, tables: Iterable["InventoryTable"]) -> "InventoryTable":
+        """Concatenate tables (without copying their columns)."""
+        pa, _ = _import_pyarrow()
+        arrow_tables = [t.table for t in tables]
+        if not arrow_tables:
+            return cls()
+        return cls(pa.concat_tables(arrow_tables))
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    def __iter__(self) -> Iterator[InventoryEntry]:
+        for row in self.iter_rows():
+            yield InventoryEntry(*row)
+
+    def __getitem__(self, index: int) -> InventoryEntry:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("inventory entry index out of range")
+        return next(iter(InventoryTable(self.table.slice(index, 1))))
+
+    def iter_rows(self) -> Iterator[Tuple[str, int, Optional[str], Optional[str], Optional[str]]]:
+        """Yield (key, size, last_modified, etag, storage_class) tuples, a batch at a time."""
+        for batch in self.table.to_batches(max_chunksize=CHUNK_SIZE):
+            yield from zip(*(column.to_pylist() for column in batch.columns), strict=True)
+
+    def total_size(self) -> int:
+        """Total size of all entries in bytes."""
+        _, pc = _import_pyarrow()
+        return pc.sum(self.table["size"]).as_py() or 0
+
+    def filter_prefix(self, prefix: str) -> "InventoryTable":
+        """Entries whose key starts with prefix, in table order."""
+        if self.sorted_by_key:
+            return self.slice(*self.prefix_range(prefix))
+        _, pc = _import_pyarrow()
+        return InventoryTable(self.table.filter(pc.starts_with(self.table["key"], pattern=prefix)))
+
+    def sort_by_key(self) -> "InventoryTable":
+        """Entries sorted by key (self if already sorted)."""
+        if self.sorted_by_key:
+            return self
+        return InventoryTable(self.table.sort_by("key"), sorted_by_key=True)
+
+    def slice(self, start: int, stop: int) -> "InventoryTable":
+        """Rows [start, stop) without copying."""
+        return InventoryTable(self.table.slice(start, stop - start), sorted_by_key=self.sorted_by_key)
+
+    def prefix_range(self, prefix: str, lo: int = 0) -> Tuple[int, int]:
+        """
+        Find the rows whose key starts with prefix by binary search.
+
+        Keys truncated to the prefix length keep the sort order, so the
+        matching rows are the contiguous run equal to the prefix.
+
+        Args:
+            prefix: Key prefix (e.g., "2020/vacation/")
+            lo: First row to search from
+
+        Returns:
+            Row range (start, stop); start == stop if nothing matches
+
+        Raises:
+            ValueError: If the table is not sorted by key
+        """
+        if not self.sorted_by_key:
+            raise ValueError("prefix_range() requires a table sorted by key")
+        if self._keys is None:
+            self._keys = self.table["key"].combine_chunks()
+        keys = self._keys
+        length = len(prefix)
+
+        def key_prefix(row: int) -> str:
+            return keys[row].as_py()[:length]
+
+        rows = range(len(self))
+        start = bisect.bisect_left(rows, prefix, lo=lo, key=key_prefix)
+        stop = bisect.bisect_right(rows, prefix, lo=start, key=key_prefix)
+        return start, stop
+
+    def prefix_ranges(self, prefixes: Iterable[str]) -> Dict[str, Tuple[int, int]]:
+        """
+        Find the row ranges of several key prefixes on a table sorted by key.
+
+        When no prefix starts with another, the ranges are disjoint and in
+        prefix order, so each search resumes where the previous range
+        ended and the table is swept once. Nested prefixes (e.g., "2020/"
+        and "2020/vacation/") are each searched over the whole table.
+
+        Args:
+            prefixes: Key prefixes (duplicates allowed)
+
+        Returns:
+            Dict of prefix to row range (start, stop)
+        """
+        ordered = sorted(set(prefixes))
+        # In sorted order, a prefix of any later entry is a prefix of the next one
+        nested = any(b.startswith(a) for a, b in zip(ordered, ordered[1:], strict=False))
+
+        ranges: Dict[str, Tuple[int, int]] = {}
+        lo = 0
+        for prefix in ordered:
+            ranges[prefix] = self.prefix_range(prefix, lo=lo)
+            if not nested:
+                lo = ranges[prefix][1]
+        return ranges
+
+
 @dataclass
 class S3ManifestFile:
     """
@@ -325,52 +515,69 @@ def parse_gcs_manifest(manifest_content: str) -> GCSManifest:
     return manifest
 
 
-def parse_s3_csv_stream(
-    csv_data: Union[bytes, BinaryIO],
-    schema_fields: List[str],
-    is_gzipped: bool = True
-) -> Generator[InventoryEntry, None, None]:
+def _inventory_batch(
+    key: Any,
+    size: Any,
+    last_modified: Any = None,
+    etag: Any = None,
+    storage_class: Any = None
+) -> Any:
     """
-    Parse S3 Inventory CSV data as a stream.
+    Build an InventoryTable record batch from parsed columns.
 
-    Uses streaming/chunked processing to handle large files without
-    loading entire content into memory.
+    Missing optional columns become nulls; folder markers (keys ending
+    with /) and null or empty keys are dropped.
+    """
+    pa, pc = _import_pyarrow()
+    nulls = pa.nulls(len(key), pa.string())
+    batch = pa.RecordBatch.from_arrays(
+        [
+            key,
+            size,
+            last_modified if last_modified is not None else nulls,
+            etag if etag is not None else nulls,
+            storage_class if storage_class is not None else nulls,
+        ],
+        schema=_inventory_schema(pa),
+    )
+    keep = pc.and_(pc.invert(pc.ends_with(key, "/")), pc.greater(pc.utf8_length(key), 0))
+    return batch.filter(keep)
 
-    Args:
-        csv_data: Raw bytes or file-like stream of CSV file (may be gzipped).
-                  If a stream is provided, parsing is fully streaming.
-                  If bytes are provided, they are wrapped in BytesIO.
-        schema_fields: List of field names from manifest fileSchema
-        is_gzipped: Whether data is gzip compressed (default True for S3)
 
-    Yields:
-        InventoryEntry objects for each row
+def _batch_column(batch: Any, name: Optional[str]) -> Any:
+    """Column of a record batch by name, or None for a missing column."""
+    return batch.column(name) if name is not None else None
 
-    Example:
-        >>> for entry in parse_s3_csv_stream(data, ["Bucket", "Key", "Size"]):
-        ...     print(entry.key)
+
+def _parse_sizes(sizes: Any) -> Any:
+    """Cast a string size column to int64, using 0 for missing or invalid values."""
+    pa, pc = _import_pyarrow()
+    sizes = pc.utf8_trim_whitespace(sizes)
+    valid = pc.fill_null(pc.match_substring_regex(sizes, pattern=r"^[0-9]+$"), False)
+    return pc.cast(pc.if_else(valid, sizes, "0"), pa.int64())
+
+
+def _open_s3_csv_stream(
+    csv_data: Union[bytes, BinaryIO],
+    is_gzipped: bool
+) -> Tuple[BinaryIO, List[Any]]:
     """
-    # Build field index map (case-insensitive)
-    field_map = {f.lower(): i for i, f in enumerate(schema_fields)}
+    Open S3 CSV data as a (decompressed) binary stream.
 
-    # Get indices for required and optional fields
-    key_idx = field_map.get("key")
-    size_idx = field_map.get("size")
-    modified_idx = field_map.get("lastmodifieddate")
-    etag_idx = field_map.get("etag")
-    storage_class_idx = field_map.get("storageclass")
+    Gzip is detected from the magic bytes without consuming them, so
+    non-seekable streams (e.g., S3 StreamingBody) are read exactly once.
 
-    if key_idx is None:
-        raise ValueError("CSV schema missing required field: Key")
+    Returns:
+        Tuple of (stream, streams to close once parsing is done)
+    """
+    closers: List[Any] = []
 
-    # Create a streaming reader - accept either bytes or file-like object
     # If bytes are provided, wrap them in BytesIO for consistent streaming interface
     if isinstance(csv_data, bytes):
         byte_stream: BinaryIO = io.BytesIO(csv_data)
-        owns_stream = True  # We created it, we close it
+        closers.append(byte_stream)
     else:
         byte_stream = csv_data
-        owns_stream = False  # Caller owns it
 
     # Wrap in BufferedReader for peek() support on non-seekable streams (e.g., S3 StreamingBody)
     # BufferedReader provides peek() which reads without consuming the stream
@@ -380,133 +587,196 @@ def parse_s3_csv_stream(
     elif hasattr(byte_stream, 'read'):
         # Wrap in BufferedReader for peek support
         # Note: BufferedReader requires a raw stream with readinto(); for streams
-        # without it (like S3 StreamingBody), use PrependStream wrapper
+        # without it, use PrependStream wrapper
         try:
             buffered_stream = io.BufferedReader(byte_stream)  # type: ignore
         except (TypeError, AttributeError):
             # Stream doesn't support BufferedReader (no readinto)
             # Read magic bytes and wrap with PrependStream to avoid loading entire stream
             magic_bytes = byte_stream.read(2)
-            # Create a PrependStream wrapper that serves magic_bytes first, then delegates
             prepend_wrapper = PrependStream(byte_stream, prepend_bytes=magic_bytes)
             buffered_stream = io.BufferedReader(prepend_wrapper)  # type: ignore
-            owns_stream = True  # We own the wrapper
     else:
         buffered_stream = byte_stream
 
-    if is_gzipped:
-        # Check magic bytes to confirm it's actually gzipped using peek (non-consuming)
-        try:
-            if hasattr(buffered_stream, 'peek'):
-                magic = buffered_stream.peek(2)[:2]
-            else:
-                # Fallback: read and check (stream should be BytesIO at this point)
-                magic = buffered_stream.read(2)
-                buffered_stream.seek(0)
-        except Exception as e:
-            logger.warning(f"Could not peek magic bytes: {e}, assuming gzipped")
-            magic = b'\x1f\x8b'  # Assume gzipped if we can't check
-
-        if magic == b'\x1f\x8b':
-            # Use streaming GzipFile instead of gzip.decompress()
-            try:
-                gz_stream = gzip.GzipFile(fileobj=buffered_stream, mode='rb')
-                text_stream = io.TextIOWrapper(gz_stream, encoding='utf-8')
-            except Exception as e:
-                logger.warning(f"Failed to open gzip stream: {e}, trying raw")
-                # Don't seek - stream may not be seekable. Create text wrapper on what we have
-                text_stream = io.TextIOWrapper(buffered_stream, encoding='utf-8')
+    if not is_gzipped:
+        return buffered_stream, closers
+
+    # Check magic bytes to confirm it's actually gzipped using peek (non-consuming)
+    try:
+        if hasattr(buffered_stream, 'peek'):
+            magic = buffered_stream.peek(2)[:2]
         else:
-            logger.warning("Data not gzipped despite is_gzipped=True (no gzip magic), trying raw")
-            text_stream = io.TextIOWrapper(buffered_stream, encoding='utf-8')
-    else:
-        text_stream = io.TextIOWrapper(buffered_stream, encoding='utf-8')
+            # Fallback: read and check (stream should be BytesIO at this point)
+            magic = buffered_stream.read(2)
+            buffered_stream.seek(0)
+    except Exception as e:
+        logger.warning(f"Could not peek magic bytes: {e}, assuming gzipped")
+        magic = b'\x1f\x8b'  # Assume gzipped if we can't check
 
-    # Parse CSV rows (S3 Inventory has no header row)
-    # Wrap the entire iteration in try/except to catch gzip errors during streaming
-    row_count = 0
-    error_count = 0
+    if magic != b'\x1f\x8b':
+        logger.warning("Data not gzipped despite is_gzipped=True (no gzip magic), trying raw")
+        return buffered_stream, closers
+
+    # Decompress while reading instead of gzip.decompress()
+    gz_stream = gzip.GzipFile(fileobj=buffered_stream, mode='rb')
+    closers.append(gz_stream)
+    return gz_stream, closers
+
+
+def _open_csv_reader(source: Any, **options: Any) -> Any:
+    """Open a pyarrow streaming CSV reader, or return None for an empty file."""
+    pa, _ = _import_pyarrow()
+    import pyarrow.csv as pa_csv
 
     try:
-        reader = csv.reader(text_stream)
+        return pa_csv.open_csv(source, **options)
+    except pa.ArrowInvalid as e:
+        if "Empty CSV file" in str(e):
+            return None
+        raise
 
-        for row in reader:
-            row_count += 1
-            try:
-                # Skip rows that don't have enough columns
-                if len(row) <= key_idx:
-                    error_count += 1
-                    logger.warning(f"Row {row_count} has insufficient columns, skipping")
-                    continue
-
-                # Extract key (required)
-                key = row[key_idx]
-
-                # Skip folder markers (keys ending with /)
-                if key.endswith("/"):
-                    continue
-
-                # Extract size (default to 0)
-                size = 0
-                if size_idx is not None and len(row) > size_idx:
-                    try:
-                        size = int(row[size_idx])
-                    except (ValueError, TypeError):
-                        pass
-
-                # Extract optional fields
-                last_modified = None
-                if modified_idx is not None and len(row) > modified_idx:
-                    last_modified = row[modified_idx] or None
-
-                etag = None
-                if etag_idx is not None and len(row) > etag_idx:
-                    etag = row[etag_idx] or None
-
-                storage_class = None
-                if storage_class_idx is not None and len(row) > storage_class_idx:
-                    storage_class = row[storage_class_idx] or None
-
-                yield InventoryEntry(
-                    key=key,
-                    size=size,
-                    last_modified=last_modified,
-                    etag=etag,
-                    storage_class=storage_class
-                )
-
-            except Exception as e:
-                error_count += 1
-                if error_count <= 10:  # Limit error logging
-                    logger.warning(f"Error parsing row {row_count}: {e}")
 
+def read_s3_csv_table(
+    csv_data: Union[bytes, BinaryIO],
+    schema_fields: List[str],
+    is_gzipped: bool = True
+) -> InventoryTable:
+    """
+    Parse S3 Inventory CSV data into an InventoryTable.
+
+    Streams the (gzipped) CSV through pyarrow's CSV reader one block at
+    a time. Rows whose column count does not match the schema are
+    skipped, invalid sizes become 0 and empty optional fields become None.
+
+    Args:
+        csv_data: Raw bytes or file-like stream of CSV file (may be gzipped)
+        schema_fields: List of field names from manifest fileSchema
+        is_gzipped: Whether data is gzip compressed (default True for S3)
+
+    Returns:
+        InventoryTable of the file entries (folder markers skipped)
+
+    Raises:
+        ValueError: If the schema has no Key field
+    """
+    pa, _ = _import_pyarrow()
+    import pyarrow.csv as pa_csv
+
+    # Build field index map (case-insensitive)
+    field_map = {f.lower(): i for i, f in enumerate(schema_fields)}
+    key_idx = field_map.get("key")
+    if key_idx is None:
+        raise ValueError("CSV schema missing required field: Key")
+
+    # S3 Inventory has no header row; name columns by position
+    column_names = [f"column{i}" for i in range(len(schema_fields))]
+
+    def column_name(field: str) -> Optional[str]:
+        idx = field_map.get(field)
+        return column_names[idx] if idx is not None else None
+
+    fields = {
+        name: column_name(field)
+        for name, field in [
+            ("key", "key"),
+            ("size", "size"),
+            ("last_modified", "lastmodifieddate"),
+            ("etag", "etag"),
+            ("storage_class", "storageclass"),
+        ]
+    }
+    include_columns = sorted({name for name in fields.values() if name is not None})
+
+    skipped_rows = 0
+
+    def skip_row(row: Any) -> str:
+        nonlocal skipped_rows
+        skipped_rows += 1
+        if skipped_rows <= 10:  # Limit error logging
+            logger.warning(f"Row {row.number} has {row.actual_columns} columns, skipping")
+        return "skip"
+
+    stream, closers = _open_s3_csv_stream(csv_data, is_gzipped)
+    batches: List[Any] = []
+    row_count = 0
+
+    try:
+        reader = _open_csv_reader(
+            stream,
+            read_options=pa_csv.ReadOptions(column_names=column_names, block_size=CSV_BLOCK_SIZE),
+            parse_options=pa_csv.ParseOptions(invalid_row_handler=skip_row),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in include_columns},
+                include_columns=include_columns,
+                # Only empty fields are null - "NA", "null", "N/A" etc. are valid keys
+                null_values=[""],
+                strings_can_be_null=True,
+                quoted_strings_can_be_null=True,
+            ),
+        )
+        for batch in reader or ():
+            row_count += batch.num_rows
+            size = _batch_column(batch, fields["size"])
+            batches.append(_inventory_batch(
+                key=_batch_column(batch, fields["key"]),
+                size=_parse_sizes(size) if size is not None else pa.array([0] * batch.num_rows, pa.int64()),
+                last_modified=_batch_column(batch, fields["last_modified"]),
+                etag=_batch_column(batch, fields["etag"]),
+                storage_class=_batch_column(batch, fields["storage_class"]),
+            ))
     except gzip.BadGzipFile as e:
         # Handle gzip errors that occur during streaming decompression
         logger.warning(f"Gzip error during streaming: {e}. Processing stopped at row {row_count}.")
-        # Don't re-raise - allow partial results if any were yielded
+        # Don't re-raise - keep the rows parsed so far
     finally:
-        # Ensure streams are closed (only close streams we created)
-        try:
-            text_stream.close()
-        except Exception:
-            pass
-        if owns_stream:
+        for closer in reversed(closers):
             try:
-                byte_stream.close()
+                closer.close()
             except Exception:
                 pass
 
-    if error_count > 0:
-        logger.warning(f"Completed parsing with {error_count} errors out of {row_count} rows")
+    if skipped_rows > 0:
+        logger.warning(f"Completed parsing with {skipped_rows} errors out of {row_count + skipped_rows} rows")
     else:
         logger.info(f"Successfully parsed {row_count} CSV rows")
 
+    return InventoryTable.from_batches(batches)
 
-def parse_gcs_csv_stream(
+
+def parse_s3_csv_stream(
     csv_data: Union[bytes, BinaryIO],
+    schema_fields: List[str],
+    is_gzipped: bool = True
 ) -> Generator[InventoryEntry, None, None]:
     """
-    Parse GCS Storage Insights CSV data as a stream.
+    Parse S3 Inventory CSV data as a stream.
+
+    Iterates the InventoryTable built by read_s3_csv_table(); use that
+    directly to keep the entries columnar.
+
+    Args:
+        csv_data: Raw bytes or file-like stream of CSV file (may be gzipped).
+                  If a stream is provided, parsing is fully streaming.
+                  If bytes are provided, they are wrapped in BytesIO.
+        schema_fields: List of field names from manifest fileSchema
+        is_gzipped: Whether data is gzip compressed (default True for S3)
+
+    Yields:
+        InventoryEntry objects for each row
+
+    Example:
+        >>> for entry in parse_s3_csv_stream(data, ["Bucket", "Key", "Size"]):
+        ...     print(entry.key)
+    """
+    yield from read_s3_csv_table(csv_data, schema_fields, is_gzipped)
+
+
+def read_gcs_csv_table(
+    csv_data: Union[bytes, BinaryIO],
+) -> InventoryTable:
+    """
+    Parse GCS Storage Insights CSV data into an InventoryTable.
 
     GCS uses different field names than S3:
     - name (vs Key)
@@ -514,96 +784,116 @@ def parse_gcs_csv_stream(
     - updated (vs LastModifiedDate)
     - etag (vs ETag)
 
+    Columns are found by the header row; missing columns become None and
+    invalid sizes become 0.
+
     Args:
-        csv_data: Raw bytes or file-like stream of CSV file (uncompressed for GCS).
-                  If a stream is provided, parsing is fully streaming.
+        csv_data: Raw bytes or file-like stream of CSV file (uncompressed for GCS)
 
-    Yields:
-        InventoryEntry objects for each row
+    Returns:
+        InventoryTable of the file entries (folder markers skipped)
     """
-    # Accept either bytes or file-like object
-    if isinstance(csv_data, bytes):
-        text_stream = io.StringIO(csv_data.decode("utf-8"))
-        owns_stream = True
-    else:
-        text_stream = io.TextIOWrapper(csv_data, encoding="utf-8")
-        owns_stream = False
+    pa, _ = _import_pyarrow()
+    import pyarrow.csv as pa_csv
 
-    row_count = 0
-    error_count = 0
+    skipped_rows = 0
 
-    try:
-        reader = csv.DictReader(text_stream)
+    def skip_row(row: Any) -> str:
+        nonlocal skipped_rows
+        skipped_rows += 1
+        if skipped_rows <= 10:
+            logger.warning(f"Error parsing GCS row {row.number}: {row.actual_columns} columns")
+        return "skip"
 
-        for row in reader:
-            row_count += 1
-            try:
-                key = row.get("name", "")
-
-                # Skip folder markers
-                if key.endswith("/") or not key:
-                    continue
-
-                size = 0
-                try:
-                    size = int(row.get("size", 0))
-                except (ValueError, TypeError):
-                    pass
-
-                yield InventoryEntry(
-                    key=key,
-                    size=size,
-                    last_modified=row.get("updated"),
-                    etag=row.get("etag"),
-                    storage_class=row.get("storageClass")
-                )
-
-            except Exception as e:
-                error_count += 1
-                if error_count <= 10:
-                    logger.warning(f"Error parsing GCS row {row_count}: {e}")
+    source = io.BytesIO(csv_data) if isinstance(csv_data, bytes) else csv_data
+    batches: List[Any] = []
+    row_count = 0
 
-    finally:
-        # Close streams we own
-        if owns_stream:
-            try:
-                text_stream.close()
-            except Exception:
-                pass
+    reader = _open_csv_reader(
+        source,
+        read_options=pa_csv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+        parse_options=pa_csv.ParseOptions(invalid_row_handler=skip_row),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in GCS_CSV_COLUMNS},
+            include_columns=GCS_CSV_COLUMNS,
+            include_missing_columns=True,
+        ),
+    )
+    for batch in reader or ():
+        row_count += batch.num_rows
+        batches.append(_inventory_batch(
+            key=batch.column("name"),
+            size=_parse_sizes(batch.column("size")),
+            last_modified=batch.column("updated"),
+            etag=batch.column("etag"),
+            storage_class=batch.column("storageClass"),
+        ))
 
-    if error_count > 0:
-        logger.warning(f"GCS parsing completed with {error_count} errors out of {row_count} rows")
+    if skipped_rows > 0:
+        logger.warning(f"GCS parsing completed with {skipped_rows} errors out of {row_count + skipped_rows} rows")
     else:
         logger.info(f"Successfully parsed {row_count} GCS CSV rows")
 
+    return InventoryTable.from_batches(batches)
 
-def parse_parquet_stream(
-    parquet_data: Union[bytes, BinaryIO],
-    provider: str = "gcs"
+
+def parse_gcs_csv_stream(
+    csv_data: Union[bytes, BinaryIO],
 ) -> Generator[InventoryEntry, None, None]:
     """
-    Parse Parquet inventory data as a stream.
+    Parse GCS Storage Insights CSV data as a stream.
 
-    Uses pyarrow for memory-efficient Parquet parsing with row batches.
+    Iterates the InventoryTable built by read_gcs_csv_table(); use that
+    directly to keep the entries columnar.
 
     Args:
-        parquet_data: Raw bytes or file-like stream of Parquet file.
-                      If a stream is provided, pyarrow reads directly from it.
-        provider: Provider name ("s3" or "gcs") for field mapping
+        csv_data: Raw bytes or file-like stream of CSV file (uncompressed for GCS).
+                  If a stream is provided, parsing is fully streaming.
 
     Yields:
         InventoryEntry objects for each row
+    """
+    yield from read_gcs_csv_table(csv_data)
+
+
+def _format_last_modified(column: Any) -> Any:
+    """
+    Convert a Parquet last-modified column to strings.
+
+    Timestamps become ISO 8601 in UTC (e.g., 2022-11-25T13:30:49.000Z, as
+    in S3 CSV inventories; naive timestamps are taken as UTC). Other types
+    are cast to string; empty strings become None.
+    """
+    pa, pc = _import_pyarrow()
+    if pa.types.is_timestamp(column.type):
+        utc = column.cast(pa.timestamp(column.type.unit, "UTC"))
+        return pc.strftime(utc, format="%Y-%m-%dT%H:%M:%SZ")
+    strings = pc.cast(column, pa.string())
+    return pc.if_else(pc.equal(strings, ""), pa.scalar(None, pa.string()), strings)
+
+
+def read_parquet_table(
+    parquet_data: Union[bytes, BinaryIO],
+    provider: str = "gcs"
+) -> InventoryTable:
+    """
+    Parse Parquet inventory data into an InventoryTable.
+
+    Reads only the inventory columns, one record batch at a time, and
+    converts them with Arrow kernels.
+
+    Args:
+        parquet_data: Raw bytes or seekable file-like stream of Parquet file
+        provider: Provider name ("s3" or "gcs") for field mapping
+
+    Returns:
+        InventoryTable of the file entries (folder markers skipped)
 
     Raises:
         ImportError: If pyarrow is not installed
     """
-    try:
-        import pyarrow.parquet as pq
-    except ImportError:
-        raise ImportError(
-            "pyarrow is required for Parquet parsing. "
-            "Install with: pip install pyarrow"
-        )
+    pa, pc = _import_pyarrow()
+    import pyarrow.parquet as pq
 
     # Field mappings per provider
     match provider:
@@ -622,41 +912,68 @@ def parse_parquet_stream(
         case _:
             raise ValueError(f"Unsupported provider: {provider}. Must be 'gcs' or 's3'.")
 
-    # Accept either bytes or file-like object
-    # pyarrow.parquet.ParquetFile accepts both
-    if isinstance(parquet_data, bytes):
-        source = io.BytesIO(parquet_data)
-    else:
-        source = parquet_data
-
-    # Read Parquet file in batches for memory efficiency
+    # pyarrow.parquet.ParquetFile accepts both (seekable) streams and buffers
+    source = io.BytesIO(parquet_data) if isinstance(parquet_data, bytes) else parquet_data
     reader = pq.ParquetFile(source)
-    row_count = 0
 
-    for batch in reader.iter_batches(batch_size=CHUNK_SIZE):
-        table = batch.to_pydict()
+    available = set(reader.schema_arrow.names)
+    if key_field not in available:
+        logger.warning(f"Parquet file has no {key_field} column, no entries parsed")
+        return InventoryTable()
+    # Column name per field, None for fields missing from the file
+    size_field, modified_field, etag_field, storage_class_field = (
+        field if field in available else None
+        for field in (size_field, modified_field, etag_field, storage_class_field)
+    )
+    columns = [
+        field for field in (key_field, size_field, modified_field, etag_field, storage_class_field)
+        if field is not None
+    ]
+
+    batches: List[Any] = []
+    for batch in reader.iter_batches(batch_size=CHUNK_SIZE, columns=columns):
+        size = _batch_column(batch, size_field)
+        modified = _batch_column(batch, modified_field)
+        etag = _batch_column(batch, etag_field)
+        storage_class = _batch_column(batch, storage_class_field)
+        batches.append(_inventory_batch(
+            key=pc.cast(batch.column(key_field), pa.string()),
+            size=(
+                pc.fill_null(pc.cast(size, pa.int64()), 0) if size is not None
+                else pa.array([0] * batch.num_rows, pa.int64())
+            ),
+            last_modified=_format_last_modified(modified) if modified is not None else None,
+            etag=pc.cast(etag, pa.string()) if etag is not None else None,
+            storage_class=pc.cast(storage_class, pa.string()) if storage_class is not None else None,
+        ))
+
+    table = InventoryTable.from_batches(batches)
+    logger.info(f"Successfully parsed {len(table)} Parquet rows")
+    return table
+
+
+def parse_parquet_stream(
+    parquet_data: Union[bytes, BinaryIO],
+    provider: str = "gcs"
+) -> Generator[InventoryEntry, None, None]:
+    """
+    Parse Parquet inventory data as a stream.
 
-        keys = table.get(key_field, [])
-        sizes = table.get(size_field, [])
-        modified = table.get(modified_field, [None] * len(keys))
-        etags = table.get(etag_field, [None] * len(keys))
-        storage_classes = table.get(storage_class_field, [None] * len(keys))
+    Iterates the InventoryTable built by read_parquet_table(); use that
+    directly to keep the entries columnar.
 
-        for i, key in enumerate(keys):
-            # Check for null/empty key first to avoid calling endswith on None
-            if not key or key.endswith("/"):
-                continue
+    Args:
+        parquet_data: Raw bytes or file-like stream of Parquet file.
+                      If a stream is provided, pyarrow reads directly from it.
+        provider: Provider name ("s3" or "gcs") for field mapping
 
-            row_count += 1
-            yield InventoryEntry(
-                key=key,
-                size=sizes[i] if i < len(sizes) else 0,
-                last_modified=str(modified[i]) if i < len(modified) and modified[i] else None,
-                etag=etags[i] if i < len(etags) else None,
-                storage_class=storage_classes[i] if i < len(storage_classes) else None
-            )
+    Yields:
+        InventoryEntry objects for each row
 
-    logger.info(f"Successfully parsed {row_count} Parquet rows")
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    yield from read_parquet_table(parquet_data, provider)
 
 
 def extract_folders(keys: Iterable[str]) -> Set[str]:
@@ -754,3 +1071,45 @@ def count_files_by_folder(
             folder_stats[folder]["total_size"] += entry.size
 
     return folder_stats
+
+
+def summarize_folders(
+    entries: InventoryTable,
+) -> Tuple[Set[str], Dict[str, Dict[str, Any]]]:
+    """
+    Extract folders and per-folder statistics from an InventoryTable.
+
+    Same results as extract_folders() and count_files_by_folder() on the
+    table's entries, but files are first grouped by their parent folder
+    with Arrow kernels, so the Python work grows with the number of
+    folders rather than the number of files.
+
+    Args:
+        entries: Inventory entries (without folder markers)
+
+    Returns:
+        Tuple of (folder paths with trailing slash,
+        dict of folder path to {'file_count', 'total_size'})
+    """
+    pa, pc = _import_pyarrow()
+    parents = pc.replace_substring_regex(
+        entries.table["key"], pattern="[^/]*$", replacement="", max_replacements=1
+    )
+    grouped = pa.table({"parent": parents, "size": entries.table["size"]}).group_by("parent").aggregate(
+        [("size", "sum"), ("size", "count")]
+    )
+
+    folder_stats: Dict[str, Dict[str, Any]] = {}
+    for parent, total_size, file_count in zip(
+        grouped["parent"].to_pylist(), grouped["size_sum"].to_pylist(), grouped["size_count"].to_pylist(), strict=True
+    ):
+        # Every ancestor of the parent folder (and the parent itself)
+        parts = parent.split("/")
+        for i in range(1, len(parts)):
+            folder = "/".join(parts[:i]) + "/"
+            if folder not in folder_stats:
+                folder_stats[folder] = {"file_count": 0, "total_size": 0}
+            folder_stats[folder]["file_count"] += file_count
+            folder_stats[folder]["total_size"] += total_size or 0
+
+    return set(folder_stats), folder_stats
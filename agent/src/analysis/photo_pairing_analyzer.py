@@ -15,12 +15,18 @@ Example:
     AB3D0001-HDR.dng  -> group "AB3D0001", separate_image "", method "HDR"
 """
 
+import heapq
 import logging
+import pickle
 import re
+import tempfile
 from collections import defaultdict
-from typing import List, Dict, Any, Optional, Set
+from functools import lru_cache, partial
+from itertools import groupby
+from operator import itemgetter
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-from src.remote.base import FileInfo
+from src.remote.base import FileInfo, iter_file_rows
 
 # Import from repository root - will work when running from agent directory
 import sys
@@ -30,6 +36,11 @@ from utils.filename_parser import FilenameParser
 
 logger = logging.getLogger(__name__)
 
+# Out-of-core ImageGroups (ExternalImageGroups): records sorted in memory per
+# run, and the listing size from which callers switch to the external sort
+EXTERNAL_SORT_RUN_SIZE = 500_000
+EXTERNAL_SORT_MIN_FILES = 1_000_000
+
 
 def build_imagegroups(
     files: List[FileInfo],
@@ -61,19 +72,35 @@ def build_imagegroups(
         >>> len(result['imagegroups'])
         1
     """
-    # Compile regex if provided
-    compiled_regex = None
-    if filename_regex:
-        try:
-            compiled_regex = re.compile(filename_regex)
-        except re.error as e:
-            logger.warning(
-                "Invalid filename_regex '%s', falling back to FilenameParser: %s",
-                filename_regex, e,
-            )
+    return build_imagegroups_from_entries(
+        ((path, name, stem) for path, name, stem, _, _ in iter_file_rows(files)),
+        filename_regex=filename_regex,
+        camera_id_group=camera_id_group,
+    )
 
-    if camera_id_group is None:
-        camera_id_group = 1
+
+def build_imagegroups_from_entries(
+    entries: Iterable[Tuple[str, str, str]],
+    filename_regex: Optional[str] = None,
+    camera_id_group: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Build ImageGroup structure from pre-split file entries.
+
+    Same result as build_imagegroups() for callers that already split each
+    path into name and stem (see ListingIndex), so they are not re-derived
+    from the FileInfo on every call.
+
+    Args:
+        entries: (path, name, stem) tuples, already filtered to photo extensions
+        filename_regex: Optional regex pattern with capture groups for
+            camera_id and counter
+        camera_id_group: Which capture group is the camera ID (1 or 2)
+
+    Returns:
+        Dict with 'imagegroups' list and 'invalid_files' list
+    """
+    parse_stem = _stem_parser(filename_regex, camera_id_group)
 
     groups = defaultdict(lambda: {
         'group_id': '',
@@ -84,54 +111,26 @@ def build_imagegroups(
 
     invalid_files = []
 
-    for file_info in files:
-        filename = file_info.name
-        stem = file_info.stem
-
-        if compiled_regex is not None:
-            # Pipeline regex-based parsing
-            parsed = _parse_with_regex(
-                filename, stem, compiled_regex, camera_id_group
-            )
-        else:
-            # Legacy FilenameParser-based parsing
-            parsed = _parse_with_filename_parser(filename)
+    for path, filename, stem in entries:
+        parsed = parse_stem(stem)
 
         if parsed is None:
-            invalid_files.append({
-                'filename': filename,
-                'path': file_info.path,
-                'reason': 'Filename does not match expected pattern',
-            })
+            invalid_files.append(_invalid_file(path, filename))
             continue
 
-        group_id = parsed['camera_id'] + parsed['counter']
+        camera_id, counter, properties = parsed
+        group_id = camera_id + counter
 
         # Initialize group if first file
         if not groups[group_id]['group_id']:
             groups[group_id]['group_id'] = group_id
-            groups[group_id]['camera_id'] = parsed['camera_id']
-            groups[group_id]['counter'] = parsed['counter']
-
-        # Determine which separate image this file belongs to
-        # Key distinction (FR-012):
-        # - Separate image suffix: ALL NUMERIC (e.g., "2", "3") - different captures
-        # - Processing method suffix: NOT numeric (e.g., "HDR", "BW") - edits applied
-        separate_image_id = ''
-        processing_methods = []
-
-        for prop in parsed['properties']:
-            if prop.isdigit():
-                # FR-012: All-numeric suffix is always a separate image indicator
-                if separate_image_id == '':
-                    separate_image_id = prop
-                else:
-                    processing_methods.append(prop)
-            else:
-                processing_methods.append(prop)
+            groups[group_id]['camera_id'] = camera_id
+            groups[group_id]['counter'] = counter
+
+        separate_image_id, processing_methods = _split_properties(properties)
 
         # Add file to appropriate separate image
-        groups[group_id]['separate_images'][separate_image_id]['files'].append(file_info.path)
+        groups[group_id]['separate_images'][separate_image_id]['files'].append(path)
 
         # Add processing methods
         for method in processing_methods:
@@ -160,12 +159,308 @@ def build_imagegroups(
     }
 
 
+class ExternalImageGroups:
+    """
+    ImageGroups built by an external sort of the listing (out-of-core mode).
+
+    build_imagegroups() keeps every file of the collection in a grouped
+    structure until the last file is read. Here each parsed file becomes one
+    small record keyed by group ID; records are sorted in runs of run_size,
+    runs larger than one are spilled to temporary files, and ImageGroups are
+    then emitted one at a time from a merge of the runs. Memory is bounded
+    by run_size and the largest single ImageGroup rather than by the size of
+    the collection. A listing that fits in one run is never written to disk.
+
+    Iterating yields the same ImageGroups, in the same order, as
+    build_imagegroups_from_entries()['imagegroups'] on the same entries, and
+    may be repeated until close(). Use as a context manager to remove the
+    temporary files.
+
+    Metadata files can be sorted alongside the photos (metadata_entries), so
+    pipeline validation can attach them per group without holding a
+    collection-wide stem index. Their stems are parsed like photo stems;
+    files whose stem does not parse cannot match an image and are dropped.
+
+    Attributes:
+        invalid_files: Photo files whose names did not parse, in listing order
+        file_count: Number of photo files placed in ImageGroups
+        run_count: Number of sorted runs spilled to temporary files
+
+    Example:
+        >>> entries = ((f.path, f.name, f.stem) for f in photo_files)
+        >>> with ExternalImageGroups(entries) as groups:
+        ...     analytics = calculate_analytics(groups, config)
+    """
+
+    # Record kinds; photos sort before metadata files of the same group
+    _PHOTO = 0
+    _METADATA = 1
+
+    # Records pickled per batch in a spilled run
+    _SPILL_BATCH_SIZE = 4096
+
+    def __init__(
+        self,
+        entries: Iterable[Tuple[str, str, str]],
+        filename_regex: Optional[str] = None,
+        camera_id_group: Optional[int] = None,
+        metadata_entries: Optional[Iterable[Tuple[str, str]]] = None,
+        run_size: Optional[int] = None,
+        temp_dir: Optional[str] = None,
+    ):
+        """
+        Parse and sort the listing.
+
+        Args:
+            entries: (path, name, stem) tuples, already filtered to photo
+                extensions (consumed once)
+            filename_regex: Optional regex pattern with capture groups for
+                camera_id and counter
+            camera_id_group: Which capture group is the camera ID (1 or 2)
+            metadata_entries: Optional (path, stem) tuples of metadata files
+            run_size: Records sorted in memory per run
+                (default EXTERNAL_SORT_RUN_SIZE)
+            temp_dir: Directory for spilled runs (default: system temp dir)
+        """
+        self.invalid_files: List[Dict[str, Any]] = []
+        self.file_count = 0
+        self._run_size = run_size or EXTERNAL_SORT_RUN_SIZE
+        self._temp_dir = temp_dir
+        self._runs: List[IO[bytes]] = []
+        self._buffer: List[tuple] = []
+        self._counts: Optional[Tuple[int, int]] = None
+
+        parse_stem = _stem_parser(filename_regex, camera_id_group)
+        seq = 0
+        for path, filename, stem in entries:
+            parsed = parse_stem(stem)
+            if parsed is None:
+                self.invalid_files.append(_invalid_file(path, filename))
+                continue
+            camera_id, counter, properties = parsed
+            separate_image_id, processing_methods = _split_properties(properties)
+            self._add((
+                camera_id + counter, self._PHOTO, seq,
+                camera_id, counter, separate_image_id, path, tuple(processing_methods),
+            ))
+            seq += 1
+        self.file_count = seq
+
+        for path, stem in metadata_entries or ():
+            parsed = parse_stem(stem)
+            if parsed is not None:
+                camera_id, counter, _ = parsed
+                self._add((camera_id + counter, self._METADATA, seq, stem, path))
+                seq += 1
+
+        self._buffer.sort()
+        if self._runs and self._buffer:
+            self._spill()
+
+    @property
+    def run_count(self) -> int:
+        """Number of sorted runs spilled to temporary files."""
+        return len(self._runs)
+
+    @property
+    def group_count(self) -> int:
+        """Number of ImageGroups (counted by one merge pass, then cached)."""
+        return self._count()[0]
+
+    @property
+    def image_count(self) -> int:
+        """Number of separate images over all ImageGroups."""
+        return self._count()[1]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Yield ImageGroups in group ID order."""
+        for group, _ in self.iter_with_metadata():
+            yield group
+
+    def iter_with_metadata(self) -> Iterator[Tuple[Dict[str, Any], Dict[str, List[str]]]]:
+        """
+        Yield each ImageGroup with the metadata files sorted into it.
+
+        Yields:
+            (ImageGroup, metadata stem -> metadata file paths) per group, in
+            group ID order
+        """
+        for group_id, records in groupby(self._records(), key=itemgetter(0)):
+            separate_images: Dict[str, Tuple[List[str], Set[str]]] = {}
+            metadata_paths: Dict[str, List[str]] = {}
+            camera_id = counter = None
+            for record in records:
+                if record[1] == self._METADATA:
+                    metadata_paths.setdefault(record[3], []).append(record[4])
+                    continue
+                _, _, _, record_camera_id, record_counter, separate_image_id, path, methods = record
+                if camera_id is None:
+                    camera_id, counter = record_camera_id, record_counter
+                image = separate_images.get(separate_image_id)
+                if image is None:
+                    image = separate_images[separate_image_id] = ([], set())
+                image[0].append(path)
+                image[1].update(methods)
+
+            if camera_id is None:
+                # Metadata files without any photo do not form a group
+                continue
+
+            yield {
+                'group_id': group_id,
+                'camera_id': camera_id,
+                'counter': counter,
+                'separate_images': {
+                    sep_id: {'files': sorted(files), 'properties': sorted(properties)}
+                    for sep_id, (files, properties) in separate_images.items()
+                },
+            }, metadata_paths
+
+    def close(self) -> None:
+        """Remove the spilled runs."""
+        for run in self._runs:
+            run.close()
+        self._runs = []
+        self._buffer = []
+
+    def __enter__(self) -> "ExternalImageGroups":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _add(self, record: tuple) -> None:
+        """Buffer one record, spilling a sorted run when the buffer is full."""
+        self._buffer.append(record)
+        if len(self._buffer) >= self._run_size:
+            self._buffer.sort()
+            self._spill()
+
+    def _spill(self) -> None:
+        """Write the (sorted) buffer to a new temporary run file."""
+        run = tempfile.TemporaryFile(dir=self._temp_dir)
+        buffer = self._buffer
+        for start in range(0, len(buffer), self._SPILL_BATCH_SIZE):
+            pickle.dump(buffer[start:start + self._SPILL_BATCH_SIZE], run, pickle.HIGHEST_PROTOCOL)
+        self._runs.append(run)
+        self._buffer = []
+
+    def _records(self) -> Iterator[tuple]:
+        """All records in (group ID, kind, listing order) order."""
+        if not self._runs:
+            return iter(self._buffer)
+        return heapq.merge(*(self._read_run(run) for run in self._runs))
+
+    @staticmethod
+    def _read_run(run: IO[bytes]) -> Iterator[tuple]:
+        """Read a spilled run back, one batch in memory at a time."""
+        run.seek(0)
+        while True:
+            try:
+                batch = pickle.load(run)
+            except EOFError:
+                return
+            offset = run.tell()
+            yield from batch
+            # Another reader may have moved the shared file position
+            run.seek(offset)
+
+    def _count(self) -> Tuple[int, int]:
+        """Count ImageGroups and separate images in one merge pass."""
+        if self._counts is None:
+            groups = images = 0
+            for group in self:
+                groups += 1
+                images += len(group['separate_images'])
+            self._counts = (groups, images)
+        return self._counts
+
+
+def _stem_parser(
+    filename_regex: Optional[str],
+    camera_id_group: Optional[int],
+) -> Callable[[str], Optional[Tuple[str, str, Tuple[str, ...]]]]:
+    """
+    Get the stem parser for a Pipeline Capture node regex.
+
+    Args:
+        filename_regex: Optional regex pattern with capture groups for
+            camera_id and counter. FilenameParser is used when not provided
+            or invalid (FR-009).
+        camera_id_group: Which capture group is the camera ID (1 or 2)
+
+    Returns:
+        Callable mapping a stem to (camera_id, counter, properties), or None
+    """
+    # Compile regex if provided
+    compiled_regex = None
+    if filename_regex:
+        try:
+            compiled_regex = re.compile(filename_regex)
+        except re.error as e:
+            logger.warning(
+                "Invalid filename_regex '%s', falling back to FilenameParser: %s",
+                filename_regex, e,
+            )
+
+    if camera_id_group is None:
+        camera_id_group = 1
+
+    if compiled_regex is not None:
+        # Pipeline regex-based parsing. Stems repeat across extensions
+        # (AB3D0001.cr3, AB3D0001.dng), so results are cached by stem.
+        return lru_cache(maxsize=FilenameParser.PARSE_CACHE_MAX_ENTRIES)(
+            partial(_parse_with_regex, compiled_regex=compiled_regex, camera_id_group=camera_id_group)
+        )
+    # Legacy FilenameParser-based parsing (cached by stem, shared
+    # with every other analyzer parsing the same listing)
+    return FilenameParser.parse_stem
+
+
+def _split_properties(properties: Iterable[str]) -> Tuple[str, List[str]]:
+    """
+    Determine which separate image a file belongs to.
+
+    Key distinction (FR-012):
+    - Separate image suffix: ALL NUMERIC (e.g., "2", "3") - different captures
+    - Processing method suffix: NOT numeric (e.g., "HDR", "BW") - edits applied
+
+    Args:
+        properties: Parsed filename properties
+
+    Returns:
+        Tuple of (separate image ID, processing methods)
+    """
+    separate_image_id = ''
+    processing_methods = []
+
+    for prop in properties:
+        if prop.isdigit():
+            # FR-012: All-numeric suffix is always a separate image indicator
+            if separate_image_id == '':
+                separate_image_id = prop
+            else:
+                processing_methods.append(prop)
+        else:
+            processing_methods.append(prop)
+
+    return separate_image_id, processing_methods
+
+
+def _invalid_file(path: str, filename: str) -> Dict[str, Any]:
+    """Build the invalid_files entry for a file whose name did not parse."""
+    return {
+        'filename': filename,
+        'path': path,
+        'reason': 'Filename does not match expected pattern',
+    }
+
+
 def _parse_with_regex(
-    filename: str,
     stem: str,
     compiled_regex: re.Pattern,
     camera_id_group: int,
-) -> Optional[Dict[str, Any]]:
+) -> Optional[Tuple[str, str, Tuple[str, ...]]]:
     """
     Parse a filename using a Pipeline Capture node's regex.
 
@@ -174,13 +469,13 @@ def _parse_with_regex(
     extract properties (processing suffixes and separate image indicators).
 
     Args:
-        filename: Full filename (with extension)
         stem: Filename without extension
         compiled_regex: Compiled regex pattern
         camera_id_group: Which group (1 or 2) is the camera ID
 
     Returns:
-        Parsed dict with camera_id, counter, properties, or None if no match
+        (camera_id, counter, properties) like FilenameParser.parse_stem(),
+        or None if no match
     """
     match = compiled_regex.match(stem)
     if not match:
@@ -196,7 +491,7 @@ def _parse_with_regex(
 
     # Extract properties from the remainder after the match
     remainder = stem[match.end():]
-    properties = []
+    properties: Tuple[str, ...] = ()
     if remainder:
         # Strip leading delimiter (remainder typically starts with '-')
         stripped = remainder.lstrip('-')
@@ -207,46 +502,21 @@ def _parse_with_regex(
         if any(p == '' for p in parts):
             # Double-dash or trailing dash produced empty property — malformed
             return None
-        properties = parts
-
-    return {
-        'camera_id': camera_id,
-        'counter': counter,
-        'properties': properties,
-    }
+        properties = tuple(parts)
 
-
-def _parse_with_filename_parser(filename: str) -> Optional[Dict[str, Any]]:
-    """
-    Parse a filename using the legacy FilenameParser.
-
-    Args:
-        filename: Full filename (with extension)
-
-    Returns:
-        Parsed dict with camera_id, counter, properties, or None if invalid
-    """
-    is_valid, error_reason = FilenameParser.validate_filename(filename)
-    if not is_valid:
-        return None
-
-    parsed = FilenameParser.parse_filename(filename)
-    return {
-        'camera_id': parsed['camera_id'],
-        'counter': parsed['counter'],
-        'properties': parsed['properties'],
-    }
+    return camera_id, counter, properties
 
 
 def calculate_analytics(
-    imagegroups: List[Dict],
+    imagegroups: Iterable[Dict],
     config: Dict[str, Any]
 ) -> Dict[str, Any]:
     """
     Calculate analytics from imagegroups.
 
     Args:
-        imagegroups: List of ImageGroup dicts
+        imagegroups: ImageGroup dicts (a list, or any iterable such as
+            ExternalImageGroups; consumed once)
         config: Config with camera_mappings and processing_methods
 
     Returns:
@@ -294,10 +564,12 @@ def calculate_analytics(
     camera_usage = defaultdict(int)
     method_usage = defaultdict(int)
     cameras_seen: Dict[str, Dict[str, Any]] = {}
+    total_groups = 0
     total_images = 0
     total_files = 0
 
     for group in imagegroups:
+        total_groups += 1
         cam_id = group['camera_id']
         camera_name = get_camera_name(cam_id)
         num_images = len(group['separate_images'])
@@ -320,6 +592,6 @@ def calculate_analytics(
         'cameras': cameras_seen,
         'method_usage': dict(method_usage),
         'image_count': total_images,
-        'group_count': len(imagegroups),
+        'group_count': total_groups,
         'file_count': total_files,
     }
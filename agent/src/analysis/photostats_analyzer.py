@@ -5,32 +5,120 @@ Extracted from photo_stats.py to enable reuse across local and remote collection
 Works with FileInfo objects instead of Path objects.
 
 Key Concepts:
-    - File Stats: Count and size by extension
+    - File Stats: Count, total size and size histogram by extension
     - File Pairing: Images with their XMP sidecars
     - Orphaned Files: Images without sidecars (require_sidecar), sidecars without images
 """
 
 from collections import defaultdict
-from typing import List, Dict, Any, Set
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
-from src.remote.base import FileInfo
+from src.remote.base import FileInfo, iter_file_rows
+
+
+# Size histograms use log2 buckets: bucket 0 holds empty files and bucket
+# i holds sizes in [2**(i-1), 2**i). The last bucket is open-ended.
+SIZE_HISTOGRAM_BUCKETS = 48
+
+
+class SizeHistogram:
+    """
+    Running size aggregate for one extension.
+
+    Folds file sizes into count/total/min/max and a fixed log2-bucket
+    histogram, so memory stays constant however many files are added.
+
+    Attributes:
+        count: Number of files
+        total: Sum of file sizes in bytes
+        min: Smallest file size (None until a file is added)
+        max: Largest file size (None until a file is added)
+        buckets: File counts per log2 size bucket
+    """
+
+    __slots__ = ('count', 'total', 'min', 'max', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self.buckets = [0] * SIZE_HISTOGRAM_BUCKETS
+
+    def add(self, size: int) -> None:
+        """Add one file size."""
+        self.count += 1
+        self.total += size
+        if self.min is None or size < self.min:
+            self.min = size
+        if self.max is None or size > self.max:
+            self.max = size
+        self.buckets[min(max(size, 0).bit_length(), SIZE_HISTOGRAM_BUCKETS - 1)] += 1
+
+    def merge(self, other: 'SizeHistogram') -> None:
+        """Add every file size folded into another histogram."""
+        if not other.count:
+            return
+        self.count += other.count
+        self.total += other.total
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets, strict=True)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON-serializable form.
+
+        Returns:
+            Dict with count, total, min, max and buckets (counts per log2
+            bucket, trailing empty buckets dropped)
+        """
+        used = len(self.buckets)
+        while used and not self.buckets[used - 1]:
+            used -= 1
+        return {
+            'count': self.count,
+            'total': self.total,
+            'min': self.min,
+            'max': self.max,
+            'buckets': self.buckets[:used],
+        }
+
+
+def size_bucket_bounds(bucket: int) -> Tuple[int, Optional[int]]:
+    """
+    Size range of a histogram bucket.
+
+    Args:
+        bucket: Bucket index
+
+    Returns:
+        (lower bound inclusive, upper bound exclusive or None if open-ended)
+    """
+    lower = 0 if bucket == 0 else 1 << (bucket - 1)
+    upper = None if bucket >= SIZE_HISTOGRAM_BUCKETS - 1 else 1 << bucket
+    return lower, upper
 
 
 def calculate_stats(
-    files: List[FileInfo],
+    files: Iterable[FileInfo],
     photo_extensions: Set[str],
     metadata_extensions: Set[str]
 ) -> Dict[str, Any]:
     """
     Calculate file counts and sizes by extension.
 
+    Sizes are folded into one SizeHistogram per extension as the listing
+    streams, so memory does not grow with the number of files.
+
     Args:
-        files: List of FileInfo objects
+        files: FileInfo objects (any iterable, consumed once)
         photo_extensions: Set of photo extensions (e.g., {'.dng', '.cr3'})
         metadata_extensions: Set of metadata extensions (e.g., {'.xmp'})
 
     Returns:
-        Dict with file_counts, file_sizes, total_files, total_size
+        Dict with file_counts, storage_by_type, size_stats,
+        image_size_stats, total_files, total_size
 
     Example:
         >>> files = [FileInfo("test.dng", 1000000), FileInfo("test.xmp", 5000)]
@@ -38,26 +126,66 @@ def calculate_stats(
         >>> stats['total_files']
         2
     """
+    histograms: Dict[str, SizeHistogram] = {}
+    for _, _, _, ext, size in iter_file_rows(files):
+        histogram = histograms.get(ext)
+        if histogram is None:
+            histogram = histograms[ext] = SizeHistogram()
+        histogram.add(size)
+
+    return stats_from_size_histograms(histograms, photo_extensions, metadata_extensions)
+
+
+def stats_from_size_histograms(
+    histograms: Dict[str, SizeHistogram],
+    photo_extensions: Set[str],
+    metadata_extensions: Set[str]
+) -> Dict[str, Any]:
+    """
+    Calculate file counts and sizes from per-extension size histograms.
+
+    Same result as calculate_stats() for a listing that has already been
+    aggregated by extension (see ListingIndex), so the listing is not walked
+    again for every extension set.
+
+    Args:
+        histograms: Lowercase extension -> SizeHistogram, in listing order
+        photo_extensions: Set of photo extensions
+        metadata_extensions: Set of metadata extensions
+
+    Returns:
+        Dict with file_counts, storage_by_type (bytes per extension),
+        size_stats (SizeHistogram.to_dict() per extension),
+        image_size_stats (SizeHistogram.to_dict() over the photo
+        extensions only), total_files, total_size
+    """
     # Normalize extensions to lowercase
     photo_exts = {ext.lower() for ext in photo_extensions}
     metadata_exts = {ext.lower() for ext in metadata_extensions}
     all_extensions = photo_exts | metadata_exts
 
-    file_counts = defaultdict(int)
-    file_sizes = defaultdict(list)
+    file_counts = {}
+    storage_by_type = {}
+    size_stats = {}
+    image_sizes = SizeHistogram()
     total_size = 0
     total_files = 0
 
-    for f in files:
-        if f.extension in all_extensions:
-            file_counts[f.extension] += 1
-            file_sizes[f.extension].append(f.size)
-            total_size += f.size
-            total_files += 1
+    for ext, histogram in histograms.items():
+        if ext in all_extensions:
+            file_counts[ext] = histogram.count
+            storage_by_type[ext] = histogram.total
+            size_stats[ext] = histogram.to_dict()
+            if ext in photo_exts:
+                image_sizes.merge(histogram)
+            total_size += histogram.total
+            total_files += histogram.count
 
     return {
-        'file_counts': dict(file_counts),
-        'file_sizes': dict(file_sizes),
+        'file_counts': file_counts,
+        'storage_by_type': storage_by_type,
+        'size_stats': size_stats,
+        'image_size_stats': image_sizes.to_dict(),
         'total_files': total_files,
         'total_size': total_size
     }
@@ -87,40 +215,65 @@ def analyze_pairing(
         >>> len(result['paired_files'])
         1
     """
+    # Group files by stem (base name without extension)
+    file_groups = defaultdict(list)
+    for path, _, stem, ext, _ in iter_file_rows(files):
+        file_groups[stem].append((path, ext))
+
+    return pairing_from_stem_groups(
+        file_groups, photo_extensions, metadata_extensions, require_sidecar
+    )
+
+
+def pairing_from_stem_groups(
+    stem_groups: Dict[str, List[Tuple[str, str]]],
+    photo_extensions: Set[str],
+    metadata_extensions: Set[str],
+    require_sidecar: Set[str]
+) -> Dict[str, Any]:
+    """
+    Analyze file pairing from files already grouped by stem.
+
+    Same result as analyze_pairing() for a listing that has already been
+    grouped by stem (see ListingIndex).
+
+    Args:
+        stem_groups: Stem -> (path, lowercase extension) pairs, in listing order
+        photo_extensions: Set of photo extensions
+        metadata_extensions: Set of metadata extensions (e.g., {'.xmp'})
+        require_sidecar: Set of extensions that require sidecars (e.g., {'.cr3'})
+
+    Returns:
+        Dict with paired_files, orphaned_images, orphaned_xmp
+    """
     # Normalize extensions
     photo_exts = {ext.lower() for ext in photo_extensions}
     metadata_exts = {ext.lower() for ext in metadata_extensions}
     require_sidecar_exts = {ext.lower() for ext in require_sidecar}
 
-    # Group files by stem (base name without extension)
-    file_groups = defaultdict(list)
-    for file_info in files:
-        file_groups[file_info.stem].append(file_info)
-
     paired_files = []
     orphaned_images = []
     orphaned_xmp = []
 
-    for base_name, group_files in file_groups.items():
-        extensions = {f.extension for f in group_files}
-        has_image = bool(extensions & photo_exts)
+    for base_name, group_files in stem_groups.items():
+        extensions = {ext for _, ext in group_files}
+        image_extensions = extensions & photo_exts
+        has_image = bool(image_extensions)
         has_xmp = bool(extensions & metadata_exts)
-        has_image_requiring_sidecar = bool(
-            {f.extension for f in group_files if f.extension in photo_exts} & require_sidecar_exts
-        )
+        has_image_requiring_sidecar = bool(image_extensions & require_sidecar_exts)
 
         if has_image and has_xmp:
             paired_files.append({
                 'base_name': base_name,
-                'files': [f.path for f in group_files]
+                'files': [path for path, _ in group_files]
             })
         elif has_image and not has_xmp and has_image_requiring_sidecar:
             orphaned_images.extend([
-                f.path for f in group_files if f.extension in require_sidecar_exts
+                path for path, ext in group_files if ext in require_sidecar_exts
             ])
         elif has_xmp and not has_image:
             orphaned_xmp.extend([
-                f.path for f in group_files if f.extension in metadata_exts
+                path for path, ext in group_files if ext in metadata_exts
             ])
 
     return {
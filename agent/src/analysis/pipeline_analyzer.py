@@ -10,11 +10,20 @@ Key Concepts:
     - Validation: Matching actual files against expected files per pipeline path
 """
 
-from typing import List, Dict, Any, Set, Optional, Callable
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice, tee
+from typing import List, Dict, Any, Set, Optional, Callable, Tuple, Iterable, Iterator
 from dataclasses import dataclass, field
 
-from src.remote.base import FileInfo
-from src.analysis.photo_pairing_analyzer import build_imagegroups
+from src.remote.base import FileInfo, iter_file_rows
+from src.analysis.photo_pairing_analyzer import (
+    EXTERNAL_SORT_MIN_FILES,
+    ExternalImageGroups,
+    build_imagegroups,
+)
 
 # Import from repository root - will work when running from agent directory
 import sys
@@ -26,14 +35,116 @@ from utils.pipeline_processor import (
     ValidationResult,
     ValidationStatus,
     PipelineConfig,
+    PipelinePlan,
+    CompiledPipelineGraph,
+    ValidationMemo,
     validate_specific_image,
     generate_expected_files,
     enumerate_paths_with_pairing,
     enumerate_all_paths,
+    build_pipeline_plan,
+    check_pipeline_path_count,
 )
 
 
-def flatten_imagegroups_to_specific_images(imagegroups: List[Dict[str, Any]]) -> List[SpecificImage]:
+# Compiled plans are small, but pipelines with many pairing/multi-method nodes
+# can have thousands of paths - keep only the most recently used versions.
+PLAN_CACHE_MAX_ENTRIES = 16
+
+_plan_cache: "OrderedDict[Tuple[str, int], PipelinePlan]" = OrderedDict()
+_plan_cache_lock = threading.Lock()
+
+# Parallel validation: images per chunk sent to a worker process, and the
+# collection size below which process start-up and result transfer cost
+# more than they save (validation stays serial)
+DEFAULT_VALIDATION_CHUNK_SIZE = 2000
+PARALLEL_VALIDATION_MIN_IMAGES = 10000
+
+# Problematic images kept per (termination type, status) for the report
+DEFAULT_ISSUE_SAMPLE_SIZE = 20
+
+
+def _compile_plan(
+    pipeline_config: PipelineConfig,
+    graph: Optional[CompiledPipelineGraph] = None,
+) -> PipelinePlan:
+    """
+    Enumerate pipeline paths and compile them into a PipelinePlan.
+
+    Args:
+        pipeline_config: PipelineConfig instance
+        graph: Optional compiled graph of pipeline_config, whose topology
+            and paths are reused instead of being recomputed
+
+    Returns:
+        PipelinePlan shared by every image validated against this pipeline
+
+    Raises:
+        PathLimitExceededError: If the pipeline has more than MAX_PIPELINE_PATHS paths
+    """
+    if graph is not None:
+        check_pipeline_path_count(graph.pipeline, topology=graph.topology)
+        return build_pipeline_plan(graph.paths)
+
+    check_pipeline_path_count(pipeline_config)
+    try:
+        all_paths = enumerate_paths_with_pairing(pipeline_config)
+    except NotImplementedError:
+        all_paths = enumerate_all_paths(pipeline_config)
+    return build_pipeline_plan(all_paths)
+
+
+def get_pipeline_plan(
+    pipeline_config: PipelineConfig,
+    pipeline_guid: Optional[str] = None,
+    pipeline_version: Optional[int] = None,
+    graph: Optional[CompiledPipelineGraph] = None,
+) -> PipelinePlan:
+    """
+    Get the compiled PipelinePlan for a pipeline version, compiling on a miss.
+
+    Pipeline versions are immutable on the server, so (guid, version) safely
+    identifies the graph. Without a guid or version the plan is compiled but
+    not cached.
+
+    Args:
+        pipeline_config: PipelineConfig instance for this pipeline version
+        pipeline_guid: Pipeline GUID (e.g., "pip_01hgw2bbg...")
+        pipeline_version: Pipeline version number
+        graph: Optional CompiledPipelineGraph of this pipeline version,
+            reused on a miss instead of enumerating paths again
+
+    Returns:
+        PipelinePlan for the pipeline
+    """
+    if not pipeline_guid or pipeline_version is None:
+        return _compile_plan(pipeline_config, graph)
+
+    key = (pipeline_guid, pipeline_version)
+    with _plan_cache_lock:
+        plan = _plan_cache.get(key)
+        if plan is not None:
+            _plan_cache.move_to_end(key)
+            return plan
+
+    plan = _compile_plan(pipeline_config, graph)
+
+    with _plan_cache_lock:
+        _plan_cache[key] = plan
+        _plan_cache.move_to_end(key)
+        while len(_plan_cache) > PLAN_CACHE_MAX_ENTRIES:
+            _plan_cache.popitem(last=False)
+
+    return plan
+
+
+def clear_pipeline_plan_cache() -> None:
+    """Drop all cached pipeline plans."""
+    with _plan_cache_lock:
+        _plan_cache.clear()
+
+
+def flatten_imagegroups_to_specific_images(imagegroups: Iterable[Dict[str, Any]]) -> List[SpecificImage]:
     """
     Flatten ImageGroups to individual SpecificImage objects.
 
@@ -111,17 +222,57 @@ def add_metadata_files(
     # Normalize extensions
     metadata_exts = {ext.lower() for ext in metadata_extensions}
 
-    # Build lookup from base_filename to SpecificImage
-    image_lookup = {si.base_filename: si for si in specific_images}
-
+    metadata_paths_by_stem: Dict[str, List[str]] = {}
     for file_info in all_files:
         if file_info.extension in metadata_exts:
-            # Metadata file - find matching SpecificImage by stem
-            base = file_info.stem
-            if base in image_lookup:
-                image_lookup[base].files.append(file_info.path)
-                # Keep files sorted
-                image_lookup[base].files.sort()
+            metadata_paths_by_stem.setdefault(file_info.stem, []).append(file_info.path)
+
+    attach_metadata_paths(specific_images, metadata_paths_by_stem)
+
+
+def attach_metadata_paths(
+    specific_images: List[SpecificImage],
+    metadata_paths_by_stem: Dict[str, List[str]]
+) -> None:
+    """
+    Add metadata file paths, already grouped by stem, to SpecificImage files.
+
+    Same effect as add_metadata_files() for callers that already grouped
+    the metadata files of a listing by stem (see ListingIndex).
+
+    Args:
+        specific_images: List of SpecificImage objects to augment
+        metadata_paths_by_stem: Stem -> metadata file paths
+
+    Side effects:
+        Modifies specific_images in-place by adding metadata files
+    """
+    for specific_image in specific_images:
+        paths = metadata_paths_by_stem.get(specific_image.base_filename)
+        if paths:
+            specific_image.files.extend(paths)
+            # Keep files sorted
+            specific_image.files.sort()
+
+
+def iter_specific_images(imagegroups: ExternalImageGroups) -> Iterator[SpecificImage]:
+    """
+    Yield SpecificImages, with metadata files attached, one ImageGroup at a time.
+
+    Out-of-core counterpart of flatten_imagegroups_to_specific_images() +
+    add_metadata_files(): metadata files come from the ImageGroup they were
+    sorted into, so no collection-wide stem index is built.
+
+    Args:
+        imagegroups: ExternalImageGroups built with metadata_entries
+
+    Yields:
+        SpecificImage objects, in the same order as flattening the groups
+    """
+    for group, metadata_paths_by_stem in imagegroups.iter_with_metadata():
+        specific_images = flatten_imagegroups_to_specific_images([group])
+        attach_metadata_paths(specific_images, metadata_paths_by_stem)
+        yield from specific_images
 
 
 def _determine_image_path(
@@ -191,12 +342,314 @@ def _determine_image_path(
     return result
 
 
+@dataclass
+class _ValidationTally:
+    """Aggregates folded from validated images; per-chunk tallies are merged."""
+    status_counts: Dict[str, int] = field(default_factory=lambda: {
+        'consistent': 0,
+        'consistent_with_warning': 0,
+        'partial': 0,
+        'inconsistent': 0,
+    })
+    termination_stats: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    path_counts: Dict[tuple, int] = field(default_factory=dict)
+    sample_size: int = 0
+    # termination_type -> status -> PARTIAL/INCONSISTENT image samples (unordered,
+    # trimmed to the worst sample_size whenever a bucket doubles)
+    samples: Dict[str, Dict[str, List[Dict[str, Any]]]] = field(default_factory=dict)
+
+    @property
+    def issues(self) -> int:
+        """Images with PARTIAL or INCONSISTENT overall status."""
+        return self.status_counts['partial'] + self.status_counts['inconsistent']
+
+    def add(self, validation_result: ValidationResult, matched_path: Optional[tuple]) -> None:
+        """
+        Count one validated image.
+
+        Args:
+            validation_result: Result of validate_specific_image()
+            matched_path: Node IDs of the path the image followed, if any
+        """
+        # Count overall status
+        self.status_counts[validation_result.overall_status.value.lower()] += 1
+
+        # Count per-termination status
+        for term_match in validation_result.termination_matches:
+            counts = self.termination_stats.get(term_match.termination_type)
+            if counts is None:
+                counts = {
+                    "CONSISTENT": 0,
+                    "CONSISTENT_WITH_WARNING": 0,
+                    "PARTIAL": 0,
+                    "INCONSISTENT": 0,
+                }
+                self.termination_stats[term_match.termination_type] = counts
+            counts[term_match.status.value] += 1
+
+            if self.sample_size and term_match.status in (ValidationStatus.PARTIAL, ValidationStatus.INCONSISTENT):
+                self._add_samples(term_match.termination_type, term_match.status.value, [{
+                    'base_filename': validation_result.base_filename,
+                    'completion_percentage': term_match.completion_percentage,
+                    'missing_files': term_match.missing_files,
+                    'extra_files': term_match.extra_files,
+                }])
+
+        # Track path for path_stats
+        if matched_path:
+            self.path_counts[matched_path] = self.path_counts.get(matched_path, 0) + 1
+
+    def merge(self, other: "_ValidationTally") -> None:
+        """
+        Add the counts of another tally (e.g. a validated chunk) to this one.
+
+        Args:
+            other: Tally to merge in
+        """
+        for status, count in other.status_counts.items():
+            self.status_counts[status] += count
+        for term_type, counts in other.termination_stats.items():
+            merged = self.termination_stats.setdefault(term_type, dict.fromkeys(counts, 0))
+            for status, count in counts.items():
+                merged[status] += count
+        for path_ids, count in other.path_counts.items():
+            self.path_counts[path_ids] = self.path_counts.get(path_ids, 0) + count
+        if self.sample_size:
+            for term_type, by_status in other.samples.items():
+                for status, samples in by_status.items():
+                    self._add_samples(term_type, status, samples)
+
+    def _add_samples(self, term_type: str, status: str, samples: List[Dict[str, Any]]) -> None:
+        """Add samples to a bucket, trimming it once it holds twice the sample size."""
+        bucket = self.samples.setdefault(term_type, {}).setdefault(status, [])
+        bucket.extend(samples)
+        if len(bucket) >= 2 * self.sample_size:
+            bucket[:] = self._worst(bucket)
+
+    def _worst(self, samples: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Lowest completion first, by filename on ties - independent of arrival order."""
+        return sorted(
+            samples, key=lambda sample: (sample['completion_percentage'], sample['base_filename'])
+        )[:self.sample_size]
+
+    def issue_samples(self) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """
+        Get the retained problematic images.
+
+        Returns:
+            Dict mapping termination_type to {status: samples}, at most
+            sample_size samples per status, lowest completion first
+        """
+        return {
+            term_type: {status: self._worst(samples) for status, samples in by_status.items()}
+            for term_type, by_status in self.samples.items()
+        }
+
+
+def _paths_by_termination(pipeline_plan: PipelinePlan) -> Dict[str, List[tuple]]:
+    """Build lookup: termination_type → list of (path_node_ids, path_data)."""
+    return {
+        term_type: [(p.node_ids, p.nodes) for p in planned_paths]
+        for term_type, planned_paths in pipeline_plan.paths_by_termination.items()
+    }
+
+
+# Per-process state of parallel validation workers, set once by the initializer
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_validation_worker(
+    pipeline_config: PipelineConfig,
+    pipeline_plan: PipelinePlan,
+    retain_results: bool,
+    sample_size: int
+) -> None:
+    """
+    Receive the pipeline once per worker process.
+
+    Args:
+        pipeline_config: PipelineConfig being validated against
+        pipeline_plan: Compiled plan for pipeline_config
+        retain_results: Whether chunks send their ValidationResults back
+        sample_size: Problematic images sampled per termination and status
+    """
+    _worker_state['pipeline_config'] = pipeline_config
+    _worker_state['pipeline_plan'] = pipeline_plan
+    _worker_state['paths_by_term'] = _paths_by_termination(pipeline_plan)
+    _worker_state['path_cache'] = {}
+    _worker_state['memo'] = ValidationMemo(pipeline_plan)
+    _worker_state['retain_results'] = retain_results
+    _worker_state['sample_size'] = sample_size
+
+
+def _validate_chunk(
+    specific_images: List[SpecificImage]
+) -> Tuple[List[ValidationResult], _ValidationTally]:
+    """
+    Validate a chunk of images in a worker process.
+
+    Args:
+        specific_images: Images to validate
+
+    Returns:
+        Tuple of (validation results in input order - empty unless results
+        are retained, tally for the chunk)
+    """
+    tally = _ValidationTally(sample_size=_worker_state['sample_size'])
+    validation_results = []
+    validated = iter_validation_results(
+        specific_images,
+        _worker_state['pipeline_config'],
+        _worker_state['pipeline_plan'],
+        memo=_worker_state['memo'],
+    )
+    for specific_image, vr in zip(specific_images, validated, strict=True):
+        if _worker_state['retain_results']:
+            validation_results.append(vr)
+        tally.add(vr, _determine_image_path(
+            specific_image, vr, _worker_state['paths_by_term'], _worker_state['path_cache']
+        ))
+    return validation_results, tally
+
+
+def _validate_parallel(
+    specific_images: Iterable[SpecificImage],
+    total_images: int,
+    pipeline_config: PipelineConfig,
+    pipeline_plan: PipelinePlan,
+    workers: int,
+    chunk_size: int,
+    progress_callback: Optional[Callable[[int, int, int], None]] = None,
+    retain_results: bool = True,
+    sample_size: int = 0
+) -> Tuple[List[ValidationResult], _ValidationTally]:
+    """
+    Validate images in chunks across a pool of worker processes.
+
+    The pipeline and its compiled plan are sent once per worker. Chunks are
+    cut from specific_images as workers become free (at most two per worker
+    in flight), so an out-of-core image stream is never fully materialized.
+    Chunk tallies are merged in chunk order so the output is identical to a
+    serial run. Progress is reported as chunks complete; an exception raised
+    by progress_callback (e.g. job cancellation) drops the chunks not yet
+    started.
+
+    Args:
+        specific_images: Images to validate (any iterable, consumed lazily)
+        total_images: Number of images in specific_images
+        pipeline_config: PipelineConfig instance
+        pipeline_plan: Compiled plan for pipeline_config
+        workers: Number of worker processes
+        chunk_size: Number of images per chunk
+        progress_callback: Optional callback(current, total, issues)
+        retain_results: Whether to collect every ValidationResult
+        sample_size: Problematic images sampled per termination and status
+
+    Returns:
+        Tuple of (validation results in input order, merged tally)
+    """
+    images = iter(specific_images)
+    chunks = enumerate(iter(lambda: list(islice(images, chunk_size)), []))
+    chunk_count = -(-total_images // chunk_size)
+    max_in_flight = 2 * workers
+
+    validation_results: List[ValidationResult] = []
+    tally = _ValidationTally(sample_size=sample_size)
+    completed: Dict[int, Tuple[List[ValidationResult], _ValidationTally]] = {}
+    next_chunk = 0
+
+    # Spawn (not fork): the agent is a threaded asyncio process, and frozen
+    # binaries rely on freeze_support() in the CLI entry point
+    executor = ProcessPoolExecutor(
+        max_workers=max(1, min(workers, chunk_count)),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_validation_worker,
+        initargs=(pipeline_config, pipeline_plan, retain_results, sample_size),
+    )
+    try:
+        in_flight: Dict[Any, Tuple[int, int]] = {}
+        exhausted = False
+        validated = 0
+        issues = 0
+        while True:
+            while not exhausted and len(in_flight) < max_in_flight:
+                item = next(chunks, None)
+                if item is None:
+                    exhausted = True
+                    break
+                idx, chunk = item
+                in_flight[executor.submit(_validate_chunk, chunk)] = (idx, len(chunk))
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx, size = in_flight.pop(future)
+                results, chunk_tally = future.result()
+                completed[idx] = (results, chunk_tally)
+                validated += size
+                issues += chunk_tally.issues
+                if progress_callback:
+                    progress_callback(validated, total_images, issues)
+
+            # Merge finished chunks in chunk order
+            while next_chunk in completed:
+                results, chunk_tally = completed.pop(next_chunk)
+                validation_results.extend(results)
+                tally.merge(chunk_tally)
+                next_chunk += 1
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    return validation_results, tally
+
+
+def iter_validation_results(
+    specific_images: Iterable[SpecificImage],
+    pipeline_config: PipelineConfig,
+    pipeline_plan: Optional[PipelinePlan] = None,
+    memo: Optional[ValidationMemo] = None
+) -> Iterator[ValidationResult]:
+    """
+    Validate images one at a time, yielding each ValidationResult.
+
+    Nothing is retained between images apart from the shape memo, so callers
+    that fold results as they arrive validate in bounded memory.
+
+    Args:
+        specific_images: Images to validate (any iterable, consumed lazily)
+        pipeline_config: PipelineConfig instance
+        pipeline_plan: Optional pre-compiled plan (see get_pipeline_plan())
+        memo: Optional ValidationMemo bound to pipeline_plan; a fresh one is
+            used when not provided
+
+    Yields:
+        ValidationResult for each image, in input order
+    """
+    if pipeline_plan is None:
+        pipeline_plan = memo.plan if memo is not None else _compile_plan(pipeline_config)
+    if memo is None:
+        # Images sharing the same shape (suffix + files minus camera_id/counter)
+        # are validated once and the result re-prefixed for the others
+        memo = ValidationMemo(pipeline_plan)
+
+    for specific_image in specific_images:
+        yield validate_specific_image(
+            specific_image, pipeline_config, show_progress=False, plan=pipeline_plan, memo=memo
+        )
+
+
 def run_pipeline_validation(
     files: List[FileInfo],
     pipeline_config: PipelineConfig,
     photo_extensions: Set[str],
     metadata_extensions: Set[str],
-    progress_callback: Optional[Callable[[int, int, int], None]] = None
+    progress_callback: Optional[Callable[[int, int, int], None]] = None,
+    pipeline_plan: Optional[PipelinePlan] = None,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_VALIDATION_CHUNK_SIZE,
+    retain_results: bool = True,
+    sample_size: int = DEFAULT_ISSUE_SAMPLE_SIZE
 ) -> Dict[str, Any]:
     """
     Run full pipeline validation on a file list.
@@ -209,6 +662,24 @@ def run_pipeline_validation(
         photo_extensions: Set of photo extensions
         metadata_extensions: Set of metadata extensions
         progress_callback: Optional callback(current, total, issues) for progress reporting
+        pipeline_plan: Optional pre-compiled plan (see get_pipeline_plan()).
+            Compiled from pipeline_config when not provided.
+        workers: Number of worker processes. With more than one worker,
+            collections of at least PARALLEL_VALIDATION_MIN_IMAGES images are
+            validated in parallel; smaller ones are validated serially.
+        chunk_size: Number of images sent to a worker at a time
+        retain_results: Keep every ValidationResult in 'validation_results'.
+            When False (streaming mode) results are folded into the counts
+            as they are produced and 'validation_results' is empty, so memory
+            no longer grows with the collection size.
+        sample_size: Number of PARTIAL/INCONSISTENT images kept per
+            termination type and status in 'issue_samples' (lowest
+            completion first)
+
+    Listings of at least EXTERNAL_SORT_MIN_FILES files are grouped out of
+    core (see ExternalImageGroups) and validated as a stream, so memory is
+    bounded regardless of collection size; smaller listings are grouped in
+    memory. Results are the same either way.
 
     Returns:
         Dict with validation results including status counts
@@ -223,108 +694,132 @@ def run_pipeline_validation(
     photo_exts = {ext.lower() for ext in photo_extensions}
     metadata_exts = {ext.lower() for ext in metadata_extensions}
 
+    if len(files) >= EXTERNAL_SORT_MIN_FILES:
+        # Steps 1-3 out of core: photo and metadata files are sorted by
+        # group ID and SpecificImages are produced one ImageGroup at a time
+        with ExternalImageGroups(
+            ((path, name, stem) for path, name, stem, ext, _ in iter_file_rows(files) if ext in photo_exts),
+            metadata_entries=(
+                (path, stem) for path, _, stem, ext, _ in iter_file_rows(files) if ext in metadata_exts
+            ),
+        ) as imagegroups:
+            return validate_specific_images(
+                iter_specific_images(imagegroups),
+                total_groups=imagegroups.group_count,
+                invalid_files=imagegroups.invalid_files,
+                pipeline_config=pipeline_config,
+                progress_callback=progress_callback,
+                pipeline_plan=pipeline_plan,
+                workers=workers,
+                chunk_size=chunk_size,
+                retain_results=retain_results,
+                sample_size=sample_size,
+                total_images=imagegroups.image_count,
+            )
+
     # Step 1: Filter to photo files and build ImageGroups
     photo_files = [f for f in files if f.extension in photo_exts]
     result = build_imagegroups(photo_files)
-    imagegroups = result['imagegroups']
-    invalid_files = result['invalid_files']
 
     # Step 2: Flatten to SpecificImages
-    specific_images = flatten_imagegroups_to_specific_images(imagegroups)
+    specific_images = flatten_imagegroups_to_specific_images(result['imagegroups'])
 
     # Step 3: Add metadata files
     add_metadata_files(specific_images, files, metadata_exts)
 
-    # Step 4: Pre-enumerate pipeline paths for path_stats tracking
-    try:
-        all_paths = enumerate_paths_with_pairing(pipeline_config)
-    except NotImplementedError:
-        all_paths = enumerate_all_paths(pipeline_config)
+    return validate_specific_images(
+        specific_images,
+        total_groups=len(result['imagegroups']),
+        invalid_files=result['invalid_files'],
+        pipeline_config=pipeline_config,
+        progress_callback=progress_callback,
+        pipeline_plan=pipeline_plan,
+        workers=workers,
+        chunk_size=chunk_size,
+        retain_results=retain_results,
+        sample_size=sample_size,
+    )
 
-    # Build lookup: termination_type → list of (path_node_ids, path_data)
-    paths_by_term: Dict[str, List[tuple]] = {}
-    for path in all_paths:
-        if not path:
-            continue
-        last_node = path[-1]
-        if last_node.get('type') != 'Termination' or last_node.get('truncated', False):
-            continue
-        term_type = last_node.get('term_type', 'Unknown')
-        node_ids = tuple(n['id'] for n in path if n.get('id'))
-        if term_type not in paths_by_term:
-            paths_by_term[term_type] = []
-        paths_by_term[term_type].append((node_ids, path))
-
-    # Path stats tracking
-    path_counts: Dict[tuple, int] = {}
-    path_cache: Dict[tuple, tuple] = {}
-
-    # Step 5: Run validation with progress reporting
-    validation_results = []
-    total_images = len(specific_images)
 
-    # Step 6: Aggregate results by overall status (as we go)
-    status_counts = {
-        'consistent': 0,
-        'consistent_with_warning': 0,
-        'partial': 0,
-        'inconsistent': 0,
-    }
+def validate_specific_images(
+    specific_images: Iterable[SpecificImage],
+    total_groups: int,
+    invalid_files: List[Dict[str, Any]],
+    pipeline_config: PipelineConfig,
+    progress_callback: Optional[Callable[[int, int, int], None]] = None,
+    pipeline_plan: Optional[PipelinePlan] = None,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_VALIDATION_CHUNK_SIZE,
+    retain_results: bool = True,
+    sample_size: int = DEFAULT_ISSUE_SAMPLE_SIZE,
+    total_images: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Validate SpecificImages (with metadata files attached) against a pipeline.
 
-    # Step 7: Collect per-termination statistics (for Trends tab)
-    termination_stats: Dict[str, Dict[str, int]] = {}
+    Second half of run_pipeline_validation(), for callers that built the
+    ImageGroups themselves (see ListingIndex). Arguments and result match
+    run_pipeline_validation().
 
-    # Validate each image with progress reporting
-    for idx, specific_image in enumerate(specific_images):
-        vr = validate_specific_image(specific_image, pipeline_config, show_progress=False)
-        validation_results.append(vr)
-        # Count overall status
-        if vr.overall_status == ValidationStatus.CONSISTENT:
-            status_counts['consistent'] += 1
-        elif vr.overall_status == ValidationStatus.CONSISTENT_WITH_WARNING:
-            status_counts['consistent_with_warning'] += 1
-        elif vr.overall_status == ValidationStatus.PARTIAL:
-            status_counts['partial'] += 1
-        elif vr.overall_status == ValidationStatus.INCONSISTENT:
-            status_counts['inconsistent'] += 1
+    Args:
+        specific_images: SpecificImage objects to validate (a list, or any
+            iterable consumed lazily when total_images is given)
+        total_groups: Number of ImageGroups the images were flattened from
+        invalid_files: Files rejected while building the ImageGroups
+        pipeline_config: PipelineConfig instance (already parsed)
+        progress_callback: Optional callback(current, total, issues)
+        pipeline_plan: Optional pre-compiled plan (see get_pipeline_plan())
+        workers: Number of worker processes
+        chunk_size: Number of images sent to a worker at a time
+        retain_results: Keep every ValidationResult in 'validation_results'
+        sample_size: Number of PARTIAL/INCONSISTENT images kept per
+            termination type and status in 'issue_samples'
+        total_images: Number of images in specific_images (default:
+            len(specific_images))
 
-        # Count per-termination status
-        for term_match in vr.termination_matches:
-            term_type = term_match.termination_type
-            match_status = term_match.status
+    Returns:
+        Dict with validation results including status counts
+    """
+    # Step 4: Compile pipeline paths once - shared by validation and path_stats
+    if pipeline_plan is None:
+        pipeline_plan = _compile_plan(pipeline_config)
+
+    # Step 5: Run validation with progress reporting, aggregating results by
+    # overall status, per termination (for Trends tab) and path (path_stats)
+    if total_images is None:
+        total_images = len(specific_images)
+
+    if workers > 1 and total_images >= max(PARALLEL_VALIDATION_MIN_IMAGES, chunk_size + 1):
+        validation_results, tally = _validate_parallel(
+            specific_images, total_images, pipeline_config, pipeline_plan,
+            workers, chunk_size, progress_callback,
+            retain_results=retain_results, sample_size=sample_size
+        )
+    else:
+        paths_by_term = _paths_by_termination(pipeline_plan)
+        path_cache: Dict[tuple, tuple] = {}
 
-            if term_type not in termination_stats:
-                termination_stats[term_type] = {
-                    "CONSISTENT": 0,
-                    "CONSISTENT_WITH_WARNING": 0,
-                    "PARTIAL": 0,
-                    "INCONSISTENT": 0,
-                }
+        validation_results = []
+        tally = _ValidationTally(sample_size=sample_size)
 
-            if match_status == ValidationStatus.CONSISTENT:
-                termination_stats[term_type]["CONSISTENT"] += 1
-            elif match_status == ValidationStatus.CONSISTENT_WITH_WARNING:
-                termination_stats[term_type]["CONSISTENT_WITH_WARNING"] += 1
-            elif match_status == ValidationStatus.PARTIAL:
-                termination_stats[term_type]["PARTIAL"] += 1
-            elif match_status == ValidationStatus.INCONSISTENT:
-                termination_stats[term_type]["INCONSISTENT"] += 1
+        # Validate each image with progress reporting (tee keeps a lazy
+        # image stream in step with its results)
+        specific_images, to_validate = tee(specific_images)
+        validated = iter_validation_results(to_validate, pipeline_config, pipeline_plan)
+        for idx, (specific_image, vr) in enumerate(zip(specific_images, validated, strict=True)):
+            if retain_results:
+                validation_results.append(vr)
+            tally.add(vr, _determine_image_path(specific_image, vr, paths_by_term, path_cache))
 
-        # Track path for path_stats
-        matched_path = _determine_image_path(
-            specific_image, vr, paths_by_term, path_cache
-        )
-        if matched_path:
-            path_counts[matched_path] = path_counts.get(matched_path, 0) + 1
+            # Report progress (every 2% or every 50 images, like backend)
+            if progress_callback:
+                progress_callback(idx + 1, total_images, tally.issues)
 
-        # Report progress (every 2% or every 50 images, like backend)
-        if progress_callback:
-            issues_so_far = status_counts['partial'] + status_counts['inconsistent']
-            progress_callback(idx + 1, total_images, issues_so_far)
+    status_counts = tally.status_counts
 
     # Build per-termination consistency counts for frontend (merges CONSISTENT_WITH_WARNING into CONSISTENT)
     by_termination = {}
-    for term_type, counts in termination_stats.items():
+    for term_type, counts in tally.termination_stats.items():
         by_termination[term_type] = {
             "CONSISTENT": counts.get("CONSISTENT", 0) + counts.get("CONSISTENT_WITH_WARNING", 0),
             "PARTIAL": counts.get("PARTIAL", 0),
@@ -334,15 +829,16 @@ def run_pipeline_validation(
     # Build path_stats output
     path_stats = [
         {"path": list(path_ids), "image_count": count}
-        for path_ids, count in path_counts.items()
+        for path_ids, count in tally.path_counts.items()
     ]
 
     return {
-        'total_images': len(specific_images),
-        'total_groups': len(imagegroups),
+        'total_images': total_images,
+        'total_groups': total_groups,
         'status_counts': status_counts,
         'by_termination': by_termination,
         'validation_results': validation_results,
+        'issue_samples': tally.issue_samples(),
         'invalid_files_count': len(invalid_files),
         'invalid_files': invalid_files,
         'path_stats': path_stats,
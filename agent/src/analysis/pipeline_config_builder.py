@@ -2,15 +2,19 @@
 Build PipelineConfig from JSON node/edge definitions.
 
 Shared by job_executor and CLI commands to convert server-format
-pipeline JSON into the PipelineConfig dataclass used by the validator.
+pipeline JSON into the PipelineConfig dataclass used by the validator,
+and into the CompiledPipelineGraph shared by every job for a pipeline
+version.
 
 Issue #108 - Remove CLI Direct Usage (Config Caching)
 """
 
 import logging
 import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger("shuttersense.agent.pipeline_config_builder")
 
@@ -18,6 +22,8 @@ logger = logging.getLogger("shuttersense.agent.pipeline_config_builder")
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 from utils.pipeline_processor import (
+    CompiledPipelineGraph,
+    compile_pipeline_graph,
     PipelineConfig,
     CaptureNode,
     FileNode,
@@ -117,3 +123,83 @@ def build_pipeline_config(
             pipeline_config.termination_nodes.append(node)
 
     return pipeline_config
+
+
+# Pipeline versions are immutable on the server; the bound only caps memory
+GRAPH_CACHE_MAX_ENTRIES = 16
+
+_graph_cache: "OrderedDict[Tuple[str, int], CompiledPipelineGraph]" = OrderedDict()
+_graph_cache_lock = threading.Lock()
+
+
+def compile_pipeline_json(
+    nodes_json: List[Dict[str, Any]],
+    edges_json: List[Dict[str, Any]],
+) -> CompiledPipelineGraph:
+    """
+    Build a CompiledPipelineGraph from JSON node and edge definitions.
+
+    Args:
+        nodes_json: List of node definitions from server
+        edges_json: List of edge definitions from server
+
+    Returns:
+        CompiledPipelineGraph, including the first Capture node's
+        filename_regex and camera_id_group
+    """
+    pipeline_config = build_pipeline_config(nodes_json, edges_json)
+    capture_properties: Dict[str, Any] = {}
+    if pipeline_config.capture_nodes:
+        capture_id = pipeline_config.capture_nodes[0].id
+        capture_properties = next(
+            (node.get("properties", {}) for node in nodes_json if node.get("id") == capture_id),
+            {},
+        )
+    return compile_pipeline_graph(pipeline_config, capture_properties=capture_properties)
+
+
+def get_compiled_pipeline_graph(
+    nodes_json: List[Dict[str, Any]],
+    edges_json: List[Dict[str, Any]],
+    pipeline_guid: Optional[str] = None,
+    pipeline_version: Optional[int] = None,
+) -> CompiledPipelineGraph:
+    """
+    Get the CompiledPipelineGraph for a pipeline version, compiling on a miss.
+
+    Without a guid or version the graph is compiled but not cached.
+
+    Args:
+        nodes_json: List of node definitions from server
+        edges_json: List of edge definitions from server
+        pipeline_guid: Pipeline GUID (e.g., "pip_01hgw2bbg...")
+        pipeline_version: Pipeline version number
+
+    Returns:
+        CompiledPipelineGraph for the pipeline version
+    """
+    if not pipeline_guid or pipeline_version is None:
+        return compile_pipeline_json(nodes_json, edges_json)
+
+    key = (pipeline_guid, pipeline_version)
+    with _graph_cache_lock:
+        graph = _graph_cache.get(key)
+        if graph is not None:
+            _graph_cache.move_to_end(key)
+            return graph
+
+    graph = compile_pipeline_json(nodes_json, edges_json)
+
+    with _graph_cache_lock:
+        _graph_cache[key] = graph
+        _graph_cache.move_to_end(key)
+        while len(_graph_cache) > GRAPH_CACHE_MAX_ENTRIES:
+            _graph_cache.popitem(last=False)
+
+    return graph
+
+
+def clear_compiled_pipeline_graph_cache() -> None:
+    """Drop all cached compiled pipeline graphs."""
+    with _graph_cache_lock:
+        _graph_cache.clear()
@@ -14,7 +14,9 @@ import re
 from dataclasses import dataclass, field
 from typing import Any, Dict, FrozenSet, List, Optional, Set
 
-from src.analysis.pipeline_config_builder import build_pipeline_config
+from utils.pipeline_processor import CompiledPipelineGraph
+
+from src.analysis.pipeline_config_builder import compile_pipeline_json
 
 logger = logging.getLogger(__name__)
 
@@ -50,11 +52,13 @@ class PipelineToolConfig:
 def extract_tool_config(
     nodes_json: List[Dict[str, Any]],
     edges_json: List[Dict[str, Any]],
+    graph: Optional[CompiledPipelineGraph] = None,
 ) -> PipelineToolConfig:
     """
     Extract tool configuration from Pipeline node/edge definitions.
 
-    Uses build_pipeline_config() to parse nodes, then extracts:
+    Uses the compiled pipeline graph (compile_pipeline_json()) for node
+    structure, then extracts:
     - filename_regex and camera_id_group from the first Capture node
     - photo/metadata extensions from File nodes (by exclusion against METADATA_EXTENSIONS)
     - require_sidecar inferred from sibling File nodes under common parents
@@ -63,6 +67,8 @@ def extract_tool_config(
     Args:
         nodes_json: Pipeline node definitions from server/cache
         edges_json: Pipeline edge definitions from server/cache
+        graph: Compiled graph of nodes_json/edges_json, e.g. from
+            get_compiled_pipeline_graph() (compiled here if omitted)
 
     Returns:
         PipelineToolConfig with all extracted configuration
@@ -70,7 +76,9 @@ def extract_tool_config(
     Raises:
         ValueError: If the Pipeline has no Capture node (FR-007)
     """
-    pipeline_config = build_pipeline_config(nodes_json, edges_json)
+    if graph is None:
+        graph = compile_pipeline_json(nodes_json, edges_json)
+    pipeline_config = graph.pipeline
 
     # --- Capture node: filename_regex and camera_id_group (FR-006, FR-007) ---
     if not pipeline_config.capture_nodes:
@@ -80,23 +88,15 @@ def extract_tool_config(
         )
 
     capture_node = pipeline_config.capture_nodes[0]
-    # Read properties from raw nodes_json (not available on CaptureNode dataclass)
-    capture_props = _get_node_properties(nodes_json, capture_node.id)
-
-    filename_regex = capture_props.get("filename_regex", "")
+    # Capture properties (not available on CaptureNode dataclass) are
+    # compiled into the graph
+    filename_regex = graph.capture_regex
     if not filename_regex:
         raise ValueError(
             f"Capture node '{capture_node.id}' is missing required "
             f"'filename_regex' property."
         )
-
-    camera_id_group_raw = capture_props.get("camera_id_group", "1")
-    try:
-        camera_id_group = int(camera_id_group_raw)
-    except (ValueError, TypeError):
-        camera_id_group = 1
-    if camera_id_group not in (1, 2):
-        camera_id_group = 1
+    camera_id_group = graph.camera_id_group
 
     # --- File nodes: photo and metadata extensions (FR-002, FR-003, FR-024) ---
     if not pipeline_config.file_nodes:
@@ -123,7 +123,7 @@ def extract_tool_config(
 
     # --- Sidecar inference (FR-004) ---
     require_sidecar = _infer_sidecar_requirements(
-        nodes_json, edges_json, photo_extensions, metadata_extensions
+        nodes_json, graph, photo_extensions, metadata_extensions
     )
 
     # --- Processing suffixes (FR-005) ---
@@ -142,20 +142,9 @@ def extract_tool_config(
     )
 
 
-def _get_node_properties(
-    nodes_json: List[Dict[str, Any]],
-    node_id: str,
-) -> Dict[str, Any]:
-    """Get properties dict for a node by ID from raw nodes_json."""
-    for node in nodes_json:
-        if node.get("id") == node_id:
-            return node.get("properties", {})
-    return {}
-
-
 def _infer_sidecar_requirements(
     nodes_json: List[Dict[str, Any]],
-    edges_json: List[Dict[str, Any]],
+    graph: CompiledPipelineGraph,
     photo_extensions: Set[str],
     metadata_extensions: Set[str],
 ) -> Set[str]:
@@ -170,8 +159,8 @@ def _infer_sidecar_requirements(
     sidecar requirements (FR-004).
 
     Args:
-        nodes_json: Raw pipeline node definitions
-        edges_json: Raw pipeline edge definitions
+        nodes_json: Raw pipeline node definitions (for File node properties)
+        graph: Compiled pipeline graph (for parent -> children edges)
         photo_extensions: Already-categorized image extensions
         metadata_extensions: Already-categorized metadata extensions
 
@@ -181,14 +170,6 @@ def _infer_sidecar_requirements(
     if not metadata_extensions:
         return set()
 
-    # Build parent -> children map from edges
-    parent_children: Dict[str, List[str]] = {}
-    for edge in edges_json:
-        from_id = edge.get("from") or edge.get("source")
-        to_id = edge.get("to") or edge.get("target")
-        if from_id and to_id:
-            parent_children.setdefault(from_id, []).append(to_id)
-
     # Build node lookup for quick access
     node_lookup: Dict[str, Dict[str, Any]] = {}
     for node in nodes_json:
@@ -200,7 +181,8 @@ def _infer_sidecar_requirements(
 
     # For each parent node, check if it has both non-optional image
     # and non-optional metadata File children
-    for parent_id, children_ids in parent_children.items():
+    for parent_id in graph.node_ids:
+        children_ids = graph.successors(parent_id)
         non_optional_image_exts: Set[str] = set()
         has_non_optional_metadata = False
 
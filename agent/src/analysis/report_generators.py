@@ -33,6 +33,26 @@ def _format_size(size_bytes: int) -> str:
     return f"{size:.2f} PB"
 
 
+def _size_bucket_label(bucket: int) -> str:
+    """Format a PhotoStats size histogram bucket as a size range label.
+
+    Args:
+        bucket: SizeHistogram bucket index.
+
+    Returns:
+        Range label (e.g., '8.00 MB - 16.00 MB', or '64.00 TB+' for the
+        open-ended last bucket).
+    """
+    from src.analysis.photostats_analyzer import size_bucket_bounds
+
+    lower, upper = size_bucket_bounds(bucket)
+    if upper is None:
+        return f"{_format_size(lower)}+"
+    if bucket == 0:
+        return "0 B"
+    return f"{_format_size(lower)} - {_format_size(upper)}"
+
+
 def generate_photostats_report(
     results: Dict[str, Any],
     location: str,
@@ -132,6 +152,47 @@ def generate_photostats_report(
                 )
             )
 
+        # Add file size summary (from per-extension histograms) and the
+        # size distribution of the photo extensions
+        size_stats = results.get('size_stats', {})
+        if size_stats:
+            size_rows: List[List[str]] = []
+            for ext, stats in size_stats.items():
+                count = stats.get('count', 0)
+                average = stats.get('total', 0) // count if count else 0
+                size_rows.append([
+                    ext.upper(),
+                    str(count),
+                    _format_size(stats.get('min') or 0),
+                    _format_size(average),
+                    _format_size(stats.get('max') or 0),
+                ])
+            sections.append(
+                ReportSection(
+                    title="File Sizes by Type",
+                    type="table",
+                    data={
+                        "headers": ["Type", "Files", "Smallest", "Average", "Largest"],
+                        "rows": size_rows
+                    },
+                    description="File size summary per file type"
+                )
+            )
+            image_buckets = results.get('image_size_stats', {}).get('buckets', [])
+            first = next((i for i, n in enumerate(image_buckets) if n), None)
+            if first is not None:
+                sections.append(
+                    ReportSection(
+                        title="Image Size Distribution",
+                        type="chart_bar",
+                        data={
+                            "labels": [_size_bucket_label(i) for i in range(first, len(image_buckets))],
+                            "values": image_buckets[first:]
+                        },
+                        description="Number of images by file size range"
+                    )
+                )
+
         # Add file pairing status
         orphaned_count = len(results.get('orphaned_images', [])) + len(results.get('orphaned_xmp', []))
         if orphaned_count > 0:
@@ -518,6 +579,33 @@ def generate_pipeline_validation_report(
                     )
                 )
 
+        # Sampled problem images (bounded per termination type and status)
+        issue_samples = validation_result.get('issue_samples', {})
+        rows = []
+        for term_type, by_status in sorted(issue_samples.items()):
+            for status in ("INCONSISTENT", "PARTIAL"):
+                for sample in by_status.get(status, []):
+                    missing = sample.get('missing_files', [])
+                    rows.append([
+                        sample['base_filename'],
+                        term_type,
+                        status,
+                        f"{sample.get('completion_percentage', 0.0):.0f}%",
+                        ", ".join(missing[:5]) + (f" (+{len(missing) - 5} more)" if len(missing) > 5 else ""),
+                    ])
+        if rows:
+            sections.append(
+                ReportSection(
+                    title="Sample Issues",
+                    type="table",
+                    data={
+                        "headers": ["Image", "Termination", "Status", "Completion", "Missing Files"],
+                        "rows": rows
+                    },
+                    description="Least complete images per termination type and status"
+                )
+            )
+
         # Warnings
         warnings = []
         if inconsistent > 0:
@@ -0,0 +1,380 @@
+"""
+Persistent listing cache for collection file listings.
+
+Stores the last file listing of each collection in a SQLite database at
+{data_dir}/listing-cache.sqlite3 so jobs do not have to re-list unchanged
+collections from scratch:
+
+- Local and SMB collections (adapters with supports_directory_rescan)
+  keep one row per directory with its modification time. A refresh stats
+  every known directory and lists again only the directories whose mtime
+  changed (entries added, removed or renamed); the files of unchanged
+  directories are read from the cache.
+- S3 and GCS collections reuse the stored listing while the adapter's
+  cheap listing_change_token() is unchanged.
+
+Each stored directory also keeps the input-state files digest of its
+files (compute_directory_file_digests), so file_list_hash() only rolls
+the stored digests up to the root instead of rehashing every file.
+
+Directory mtimes do not change when a file is modified in place, and the
+object store tokens only cover the top level of the prefix, so every
+listing is also bounded by max_age: older snapshots are listed in full.
+A listing reused by change token can miss changes inside existing
+sub-prefixes for up to max_age, so callers that must see every change
+(e.g. NO_CHANGE detection) pass reuse_by_token=False.
+
+Reads and writes are serialized; one cache may be shared across threads.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.config import get_cache_paths
+from src.input_state import compute_directory_file_digests, parse_last_modified, roll_up_directory_digests
+from src.remote.base import DirectoryScan, FileTable, StorageAdapter
+
+logger = logging.getLogger(__name__)
+
+# Bump when the schema changes; older databases are rebuilt
+LISTING_CACHE_SCHEMA_VERSION = 2
+
+# Concurrent directory stat/list requests during a refresh
+LISTING_RESCAN_WORKERS = 8
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    collection_key TEXT PRIMARY KEY,
+    location TEXT NOT NULL,
+    change_token TEXT,
+    full_scan_at REAL NOT NULL,
+    refreshed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS directories (
+    collection_key TEXT NOT NULL,
+    directory TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    subdirectories TEXT NOT NULL,
+    PRIMARY KEY (collection_key, directory)
+);
+CREATE TABLE IF NOT EXISTS files (
+    collection_key TEXT NOT NULL,
+    directory TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_modified TEXT
+);
+CREATE INDEX IF NOT EXISTS files_by_directory ON files (collection_key, directory);
+CREATE TABLE IF NOT EXISTS digests (
+    collection_key TEXT NOT NULL,
+    directory TEXT NOT NULL,
+    file_directory TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    PRIMARY KEY (collection_key, file_directory)
+);
+"""
+
+
+def _get_cache_file() -> Path:
+    """Get the listing cache database path, creating parent dir if needed."""
+    cache_file = get_cache_paths()["listing_cache_file"]
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    return cache_file
+
+
+class ListingCache:
+    """
+    Per-collection file listings persisted across jobs.
+
+    Usage:
+        >>> cache = ListingCache()
+        >>> files = cache.get_listing("local|/photos", LocalAdapter({}), "/photos",
+        ...                           max_age=timedelta(hours=24))
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, workers: int = LISTING_RESCAN_WORKERS):
+        """
+        Open (or create) the listing cache database.
+
+        Args:
+            db_path: Database file (defaults to {data_dir}/listing-cache.sqlite3)
+            workers: Concurrent directory requests during a refresh
+        """
+        self._db_path = Path(db_path) if db_path else _get_cache_file()
+        self._workers = workers
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != LISTING_CACHE_SCHEMA_VERSION:
+            self._conn.executescript(
+                "DROP TABLE IF EXISTS snapshots;"
+                "DROP TABLE IF EXISTS directories;"
+                "DROP TABLE IF EXISTS files;"
+                "DROP TABLE IF EXISTS digests;"
+            )
+            self._conn.execute(f"PRAGMA user_version = {LISTING_CACHE_SCHEMA_VERSION}")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def invalidate(self, collection_key: Optional[str] = None) -> None:
+        """
+        Drop stored listings so the next read lists in full.
+
+        Args:
+            collection_key: Collection to drop (None drops every collection)
+        """
+        with self._lock, self._conn:
+            for table in ("snapshots", "directories", "files", "digests"):
+                if collection_key is None:
+                    self._conn.execute(f"DELETE FROM {table}")
+                else:
+                    self._conn.execute(f"DELETE FROM {table} WHERE collection_key = ?", (collection_key,))
+
+    def get_listing(
+        self,
+        collection_key: str,
+        adapter: StorageAdapter,
+        location: str,
+        max_age: timedelta,
+        force_refresh: bool = False,
+        reuse_by_token: bool = True
+    ) -> FileTable:
+        """
+        Get a collection's listing, refreshing the stored snapshot as needed.
+
+        Args:
+            collection_key: Identifies the collection (and its storage)
+            adapter: Storage adapter for the collection
+            location: Location passed to the adapter
+            max_age: Snapshots whose last full listing is older than this
+                are listed in full again
+            force_refresh: List in full regardless of the stored snapshot
+            reuse_by_token: Whether an object store listing may be reused
+                while its change token is unchanged (the token only covers
+                the top level of the prefix, so the reused listing can be
+                stale for up to max_age)
+
+        Returns:
+            FileTable of the collection's files, in the order a directory
+            walk (local/SMB) or the adapter (S3/GCS) lists them
+        """
+        with self._lock:
+            snapshot = self._conn.execute(
+                "SELECT location, change_token, full_scan_at FROM snapshots WHERE collection_key = ?",
+                (collection_key,)
+            ).fetchone()
+            now = time.time()
+            full = (
+                force_refresh
+                or snapshot is None
+                or snapshot[0] != location
+                or now - snapshot[2] > max_age.total_seconds()
+            )
+            full_scan_at = now if full else snapshot[2]
+
+            if adapter.supports_directory_rescan:
+                try:
+                    return self._rescan(collection_key, adapter, location, full, full_scan_at)
+                except Exception as e:
+                    # Use the adapter's own listing (retries, error mapping);
+                    # the snapshot is rebuilt on the next read
+                    logger.warning("Listing cache rescan failed for %s: %s", collection_key, e)
+                    self._delete(collection_key)
+                    self._conn.commit()
+                    return adapter.list_files_with_metadata(location)
+
+            token = adapter.listing_change_token(location)
+            if reuse_by_token and not full and token is not None and token == snapshot[1]:
+                logger.warning(
+                    "Reusing stored listing for %s (change token unchanged); changes inside "
+                    "existing sub-prefixes are not seen until the listing is %s old",
+                    collection_key, max_age,
+                )
+                return self._load_files(collection_key, "")
+
+            files = adapter.list_files_with_metadata(location)
+            with self._conn:
+                self._delete(collection_key)
+                self._conn.executemany(
+                    "INSERT INTO files (collection_key, directory, path, size, last_modified) "
+                    "VALUES (?, '', ?, ?, ?)",
+                    ((collection_key, f.path, f.size, f.last_modified) for f in files)
+                )
+                self._save_digests(collection_key, "", ((f.path, f.size, f.last_modified) for f in files))
+                self._save_snapshot(collection_key, location, token, now, now)
+            return files
+
+    def _rescan(
+        self,
+        collection_key: str,
+        adapter: StorageAdapter,
+        location: str,
+        full: bool,
+        full_scan_at: float
+    ) -> FileTable:
+        """
+        Walk the collection, listing only directories whose mtime changed.
+
+        Every directory is queued as soon as its parent is known; results
+        are consumed depth-first (a directory's files, then each of its
+        subdirectories), so the listing order does not depend on timing.
+        """
+        previous: Dict[str, Tuple[int, List[str]]] = {}
+        if not full:
+            previous = {
+                directory: (mtime_ns, json.loads(subdirectories))
+                for directory, mtime_ns, subdirectories in self._conn.execute(
+                    "SELECT directory, mtime_ns, subdirectories FROM directories WHERE collection_key = ?",
+                    (collection_key,)
+                )
+            }
+
+        def refresh(directory: str) -> Tuple[int, List[str], Optional[DirectoryScan]]:
+            stored = previous.get(directory)
+            if stored is not None and adapter.directory_mtime(location, directory) == stored[0]:
+                return stored[0], stored[1], None
+            scan = adapter.scan_directory(location, directory)
+            return scan.mtime_ns, scan.directories, scan
+
+        files = FileTable()
+        directories: Dict[str, Tuple[int, List[str]]] = {}
+        scans: List[Tuple[str, DirectoryScan]] = []
+        executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="listing-rescan")
+        try:
+            pending = [("", executor.submit(refresh, ""))]
+            while pending:
+                directory, future = pending.pop()
+                mtime_ns, subdirectories, scan = future.result()
+                directories[directory] = (mtime_ns, subdirectories)
+                pending.extend(
+                    (subdirectory, executor.submit(refresh, subdirectory))
+                    for subdirectory in reversed(subdirectories)
+                )
+                if scan is None:
+                    files.extend(self._load_files(collection_key, directory))
+                else:
+                    files.append_rows(scan.files)
+                    scans.append((directory, scan))
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        removed = [directory for directory in previous if directory not in directories]
+        with self._conn:
+            if full:
+                self._delete(collection_key)
+            for directory in removed:
+                self._conn.execute(
+                    "DELETE FROM files WHERE collection_key = ? AND directory = ?", (collection_key, directory)
+                )
+                self._conn.execute(
+                    "DELETE FROM directories WHERE collection_key = ? AND directory = ?", (collection_key, directory)
+                )
+                self._conn.execute(
+                    "DELETE FROM digests WHERE collection_key = ? AND directory = ?", (collection_key, directory)
+                )
+            for directory, scan in scans:
+                self._conn.execute(
+                    "DELETE FROM files WHERE collection_key = ? AND directory = ?", (collection_key, directory)
+                )
+                self._conn.execute(
+                    "DELETE FROM digests WHERE collection_key = ? AND directory = ?", (collection_key, directory)
+                )
+                self._conn.executemany(
+                    "INSERT INTO files (collection_key, directory, path, size, last_modified) VALUES (?, ?, ?, ?, ?)",
+                    ((collection_key, directory, path, size, last_modified)
+                     for path, size, last_modified in scan.files)
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO directories (collection_key, directory, mtime_ns, subdirectories) "
+                    "VALUES (?, ?, ?, ?)",
+                    (collection_key, directory, scan.mtime_ns, json.dumps(scan.directories))
+                )
+                self._save_digests(collection_key, directory, scan.files)
+            self._save_snapshot(collection_key, location, None, full_scan_at, time.time())
+
+        logger.info(
+            "Listed %d files for %s (%d of %d directories rescanned, %d removed)",
+            len(files), collection_key, len(scans), len(directories), len(removed),
+        )
+        return files
+
+    def file_list_hash(self, collection_key: str) -> Optional[str]:
+        """
+        Get the input-state file list hash of a collection's stored listing.
+
+        Rolls the stored per-directory digests up to the root, so only the
+        directories rescanned by the last get_listing() were hashed file by
+        file. Equals InputStateComputer.compute_file_list_hash_from_file_info()
+        over the listing get_listing() returned.
+
+        Args:
+            collection_key: Identifies the collection (and its storage)
+
+        Returns:
+            64-character hex SHA-256 hash, or None if nothing is stored
+        """
+        with self._lock:
+            if self._conn.execute(
+                "SELECT 1 FROM snapshots WHERE collection_key = ?", (collection_key,)
+            ).fetchone() is None:
+                return None
+            digests = dict(self._conn.execute(
+                "SELECT file_directory, digest FROM digests WHERE collection_key = ?", (collection_key,)
+            ))
+        return roll_up_directory_digests(digests)[""]
+
+    def _load_files(self, collection_key: str, directory: str) -> FileTable:
+        """Read one directory's stored files, in listing order."""
+        files = FileTable()
+        files.append_rows(self._conn.execute(
+            "SELECT path, size, last_modified FROM files WHERE collection_key = ? AND directory = ? ORDER BY rowid",
+            (collection_key, directory)
+        ))
+        return files
+
+    def _save_snapshot(
+        self,
+        collection_key: str,
+        location: str,
+        change_token: Optional[str],
+        full_scan_at: float,
+        refreshed_at: float
+    ) -> None:
+        """Insert or update a collection's snapshot row."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO snapshots "
+            "(collection_key, location, change_token, full_scan_at, refreshed_at) VALUES (?, ?, ?, ?, ?)",
+            (collection_key, location, change_token, full_scan_at, refreshed_at)
+        )
+
+    def _save_digests(
+        self,
+        collection_key: str,
+        directory: str,
+        rows: Iterable[Tuple[str, int, Optional[str]]]
+    ) -> None:
+        """Store the files digests of one listed directory (caller commits)."""
+        digests = compute_directory_file_digests(
+            (path, size, parse_last_modified(last_modified)) for path, size, last_modified in rows
+        )
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO digests (collection_key, directory, file_directory, digest) VALUES (?, ?, ?, ?)",
+            ((collection_key, directory, file_directory, digest) for file_directory, digest in digests.items())
+        )
+
+    def _delete(self, collection_key: str) -> None:
+        """Delete every stored row of a collection (caller commits)."""
+        for table in ("snapshots", "directories", "files", "digests"):
+            self._conn.execute(f"DELETE FROM {table} WHERE collection_key = ?", (collection_key,))
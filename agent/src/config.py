@@ -39,6 +39,9 @@ ENV_CONFIG_PATH = "SHUSAI_CONFIG_PATH"
 DEFAULT_HEARTBEAT_INTERVAL = 30  # seconds
 DEFAULT_POLL_INTERVAL = 5  # seconds
 DEFAULT_LOG_LEVEL = "INFO"
+DEFAULT_VALIDATION_WORKERS = 1  # 1 = serial pipeline validation
+DEFAULT_VALIDATION_CHUNK_SIZE = 2000  # images per parallel validation chunk
+DEFAULT_LISTING_CACHE_MAX_AGE_HOURS = 0  # 0 = persistent listing cache disabled
 
 # URL validation regex
 URL_PATTERN = re.compile(
@@ -92,7 +95,7 @@ def get_cache_paths() -> dict:
 
     Returns:
         Dict with keys: data_dir, test_cache_dir, collection_cache_file,
-        team_config_cache_file, results_dir
+        team_config_cache_file, results_dir, listing_cache_file
     """
     data_dir = get_default_data_dir()
     return {
@@ -101,6 +104,7 @@ def get_cache_paths() -> dict:
         "collection_cache_file": data_dir / "collection-cache.json",
         "team_config_cache_file": data_dir / "team-config-cache.json",
         "results_dir": data_dir / "results",
+        "listing_cache_file": data_dir / "listing-cache.sqlite3",
     }
 
 
@@ -147,6 +151,13 @@ class AgentConfig:
         heartbeat_interval_seconds: Interval for heartbeat messages
         poll_interval_seconds: Interval for job polling
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
+        validation_workers: Worker processes for pipeline validation (1 = serial)
+        validation_chunk_size: Images per chunk sent to a validation worker
+        listing_cache_max_age_hours: Maximum age of a stored collection
+            listing before it is re-listed in full (0 = listing cache disabled).
+            S3/GCS listings reused by change token can miss changes inside
+            existing sub-prefixes for up to this long; NO_CHANGE detection
+            always re-lists them.
     """
 
     def __init__(
@@ -186,6 +197,9 @@ class AgentConfig:
         self._heartbeat_interval_seconds: int = DEFAULT_HEARTBEAT_INTERVAL
         self._poll_interval_seconds: int = DEFAULT_POLL_INTERVAL
         self._log_level: str = DEFAULT_LOG_LEVEL
+        self._validation_workers: int = DEFAULT_VALIDATION_WORKERS
+        self._validation_chunk_size: int = DEFAULT_VALIDATION_CHUNK_SIZE
+        self._listing_cache_max_age_hours: float = DEFAULT_LISTING_CACHE_MAX_AGE_HOURS
 
         # Load configuration
         self._load()
@@ -274,6 +288,36 @@ class AgentConfig:
         """Set the log level."""
         self._log_level = value
 
+    @property
+    def validation_workers(self) -> int:
+        """Get the number of worker processes used for pipeline validation."""
+        return self._validation_workers
+
+    @validation_workers.setter
+    def validation_workers(self, value: int) -> None:
+        """Set the number of worker processes used for pipeline validation."""
+        self._validation_workers = value
+
+    @property
+    def validation_chunk_size(self) -> int:
+        """Get the number of images per parallel validation chunk."""
+        return self._validation_chunk_size
+
+    @validation_chunk_size.setter
+    def validation_chunk_size(self, value: int) -> None:
+        """Set the number of images per parallel validation chunk."""
+        self._validation_chunk_size = value
+
+    @property
+    def listing_cache_max_age_hours(self) -> float:
+        """Get the maximum age of a stored collection listing (0 = disabled)."""
+        return self._listing_cache_max_age_hours
+
+    @listing_cache_max_age_hours.setter
+    def listing_cache_max_age_hours(self, value: float) -> None:
+        """Set the maximum age of a stored collection listing (0 = disabled)."""
+        self._listing_cache_max_age_hours = value
+
     @property
     def authorized_roots(self) -> List[str]:
         """Get the list of authorized local filesystem roots."""
@@ -323,6 +367,15 @@ class AgentConfig:
                 "poll_interval_seconds", DEFAULT_POLL_INTERVAL
             )
             self._log_level = data.get("log_level", DEFAULT_LOG_LEVEL)
+            self._validation_workers = data.get(
+                "validation_workers", DEFAULT_VALIDATION_WORKERS
+            )
+            self._validation_chunk_size = data.get(
+                "validation_chunk_size", DEFAULT_VALIDATION_CHUNK_SIZE
+            )
+            self._listing_cache_max_age_hours = data.get(
+                "listing_cache_max_age_hours", DEFAULT_LISTING_CACHE_MAX_AGE_HOURS
+            )
 
         except yaml.YAMLError as e:
             raise ConfigError(f"Failed to parse config file: {e}")
@@ -350,6 +403,9 @@ class AgentConfig:
             "heartbeat_interval_seconds": self._heartbeat_interval_seconds,
             "poll_interval_seconds": self._poll_interval_seconds,
             "log_level": self._log_level,
+            "validation_workers": self._validation_workers,
+            "validation_chunk_size": self._validation_chunk_size,
+            "listing_cache_max_age_hours": self._listing_cache_max_age_hours,
         }
 
         with open(self._config_path, "w") as f:
@@ -394,6 +450,22 @@ class AgentConfig:
                 f"poll_interval_seconds must be non-negative, got: {self.poll_interval_seconds}"
             )
 
+        # Validate pipeline validation parallelism
+        if self.validation_workers < 1:
+            raise ConfigValidationError(
+                f"validation_workers must be at least 1, got: {self.validation_workers}"
+            )
+        if self.validation_chunk_size < 1:
+            raise ConfigValidationError(
+                f"validation_chunk_size must be positive, got: {self.validation_chunk_size}"
+            )
+
+        # Validate listing cache staleness bound
+        if self.listing_cache_max_age_hours < 0:
+            raise ConfigValidationError(
+                f"listing_cache_max_age_hours must be non-negative, got: {self.listing_cache_max_age_hours}"
+            )
+
     def update_registration(
         self,
         agent_guid: str,
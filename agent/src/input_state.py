@@ -6,7 +6,8 @@ Computes deterministic hashes of collection state (files + configuration)
 to detect when a collection has not changed since the last analysis.
 
 The Input State hash is computed from:
-1. File list hash: SHA-256 of sorted (relative_path, size, mtime) tuples
+1. File list hash: root of a directory tree of SHA-256 digests over
+   (relative_path, size, mtime) tuples (see roll_up_directory_digests)
 2. Configuration hash: SHA-256 of sorted tool configuration
 
 When the Input State hash matches the previous result's hash, the collection
@@ -16,15 +17,116 @@ has not changed and execution can be skipped.
 import hashlib
 import json
 import logging
+import os
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, Iterable, List, Tuple, Optional
 
 from src.remote.base import FileInfo
+from src.remote.local_adapter import LocalFileEntry, walk_local_files
 
 
 logger = logging.getLogger("shuttersense.agent.input_state")
 
+# Files digest of a directory without files of its own
+_EMPTY_DIGEST = hashlib.sha256(b"").hexdigest()
+
+
+# Must match backend/src/services/input_state_service.py compute_directory_file_digests
+def compute_directory_file_digests(
+    files: Iterable[Tuple[str, int, float]]
+) -> Dict[str, str]:
+    """
+    Compute the files digest of every directory holding files.
+
+    Files are grouped by directory ("" for the collection root, otherwise
+    the path prefix up to and including the last "/"). A directory's
+    digest is the SHA-256 of its sorted "name|size|mtime\n" lines, with
+    mtime truncated to an integer.
+
+    Args:
+        files: (relative_path, size, mtime) tuples, in any order
+
+    Returns:
+        Dict of directory -> 64-character hex SHA-256 digest
+    """
+    lines: Dict[str, List[str]] = {}
+    for path, size, mtime in files:
+        slash = path.rfind("/")
+        lines.setdefault(path[:slash + 1], []).append(f"{path[slash + 1:]}|{size}|{int(mtime)}\n")
+
+    digests: Dict[str, str] = {}
+    for directory, directory_lines in lines.items():
+        directory_lines.sort()
+        digest = hashlib.sha256()
+        for line in directory_lines:
+            digest.update(line.encode("utf-8"))
+        digests[directory] = digest.hexdigest()
+    return digests
+
+
+def _parent_directory(directory: str) -> Tuple[str, str]:
+    """Split a non-root directory ("a/b/") into its parent ("a/") and name ("b")."""
+    slash = directory.rfind("/", 0, len(directory) - 1)
+    return directory[:slash + 1], directory[slash + 1:-1]
+
+
+# Must match backend/src/services/input_state_service.py roll_up_directory_digests
+def roll_up_directory_digests(files_digests: Dict[str, str]) -> Dict[str, str]:
+    """
+    Roll per-directory files digests up into tree digests.
+
+    A directory's tree digest is the SHA-256 of its files digest (or the
+    digest of no files) followed by "\n" and its sorted "name|tree_digest\n"
+    child lines. Only directories holding files, their ancestors and the
+    root ("") take part. The root's tree digest is the file list hash, so
+    a change in one directory only rehashes that directory's files and
+    the digests on its path to the root.
+
+    Args:
+        files_digests: Directory -> files digest, from
+            compute_directory_file_digests()
+
+    Returns:
+        Dict of directory -> tree digest, always including the root ""
+    """
+    children: Dict[str, List[str]] = {"": []}
+    for directory in files_digests:
+        while directory not in children:
+            children[directory] = []
+            directory = _parent_directory(directory)[0]
+
+    trees: Dict[str, str] = {}
+    # Deeper directories first, so children are done before their parent
+    for directory in sorted(children, key=lambda d: d.count("/"), reverse=True):
+        child_lines = children[directory]
+        child_lines.sort()
+        digest = hashlib.sha256(f"{files_digests.get(directory, _EMPTY_DIGEST)}\n".encode("utf-8"))
+        for line in child_lines:
+            digest.update(line.encode("utf-8"))
+        trees[directory] = digest.hexdigest()
+        if directory:
+            parent, name = _parent_directory(directory)
+            children[parent].append(f"{name}|{trees[directory]}\n")
+    return trees
+
+
+def parse_last_modified(last_modified: Optional[str]) -> int:
+    """
+    Convert a FileInfo last_modified string to the timestamp used in hashes.
+
+    Args:
+        last_modified: ISO 8601 timestamp, or None
+
+    Returns:
+        Integer Unix timestamp, or 0 if missing or unparseable
+    """
+    if last_modified:
+        try:
+            return int(datetime.fromisoformat(last_modified.replace("Z", "+00:00")).timestamp())
+        except (ValueError, AttributeError):
+            pass
+    return 0
+
 
 class InputStateComputer:
     """
@@ -50,6 +152,9 @@ class InputStateComputer:
         """
         Compute file list hash by scanning a local directory.
 
+        Walks the directory with walk_local_files(), the same walker
+        LocalAdapter lists with.
+
         Args:
             collection_path: Path to the collection directory
             extensions: Optional list of extensions to filter (e.g., [".dng", ".xmp"])
@@ -57,24 +162,38 @@ class InputStateComputer:
         Returns:
             Tuple of (hash, file_count)
         """
-        path = Path(collection_path)
-        files: List[Tuple[str, int, int]] = []
+        return self.compute_file_list_hash_from_entries(walk_local_files(collection_path), extensions)
+
+    def compute_file_list_hash_from_entries(
+        self,
+        entries: Iterable[LocalFileEntry],
+        extensions: Optional[List[str]] = None
+    ) -> Tuple[str, int]:
+        """
+        Compute file list hash from walk_local_files() entries.
+
+        Same hash as compute_file_list_hash_from_path() on the walked
+        directory, for callers that also keep the listing.
+
+        Args:
+            entries: (relative_path, size, mtime) entries
+            extensions: Optional list of extensions to filter (e.g., [".dng", ".xmp"])
 
-        for file_path in path.rglob("*"):
-            if not file_path.is_file():
-                continue
+        Returns:
+            Tuple of (hash, file_count)
+        """
+        files: List[Tuple[str, int, int]] = []
 
-            # Filter by extension if specified
-            if extensions and file_path.suffix.lower() not in extensions:
-                continue
+        for relative_path, size, mtime in entries:
+            # Filter by extension if specified (Path.suffix rules)
+            if extensions:
+                name = os.path.basename(relative_path)
+                dot = name.rfind(".")
+                suffix = name[dot:].lower() if 0 < dot < len(name) - 1 else ""
+                if suffix not in extensions:
+                    continue
 
-            try:
-                stat = file_path.stat()
-                relative_path = str(file_path.relative_to(path))
-                files.append((relative_path, stat.st_size, int(stat.st_mtime)))
-            except (OSError, ValueError) as e:
-                logger.warning(f"Failed to stat file {file_path}: {e}")
-                continue
+            files.append((relative_path, size, int(mtime)))
 
         return self._compute_file_list_hash(files), len(files)
 
@@ -93,19 +212,10 @@ class InputStateComputer:
         Returns:
             Tuple of (hash, file_count)
         """
-        files: List[Tuple[str, int, int]] = []
-
-        for info in file_infos:
-            # Parse last_modified string to timestamp, or use 0 if not available
-            mtime = 0
-            if info.last_modified:
-                try:
-                    # ISO format string to timestamp
-                    dt = datetime.fromisoformat(info.last_modified.replace("Z", "+00:00"))
-                    mtime = int(dt.timestamp())
-                except (ValueError, AttributeError):
-                    pass
-            files.append((info.path, info.size, mtime))
+        files: List[Tuple[str, int, int]] = [
+            (info.path, info.size, parse_last_modified(info.last_modified))
+            for info in file_infos
+        ]
 
         return self._compute_file_list_hash(files), len(files)
 
@@ -116,8 +226,9 @@ class InputStateComputer:
         """
         Compute SHA-256 hash of file list.
 
-        The file list is sorted by path to ensure deterministic ordering.
         Each file is represented as (relative_path, size_bytes, mtime_timestamp).
+        The hash is the root of the directory digest tree, so it does not
+        depend on the order of the files.
 
         Args:
             files: List of (path, size, mtime) tuples
@@ -125,19 +236,7 @@ class InputStateComputer:
         Returns:
             64-character hex SHA-256 hash
         """
-        # Sort by path for deterministic ordering
-        sorted_files = sorted(files, key=lambda f: f[0])
-
-        # Build canonical representation
-        # Format: "path|size|mtime\n" for each file
-        lines = []
-        for path, size, mtime in sorted_files:
-            lines.append(f"{path}|{size}|{mtime}")
-
-        content = "\n".join(lines)
-
-        # Compute SHA-256
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return roll_up_directory_digests(compute_directory_file_digests(files))[""]
 
     def compute_configuration_hash(
         self,
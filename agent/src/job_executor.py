@@ -11,13 +11,15 @@ Tasks: T092, T098
 import asyncio
 import hashlib
 import logging
-from typing import Dict, Any, List, Optional, Callable
+import os
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Callable, Tuple
 from dataclasses import dataclass
 
 from src.api_client import AgentApiClient
 from src.progress_reporter import ProgressReporter
 from src.result_signer import ResultSigner
 from src.config_loader import ApiConfigLoader
+from src.config import AgentConfig
 from src.chunked_upload import (
     ChunkedUploadClient,
     should_use_chunked_upload,
@@ -32,13 +34,16 @@ from src.input_state import (
 from src.analysis import (
     build_imagegroups,
     calculate_analytics,
-    analyze_pairing,
-    calculate_stats,
+    ExternalImageGroups,
+    EXTERNAL_SORT_MIN_FILES,
     run_pipeline_validation,
+    get_pipeline_plan,
     flatten_imagegroups_to_specific_images,
     add_metadata_files,
+    ListingIndex,
 )
-from src.remote.base import FileInfo
+from src.remote.base import FileInfo, FileTable, iter_file_rows
+from utils.filename_parser import FilenameParser
 
 
 logger = logging.getLogger("shuttersense.agent.executor")
@@ -74,20 +79,32 @@ class JobExecutor:
         api_client: API client for server communication
     """
 
-    def __init__(self, api_client: AgentApiClient):
+    # Files between "scanning" progress reports while a listing streams in
+    LISTING_PROGRESS_INTERVAL = 10_000
+
+    # Tools that analyze a collection listing (job snapshot, listing cache)
+    LISTING_TOOLS = frozenset({"photostats", "photo_pairing", "pipeline_validation"})
+
+    def __init__(self, api_client: AgentApiClient, agent_config: Optional[AgentConfig] = None):
         """
         Initialize the job executor.
 
         Args:
             api_client: API client for server communication
+            agent_config: Optional agent configuration for runtime settings
+                (e.g. pipeline validation parallelism). Defaults apply when omitted.
         """
         self._api_client = api_client
+        self._agent_config = agent_config
         self._progress_reporter: Optional[ProgressReporter] = None
         self._config_loader: Optional[ApiConfigLoader] = None
         self._result_signer: Optional[ResultSigner] = None
         self._event_loop: Optional[asyncio.AbstractEventLoop] = None
         self._cancel_requested = False
         self._current_job_guid: Optional[str] = None
+        self._listing_cache = None  # ListingCache, opened on first use
+        # Listing hashed by _check_no_change, handed to the tool if it runs
+        self._job_listing: Optional[FileTable] = None
 
     def request_cancellation(self) -> None:
         """
@@ -116,7 +133,7 @@ class JobExecutor:
         self,
         cached_file_info: List[Dict[str, Any]],
         collection_path: str
-    ) -> List[FileInfo]:
+    ) -> FileTable:
         """
         Convert cached FileInfo from server format to adapter FileInfo format.
 
@@ -133,36 +150,34 @@ class JobExecutor:
             collection_path: Collection location (used to extract relative paths)
 
         Returns:
-            List of FileInfo objects for adapter compatibility
+            FileTable of FileInfo rows for adapter compatibility
         """
         from urllib.parse import unquote
 
-        file_infos: List[FileInfo] = []
-
         # Normalize collection path (remove trailing slash for prefix matching)
         # Also URL-decode the collection path for consistent matching
         prefix = unquote(collection_path.rstrip("/") + "/") if collection_path else ""
 
-        for fi in cached_file_info:
-            key = fi.get("key", "")
-            if not key:
-                continue
+        def relative_rows():
+            for fi in cached_file_info:
+                key = fi.get("key", "")
+                if not key:
+                    continue
+
+                # URL-decode the key (S3/GCS inventory keys are URL-encoded)
+                decoded_key = unquote(key)
 
-            # URL-decode the key (S3/GCS inventory keys are URL-encoded)
-            decoded_key = unquote(key)
+                # Extract relative path by removing collection prefix
+                if prefix and decoded_key.startswith(prefix):
+                    relative_path = decoded_key[len(prefix):]
+                else:
+                    # If key doesn't match prefix, use full decoded key
+                    relative_path = decoded_key
 
-            # Extract relative path by removing collection prefix
-            if prefix and decoded_key.startswith(prefix):
-                relative_path = decoded_key[len(prefix):]
-            else:
-                # If key doesn't match prefix, use full decoded key
-                relative_path = decoded_key
+                yield relative_path, fi.get("size", 0), fi.get("last_modified")
 
-            file_infos.append(FileInfo(
-                path=relative_path,
-                size=fi.get("size", 0),
-                last_modified=fi.get("last_modified"),
-            ))
+        file_infos = FileTable()
+        file_infos.append_rows(relative_rows())
 
         logger.debug(
             f"Converted {len(file_infos)} cached FileInfo entries",
@@ -198,6 +213,182 @@ class JobExecutor:
 
         return True
 
+    def _get_cached_listing(
+        self,
+        job: Dict[str, Any],
+        collection_path: str,
+        connector: Optional[Dict[str, Any]],
+        reuse_by_token: bool = True
+    ) -> Optional[FileTable]:
+        """
+        Get the collection listing from the persistent listing cache.
+
+        Local and SMB collections re-list only directories whose mtime
+        changed since the stored listing; S3 and GCS collections reuse it
+        while the adapter's change token is unchanged (unless
+        reuse_by_token is False). Listings older than
+        listing_cache_max_age_hours are listed in full, as are listings for
+        jobs with force_listing_refresh or force_cloud_refresh.
+
+        Args:
+            job: Job data
+            collection_path: Collection location
+            connector: Connector info (None for local collections)
+            reuse_by_token: Whether a S3/GCS listing may be reused by change
+                token (the token does not cover changes inside existing
+                sub-prefixes)
+
+        Returns:
+            FileTable listing, or None if the listing cache is disabled
+        """
+        if self._agent_config is None or self._agent_config.listing_cache_max_age_hours <= 0:
+            return None
+
+        from datetime import timedelta
+
+        from src.cache.listing_cache import ListingCache
+        from src.remote.local_adapter import LocalAdapter
+
+        if self._listing_cache is None:
+            self._listing_cache = ListingCache()
+
+        if connector is not None:
+            adapter = self._get_storage_adapter(connector)
+            location = self._normalize_remote_path(collection_path, connector.get("type", ""))
+        else:
+            adapter = LocalAdapter({})
+            location = collection_path
+        collection_key = self._listing_cache_key(collection_path, connector)
+
+        parameters = job.get("parameters") or {}
+        force_refresh = bool(
+            parameters.get("force_listing_refresh", False)
+            or parameters.get("force_cloud_refresh", False)
+        )
+        files = self._listing_cache.get_listing(
+            collection_key,
+            adapter,
+            location,
+            max_age=timedelta(hours=self._agent_config.listing_cache_max_age_hours),
+            force_refresh=force_refresh,
+            reuse_by_token=reuse_by_token,
+        )
+        logger.info(
+            f"Using listing cache for tool execution ({len(files)} files)",
+            extra={"tool": job.get("tool"), "force_refresh": force_refresh}
+        )
+        return files
+
+    def _listing_cache_key(
+        self,
+        collection_path: str,
+        connector: Optional[Dict[str, Any]]
+    ) -> str:
+        """Get the listing cache key of a collection (connector GUID or "local", plus location)."""
+        if connector is not None:
+            location = self._normalize_remote_path(collection_path, connector.get("type", ""))
+            return f"{connector.get('guid')}|{location}"
+        return f"local|{collection_path}"
+
+    def _cached_file_list_hash(
+        self,
+        collection_path: str,
+        connector: Optional[Dict[str, Any]]
+    ) -> Optional[str]:
+        """
+        Get the file list hash of the listing just read from the listing cache.
+
+        The cache rolls up its stored per-directory digests, so only the
+        directories rescanned for this job were hashed file by file.
+
+        Args:
+            collection_path: Collection location
+            connector: Connector info (None for local collections)
+
+        Returns:
+            File list hash, or None if the listing did not come from the cache
+        """
+        if self._listing_cache is None:
+            return None
+        return self._listing_cache.file_list_hash(self._listing_cache_key(collection_path, connector))
+
+    def _list_remote_collection(
+        self,
+        job: Dict[str, Any],
+        collection_path: str,
+        connector: Dict[str, Any]
+    ) -> FileTable:
+        """
+        List a remote collection through the listing cache or its adapter.
+
+        The listing is hashed for NO_CHANGE detection, so a stored S3/GCS
+        listing is never reused by change token here: the token only covers
+        the top level of the prefix, and a stale listing would report a
+        false NO_CHANGE.
+
+        Args:
+            job: Job data
+            collection_path: Collection location
+            connector: Connector info
+
+        Returns:
+            FileTable listing, with paths as the tools list them
+        """
+        files = self._get_cached_listing(job, collection_path, connector, reuse_by_token=False)
+        if files is None:
+            adapter = self._get_storage_adapter(connector)
+            files = adapter.list_files_with_metadata(
+                self._normalize_remote_path(collection_path, connector.get("type", ""))
+            )
+        return files
+
+    def _hash_local_collection(
+        self,
+        job: Dict[str, Any],
+        collection_path: str
+    ) -> Tuple[str, int, Optional[FileTable]]:
+        """
+        Compute a local collection's file list hash, keeping its listing.
+
+        Walks the collection once: the same entries are hashed (exactly
+        like compute_file_list_hash_from_path()) and collected into the
+        FileTable LocalAdapter.list_files_with_metadata() would return.
+        With the listing cache enabled, the cached listing is hashed instead.
+
+        Args:
+            job: Job data
+            collection_path: Local collection path
+
+        Returns:
+            Tuple of (hash, file_count, listing); listing is None if the
+            path is not a directory as given (the tool lists it itself)
+        """
+        from datetime import datetime
+
+        from src.remote.local_adapter import walk_local_files
+
+        computer = get_input_state_computer()
+        files = self._get_cached_listing(job, collection_path, None)
+        if files is not None:
+            file_hash = self._cached_file_list_hash(collection_path, None)
+            if file_hash is None:
+                file_hash, _ = computer.compute_file_list_hash_from_file_info(files)
+            return file_hash, len(files), files
+
+        if not os.path.isdir(collection_path):
+            file_hash, file_count = computer.compute_file_list_hash_from_path(collection_path)
+            return file_hash, file_count, None
+
+        files = FileTable()
+
+        def entries():
+            for relative_path, size, mtime in walk_local_files(collection_path):
+                files.append(relative_path, size, datetime.fromtimestamp(mtime).isoformat())
+                yield relative_path, size, mtime
+
+        file_hash, file_count = computer.compute_file_list_hash_from_entries(entries())
+        return file_hash, file_count, files
+
     async def execute(self, job: Dict[str, Any]) -> None:
         """
         Execute a job.
@@ -217,6 +408,7 @@ class JobExecutor:
         # Reset cancellation state for new job
         self._cancel_requested = False
         self._current_job_guid = job_guid
+        self._job_listing = None
 
         # Store event loop for thread-safe progress callbacks
         self._event_loop = asyncio.get_running_loop()
@@ -351,6 +543,9 @@ class JobExecutor:
         finally:
             # Cleanup
             self._current_job_guid = None
+            self._job_listing = None
+            # Parsed stems are shared within a job, not across jobs
+            FilenameParser.clear_parse_cache()
             if self._progress_reporter:
                 await self._progress_reporter.close()
 
@@ -388,11 +583,16 @@ class JobExecutor:
         pipeline_data = config.get("pipeline")
         if pipeline_data and isinstance(pipeline_data, dict):
             try:
+                from src.analysis.pipeline_config_builder import get_compiled_pipeline_graph
                 from src.analysis.pipeline_tool_config import extract_tool_config
                 nodes_json = pipeline_data.get("nodes") or pipeline_data.get("nodes_json") or []
                 edges_json = pipeline_data.get("edges") or pipeline_data.get("edges_json") or []
                 if nodes_json:
-                    pipeline_tool_config = extract_tool_config(nodes_json, edges_json)
+                    graph = get_compiled_pipeline_graph(
+                        nodes_json, edges_json,
+                        pipeline_data.get("guid"), pipeline_data.get("version"),
+                    )
+                    pipeline_tool_config = extract_tool_config(nodes_json, edges_json, graph=graph)
                     logger.info("Extracted PipelineToolConfig from Pipeline %s", pipeline_data.get("guid", "?"))
             except Exception as e:
                 logger.warning("Failed to extract PipelineToolConfig, falling back to config: %s", e)
@@ -412,6 +612,22 @@ class JobExecutor:
                     }
                 )
 
+        # Without inventory FileInfo, use the listing _check_no_change already
+        # hashed, or else the persistent listing cache when enabled
+        job_listing, self._job_listing = self._job_listing, None
+        if cached_file_info is None and tool in self.LISTING_TOOLS:
+            if job_listing is not None:
+                cached_file_info = job_listing
+                logger.info(
+                    f"Using job listing snapshot for tool execution ({len(cached_file_info)} files)",
+                    extra={"tool": tool}
+                )
+            elif collection_path:
+                loop = asyncio.get_event_loop()
+                cached_file_info = await loop.run_in_executor(
+                    None, self._get_cached_listing, job, collection_path, connector
+                )
+
         if tool == "photostats":
             # Unified code path: connector=None means local, connector!=None means remote
             return await self._run_photostats(
@@ -532,21 +748,38 @@ class JobExecutor:
                             "file_info_source": job.get("file_info_source"),
                         }
                     )
+                    file_hash = None
                 else:
                     # No cache or force_cloud_refresh - list files from storage adapter
-                    adapter = self._get_storage_adapter(connector)
-                    file_infos = adapter.list_files_with_metadata(collection_path)
+                    # once; the tool reuses this listing if analysis is needed
+                    loop = asyncio.get_event_loop()
+                    file_infos = await loop.run_in_executor(
+                        None, self._list_remote_collection, job, collection_path, connector
+                    )
                     logger.info(
                         f"Listed files from cloud adapter ({len(file_infos)} files)",
                         extra={"job_guid": job_guid}
                     )
-                file_hash, file_count = computer.compute_file_list_hash_from_file_info(file_infos)
+                    if tool in self.LISTING_TOOLS:
+                        self._job_listing = file_infos
+                    file_hash = await loop.run_in_executor(
+                        None, self._cached_file_list_hash, collection_path, connector
+                    )
+                if file_hash is None:
+                    file_hash, file_count = computer.compute_file_list_hash_from_file_info(file_infos)
+                else:
+                    file_count = len(file_infos)
             else:
                 # Local collection
                 if not collection_path:
                     logger.warning("No collection path for local collection")
                     return False, None
-                file_hash, file_count = computer.compute_file_list_hash_from_path(collection_path)
+                loop = asyncio.get_event_loop()
+                file_hash, file_count, file_infos = await loop.run_in_executor(
+                    None, self._hash_local_collection, job, collection_path
+                )
+                if tool in self.LISTING_TOOLS:
+                    self._job_listing = file_infos
 
             # Compute configuration hash
             config_hash = computer.compute_configuration_hash(config)
@@ -769,17 +1002,20 @@ class JobExecutor:
                     file_infos = cached_file_info
                     logger.info(f"Using cached FileInfo ({len(file_infos)} files)")
                 else:
-                    # List files with metadata (same interface for local and remote)
+                    # Stream files with metadata (same interface for local and remote),
+                    # indexing them while the listing is still in progress
                     logger.info(f"Listing files from collection: {normalized_path}")
-                    file_infos = adapter.list_files_with_metadata(normalized_path)
-                    logger.info(f"Found {len(file_infos)} files in collection")
+                    file_infos = adapter.iter_files_with_metadata(normalized_path)
+                index = ListingIndex(self._iter_listing_with_progress(file_infos, 10, location_display))
+                del file_infos
+                logger.info(f"Found {index.file_count} files in collection")
 
                 # Report progress
                 self._sync_progress_callback(
                     stage="analyzing",
                     percentage=30,
-                    message=f"Analyzing {len(file_infos)} files...",
-                    files_scanned=len(file_infos)
+                    message=f"Analyzing {index.file_count} files...",
+                    files_scanned=index.file_count
                 )
 
                 # Override config extensions with Pipeline-derived values (Issue #217)
@@ -791,7 +1027,7 @@ class JobExecutor:
                     effective_config["require_sidecar"] = list(pipeline_tool_config.require_sidecar)
 
                 # Process files using shared analysis module (same for local and remote)
-                results = self._process_photostats_files(file_infos, effective_config)
+                results = self._process_photostats_index(index, effective_config)
 
                 # Add scan duration
                 results['scan_time'] = time.time() - start_time
@@ -906,9 +1142,10 @@ class JobExecutor:
                     all_files = cached_file_info
                     logger.info(f"Using cached FileInfo ({len(all_files)} files)")
                 else:
-                    # List files with metadata (same interface for local and remote)
+                    # Stream files with metadata (same interface for local and remote),
+                    # keeping only photo files as the listing comes in
                     logger.info(f"Listing files from collection: {normalized_path}")
-                    all_files = adapter.list_files_with_metadata(normalized_path)
+                    all_files = adapter.iter_files_with_metadata(normalized_path)
 
                 # Use Pipeline-derived extensions when available (Issue #217)
                 if pipeline_tool_config is not None:
@@ -916,7 +1153,13 @@ class JobExecutor:
                 else:
                     photo_extensions = set(config.get('photo_extensions', []))
                     photo_exts_lower = {ext.lower() for ext in photo_extensions}
-                photo_files = [f for f in all_files if f.extension in photo_exts_lower]
+                # Photo files are kept column-wise (no per-file objects) and
+                # streamed back out of the table for grouping
+                photo_files = FileTable(
+                    f for f in self._iter_listing_with_progress(all_files, 10, location_display)
+                    if f.extension in photo_exts_lower
+                )
+                del all_files
                 logger.info(f"Found {len(photo_files)} photo files in collection")
 
                 # Report progress
@@ -928,16 +1171,27 @@ class JobExecutor:
                 )
 
                 # Use Pipeline regex for filename parsing when available (Issue #217 US2)
+                parser_options = {}
                 if pipeline_tool_config is not None and pipeline_tool_config.filename_regex:
-                    result = build_imagegroups(
-                        photo_files,
-                        filename_regex=pipeline_tool_config.filename_regex,
-                        camera_id_group=pipeline_tool_config.camera_id_group,
+                    parser_options = {
+                        'filename_regex': pipeline_tool_config.filename_regex,
+                        'camera_id_group': pipeline_tool_config.camera_id_group,
+                    }
+
+                # Very large collections are grouped out of core: ImageGroups
+                # are streamed into the analytics one at a time
+                external_groups = None
+                if len(photo_files) >= EXTERNAL_SORT_MIN_FILES:
+                    external_groups = ExternalImageGroups(
+                        ((path, name, stem) for path, name, stem, _, _ in iter_file_rows(photo_files)),
+                        **parser_options
                     )
+                    imagegroups = external_groups
+                    invalid_files = external_groups.invalid_files
                 else:
-                    result = build_imagegroups(photo_files)
-                imagegroups = result['imagegroups']
-                invalid_files = result['invalid_files']
+                    result = build_imagegroups(photo_files, **parser_options)
+                    imagegroups = result['imagegroups']
+                    invalid_files = result['invalid_files']
 
                 # Report progress
                 self._sync_progress_callback(
@@ -953,7 +1207,11 @@ class JobExecutor:
 
                 # Calculate analytics with config for label resolution
                 # Camera entities are created server-side from camera_usage in results
-                analytics = calculate_analytics(imagegroups, analytics_config)
+                try:
+                    analytics = calculate_analytics(imagegroups, analytics_config)
+                finally:
+                    if external_groups is not None:
+                        external_groups.close()
 
                 scan_duration = time.time() - start_time
 
@@ -1079,8 +1337,9 @@ class JobExecutor:
                 error_message="Pipeline data not found in job config"
             )
 
-        # Create PipelineConfig from API data (outside executor to use self)
-        pipeline_config = self._create_pipeline_config_from_api(pipeline_data)
+        # Compile the pipeline graph from API data (outside executor to use self)
+        pipeline_graph = self._get_compiled_graph_from_api(pipeline_data)
+        pipeline_config = pipeline_graph.pipeline
 
         def run_display_graph():
             from datetime import datetime
@@ -1091,7 +1350,7 @@ class JobExecutor:
                 build_report_context,
             )
             from utils.report_renderer import ReportRenderer
-            from utils.pipeline_processor import enumerate_paths_with_pairing
+            from utils.pipeline_processor import check_pipeline_path_count
             from src.config_loader import DictConfigLoader
 
             # Create a config loader with the required attributes
@@ -1115,8 +1374,10 @@ class JobExecutor:
             # Build graph visualization and KPIs
             scan_start = datetime.now()
 
-            # Enumerate paths for display graph
-            all_paths = enumerate_paths_with_pairing(pipeline_config)
+            # Refuse pipelines whose paths would not fit in memory, then
+            # enumerate paths for display graph
+            check_pipeline_path_count(pipeline_config, topology=pipeline_graph.topology)
+            all_paths = pipeline_graph.paths
 
             scan_end = datetime.now()
             scan_duration = (scan_end - scan_start).total_seconds()
@@ -1205,9 +1466,11 @@ class JobExecutor:
 
         pipeline_name = pipeline_data.get('name', 'Unknown Pipeline')
         pipeline_guid = pipeline_data.get('guid')
+        pipeline_version = pipeline_data.get('version')
 
-        # Create PipelineConfig from API data (outside executor to use self)
-        pipeline_config = self._create_pipeline_config_from_api(pipeline_data)
+        # Compile the pipeline graph from API data (outside executor to use self)
+        pipeline_graph = self._get_compiled_graph_from_api(pipeline_data)
+        pipeline_config = pipeline_graph.pipeline
 
         def run_collection_validation():
             import time
@@ -1247,9 +1510,11 @@ class JobExecutor:
                 all_files = cached_file_info
                 logger.info(f"Using cached FileInfo ({len(all_files)} files)")
             else:
-                # List files with metadata (same interface for local and remote)
+                # Stream files with metadata (same interface for local and remote)
                 logger.info(f"Listing files from collection: {normalized_path}")
-                all_files = adapter.list_files_with_metadata(normalized_path)
+                all_files = FileTable(self._iter_listing_with_progress(
+                    adapter.iter_files_with_metadata(normalized_path), 10, location_display
+                ))
                 logger.info(f"Found {len(all_files)} files in collection")
 
             # Report progress
@@ -1286,13 +1551,31 @@ class JobExecutor:
                 files_scanned=0
             )
 
-            # Use SHARED analysis (same code path for local and remote)
+            # Paths are enumerated once per pipeline version and reused across jobs
+            pipeline_plan = get_pipeline_plan(
+                pipeline_config, pipeline_guid, pipeline_version, graph=pipeline_graph
+            )
+
+            # Parallel validation is opt-in through the agent config
+            parallel_options = {}
+            if self._agent_config is not None:
+                parallel_options = {
+                    'workers': self._agent_config.validation_workers,
+                    'chunk_size': self._agent_config.validation_chunk_size,
+                }
+
+            # Use SHARED analysis (same code path for local and remote).
+            # Per-image results are not needed for the report or results JSON,
+            # so stream them and keep only bounded samples of problem images.
             validation_result = run_pipeline_validation(
                 files=all_files,
                 pipeline_config=pipeline_config,
                 photo_extensions=photo_extensions,
                 metadata_extensions=metadata_extensions,
-                progress_callback=validation_progress
+                progress_callback=validation_progress,
+                pipeline_plan=pipeline_plan,
+                retain_results=False,
+                **parallel_options,
             )
 
             # Report progress
@@ -1355,11 +1638,28 @@ class JobExecutor:
         Returns:
             PipelineConfig instance
         """
-        from src.analysis.pipeline_config_builder import build_pipeline_config
+        return self._get_compiled_graph_from_api(pipeline_data).pipeline
+
+    def _get_compiled_graph_from_api(self, pipeline_data: Dict[str, Any]):
+        """
+        Get the CompiledPipelineGraph for API pipeline data.
+
+        Cached per pipeline guid + version, so repeated jobs for the same
+        pipeline version skip graph setup and path enumeration.
+
+        Args:
+            pipeline_data: Dict with 'nodes', 'edges', 'guid' and 'version' from API
+
+        Returns:
+            CompiledPipelineGraph instance
+        """
+        from src.analysis.pipeline_config_builder import get_compiled_pipeline_graph
 
-        return build_pipeline_config(
+        return get_compiled_pipeline_graph(
             nodes_json=pipeline_data.get("nodes", []),
             edges_json=pipeline_data.get("edges", []),
+            pipeline_guid=pipeline_data.get("guid"),
+            pipeline_version=pipeline_data.get("version"),
         )
 
     async def _run_collection_test(self, job: Dict[str, Any]) -> JobResult:
@@ -2488,6 +2788,40 @@ class JobExecutor:
             # Phase C failures should not fail the entire job
             return 0, False
 
+    def _iter_listing_with_progress(
+        self,
+        files: Iterable[FileInfo],
+        percentage: int,
+        location_display: str
+    ) -> Iterator[FileInfo]:
+        """
+        Pass a file listing through, reporting "scanning" progress as it streams in.
+
+        Reports every LISTING_PROGRESS_INTERVAL files through
+        _sync_progress_callback(), which also stops the listing if the job
+        was cancelled.
+
+        Args:
+            files: File listing (typically adapter.iter_files_with_metadata())
+            percentage: Progress percentage to report while listing
+            location_display: Collection location for progress messages
+
+        Yields:
+            The listing's FileInfo objects, unchanged
+        """
+        interval = self.LISTING_PROGRESS_INTERVAL
+        count = 0
+        for file_info in files:
+            count += 1
+            if count % interval == 0:
+                self._sync_progress_callback(
+                    stage="scanning",
+                    percentage=percentage,
+                    message=f"Scanning {location_display}... ({count} files listed)",
+                    files_scanned=count
+                )
+            yield file_info
+
     def _sync_progress_callback(
         self,
         stage: str,
@@ -2631,18 +2965,16 @@ class JobExecutor:
 
         return location
 
-    def _process_photostats_files(
+    def _process_photostats_index(
         self,
-        file_infos: list,
+        index: ListingIndex,
         config: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
-        Process file list to generate PhotoStats results.
-
-        Uses shared analysis modules for unified local/remote processing.
+        Generate PhotoStats results from an indexed file listing.
 
         Args:
-            file_infos: List of FileInfo objects with path and size
+            index: ListingIndex over the collection's files
             config: Configuration dict with photo_extensions, metadata_extensions, require_sidecar
 
         Returns:
@@ -2653,9 +2985,9 @@ class JobExecutor:
         require_sidecar = set(config.get('require_sidecar', []))
 
         # Use shared analysis modules (same code path as local)
-        stats_result = calculate_stats(file_infos, photo_extensions, metadata_extensions)
-        pairing_result = analyze_pairing(
-            file_infos, photo_extensions, metadata_extensions, require_sidecar
+        stats_result = index.calculate_stats(photo_extensions, metadata_extensions)
+        pairing_result = index.analyze_pairing(
+            photo_extensions, metadata_extensions, require_sidecar
         )
 
         # Combine results into PhotoStats format
@@ -2664,10 +2996,9 @@ class JobExecutor:
             'total_files': stats_result['total_files'],
             'total_size': stats_result['total_size'],
             'file_counts': stats_result['file_counts'],
-            'storage_by_type': {
-                ext: sum(sizes)
-                for ext, sizes in stats_result['file_sizes'].items()
-            },
+            'storage_by_type': stats_result['storage_by_type'],
+            'size_stats': stats_result['size_stats'],
+            'image_size_stats': stats_result['image_size_stats'],
             'orphaned_images': pairing_result['orphaned_images'],
             'orphaned_xmp': pairing_result['orphaned_xmp'],
         }
@@ -227,7 +227,7 @@ class AgentRunner:
             self.logger.warning(f"Initial heartbeat failed: {e}, continuing anyway...")
 
         # Create job executor and polling loop
-        job_executor = JobExecutor(self._api_client)
+        job_executor = JobExecutor(self._api_client, agent_config=self.config)
         self._polling_loop = JobPollingLoop(
             api_client=self._api_client,
             job_executor=job_executor,
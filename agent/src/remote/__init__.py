@@ -23,7 +23,7 @@ Note:
     dependencies when only local filesystem access is needed.
 """
 
-from src.remote.base import StorageAdapter, FileInfo
+from src.remote.base import StorageAdapter, FileInfo, FileRow, FileTable
 from src.remote.local_adapter import LocalAdapter
 
 # Lazy imports for cloud adapters to avoid requiring boto3/google-cloud-storage/smbprotocol
@@ -54,6 +54,8 @@ def __getattr__(name: str):
 __all__ = [
     "StorageAdapter",
     "FileInfo",
+    "FileRow",
+    "FileTable",
     "S3Adapter",
     "GCSAdapter",
     "SMBAdapter",
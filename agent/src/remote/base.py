@@ -7,20 +7,29 @@ All concrete adapters must implement list_files() and test_connection() methods.
 Design Pattern: Strategy pattern for pluggable storage backends
 """
 
+import hashlib
+import re
 from abc import ABC, abstractmethod
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Any, Tuple, Optional
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union, overload,
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     """
     Unified file information for both local and remote files.
 
     This is the canonical file representation for all storage backends,
     enabling shared analysis logic across local and remote collections.
+    Slotted, so neither FileInfo nor FileRow instances carry a __dict__.
 
     Attributes:
         path: File path relative to the storage location
@@ -69,6 +78,610 @@ class FileInfo:
         )
 
 
+def split_file_path(path: str) -> Tuple[str, str, str]:
+    """
+    Split a file path into (name, stem, extension).
+
+    Same rules as the FileInfo name, stem and extension properties: the
+    directory ends at the last '/', the extension starts at the last '.'
+    of the name and is lowercased with its dot.
+
+    Args:
+        path: File path relative to the storage location
+
+    Returns:
+        Tuple of (name, stem, extension)
+    """
+    name = path[path.rfind('/') + 1:]
+    dot = name.rfind('.')
+    if dot < 0:
+        return name, name, ""
+    return name, name[:dot], "." + name[dot + 1:].lower()
+
+
+class FileRow(FileInfo):
+    """
+    Read-only FileInfo view of one row of a FileTable.
+
+    Nothing is copied out of the table until an attribute is read, and
+    name/stem/extension come from the precomputed columns instead of being
+    re-split from the path. Compares equal to a FileInfo with the same
+    path, size and last_modified, and pickles as a plain FileInfo.
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "FileTable", index: int):
+        self._table = table
+        self._index = index
+
+    @property
+    def path(self) -> str:
+        table = self._table
+        return table._directories[table._directory_codes[self._index]] + table._name(self._index)
+
+    @property
+    def size(self) -> int:
+        return self._table._sizes[self._index]
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self._table._last_modified(self._index)
+
+    @property
+    def name(self) -> str:
+        return self._table._name(self._index)
+
+    @property
+    def extension(self) -> str:
+        table = self._table
+        return table._extensions[table._extension_codes[self._index]]
+
+    @property
+    def stem(self) -> str:
+        return self._table._name(self._index)[:self._table._stem_lengths[self._index]]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FileInfo):
+            return NotImplemented
+        return (self.path, self.size, self.last_modified) == (other.path, other.size, other.last_modified)
+
+    __hash__ = None  # type: ignore[assignment]  # like FileInfo (mutable dataclass)
+
+    def __reduce__(self):
+        return FileInfo, (self.path, self.size, self.last_modified)
+
+
+# ISO 8601 timestamps as produced by datetime.isoformat() and cloud listings
+_TIMESTAMP_PATTERN = re.compile(
+    r"(\d{4}-\d{2}-\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?(Z|[+-]\d{2}:\d{2})?"
+)
+
+# Timestamp format codes: 0 = no timestamp, 1 = stored verbatim
+_NO_TIMESTAMP = 0
+_RAW_TIMESTAMP = 1
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+@lru_cache(maxsize=4096)
+def _epoch_day(text: str) -> Optional[int]:
+    """Days since 1970-01-01 for a YYYY-MM-DD date, or None if invalid."""
+    try:
+        return date.fromisoformat(text).toordinal() - _EPOCH_ORDINAL
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _epoch_date(day: int) -> str:
+    """YYYY-MM-DD date for a number of days since 1970-01-01."""
+    return date.fromordinal(day + _EPOCH_ORDINAL).isoformat()
+
+
+class FileTable:
+    """
+    Compact columnar file listing.
+
+    Stores a listing as parallel columns instead of one FileInfo object per
+    file: interned directory and extension codes, file names packed into
+    shared string chunks with their stem lengths, sizes, and modification
+    timestamps packed as integers. Behaves like a read-only list of
+    FileInfo (len, iteration, indexing) whose items are FileRow views, so
+    existing analysis code works unchanged; hot loops can read the columns
+    directly through iter_split().
+
+    Timestamps are split into wall-clock seconds, fraction digits and a
+    shared format (fraction width and UTC offset suffix), and format back
+    to exactly the original string; any other timestamp text is kept
+    verbatim.
+
+    Usage:
+        >>> table = FileTable()
+        >>> table.append("2024/AB3D0001.CR3", 25000000, "2024-01-01T10:00:00")
+        >>> table[0].extension
+        '.cr3'
+        >>> [f.stem for f in table]
+        ['AB3D0001']
+    """
+
+    # Names per packed string chunk
+    NAME_CHUNK_SIZE = 1024
+
+    __slots__ = (
+        "_directories", "_directory_lookup", "_extensions", "_extension_lookup",
+        "_directory_codes", "_name_chunks", "_name_ends", "_pending_names",
+        "_extension_codes", "_stem_lengths", "_sizes",
+        "_mtime_seconds", "_mtime_fractions", "_mtime_codes",
+        "_mtime_formats", "_mtime_format_lookup", "_raw_mtimes",
+    )
+
+    def __init__(self, files: Iterable[FileInfo] = ()):
+        """
+        Create a table, optionally filled from FileInfo objects.
+
+        Args:
+            files: FileInfo objects to append
+        """
+        # Directory prefixes include their trailing '/', so path = prefix + name
+        self._directories: List[str] = [""]
+        self._directory_lookup: Dict[str, int] = {"": 0}
+        self._extensions: List[str] = [""]
+        self._extension_lookup: Dict[str, int] = {"": 0}
+        self._directory_codes = array("I")
+        # Full chunks of NAME_CHUNK_SIZE names joined into one string, with
+        # each name's end offset within its chunk; the last chunk is pending
+        self._name_chunks: List[str] = []
+        self._name_ends = array("I")
+        self._pending_names: List[str] = []
+        self._extension_codes = array("I")
+        self._stem_lengths = array("I")
+        self._sizes = array("q")
+        self._mtime_seconds = array("q")
+        self._mtime_fractions = array("I")
+        self._mtime_codes = array("H")
+        self._mtime_formats: List[Optional[Tuple[int, str]]] = [None, None]
+        self._mtime_format_lookup: Dict[Tuple[int, str], int] = {}
+        self._raw_mtimes: Dict[int, str] = {}
+        self.extend(files)
+
+    def append(self, path: str, size: int, last_modified: Optional[str] = None) -> None:
+        """
+        Append one file.
+
+        Args:
+            path: File path relative to the storage location
+            size: File size in bytes
+            last_modified: Last modification timestamp (if available)
+        """
+        self.append_rows(((path, size, last_modified),))
+
+    def append_rows(self, rows: Iterable[Tuple[str, int, Optional[str]]]) -> None:
+        """
+        Append (path, size, last_modified) tuples.
+
+        Faster than append() per file for large batches (e.g. a listing page
+        or cached inventory FileInfo).
+
+        Args:
+            rows: (path, size, last_modified) per file
+        """
+        directories = self._directories
+        directory_lookup = self._directory_lookup
+        extensions = self._extensions
+        extension_lookup = self._extension_lookup
+        pending = self._pending_names
+        name_ends = self._name_ends
+        chunk_size = self.NAME_CHUNK_SIZE
+        append_directory_code = self._directory_codes.append
+        append_extension_code = self._extension_codes.append
+        append_stem_length = self._stem_lengths.append
+        append_size = self._sizes.append
+        append_mtime = self._append_mtime
+
+        for path, size, last_modified in rows:
+            slash = path.rfind('/') + 1
+            directory = path[:slash]
+            name = path[slash:]
+            dot = name.rfind('.')
+            if dot < 0:
+                append_stem_length(len(name))
+                extension = ""
+            else:
+                append_stem_length(dot)
+                extension = "." + name[dot + 1:].lower()
+
+            directory_code = directory_lookup.get(directory)
+            if directory_code is None:
+                directory_code = directory_lookup[directory] = len(directories)
+                directories.append(directory)
+            append_directory_code(directory_code)
+
+            extension_code = extension_lookup.get(extension)
+            if extension_code is None:
+                extension_code = extension_lookup[extension] = len(extensions)
+                extensions.append(extension)
+            append_extension_code(extension_code)
+
+            name_ends.append((name_ends[-1] if pending else 0) + len(name))
+            pending.append(name)
+            if len(pending) == chunk_size:
+                self._name_chunks.append("".join(pending))
+                pending.clear()
+
+            append_size(size)
+            append_mtime(last_modified)
+
+    def extend(self, files: Iterable[FileInfo]) -> None:
+        """
+        Append FileInfo objects (or the rows of another FileTable).
+
+        Args:
+            files: FileInfo objects to append
+        """
+        if isinstance(files, FileTable):
+            self._extend_table(files)
+            return
+        self.append_rows((f.path, f.size, f.last_modified) for f in files)
+
+    def _extend_table(self, other: "FileTable") -> None:
+        """
+        Append the rows of another table column by column.
+
+        Interned directory, extension and timestamp format codes are
+        remapped and the other columns copied as they are, so merging
+        tables (e.g. concurrently listed shards) does not re-split paths or
+        re-parse timestamps.
+        """
+        if other is self:
+            other = FileTable(list(other))
+
+        mtime_codes = [_NO_TIMESTAMP, _RAW_TIMESTAMP]
+        for key in other._mtime_formats[2:]:
+            format_code = self._mtime_format_lookup.get(key)
+            if format_code is None:
+                if len(self._mtime_formats) > 0xFFFF:
+                    # Out of format codes: fall back to re-parsing every row
+                    self.append_rows(
+                        (path, size, other._last_modified(index))
+                        for index, (path, _, _, _, size) in enumerate(other.iter_split())
+                    )
+                    return
+                format_code = len(self._mtime_formats)
+                self._mtime_formats.append(key)
+                self._mtime_format_lookup[key] = format_code
+            mtime_codes.append(format_code)
+
+        directory_codes = [self._intern(self._directories, self._directory_lookup, d) for d in other._directories]
+        extension_codes = [self._intern(self._extensions, self._extension_lookup, e) for e in other._extensions]
+
+        offset = len(self._sizes)
+        self._directory_codes.extend(directory_codes[code] for code in other._directory_codes)
+        self._extension_codes.extend(extension_codes[code] for code in other._extension_codes)
+        self._stem_lengths.extend(other._stem_lengths)
+        self._sizes.extend(other._sizes)
+        self._mtime_seconds.extend(other._mtime_seconds)
+        self._mtime_fractions.extend(other._mtime_fractions)
+        self._mtime_codes.extend(mtime_codes[code] for code in other._mtime_codes)
+        for index, text in other._raw_mtimes.items():
+            self._raw_mtimes[offset + index] = text
+
+        if not self._pending_names:
+            # Chunk-aligned: full chunks and their offsets copy over as they are
+            self._name_chunks.extend(other._name_chunks)
+            self._name_ends.extend(other._name_ends)
+            self._pending_names.extend(other._pending_names)
+            return
+
+        pending = self._pending_names
+        name_ends = self._name_ends
+        chunk_size = self.NAME_CHUNK_SIZE
+        for name in other._iter_names():
+            name_ends.append((name_ends[-1] if pending else 0) + len(name))
+            pending.append(name)
+            if len(pending) == chunk_size:
+                self._name_chunks.append("".join(pending))
+                pending.clear()
+
+    @staticmethod
+    def _intern(values: List[str], lookup: Dict[str, int], value: str) -> int:
+        code = lookup.get(value)
+        if code is None:
+            code = lookup[value] = len(values)
+            values.append(value)
+        return code
+
+    def iter_split(self) -> Iterator[Tuple[str, str, str, str, int]]:
+        """
+        Iterate (path, name, stem, extension, size) per file, in order.
+
+        Reads the columns directly, without creating a FileRow per file.
+        """
+        directories = self._directories
+        extensions = self._extensions
+        for directory_code, name, extension_code, stem_length, size in zip(
+            self._directory_codes, self._iter_names(), self._extension_codes,
+            self._stem_lengths, self._sizes, strict=True,
+        ):
+            yield (
+                directories[directory_code] + name, name, name[:stem_length],
+                extensions[extension_code], size,
+            )
+
+    @property
+    def total_size(self) -> int:
+        """Sum of all file sizes in bytes."""
+        return sum(self._sizes)
+
+    def _name(self, index: int) -> str:
+        chunk_index, offset = divmod(index, self.NAME_CHUNK_SIZE)
+        if chunk_index == len(self._name_chunks):
+            return self._pending_names[offset]
+        start = self._name_ends[index - 1] if offset else 0
+        return self._name_chunks[chunk_index][start:self._name_ends[index]]
+
+    def _iter_names(self) -> Iterator[str]:
+        ends = self._name_ends
+        first = 0
+        for chunk in self._name_chunks:
+            start = 0
+            for index in range(first, first + self.NAME_CHUNK_SIZE):
+                end = ends[index]
+                yield chunk[start:end]
+                start = end
+            first += self.NAME_CHUNK_SIZE
+        yield from self._pending_names
+
+    def _append_mtime(self, last_modified: Optional[str]) -> None:
+        seconds = fraction = 0
+        code = _NO_TIMESTAMP
+        if last_modified is not None:
+            code = _RAW_TIMESTAMP
+            match = _TIMESTAMP_PATTERN.fullmatch(last_modified)
+            if match:
+                date, hour, minute, second, digits, suffix = match.groups()
+                day = _epoch_day(date)
+                hour, minute, second = int(hour), int(minute), int(second)
+                if day is not None and hour < 24 and minute < 60 and second < 60:
+                    key = (len(digits) if digits else 0, suffix or "")
+                    format_code = self._mtime_format_lookup.get(key)
+                    if format_code is None and len(self._mtime_formats) <= 0xFFFF:
+                        format_code = len(self._mtime_formats)
+                        self._mtime_formats.append(key)
+                        self._mtime_format_lookup[key] = format_code
+                    if format_code is not None:
+                        code = format_code
+                        seconds = day * 86400 + hour * 3600 + minute * 60 + second
+                        fraction = int(digits) if digits else 0
+            if code == _RAW_TIMESTAMP:
+                self._raw_mtimes[len(self._mtime_codes)] = last_modified
+        self._mtime_seconds.append(seconds)
+        self._mtime_fractions.append(fraction)
+        self._mtime_codes.append(code)
+
+    def _last_modified(self, index: int) -> Optional[str]:
+        code = self._mtime_codes[index]
+        if code == _NO_TIMESTAMP:
+            return None
+        if code == _RAW_TIMESTAMP:
+            return self._raw_mtimes[index]
+        width, suffix = self._mtime_formats[code]
+        day, seconds = divmod(self._mtime_seconds[index], 86400)
+        minutes, second = divmod(seconds, 60)
+        hour, minute = divmod(minutes, 60)
+        text = f"{_epoch_date(day)}T{hour:02d}:{minute:02d}:{second:02d}"
+        if width:
+            text = f"{text}.{self._mtime_fractions[index]:0{width}d}"
+        return text + suffix
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    @overload
+    def __getitem__(self, index: int) -> FileRow: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[FileRow]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[FileRow, List[FileRow]]:
+        if isinstance(index, slice):
+            return [FileRow(self, i) for i in range(*index.indices(len(self)))]
+        length = len(self._sizes)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("FileTable index out of range")
+        return FileRow(self, index)
+
+    def __iter__(self) -> Iterator[FileRow]:
+        for index in range(len(self._sizes)):
+            yield FileRow(self, index)
+
+    def __bool__(self) -> bool:
+        return bool(self._sizes)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (FileTable, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"FileTable({len(self)} files)"
+
+
+def iter_file_rows(files: Iterable[FileInfo]) -> Iterator[Tuple[str, str, str, str, int]]:
+    """
+    Iterate (path, name, stem, extension, size) for a file listing.
+
+    Reads a FileTable column-wise (see FileTable.iter_split()); any other
+    iterable of FileInfo has each path split once.
+
+    Args:
+        files: FileTable or iterable of FileInfo
+
+    Returns:
+        Iterator of (path, name, stem, extension, size) tuples, in order
+    """
+    if isinstance(files, FileTable):
+        return files.iter_split()
+    return ((f.path, *split_file_path(f.path), f.size) for f in files)
+
+
+def _iter_sharded_segments(
+    list_prefix: Callable[[str, bool], Tuple[FileTable, List[str]]],
+    prefix: str,
+    workers: int,
+    discovery_depth: int,
+) -> Iterator[Union[FileRow, FileTable]]:
+    """
+    Yield a sharded listing as objects and shard tables, in key order.
+
+    See list_prefix_sharded(). Every shard is submitted to the worker pool
+    as soon as discovery ends; each shard's table is yielded once it and
+    all earlier segments are done.
+    """
+    if workers <= 1 or discovery_depth <= 0:
+        yield list_prefix(prefix, False)[0]
+        return
+
+    # (sort key, object row or shard future)
+    segments: List[Tuple[str, Any]] = []
+    shards = [prefix]
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        for depth in range(discovery_depth):
+            if not shards or len(shards) >= workers:
+                break
+            listings = list(executor.map(lambda shard: list_prefix(shard, True), shards))
+            if depth == 0 and not listings[0][1]:
+                # Flat prefix: the delimiter listing was the full listing
+                yield listings[0][0]
+                return
+            shards = []
+            for files, children in listings:
+                segments.extend((row.path, row) for row in files)
+                shards.extend(children)
+
+        segments.extend(
+            (shard, executor.submit(lambda shard=shard: list_prefix(shard, False)[0]))
+            for shard in shards
+        )
+        segments.sort(key=itemgetter(0))
+        for _, segment in segments:
+            yield segment if isinstance(segment, FileRow) else segment.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def list_prefix_sharded(
+    list_prefix: Callable[[str, bool], Tuple[FileTable, List[str]]],
+    prefix: str,
+    workers: int,
+    discovery_depth: int,
+) -> FileTable:
+    """
+    List an object store prefix as shards listed concurrently.
+
+    Child prefixes are discovered with delimiter listings, breadth first,
+    until there are at least `workers` shards or `discovery_depth` levels
+    have been expanded. The shards are then listed in full on a pool of
+    `workers` threads. Object stores return keys in lexicographic order and
+    every shard covers a contiguous key range, so sorting the objects found
+    during discovery and the shards by key reproduces the sequential
+    listing order exactly.
+
+    Args:
+        list_prefix: Lists one prefix with the adapter's retry handling.
+            Called as list_prefix(prefix, delimited); returns the objects
+            and, when delimited, the child prefixes (common prefixes) whose
+            objects were not listed.
+        prefix: Key prefix to list ('' for the whole bucket)
+        workers: Maximum concurrent listing requests (1 lists sequentially)
+        discovery_depth: Maximum prefix levels expanded to find shards
+
+    Returns:
+        FileTable of all objects under prefix, in key order
+    """
+    files = FileTable()
+    for segment in _iter_sharded_segments(list_prefix, prefix, workers, discovery_depth):
+        if isinstance(segment, FileTable):
+            if not files:
+                files = segment
+            else:
+                files.extend(segment)
+        else:
+            files.append(segment.path, segment.size, segment.last_modified)
+    return files
+
+
+def iter_prefix_sharded(
+    list_prefix: Callable[[str, bool], Tuple[FileTable, List[str]]],
+    prefix: str,
+    workers: int,
+    discovery_depth: int,
+) -> Iterator[FileInfo]:
+    """
+    Stream an object store prefix listed as concurrent shards.
+
+    Same listing and order as list_prefix_sharded(), but files are yielded
+    shard by shard as soon as each shard (and every shard before it in key
+    order) has been listed, so callers can start on the first shards while
+    later ones are still being listed.
+
+    Args:
+        list_prefix: See list_prefix_sharded()
+        prefix: Key prefix to list ('' for the whole bucket)
+        workers: Maximum concurrent listing requests (1 lists sequentially)
+        discovery_depth: Maximum prefix levels expanded to find shards
+
+    Yields:
+        FileInfo per object under prefix, in key order
+    """
+    for segment in _iter_sharded_segments(list_prefix, prefix, workers, discovery_depth):
+        if isinstance(segment, FileTable):
+            yield from segment
+        else:
+            yield segment
+
+
+@dataclass
+class DirectoryScan:
+    """
+    One directory listed for an incremental listing refresh.
+
+    Attributes:
+        mtime_ns: Directory modification time (nanoseconds), read before
+            the directory was listed
+        files: (path, size, last_modified) per file directly in the directory
+        directories: Adapter directory references for its subdirectories
+    """
+    mtime_ns: int
+    files: List[Tuple[str, int, Optional[str]]]
+    directories: List[str]
+
+
+def listing_fingerprint(files: Iterable[FileInfo], directories: Iterable[str] = ()) -> str:
+    """
+    Fingerprint a (partial) listing for change checks.
+
+    Args:
+        files: Listed files
+        directories: Listed child prefixes/directories
+
+    Returns:
+        64-character hex SHA-256 of the paths, sizes, modification times
+        and child prefixes
+    """
+    digest = hashlib.sha256()
+    for f in files:
+        digest.update(f"{f.path}|{f.size}|{f.last_modified}\n".encode("utf-8"))
+    for directory in directories:
+        digest.update(f"{directory}/\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
 class StorageAdapter(ABC):
     """
     Abstract base class for remote storage adapters.
@@ -79,15 +692,22 @@ class StorageAdapter(ABC):
     Methods:
         list_files(): List all files in the storage location (paths only)
         list_files_with_metadata(): List files with size and metadata
+        iter_files_with_metadata(): Stream files with size and metadata
         test_connection(): Validate credentials and connectivity
 
     Usage:
         >>> adapter = S3Adapter(credentials)
         >>> files = adapter.list_files(location="bucket-name/prefix")
         >>> files_with_size = adapter.list_files_with_metadata(location="bucket-name/prefix")
+        >>> for f in adapter.iter_files_with_metadata(location="bucket-name/prefix"):
+        >>>     print(f.path)
         >>> success, message = adapter.test_connection()
     """
 
+    # Whether directory_mtime() and scan_directory() are implemented, so a
+    # stored listing can be refreshed by rescanning only changed directories
+    supports_directory_rescan = False
+
     def __init__(self, credentials: Dict[str, Any]):
         """
         Initialize storage adapter with credentials.
@@ -127,7 +747,7 @@ class StorageAdapter(ABC):
         pass
 
     @abstractmethod
-    def list_files_with_metadata(self, location: str) -> List[FileInfo]:
+    def list_files_with_metadata(self, location: str) -> FileTable:
         """
         List all files with metadata (size, modification time) at the specified location.
 
@@ -141,7 +761,7 @@ class StorageAdapter(ABC):
                 SMB: "/share-path/optional/prefix"
 
         Returns:
-            List of FileInfo objects with path and size
+            FileTable of the files (a read-only list of FileInfo) with path and size
 
         Raises:
             ConnectionError: If cannot connect to remote storage
@@ -155,6 +775,81 @@ class StorageAdapter(ABC):
         """
         pass
 
+    def iter_files_with_metadata(self, location: str) -> Iterator[FileInfo]:
+        """
+        Stream all files with metadata (size, modification time) at the specified location.
+
+        Yields the same files as list_files_with_metadata() while the listing
+        is still in progress, so callers can overlap listing with analysis
+        and never hold the full listing unless they keep it. Adapters
+        override this with a native streaming listing; the default lists
+        everything first.
+
+        Args:
+            location: Storage location path (see list_files_with_metadata())
+
+        Returns:
+            Iterator of FileInfo with path, size and last_modified
+
+        Raises:
+            ConnectionError: If cannot connect to remote storage
+            PermissionError: If credentials lack necessary permissions
+            ValueError: If location is invalid
+
+        Example:
+            >>> for f in adapter.iter_files_with_metadata("my-bucket/photos"):
+            >>>     print(f"{f.path}: {f.size} bytes")
+        """
+        return iter(self.list_files_with_metadata(location))
+
+    def directory_mtime(self, location: str, directory: str) -> int:
+        """
+        Get a directory's modification time for incremental listing refreshes.
+
+        Only called when supports_directory_rescan is True.
+
+        Args:
+            location: Storage location path (see list_files_with_metadata())
+            directory: Directory reference from scan_directory() ('' for the
+                location itself)
+
+        Returns:
+            Modification time in nanoseconds
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support directory rescans")
+
+    def scan_directory(self, location: str, directory: str) -> DirectoryScan:
+        """
+        List the files and subdirectories directly in one directory.
+
+        Only called when supports_directory_rescan is True. Walking from
+        directory '' through every returned subdirectory lists the same
+        files as list_files_with_metadata().
+
+        Args:
+            location: Storage location path (see list_files_with_metadata())
+            directory: Directory reference ('' for the location itself)
+
+        Returns:
+            DirectoryScan with the directory's mtime, files and subdirectories
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support directory rescans")
+
+    def listing_change_token(self, location: str) -> Optional[str]:
+        """
+        Get a cheap token that changes when the listing changes.
+
+        Used to decide whether a stored listing can be reused without listing
+        everything again. The default (None) means no cheap check exists.
+
+        Args:
+            location: Storage location path (see list_files_with_metadata())
+
+        Returns:
+            Opaque token, or None if the adapter has no cheap change check
+        """
+        return None
+
     @abstractmethod
     def test_connection(self) -> Tuple[bool, str]:
         """
@@ -8,13 +8,15 @@ Implements exponential backoff retry for transient failures (FR-012: 3 retries).
 import json
 import logging
 import time
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
 from google.cloud import storage
 from google.cloud.exceptions import GoogleCloudError, Forbidden, NotFound
 from google.auth.exceptions import GoogleAuthError
 
-from src.remote.base import StorageAdapter, FileInfo
+from src.remote.base import (
+    StorageAdapter, FileInfo, FileTable, iter_prefix_sharded, list_prefix_sharded, listing_fingerprint,
+)
 
 
 logger = logging.getLogger("shuttersense.agent.remote.gcs")
@@ -48,6 +50,7 @@ class GCSAdapter(StorageAdapter):
     Features:
         - Exponential backoff retry (3 attempts per FR-012)
         - Paginated listing for large buckets
+        - Concurrent listing of child prefixes (LIST_WORKERS shards)
         - Service account authentication
         - Comprehensive error handling with actionable messages
 
@@ -62,6 +65,10 @@ class GCSAdapter(StorageAdapter):
     INITIAL_BACKOFF = 1.0  # seconds
     BACKOFF_MULTIPLIER = 2.0
 
+    # Concurrent prefix-sharded listing (list_files_with_metadata)
+    LIST_WORKERS = 8
+    SHARD_DISCOVERY_DEPTH = 2
+
     def __init__(self, credentials: Dict[str, Any]):
         """
         Initialize GCS adapter with service account credentials.
@@ -169,18 +176,23 @@ class GCSAdapter(StorageAdapter):
 
         return files
 
-    def list_files_with_metadata(self, location: str) -> List[FileInfo]:
+    def list_files_with_metadata(self, location: str) -> FileTable:
         """
         List all files with metadata (size, modification time) in GCS bucket/prefix.
 
         Uses blob properties which are included in the list operation.
         No additional API calls needed beyond the listing operation.
 
+        Child prefixes are discovered with delimiter listings and listed as
+        LIST_WORKERS concurrent shards (see list_prefix_sharded()), each with
+        its own retries. Files are returned in the same name order as a
+        sequential listing.
+
         Args:
             location: GCS location in format "bucket-name" or "bucket-name/prefix"
 
         Returns:
-            List of FileInfo objects with path, size, and last_modified
+            FileTable with path, size, and last_modified per file
 
         Raises:
             ValueError: If location format is invalid
@@ -190,31 +202,118 @@ class GCSAdapter(StorageAdapter):
         # Parse bucket and prefix from location
         parts = location.split("/", 1)
         bucket_name = parts[0]
-        prefix = parts[1] if len(parts) > 1 else None
+        prefix = parts[1] if len(parts) > 1 else ""
+
+        files = list_prefix_sharded(
+            lambda shard, delimited: self._list_prefix_with_metadata(bucket_name, shard, delimited),
+            prefix,
+            workers=self.LIST_WORKERS,
+            discovery_depth=self.SHARD_DISCOVERY_DEPTH,
+        )
+
+        total_size = files.total_size
+        logger.info(
+            f"Listed {len(files)} files ({total_size} bytes) from GCS bucket={bucket_name} prefix={prefix or None}"
+        )
+        return files
+
+    def iter_files_with_metadata(self, location: str) -> Iterator[FileInfo]:
+        """
+        Stream all files with metadata in GCS bucket/prefix.
+
+        Same listing as list_files_with_metadata(), yielded shard by shard in
+        name order as soon as each shard and every shard before it has been
+        listed (see iter_prefix_sharded()).
+
+        Args:
+            location: GCS location in format "bucket-name" or "bucket-name/prefix"
+
+        Returns:
+            Iterator of FileInfo with path, size, and last_modified
 
-        files: List[FileInfo] = []
+        Raises:
+            ConnectionError: If cannot connect after retries
+            PermissionError: If credentials lack list permissions
+        """
+        parts = location.split("/", 1)
+        bucket_name = parts[0]
+        prefix = parts[1] if len(parts) > 1 else ""
 
+        return iter_prefix_sharded(
+            lambda shard, delimited: self._list_prefix_with_metadata(bucket_name, shard, delimited),
+            prefix,
+            workers=self.LIST_WORKERS,
+            discovery_depth=self.SHARD_DISCOVERY_DEPTH,
+        )
+
+    def listing_change_token(self, location: str) -> Optional[str]:
+        """
+        Fingerprint the top level of a GCS bucket/prefix.
+
+        One delimiter listing: the objects directly under the prefix and its
+        child prefixes. Adding or removing top-level folders or files changes
+        the token; changes deeper in existing folders do not, so callers
+        reusing a stored listing must also bound its age.
+
+        Args:
+            location: GCS location in format "bucket-name" or "bucket-name/prefix"
+
+        Returns:
+            64-character hex fingerprint
+        """
+        parts = location.split("/", 1)
+        bucket_name = parts[0]
+        prefix = parts[1] if len(parts) > 1 else ""
+
+        files, child_prefixes = self._list_prefix_with_metadata(bucket_name, prefix, delimited=True)
+        return listing_fingerprint(files, child_prefixes)
+
+    def _list_prefix_with_metadata(
+        self,
+        bucket_name: str,
+        prefix: str,
+        delimited: bool = False
+    ) -> Tuple[FileTable, List[str]]:
+        """
+        List one prefix with retries.
+
+        Args:
+            bucket_name: Bucket name
+            prefix: Blob name prefix
+            delimited: List only the blobs directly under prefix and
+                return the child prefixes (delimiter="/")
+
+        Returns:
+            Tuple of (FileTable of the listed blobs, child prefixes)
+
+        Raises:
+            ValueError: If the bucket does not exist
+            ConnectionError: If cannot connect after retries
+            PermissionError: If credentials lack list permissions
+        """
         for attempt in range(self.MAX_RETRIES):
             try:
                 bucket = self.client.bucket(bucket_name)
 
                 # List blobs with prefix - includes size and updated properties
-                blobs = bucket.list_blobs(prefix=prefix)
+                blobs = bucket.list_blobs(
+                    prefix=prefix or None,
+                    delimiter="/" if delimited else None
+                )
 
+                files = FileTable()
                 for blob in blobs:
                     # Skip directory markers (end with /)
                     if not blob.name.endswith("/"):
-                        files.append(FileInfo(
-                            path=blob.name,
-                            size=blob.size or 0,
-                            last_modified=blob.updated.isoformat() if blob.updated else None
-                        ))
+                        files.append(
+                            blob.name,
+                            blob.size or 0,
+                            blob.updated.isoformat() if blob.updated else None,
+                        )
 
-                total_size = sum(f.size for f in files)
-                logger.info(
-                    f"Listed {len(files)} files ({total_size} bytes) from GCS bucket={bucket_name} prefix={prefix}"
-                )
-                return files
+                # Common prefixes are only known once every page was read
+                child_prefixes = sorted(blobs.prefixes) if delimited else []
+                return files, child_prefixes
 
             except Forbidden as e:
                 logger.error(f"GCS permission error bucket={bucket_name} error={e}")
@@ -232,7 +331,8 @@ class GCSAdapter(StorageAdapter):
                 if attempt < self.MAX_RETRIES - 1:
                     backoff = self.INITIAL_BACKOFF * (self.BACKOFF_MULTIPLIER ** attempt)
                     logger.warning(
-                        f"GCS list_files_with_metadata attempt {attempt + 1} failed, retrying in {backoff}s error={e}"
+                        f"GCS list_files_with_metadata attempt {attempt + 1} failed for prefix={prefix}, "
+                        f"retrying in {backoff}s error={e}"
                     )
                     time.sleep(backoff)
                 else:
@@ -246,7 +346,7 @@ class GCSAdapter(StorageAdapter):
                 logger.error(f"GCS unexpected error: {e} bucket={bucket_name}")
                 raise ConnectionError(f"Unexpected error accessing GCS: {str(e)}")
 
-        return files
+        return FileTable(), []
 
     def test_connection(self) -> Tuple[bool, str]:
         """
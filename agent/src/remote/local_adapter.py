@@ -7,10 +7,101 @@ unified processing with remote collections (S3, GCS, SMB).
 Design Pattern: Strategy pattern - same interface as remote adapters
 """
 
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 
-from src.remote.base import StorageAdapter, FileInfo
+from src.remote.base import StorageAdapter, DirectoryScan, FileInfo, FileTable
+
+
+logger = logging.getLogger("shuttersense.agent.remote.local")
+
+# Threads listing subdirectories concurrently (stat() releases the GIL, so
+# this mostly helps network mounts and cold caches)
+LOCAL_WALK_WORKERS = 8
+
+# (path relative to the root, size in bytes, mtime as a POSIX timestamp)
+LocalFileEntry = Tuple[str, int, float]
+
+
+def _scan_directory(path: str, prefix: str) -> Tuple[List[LocalFileEntry], List[Tuple[str, str]]]:
+    """
+    List one directory with os.scandir().
+
+    Entry types come from the directory listing itself; files are stat()ed
+    once through DirEntry.stat(), which caches the result.
+
+    Args:
+        path: Directory to list
+        prefix: Relative path of the directory, with a trailing separator
+            ('' for the root)
+
+    Returns:
+        Tuple of (file entries, (path, prefix) per subdirectory)
+    """
+    files: List[LocalFileEntry] = []
+    directories: List[Tuple[str, str]] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    # Like Path.rglob(): don't descend into symlinked directories
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append((entry.path, prefix + entry.name + os.sep))
+                        continue
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    # Skip files we can't access
+                    continue
+                files.append((prefix + entry.name, stat.st_size, stat.st_mtime))
+    except OSError as e:
+        # Skip directories we can't list
+        logger.warning(f"Cannot list directory {path}: {e}")
+    return files, directories
+
+
+def walk_local_files(root: str, workers: int = LOCAL_WALK_WORKERS) -> Iterator[LocalFileEntry]:
+    """
+    Recursively yield every file under a local directory.
+
+    Shared by LocalAdapter and InputStateComputer, so listing a collection
+    and hashing its file list walk the tree the same way. Files are yielded
+    in a deterministic depth-first order (a directory's files, then each of
+    its subdirectories) whether or not subdirectories are listed in parallel.
+
+    Args:
+        root: Directory to walk
+        workers: Threads listing subdirectories concurrently (1 walks
+            sequentially)
+
+    Yields:
+        (relative_path, size, mtime) per file; relative paths use the
+        platform separator, like Path.relative_to()
+    """
+    if workers <= 1:
+        pending = [(root, "")]
+        while pending:
+            files, directories = _scan_directory(*pending.pop())
+            yield from files
+            pending.extend(reversed(directories))
+        return
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="local-walk")
+    try:
+        futures = [executor.submit(_scan_directory, root, "")]
+        while futures:
+            files, directories = futures.pop().result()
+            futures.extend(
+                executor.submit(_scan_directory, path, prefix) for path, prefix in reversed(directories)
+            )
+            yield from files
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
 
 
 class LocalAdapter(StorageAdapter):
@@ -24,8 +115,12 @@ class LocalAdapter(StorageAdapter):
         >>> adapter = LocalAdapter({})
         >>> files = adapter.list_files("/path/to/photos")
         >>> files_with_metadata = adapter.list_files_with_metadata("/path/to/photos")
+        >>> for f in adapter.iter_files_with_metadata("/path/to/photos"):
+        >>>     print(f.path, f.size)
     """
 
+    supports_directory_rescan = True
+
     def __init__(self, credentials: dict):
         """
         Initialize LocalAdapter.
@@ -57,26 +152,50 @@ class LocalAdapter(StorageAdapter):
         if not folder.is_dir():
             raise ValueError(f"Path is not a directory: {location}")
 
-        files = []
-        for file_path in folder.rglob('*'):
-            if file_path.is_file():
-                try:
-                    files.append(str(file_path.relative_to(folder)))
-                except (PermissionError, OSError):
-                    # Skip files we can't access
-                    continue
+        return [relative_path for relative_path, _, _ in walk_local_files(str(folder))]
+
+    def list_files_with_metadata(self, location: str) -> FileTable:
+        """
+        List all files with metadata in local directory.
+
+        Args:
+            location: Local filesystem path
+
+        Returns:
+            FileTable with path, size, and last_modified per file
 
+        Raises:
+            FileNotFoundError: If location doesn't exist
+            PermissionError: If location isn't accessible
+        """
+        folder = Path(location).expanduser().resolve()
+
+        if not folder.exists():
+            raise FileNotFoundError(f"Path does not exist: {location}")
+
+        if not folder.is_dir():
+            raise ValueError(f"Path is not a directory: {location}")
+
+        files = FileTable()
+        files.append_rows(
+            (relative_path, size, datetime.fromtimestamp(mtime).isoformat())
+            for relative_path, size, mtime in walk_local_files(str(folder))
+        )
         return files
 
-    def list_files_with_metadata(self, location: str) -> List[FileInfo]:
+    def iter_files_with_metadata(self, location: str) -> Iterator[FileInfo]:
         """
-        List all files with metadata in local directory.
+        Stream all files with metadata in local directory.
+
+        Same files as list_files_with_metadata(), yielded directory by
+        directory as the walk proceeds. The location is checked before
+        this returns.
 
         Args:
             location: Local filesystem path
 
         Returns:
-            List of FileInfo objects with path, size, and last_modified
+            Iterator of FileInfo with path, size, and last_modified
 
         Raises:
             FileNotFoundError: If location doesn't exist
@@ -90,16 +209,49 @@ class LocalAdapter(StorageAdapter):
         if not folder.is_dir():
             raise ValueError(f"Path is not a directory: {location}")
 
-        files = []
-        for file_path in folder.rglob('*'):
-            if file_path.is_file():
-                try:
-                    files.append(FileInfo.from_path_object(file_path, folder))
-                except (PermissionError, OSError):
-                    # Skip files we can't access
-                    continue
+        return (
+            FileInfo(path=relative_path, size=size, last_modified=datetime.fromtimestamp(mtime).isoformat())
+            for relative_path, size, mtime in walk_local_files(str(folder))
+        )
 
-        return files
+    def directory_mtime(self, location: str, directory: str) -> int:
+        """
+        Get a directory's modification time.
+
+        Args:
+            location: Local filesystem path
+            directory: Relative directory prefix from scan_directory()
+                ('' for the location itself)
+
+        Returns:
+            Modification time in nanoseconds
+        """
+        return os.stat(os.path.join(os.path.expanduser(location), directory)).st_mtime_ns
+
+    def scan_directory(self, location: str, directory: str) -> DirectoryScan:
+        """
+        List the files and subdirectories directly in one directory.
+
+        Args:
+            location: Local filesystem path
+            directory: Relative directory prefix, with a trailing separator
+                ('' for the location itself)
+
+        Returns:
+            DirectoryScan with paths relative to location, like
+            list_files_with_metadata()
+        """
+        path = os.path.join(os.path.expanduser(location), directory)
+        mtime_ns = os.stat(path).st_mtime_ns
+        files, directories = _scan_directory(path, directory)
+        return DirectoryScan(
+            mtime_ns=mtime_ns,
+            files=[
+                (relative_path, size, datetime.fromtimestamp(mtime).isoformat())
+                for relative_path, size, mtime in files
+            ],
+            directories=[prefix for _, prefix in directories],
+        )
 
     def test_connection(self) -> Tuple[bool, str]:
         """
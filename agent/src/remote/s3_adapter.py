@@ -7,12 +7,14 @@ Implements exponential backoff retry for transient failures (FR-012: 3 retries).
 
 import logging
 import time
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError, EndpointConnectionError
 
-from src.remote.base import StorageAdapter, FileInfo
+from src.remote.base import (
+    StorageAdapter, FileInfo, FileTable, iter_prefix_sharded, list_prefix_sharded, listing_fingerprint,
+)
 
 
 logger = logging.getLogger("shuttersense.agent.remote.s3")
@@ -35,6 +37,7 @@ class S3Adapter(StorageAdapter):
     Features:
         - Exponential backoff retry (3 attempts per FR-012)
         - Paginated listing for large buckets
+        - Concurrent listing of child prefixes (LIST_WORKERS shards)
         - Connection pooling via boto3 session
         - Comprehensive error handling with actionable messages
 
@@ -49,6 +52,10 @@ class S3Adapter(StorageAdapter):
     INITIAL_BACKOFF = 1.0  # seconds
     BACKOFF_MULTIPLIER = 2.0
 
+    # Concurrent prefix-sharded listing (list_files_with_metadata)
+    LIST_WORKERS = 8
+    SHARD_DISCOVERY_DEPTH = 2
+
     def __init__(self, credentials: Dict[str, Any]):
         """
         Initialize S3 adapter with credentials.
@@ -170,18 +177,23 @@ class S3Adapter(StorageAdapter):
 
         return files
 
-    def list_files_with_metadata(self, location: str) -> List[FileInfo]:
+    def list_files_with_metadata(self, location: str) -> FileTable:
         """
         List all files with metadata (size, modification time) in S3 bucket/prefix.
 
         Uses list_objects_v2 which returns Size and LastModified for each object.
         No additional API calls needed beyond the listing operation.
 
+        Child prefixes are discovered with delimiter listings and listed as
+        LIST_WORKERS concurrent shards (see list_prefix_sharded()), each with
+        its own retries. Files are returned in the same key order as a
+        sequential listing.
+
         Args:
             location: S3 location in format "bucket-name" or "bucket-name/prefix"
 
         Returns:
-            List of FileInfo objects with path, size, and last_modified
+            FileTable with path, size, and last_modified per file
 
         Raises:
             ValueError: If location format is invalid
@@ -193,7 +205,94 @@ class S3Adapter(StorageAdapter):
         bucket = parts[0]
         prefix = parts[1] if len(parts) > 1 else ""
 
-        files: List[FileInfo] = []
+        files = list_prefix_sharded(
+            lambda shard, delimited: self._list_prefix_with_metadata(bucket, shard, delimited),
+            prefix,
+            workers=self.LIST_WORKERS,
+            discovery_depth=self.SHARD_DISCOVERY_DEPTH,
+        )
+
+        total_size = files.total_size
+        logger.info(
+            f"Listed {len(files)} files ({total_size} bytes) from S3 bucket={bucket} prefix={prefix}"
+        )
+        return files
+
+    def iter_files_with_metadata(self, location: str) -> Iterator[FileInfo]:
+        """
+        Stream all files with metadata in S3 bucket/prefix.
+
+        Same listing as list_files_with_metadata(), yielded shard by shard in
+        key order as soon as each shard and every shard before it has been
+        listed (see iter_prefix_sharded()).
+
+        Args:
+            location: S3 location in format "bucket-name" or "bucket-name/prefix"
+
+        Returns:
+            Iterator of FileInfo with path, size, and last_modified
+
+        Raises:
+            ConnectionError: If cannot connect after retries
+            PermissionError: If credentials lack list permissions
+        """
+        parts = location.split("/", 1)
+        bucket = parts[0]
+        prefix = parts[1] if len(parts) > 1 else ""
+
+        return iter_prefix_sharded(
+            lambda shard, delimited: self._list_prefix_with_metadata(bucket, shard, delimited),
+            prefix,
+            workers=self.LIST_WORKERS,
+            discovery_depth=self.SHARD_DISCOVERY_DEPTH,
+        )
+
+    def listing_change_token(self, location: str) -> Optional[str]:
+        """
+        Fingerprint the top level of a S3 bucket/prefix.
+
+        One delimiter listing: the objects directly under the prefix and its
+        child prefixes. Adding or removing top-level folders or files changes
+        the token; changes deeper in existing folders do not, so callers
+        reusing a stored listing must also bound its age.
+
+        Args:
+            location: S3 location in format "bucket-name" or "bucket-name/prefix"
+
+        Returns:
+            64-character hex fingerprint
+        """
+        parts = location.split("/", 1)
+        bucket = parts[0]
+        prefix = parts[1] if len(parts) > 1 else ""
+
+        files, child_prefixes = self._list_prefix_with_metadata(bucket, prefix, delimited=True)
+        return listing_fingerprint(files, child_prefixes)
+
+    def _list_prefix_with_metadata(
+        self,
+        bucket: str,
+        prefix: str,
+        delimited: bool = False
+    ) -> Tuple[FileTable, List[str]]:
+        """
+        List one prefix with paginated list_objects_v2 calls and retries.
+
+        Args:
+            bucket: Bucket name
+            prefix: Key prefix
+            delimited: List only the objects directly under prefix and
+                return the child prefixes (Delimiter="/")
+
+        Returns:
+            Tuple of (FileTable of the listed objects, child prefixes)
+
+        Raises:
+            ConnectionError: If cannot connect after retries
+            PermissionError: If credentials lack list permissions
+        """
+        files = FileTable()
+        child_prefixes: List[str] = []
         continuation_token = None
 
         for attempt in range(self.MAX_RETRIES):
@@ -204,6 +303,8 @@ class S3Adapter(StorageAdapter):
                         "Bucket": bucket,
                         "Prefix": prefix
                     }
+                    if delimited:
+                        kwargs["Delimiter"] = "/"
                     if continuation_token:
                         kwargs["ContinuationToken"] = continuation_token
 
@@ -211,16 +312,19 @@ class S3Adapter(StorageAdapter):
 
                     # Extract file info with metadata
                     if "Contents" in response:
-                        for obj in response["Contents"]:
-                            key = obj["Key"]
-                            # Skip if it's a directory marker (ends with /)
-                            if not key.endswith("/"):
-                                last_modified = obj.get("LastModified")
-                                files.append(FileInfo(
-                                    path=key,
-                                    size=obj["Size"],
-                                    last_modified=last_modified.isoformat() if last_modified else None
-                                ))
+                        # Skip directory markers (keys ending with /)
+                        files.append_rows(
+                            (
+                                obj["Key"],
+                                obj["Size"],
+                                obj["LastModified"].isoformat() if obj.get("LastModified") else None,
+                            )
+                            for obj in response["Contents"]
+                            if not obj["Key"].endswith("/")
+                        )
+                    child_prefixes.extend(
+                        common["Prefix"] for common in response.get("CommonPrefixes", [])
+                    )
 
                     # Check if more pages exist
                     if response.get("IsTruncated"):
@@ -228,11 +332,7 @@ class S3Adapter(StorageAdapter):
                     else:
                         break
 
-                total_size = sum(f.size for f in files)
-                logger.info(
-                    f"Listed {len(files)} files ({total_size} bytes) from S3 bucket={bucket} prefix={prefix}"
-                )
-                return files
+                return files, child_prefixes
 
             except ClientError as e:
                 error_code = e.response.get("Error", {}).get("Code", "Unknown")
@@ -249,7 +349,8 @@ class S3Adapter(StorageAdapter):
                 if attempt < self.MAX_RETRIES - 1:
                     backoff = self.INITIAL_BACKOFF * (self.BACKOFF_MULTIPLIER ** attempt)
                     logger.warning(
-                        f"S3 list_files_with_metadata attempt {attempt + 1} failed, retrying in {backoff}s error={e}"
+                        f"S3 list_files_with_metadata attempt {attempt + 1} failed for prefix={prefix}, "
+                        f"retrying in {backoff}s error={e}"
                     )
                     time.sleep(backoff)
                 else:
@@ -263,7 +364,7 @@ class S3Adapter(StorageAdapter):
                 logger.error(f"S3 connection error: {e} bucket={bucket}")
                 raise ConnectionError(f"Cannot connect to S3: {str(e)}")
 
-        return files
+        return files, child_prefixes
 
     def test_connection(self) -> Tuple[bool, str]:
         """
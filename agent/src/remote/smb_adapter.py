@@ -6,17 +6,50 @@ Implements retry logic for transient network failures.
 """
 
 import logging
+import queue
+import threading
 import time
-from typing import List, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Dict, Any, Iterator, Tuple
 
-from smbclient import register_session, listdir, stat
+from smbclient import register_session, listdir, reset_connection_cache, scandir, stat
 from smbprotocol.exceptions import SMBConnectionClosed, SMBAuthenticationError, SMBOSError
 
-from src.remote.base import StorageAdapter, FileInfo
+from src.remote.base import StorageAdapter, DirectoryScan, FileInfo, FileTable
 
 
 logger = logging.getLogger("shuttersense.agent.remote.smb")
 
+# Session pools for the concurrent directory walk, shared by every adapter
+# for the same server and user so connections are reused across adapters
+# and listings instead of piling up: (server, port, username) -> pool
+_SESSION_POOLS: Dict[Tuple[str, int, str], "queue.Queue[Dict[str, Any]]"] = {}
+_SESSION_POOLS_LOCK = threading.Lock()
+
+
+def _session_pool(server: str, port: int, username: str, size: int) -> "queue.Queue[Dict[str, Any]]":
+    """
+    Get the shared session pool for a server and user.
+
+    Args:
+        server: SMB server name or address
+        port: SMB port
+        username: User the sessions authenticate as
+        size: Number of sessions (smbclient connection caches) in a new pool
+
+    Returns:
+        Queue of smbclient connection caches
+    """
+    key = (server, port, username)
+    with _SESSION_POOLS_LOCK:
+        pool = _SESSION_POOLS.get(key)
+        if pool is None:
+            pool = _SESSION_POOLS[key] = queue.Queue(maxsize=size)
+            for _ in range(size):
+                pool.put({})
+        return pool
+
 
 class SMBAdapter(StorageAdapter):
     """
@@ -36,7 +69,8 @@ class SMBAdapter(StorageAdapter):
 
     Features:
         - Retry logic for transient network failures (3 attempts)
-        - Recursive directory traversal
+        - Recursive directory traversal using enumeration metadata (no per-file stat)
+        - Concurrent subdirectory listing over a pool of WALK_WORKERS sessions
         - Session management and connection pooling
         - Comprehensive error handling with actionable messages
 
@@ -51,6 +85,11 @@ class SMBAdapter(StorageAdapter):
     INITIAL_BACKOFF = 1.0  # seconds
     BACKOFF_MULTIPLIER = 2.0
 
+    # Concurrent directory walk: worker threads, one pooled session each
+    WALK_WORKERS = 4
+
+    supports_directory_rescan = True
+
     def __init__(self, credentials: Dict[str, Any]):
         """
         Initialize SMB adapter with credentials.
@@ -86,138 +125,198 @@ class SMBAdapter(StorageAdapter):
         except Exception as e:
             raise ValueError(f"Failed to register SMB session: {str(e)}")
 
-    def _list_directory_recursive(self, path: str) -> List[str]:
+        # Session pool for the directory walk: one smbclient connection cache
+        # per session, each reused across directories, listings and adapters
+        self._share_prefix = f"//{self.server}/{self.share}/"
+        self._session_kwargs = {
+            "username": self.username,
+            "password": self.password,
+            "port": self.port,
+        }
+        self._sessions = _session_pool(self.server, self.port, self.username, self.WALK_WORKERS)
+
+    def _scandir(self, path: str) -> Tuple[List[FileInfo], List[str]]:
         """
-        Recursively list all files in a directory.
+        List one directory on a pooled session.
+
+        Sizes and modification times come from the directory enumeration
+        itself (FileIdFullDirectoryInformation), so no per-entry stat()
+        round trip is needed.
 
         Args:
             path: SMB path in UNC format (//server/share/path)
 
         Returns:
-            List of file paths relative to the share root
+            Tuple of (files directly in the directory, subdirectory paths)
         """
-        files = []
-
+        connection_cache = self._sessions.get()
+        files: List[FileInfo] = []
+        directories: List[str] = []
         try:
-            entries = listdir(path)
-
-            for entry in entries:
-                full_path = f"{path}/{entry}"
-
-                # Get file stats to determine if it's a file or directory
+            for entry in scandir(path, connection_cache=connection_cache, **self._session_kwargs):
+                full_path = f"{path}/{entry.name}"
                 try:
-                    file_stat = stat(full_path)
-
-                    # Check if it's a directory (mode & 0o040000)
-                    if file_stat.st_mode & 0o040000:
-                        # Recursively list subdirectory
-                        files.extend(self._list_directory_recursive(full_path))
-                    else:
-                        # It's a file, add to list (remove //server/share/ prefix)
-                        relative_path = full_path.replace(f"//{self.server}/{self.share}/", "")
-                        files.append(relative_path)
-
+                    if entry.is_dir():
+                        directories.append(full_path)
+                        continue
+                    info = entry.smb_info
                 except SMBOSError as e:
                     # Skip files/dirs we can't access
                     logger.warning(f"Cannot access SMB path: {full_path} error={e}")
                     continue
 
+                # Remove //server/share/ prefix
+                relative_path = full_path.replace(self._share_prefix, "")
+                last_modified = None
+                mtime = info.last_write_time.timestamp()
+                if mtime:
+                    last_modified = datetime.fromtimestamp(mtime).isoformat()
+                files.append(FileInfo(path=relative_path, size=info.end_of_file, last_modified=last_modified))
         except SMBOSError as e:
             logger.error(f"Error listing SMB directory: {path} error={e}")
             raise
+        finally:
+            self._sessions.put(connection_cache)
 
-        return files
+        return files, directories
 
-    def _list_directory_recursive_with_metadata(self, path: str) -> List[FileInfo]:
+    def _walk(self, path: str) -> Iterator[Tuple[str, List[FileInfo]]]:
         """
-        Recursively list all files with metadata in a directory.
+        Recursively yield the files of a directory tree, one directory at a time.
+
+        Subdirectories are listed concurrently on WALK_WORKERS threads, each
+        borrowing one of the pooled sessions. Every directory that has been
+        found is queued for listing right away, while directories are
+        yielded in depth-first order (a directory, then each of its
+        subdirectories in enumeration order), so the output order does not
+        depend on thread timing.
 
         Args:
             path: SMB path in UNC format (//server/share/path)
 
-        Returns:
-            List of FileInfo objects with path, size, and last_modified
+        Yields:
+            Tuple of (directory UNC path, FileInfo per file directly in it,
+            with path relative to the share root, size and last_modified)
         """
-        from datetime import datetime
-
-        files: List[FileInfo] = []
-
+        executor = ThreadPoolExecutor(max_workers=self.WALK_WORKERS, thread_name_prefix="smb-walk")
         try:
-            entries = listdir(path)
+            pending = [(path, executor.submit(self._scandir, path))]
+            while pending:
+                directory, future = pending.pop()
+                files, subdirectories = future.result()
+                pending.extend(
+                    (subdirectory, executor.submit(self._scandir, subdirectory))
+                    for subdirectory in reversed(subdirectories)
+                )
+                yield directory, files
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _reset_sessions(self) -> None:
+        """Close all pooled sessions; they reconnect on next use."""
+        for _ in range(self._sessions.maxsize):
+            connection_cache = self._sessions.get()
+            try:
+                reset_connection_cache(connection_cache=connection_cache)
+            except Exception as e:
+                logger.warning(f"Failed to close SMB session server={self.server} error={e}")
+            finally:
+                self._sessions.put({})
 
-            for entry in entries:
-                full_path = f"{path}/{entry}"
+    def _unc_path(self, location: str) -> str:
+        """Build the UNC path (//server/share/location) for a location."""
+        location = location.lstrip("/")  # Remove leading slash
+        unc_path = f"//{self.server}/{self.share}"
+        if location:
+            unc_path = f"{unc_path}/{location}"
+        return unc_path
 
-                # Get file stats to determine if it's a file or directory
-                try:
-                    file_stat = stat(full_path)
-
-                    # Check if it's a directory (mode & 0o040000)
-                    if file_stat.st_mode & 0o040000:
-                        # Recursively list subdirectory
-                        files.extend(self._list_directory_recursive_with_metadata(full_path))
-                    else:
-                        # It's a file, add to list with metadata
-                        relative_path = full_path.replace(f"//{self.server}/{self.share}/", "")
-                        last_modified = None
-                        if file_stat.st_mtime:
-                            last_modified = datetime.fromtimestamp(file_stat.st_mtime).isoformat()
-                        files.append(FileInfo(
-                            path=relative_path,
-                            size=file_stat.st_size,
-                            last_modified=last_modified
-                        ))
+    def directory_mtime(self, location: str, directory: str) -> int:
+        """
+        Get a directory's last write time on a pooled session.
 
-                except SMBOSError as e:
-                    # Skip files/dirs we can't access
-                    logger.warning(f"Cannot access SMB path: {full_path} error={e}")
-                    continue
+        Args:
+            location: SMB path relative to share
+            directory: UNC path from scan_directory() ('' for the location itself)
 
-        except SMBOSError as e:
-            logger.error(f"Error listing SMB directory: {path} error={e}")
-            raise
+        Returns:
+            Modification time in nanoseconds
+        """
+        connection_cache = self._sessions.get()
+        try:
+            return stat(
+                directory or self._unc_path(location),
+                connection_cache=connection_cache,
+                **self._session_kwargs
+            ).st_mtime_ns
+        finally:
+            self._sessions.put(connection_cache)
+
+    def scan_directory(self, location: str, directory: str) -> DirectoryScan:
+        """
+        List the files and subdirectories directly in one directory.
 
-        return files
+        Args:
+            location: SMB path relative to share
+            directory: UNC path of the directory ('' for the location itself)
 
-    def list_files(self, location: str) -> List[str]:
+        Returns:
+            DirectoryScan with paths relative to the share root and
+            subdirectory UNC paths
         """
-        List all files in SMB share/path.
+        path = directory or self._unc_path(location)
+        mtime_ns = self.directory_mtime(location, path)
+        files, directories = self._scandir(path)
+        return DirectoryScan(
+            mtime_ns=mtime_ns,
+            files=[(f.path, f.size, f.last_modified) for f in files],
+            directories=directories,
+        )
+
+    def _iter_walk(self, location: str, operation: str) -> Iterator[FileInfo]:
+        """
+        Walk a location with retry logic, yielding files as they are listed.
 
-        Implements recursive directory traversal with retry logic.
+        A dropped connection restarts the walk on fresh sessions and skips
+        the directories whose files were already yielded (by path, so
+        directories that changed in between cannot shift the resumed
+        listing); callers never see a file twice.
 
         Args:
             location: SMB path relative to share (e.g., "/2024/vacation" or "")
+            operation: Operation name for log messages
 
-        Returns:
-            List of file paths relative to share root
+        Yields:
+            FileInfo with path relative to the share root
 
         Raises:
             ConnectionError: If cannot connect after retries
             PermissionError: If credentials lack access permissions
             ValueError: If location is invalid
-
-        Example:
-            >>> files = adapter.list_files("/photos/2024")
-            >>> print(files)
-            ['photos/2024/IMG_001.jpg', 'photos/2024/IMG_002.dng']
         """
-        # Build UNC path: //server/share/location
         location = location.lstrip("/")  # Remove leading slash
-        unc_path = f"//{self.server}/{self.share}"
-        if location:
-            unc_path = f"{unc_path}/{location}"
+        unc_path = self._unc_path(location)
 
-        files = []
+        yielded = 0
+        total_size = 0
+        listed_directories = set()
 
         for attempt in range(self.MAX_RETRIES):
             try:
-                files = self._list_directory_recursive(unc_path)
+                for directory, files in self._walk(unc_path):
+                    if directory in listed_directories:
+                        continue
+                    for file_info in files:
+                        yielded += 1
+                        total_size += file_info.size
+                        yield file_info
+                    listed_directories.add(directory)
 
                 logger.info(
-                    f"Listed {len(files)} files from SMB server={self.server} "
+                    f"Listed {yielded} files ({total_size} bytes) from SMB server={self.server} "
                     f"share={self.share} location={location}"
                 )
-                return files
+                return
 
             except SMBAuthenticationError as e:
                 logger.error(f"SMB authentication failed server={self.server} error={e}")
@@ -231,11 +330,12 @@ class SMBAdapter(StorageAdapter):
                 if attempt < self.MAX_RETRIES - 1:
                     backoff = self.INITIAL_BACKOFF * (self.BACKOFF_MULTIPLIER ** attempt)
                     logger.warning(
-                        f"SMB list_files attempt {attempt + 1} failed, retrying in {backoff}s error={e}"
+                        f"SMB {operation} attempt {attempt + 1} failed, retrying in {backoff}s error={e}"
                     )
                     time.sleep(backoff)
 
                     # Re-register session after connection closed
+                    self._reset_sessions()
                     try:
                         register_session(
                             server=self.server,
@@ -246,7 +346,7 @@ class SMBAdapter(StorageAdapter):
                     except Exception as re_reg_error:
                         logger.error(f"Failed to re-register SMB session: {re_reg_error}")
                 else:
-                    logger.error(f"SMB list_files failed after {self.MAX_RETRIES} attempts")
+                    logger.error(f"SMB {operation} failed after {self.MAX_RETRIES} attempts")
                     raise ConnectionError(
                         f"Failed to list SMB share {self.server}/{self.share} "
                         f"after {self.MAX_RETRIES} attempts. Last error: {str(e)}"
@@ -265,91 +365,69 @@ class SMBAdapter(StorageAdapter):
                 logger.error(f"SMB unexpected error: {e} server={self.server}")
                 raise ConnectionError(f"Unexpected error accessing SMB share: {str(e)}")
 
-        return files
-
-    def list_files_with_metadata(self, location: str) -> List[FileInfo]:
+    def list_files(self, location: str) -> List[str]:
         """
-        List all files with metadata (size, modification time) in SMB share/path.
+        List all files in SMB share/path.
 
-        Uses stat() to get file sizes during recursive traversal.
+        Implements recursive directory traversal with retry logic.
 
         Args:
             location: SMB path relative to share (e.g., "/2024/vacation" or "")
 
         Returns:
-            List of FileInfo objects with path, size, and last_modified
+            List of file paths relative to share root
 
         Raises:
             ConnectionError: If cannot connect after retries
             PermissionError: If credentials lack access permissions
             ValueError: If location is invalid
+
+        Example:
+            >>> files = adapter.list_files("/photos/2024")
+            >>> print(files)
+            ['photos/2024/IMG_001.jpg', 'photos/2024/IMG_002.dng']
         """
-        # Build UNC path: //server/share/location
-        location = location.lstrip("/")  # Remove leading slash
-        unc_path = f"//{self.server}/{self.share}"
-        if location:
-            unc_path = f"{unc_path}/{location}"
+        return [file_info.path for file_info in self._iter_walk(location, "list_files")]
 
-        files: List[FileInfo] = []
+    def list_files_with_metadata(self, location: str) -> FileTable:
+        """
+        List all files with metadata (size, modification time) in SMB share/path.
 
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                files = self._list_directory_recursive_with_metadata(unc_path)
+        Sizes and modification times come from the directory listings, with
+        subdirectories listed concurrently (see _walk()).
 
-                total_size = sum(f.size for f in files)
-                logger.info(
-                    f"Listed {len(files)} files ({total_size} bytes) from SMB server={self.server} "
-                    f"share={self.share} location={location}"
-                )
-                return files
+        Args:
+            location: SMB path relative to share (e.g., "/2024/vacation" or "")
 
-            except SMBAuthenticationError as e:
-                logger.error(f"SMB authentication failed server={self.server} error={e}")
-                raise PermissionError(
-                    f"SMB authentication failed for {self.server}/{self.share}. "
-                    f"Check username and password: {str(e)}"
-                )
+        Returns:
+            FileTable with path, size, and last_modified per file
 
-            except SMBConnectionClosed as e:
-                # Retry connection errors
-                if attempt < self.MAX_RETRIES - 1:
-                    backoff = self.INITIAL_BACKOFF * (self.BACKOFF_MULTIPLIER ** attempt)
-                    logger.warning(
-                        f"SMB list_files_with_metadata attempt {attempt + 1} failed, retrying in {backoff}s error={e}"
-                    )
-                    time.sleep(backoff)
+        Raises:
+            ConnectionError: If cannot connect after retries
+            PermissionError: If credentials lack access permissions
+            ValueError: If location is invalid
+        """
+        return FileTable(self._iter_walk(location, "list_files_with_metadata"))
 
-                    # Re-register session after connection closed
-                    try:
-                        register_session(
-                            server=self.server,
-                            username=self.username,
-                            password=self.password,
-                            port=self.port
-                        )
-                    except Exception as re_reg_error:
-                        logger.error(f"Failed to re-register SMB session: {re_reg_error}")
-                else:
-                    logger.error(f"SMB list_files_with_metadata failed after {self.MAX_RETRIES} attempts")
-                    raise ConnectionError(
-                        f"Failed to list SMB share {self.server}/{self.share} "
-                        f"after {self.MAX_RETRIES} attempts. Last error: {str(e)}"
-                    )
+    def iter_files_with_metadata(self, location: str) -> Iterator[FileInfo]:
+        """
+        Stream all files with metadata in SMB share/path.
 
-            except SMBOSError as e:
-                logger.error(f"SMB file system error: {e} path={unc_path}")
-                if "No such file or directory" in str(e):
-                    raise ValueError(f"SMB path not found: {unc_path}")
-                elif "Permission denied" in str(e):
-                    raise PermissionError(f"Access denied to SMB path: {unc_path}")
-                else:
-                    raise ConnectionError(f"SMB error: {str(e)}")
+        Same listing as list_files_with_metadata(), yielded directory by
+        directory while the concurrent walk continues.
 
-            except Exception as e:
-                logger.error(f"SMB unexpected error: {e} server={self.server}")
-                raise ConnectionError(f"Unexpected error accessing SMB share: {str(e)}")
+        Args:
+            location: SMB path relative to share (e.g., "/2024/vacation" or "")
+
+        Returns:
+            Iterator of FileInfo with path, size, and last_modified
 
-        return files
+        Raises:
+            ConnectionError: If cannot connect after retries
+            PermissionError: If credentials lack access permissions
+            ValueError: If location is invalid
+        """
+        return self._iter_walk(location, "iter_files_with_metadata")
 
     def test_connection(self) -> Tuple[bool, str]:
         """
@@ -11,7 +11,7 @@ Tasks: T028, T028a, T029, T032, T063, T064, T065, T066, T085, T086, T087, T088,
 Architecture:
     Phase A: Folder Extraction
         1. Fetch manifest.json from inventory location
-        2. Download and parse data files (CSV/Parquet)
+        2. Download and parse data files (CSV/Parquet), several at a time
         3. Extract unique folder paths
         4. Report folders to server
 
@@ -31,25 +31,30 @@ Architecture:
 """
 
 import asyncio
+import io
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, BinaryIO, Callable, Dict, List, Optional, Set, Union
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Optional, Set, Union
 
 from src.analysis.inventory_parser import (
     InventoryEntry,
+    InventoryTable,
     S3Manifest,
     GCSManifest,
     parse_s3_manifest,
     parse_gcs_manifest,
-    parse_s3_csv_stream,
-    parse_gcs_csv_stream,
-    parse_parquet_stream,
-    extract_folders,
-    count_files_by_folder,
+    read_s3_csv_table,
+    read_gcs_csv_table,
+    read_parquet_table,
+    summarize_folders,
 )
 
 logger = logging.getLogger("shuttersense.agent.tools.inventory_import")
 
+# Data files downloaded and parsed concurrently during Phase A
+INVENTORY_DOWNLOAD_WORKERS = 8
+
 
 @dataclass
 class FileInfoData:
@@ -109,7 +114,8 @@ class InventoryImportResult:
         folder_stats: Dict of folder path to stats (file_count, total_size)
         total_files: Total number of files processed
         total_size: Total size of all files in bytes
-        all_entries: All inventory entries (for Phase B processing)
+        all_entries: All inventory entries, columnar (for Phase B processing);
+            a list of InventoryEntry is converted on construction
         error_message: Error message if import failed
         latest_manifest: Display path of the manifest used (e.g., "2026-01-26T01-00Z/manifest.json")
     """
@@ -118,10 +124,14 @@ class InventoryImportResult:
     folder_stats: Dict[str, Dict[str, Any]]
     total_files: int
     total_size: int
-    all_entries: Optional[List[InventoryEntry]] = None  # For Phase B
+    all_entries: Optional[InventoryTable] = None  # For Phase B
     error_message: Optional[str] = None
     latest_manifest: Optional[str] = None  # Display path of the manifest used (e.g., "2026-01-26T01-00Z/manifest.json")
 
+    def __post_init__(self) -> None:
+        if self.all_entries is not None and not isinstance(self.all_entries, InventoryTable):
+            self.all_entries = InventoryTable.from_entries(self.all_entries)
+
 
 @dataclass
 class PhaseBResult:
@@ -286,6 +296,7 @@ class InventoryImportTool:
         inventory_config: Dict[str, Any],
         connector_type: str,
         progress_callback: Optional[Callable[[str, int, str], None]] = None,
+        download_workers: int = INVENTORY_DOWNLOAD_WORKERS,
     ):
         """
         Initialize the inventory import tool.
@@ -300,11 +311,13 @@ class InventoryImportTool:
                 - report_config_name: Report configuration name (GCS)
             connector_type: Type of connector ("s3" or "gcs")
             progress_callback: Optional callback(stage, percentage, message)
+            download_workers: Data files downloaded and parsed concurrently
         """
         self._adapter = adapter
         self._config = inventory_config
         self._connector_type = connector_type
         self._progress_callback = progress_callback or (lambda s, p, m: None)
+        self._download_workers = max(1, download_workers)
 
     async def execute(self) -> InventoryImportResult:
         """
@@ -509,43 +522,28 @@ class InventoryImportTool:
         Returns:
             InventoryImportResult with folders and statistics
         """
-        loop = asyncio.get_event_loop()
-        all_entries: List[InventoryEntry] = []
-        total_files = len(manifest.files)
-
-        for idx, file_ref in enumerate(manifest.files):
-            progress_pct = 15 + int((idx / total_files) * 70)
-            self._report_progress(
-                "processing_data",
-                progress_pct,
-                f"Processing data file {idx + 1}/{total_files}..."
-            )
-
-            # Fetch data file using full key from manifest
-            logger.info(f"Fetching data file: {file_ref.key}")
-            data = await loop.run_in_executor(
-                None,
-                self._fetch_object,
-                destination_bucket,
-                file_ref.key
-            )
-
-            # Detect format and parse
-            if manifest.file_format.upper() == "PARQUET":
-                entries = list(parse_parquet_stream(data, provider="s3"))
-            else:
-                # CSV (gzipped by default for S3)
-                entries = list(parse_s3_csv_stream(data, manifest.schema_fields))
+        if manifest.file_format.upper() == "PARQUET":
+            def parse(stream: BinaryIO, key: str) -> InventoryTable:
+                return read_parquet_table(self._seekable(stream), provider="s3")
+        else:
+            # CSV (gzipped by default for S3)
+            def parse(stream: BinaryIO, key: str) -> InventoryTable:
+                return read_s3_csv_table(stream, manifest.schema_fields)
 
-            all_entries.extend(entries)
-            logger.info(f"Parsed {len(entries)} entries from {file_ref.key}")
+        all_entries = await self._parse_data_files(
+            destination_bucket,
+            [file_ref.key for file_ref in manifest.files],
+            parse,
+            "data file"
+        )
+        # Sorted once so Phase B finds each collection's prefix by binary search
+        all_entries = all_entries.sort_by_key()
 
         # Extract folders from all entries
         self._report_progress("extracting_folders", 90, "Extracting folder structure...")
 
-        folders = extract_folders(entry.key for entry in all_entries)
-        folder_stats = count_files_by_folder(all_entries)
-        total_size = sum(entry.size for entry in all_entries)
+        folders, folder_stats = summarize_folders(all_entries)
+        total_size = all_entries.total_size()
 
         self._report_progress("completing", 100, f"Found {len(folders)} folders")
 
@@ -580,49 +578,34 @@ class InventoryImportTool:
         Returns:
             InventoryImportResult with folders and statistics
         """
-        loop = asyncio.get_event_loop()
-        all_entries: List[InventoryEntry] = []
-
         # Get the directory containing the manifest for relative shard paths
         manifest_dir = "/".join(manifest_key.split("/")[:-1])
 
-        total_shards = len(manifest.shard_file_names)
-
-        for idx, shard_name in enumerate(manifest.shard_file_names):
-            progress_pct = 15 + int((idx / total_shards) * 70)
-            self._report_progress(
-                "processing_data",
-                progress_pct,
-                f"Processing shard {idx + 1}/{total_shards}..."
-            )
-
-            # Shard files are relative to manifest directory
-            shard_key = f"{manifest_dir}/{shard_name}" if manifest_dir else shard_name
-            logger.info(f"Fetching shard file: {shard_key}")
-
-            data = await loop.run_in_executor(
-                None,
-                self._fetch_object,
-                destination_bucket,
-                shard_key
-            )
-
+        def parse(stream: BinaryIO, key: str) -> InventoryTable:
             # Detect format from filename
-            if shard_name.endswith(".parquet"):
-                entries = list(parse_parquet_stream(data, provider="gcs"))
-            else:
-                # CSV (uncompressed for GCS)
-                entries = list(parse_gcs_csv_stream(data))
+            if key.endswith(".parquet"):
+                return read_parquet_table(self._seekable(stream), provider="gcs")
+            # CSV (uncompressed for GCS)
+            return read_gcs_csv_table(stream)
 
-            all_entries.extend(entries)
-            logger.info(f"Parsed {len(entries)} entries from {shard_name}")
+        # Shard files are relative to manifest directory
+        all_entries = await self._parse_data_files(
+            destination_bucket,
+            [
+                f"{manifest_dir}/{shard_name}" if manifest_dir else shard_name
+                for shard_name in manifest.shard_file_names
+            ],
+            parse,
+            "shard"
+        )
+        # Sorted once so Phase B finds each collection's prefix by binary search
+        all_entries = all_entries.sort_by_key()
 
         # Extract folders
         self._report_progress("extracting_folders", 90, "Extracting folder structure...")
 
-        folders = extract_folders(entry.key for entry in all_entries)
-        folder_stats = count_files_by_folder(all_entries)
-        total_size = sum(entry.size for entry in all_entries)
+        folders, folder_stats = summarize_folders(all_entries)
+        total_size = all_entries.total_size()
 
         self._report_progress("completing", 100, f"Found {len(folders)} folders")
 
@@ -640,6 +623,87 @@ class InventoryImportTool:
             all_entries=all_entries  # Keep for Phase B
         )
 
+    async def _parse_data_files(
+        self,
+        bucket: str,
+        keys: List[str],
+        parse: Callable[[BinaryIO, str], InventoryTable],
+        label: str
+    ) -> InventoryTable:
+        """
+        Download and parse inventory data files concurrently.
+
+        Up to download_workers files are streamed into their parser at a
+        time; tables are merged as each file completes, so entry order
+        follows completion rather than the manifest.
+
+        Args:
+            bucket: Bucket containing the data files
+            keys: Data file keys from the manifest
+            parse: Parser called as parse(stream, key) on a worker thread
+            label: Data file name used in progress messages ("shard")
+
+        Returns:
+            Entries of all data files
+        """
+        loop = asyncio.get_event_loop()
+        tables: List[InventoryTable] = []
+        total = len(keys)
+        self._report_progress("processing_data", 15, f"Processing {total} {label}s...")
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self._download_workers, max(total, 1)),
+            thread_name_prefix="inventory-download"
+        )
+        try:
+            futures = [
+                loop.run_in_executor(executor, self._fetch_and_parse, bucket, key, parse)
+                for key in keys
+            ]
+            for done, future in enumerate(asyncio.as_completed(futures), start=1):
+                tables.append(await future)
+                self._report_progress(
+                    "processing_data",
+                    15 + int((done / total) * 70),
+                    f"Processed {label} {done}/{total}"
+                )
+        finally:
+            # On failure, skip files not started yet instead of waiting for them
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return InventoryTable.concat(tables)
+
+    def _fetch_and_parse(
+        self,
+        bucket: str,
+        key: str,
+        parse: Callable[[BinaryIO, str], InventoryTable]
+    ) -> InventoryTable:
+        """Stream one data file into its parser (runs on a download worker)."""
+        logger.info(f"Fetching data file: {key}")
+        stream = self._fetch_object_stream(bucket, key)
+        try:
+            entries = parse(stream, key)
+        finally:
+            try:
+                stream.close()
+            except Exception:
+                pass
+        logger.info(f"Parsed {len(entries)} entries from {key}")
+        return entries
+
+    @staticmethod
+    def _seekable(stream: BinaryIO) -> BinaryIO:
+        """
+        Get a seekable stream for Parquet, which reads its footer first.
+
+        GCS blob readers seek with ranged reads; S3 streaming bodies cannot
+        seek and are read into memory.
+        """
+        if stream.seekable():
+            return stream
+        return io.BytesIO(stream.read())
+
     def _fetch_object_stream(self, bucket: str, key: str) -> BinaryIO:
         """
         Fetch an object from cloud storage as a streaming file-like object.
@@ -708,7 +772,9 @@ class InventoryImportTool:
         Execute Phase B: FileInfo Population.
 
         Filters inventory entries by collection folder path prefix and
-        extracts FileInfo for each collection.
+        extracts FileInfo for each collection. Entries are sorted by key
+        once, and each collection's entries are the slice found by binary
+        search on its prefix.
 
         Args:
             phase_a_result: Result from Phase A containing all_entries
@@ -756,6 +822,13 @@ class InventoryImportTool:
         collection_file_info: Dict[str, List[FileInfoData]] = {}
         total_collections = len(collections_data)
 
+        all_entries = phase_a_result.all_entries.sort_by_key()
+        prefix_ranges = all_entries.prefix_ranges(
+            self._collection_prefix(coll["folder_path"])
+            for coll in collections_data
+            if coll.get("collection_guid") and coll.get("folder_path")
+        )
+
         for idx, coll in enumerate(collections_data):
             collection_guid = coll.get("collection_guid", "")
             folder_path = coll.get("folder_path", "")
@@ -770,10 +843,9 @@ class InventoryImportTool:
                 f"Processing collection {idx + 1}/{total_collections}..."
             )
 
-            # Filter entries by folder path prefix
-            filtered_entries = self._filter_entries_by_prefix(
-                phase_a_result.all_entries,
-                folder_path
+            # Entries under the folder path prefix
+            filtered_entries = all_entries.slice(
+                *prefix_ranges[self._collection_prefix(folder_path)]
             )
 
             # Extract FileInfo from filtered entries
@@ -783,7 +855,7 @@ class InventoryImportTool:
 
             logger.info(
                 f"Collection {collection_guid}: {len(file_info_list)} files "
-                f"(filtered from {len(phase_a_result.all_entries)} total)"
+                f"(filtered from {len(all_entries)} total)"
             )
 
         self._report_progress(
@@ -805,9 +877,9 @@ class InventoryImportTool:
 
     def _filter_entries_by_prefix(
         self,
-        entries: List[InventoryEntry],
+        entries: Union[InventoryTable, List[InventoryEntry]],
         folder_path: str
-    ) -> List[InventoryEntry]:
+    ) -> InventoryTable:
         """
         Filter inventory entries by folder path prefix.
 
@@ -818,24 +890,27 @@ class InventoryImportTool:
             folder_path: Folder path prefix to filter by (e.g., "2020/vacation/")
 
         Returns:
-            List of entries matching the prefix
+            InventoryTable of entries matching the prefix
         """
-        # Normalize folder path to ensure it ends with /
-        prefix = folder_path if folder_path.endswith("/") else folder_path + "/"
+        if not isinstance(entries, InventoryTable):
+            entries = InventoryTable.from_entries(entries)
 
-        return [
-            entry for entry in entries
-            if entry.key.startswith(prefix)
-        ]
+        return entries.filter_prefix(self._collection_prefix(folder_path))
+
+    @staticmethod
+    def _collection_prefix(folder_path: str) -> str:
+        """Normalize a collection folder path to a key prefix ending with /."""
+        return folder_path if folder_path.endswith("/") else folder_path + "/"
 
     def _extract_file_info(
         self,
-        entries: List[InventoryEntry]
+        entries: Union[InventoryTable, Iterable[InventoryEntry]]
     ) -> List[FileInfoData]:
         """
         Extract FileInfo from inventory entries.
 
-        Converts InventoryEntry objects to FileInfoData with the required fields.
+        Converts inventory entries to FileInfoData with the required fields.
+        Table rows are read as tuples, without InventoryEntry objects.
 
         Args:
             entries: Filtered inventory entries for a collection
@@ -843,22 +918,25 @@ class InventoryImportTool:
         Returns:
             List of FileInfoData objects
         """
-        file_info_list = []
-
-        for entry in entries:
-            # last_modified is already an ISO8601 string from InventoryEntry
-            last_modified_str = entry.last_modified or ""
-
-            file_info = FileInfoData(
-                key=entry.key,
-                size=entry.size,
-                last_modified=last_modified_str,
-                etag=entry.etag,
-                storage_class=entry.storage_class
+        if isinstance(entries, InventoryTable):
+            rows = entries.iter_rows()
+        else:
+            rows = (
+                (entry.key, entry.size, entry.last_modified, entry.etag, entry.storage_class)
+                for entry in entries
             )
-            file_info_list.append(file_info)
 
-        return file_info_list
+        # last_modified is already an ISO8601 string (or None)
+        return [
+            FileInfoData(
+                key=key,
+                size=size,
+                last_modified=last_modified or "",
+                etag=etag,
+                storage_class=storage_class
+            )
+            for key, size, last_modified, etag, storage_class in rows
+        ]
 
     # =========================================================================
     # Phase C: Delta Detection (Issue #107 Phase 8)
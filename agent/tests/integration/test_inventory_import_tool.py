@@ -24,6 +24,13 @@ from src.tools.inventory_import_tool import InventoryImportTool
 # ============================================================================
 
 
+class MockStreamingBody(io.BufferedReader):
+    """Chunked, non-seekable stream like botocore's StreamingBody."""
+
+    def seekable(self) -> bool:
+        return False
+
+
 class MockS3Adapter:
     """Mock S3 adapter for testing."""
 
@@ -44,10 +51,7 @@ class MockS3Adapter:
         if full_key not in self._files:
             raise Exception(f"NoSuchKey: {full_key}")
 
-        content = self._files[full_key]
-        body = MagicMock()
-        body.read.return_value = content
-        return {"Body": body}
+        return {"Body": MockStreamingBody(io.BytesIO(self._files[full_key]))}
 
     def list_files(self, location: str) -> List[str]:
         """Mock list_files - returns keys matching location prefix."""
@@ -346,6 +350,40 @@ class TestS3InventoryImportIntegration:
         assert "folder1/" in result.folders
         assert "folder2/" in result.folders
 
+    @pytest.mark.asyncio
+    async def test_s3_import_data_files_concurrently(self):
+        """Test data files are merged from a bounded pool with progress per file."""
+        data_files = [
+            {"key": f"photos-bucket/daily/2026-01-20T00-00Z/data{i}.csv.gz", "size": 100}
+            for i in range(5)
+        ]
+        files = {
+            "photos-bucket/daily/2026-01-20T00-00Z/manifest.json":
+                create_s3_manifest(data_files=data_files).encode("utf-8"),
+        }
+        for i, data_file in enumerate(data_files):
+            files[data_file["key"]] = create_s3_csv_data([{"key": f"folder{i}/file.jpg", "size": i}])
+        adapter = MockS3Adapter(files)
+
+        config = {
+            "destination_bucket": "inventory-bucket",
+            "source_bucket": "photos-bucket",
+            "config_name": "daily",
+        }
+
+        progress_messages = []
+        tool = InventoryImportTool(
+            adapter, config, "s3",
+            lambda s, p, m: progress_messages.append(m) if s == "processing_data" else None,
+            download_workers=2,
+        )
+        result = await tool.execute()
+
+        assert result.success is True
+        assert sorted(entry.key for entry in result.all_entries) == [f"folder{i}/file.jpg" for i in range(5)]
+        assert progress_messages[-1] == "Processed data file 5/5"
+        assert len(progress_messages) == 6
+
     @pytest.mark.asyncio
     async def test_s3_import_missing_manifest(self):
         """Test S3 import fails gracefully when manifest not found."""
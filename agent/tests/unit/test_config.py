@@ -183,6 +183,40 @@ class TestConfigValidation:
 
         assert "poll" in str(exc_info.value).lower()
 
+    def test_invalid_validation_parallelism(self, temp_config_dir):
+        """Test validation of pipeline validation workers and chunk size."""
+        from src.config import AgentConfig, ConfigValidationError
+
+        config = AgentConfig(config_dir=temp_config_dir)
+        config.server_url = "http://localhost:8000"
+        assert config.validation_workers == 1
+        config.validate()  # Serial default is valid
+
+        config.validation_workers = 0
+        with pytest.raises(ConfigValidationError) as exc_info:
+            config.validate()
+        assert "validation_workers" in str(exc_info.value)
+
+        config.validation_workers = 4
+        config.validation_chunk_size = 0
+        with pytest.raises(ConfigValidationError) as exc_info:
+            config.validate()
+        assert "validation_chunk_size" in str(exc_info.value)
+
+    def test_invalid_listing_cache_max_age(self, temp_config_dir):
+        """Test validation of the listing cache staleness bound."""
+        from src.config import AgentConfig, ConfigValidationError
+
+        config = AgentConfig(config_dir=temp_config_dir)
+        config.server_url = "http://localhost:8000"
+        assert config.listing_cache_max_age_hours == 0
+        config.validate()  # Disabled default is valid
+
+        config.listing_cache_max_age_hours = -1
+        with pytest.raises(ConfigValidationError) as exc_info:
+            config.validate()
+        assert "listing_cache_max_age_hours" in str(exc_info.value)
+
 
 class TestConfigPersistence:
     """Tests for configuration persistence."""
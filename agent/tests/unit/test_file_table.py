@@ -0,0 +1,161 @@
+"""
+Unit tests for the columnar FileTable.
+
+Tests that FileTable rows behave like the FileInfo objects they replace.
+"""
+
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.remote.base import FileInfo, FileRow, FileTable, iter_file_rows, split_file_path
+
+PATHS = [
+    "2024/vacation/AB3D0001.CR3",
+    "2024/vacation/AB3D0001.xmp",
+    "2024/vacation/AB3D0001-HDR.dng",
+    "AB3D0002.cr3",
+    "/rooted.dng",
+    "README",
+    "dir/.hidden",
+    "dir/trailing.",
+    "a.b/c.tar.gz",
+]
+
+
+@pytest.fixture
+def file_infos():
+    return [FileInfo(path=p, size=i * 100, last_modified=f"2024-01-0{i + 1}T00:00:00") for i, p in enumerate(PATHS)]
+
+
+class TestFileTable:
+    """Tests for FileTable and FileRow."""
+
+    def test_rows_match_file_info(self, file_infos):
+        """Test every row exposes the same attributes as the FileInfo."""
+        table = FileTable(file_infos)
+
+        assert len(table) == len(file_infos)
+        for row, info in zip(table, file_infos, strict=True):
+            assert isinstance(row, FileInfo)
+            assert (row.path, row.size, row.last_modified) == (info.path, info.size, info.last_modified)
+            assert (row.name, row.stem, row.extension) == (info.name, info.stem, info.extension)
+
+    def test_split_file_path_matches_file_info(self, file_infos):
+        """Test split_file_path() follows the FileInfo property rules."""
+        for info in file_infos:
+            assert split_file_path(info.path) == (info.name, info.stem, info.extension)
+
+    def test_iter_split(self, file_infos):
+        """Test column iteration matches iter_file_rows() on plain FileInfo."""
+        table = FileTable(file_infos)
+
+        assert list(table.iter_split()) == list(iter_file_rows(file_infos))
+        assert list(iter_file_rows(table)) == list(iter_file_rows(file_infos))
+
+    def test_directories_and_extensions_are_interned(self):
+        """Test repeated directories and extensions are stored once."""
+        table = FileTable()
+        for i in range(100):
+            table.append(f"2024/vacation/IMG_{i:04d}.CR3", i)
+
+        assert table._directories == ["", "2024/vacation/"]
+        assert table._extensions == ["", ".cr3"]
+        assert table.total_size == sum(range(100))
+
+    def test_names_span_chunks(self):
+        """Test names are read back correctly across packed chunks."""
+        count = FileTable.NAME_CHUNK_SIZE * 2 + 5
+        paths = [f"d{i % 3}/IMG_{i}.dng" for i in range(count)]
+        table = FileTable(FileInfo(path=p, size=i) for i, p in enumerate(paths))
+
+        assert [row.path for row in table] == paths
+        assert [path for path, *_ in table.iter_split()] == paths
+        assert table[FileTable.NAME_CHUNK_SIZE].path == paths[FileTable.NAME_CHUNK_SIZE]
+
+    @pytest.mark.parametrize("timestamp", [
+        None,
+        "2024-01-01T10:00:00",
+        "2024-01-01T10:00:00.123456",
+        "2024-01-01T10:00:00.000Z",
+        "2024-01-01T10:00:00+02:00",
+        "1960-05-05T05:05:05-05:00",
+        "0999-01-01T00:00:00",
+        "2023-02-29T00:00:00",
+        "2024-01-01T24:00:00",
+        "2024-01-01 10:00:00",
+        "not a timestamp",
+    ])
+    def test_timestamps_round_trip(self, timestamp):
+        """Test packed timestamps format back to exactly the original text."""
+        table = FileTable()
+        table.append("a.dng", 1, timestamp)
+        table.append("b.dng", 1, "2024-06-01T12:30:45Z")
+
+        assert table[0].last_modified == timestamp
+        assert table[1].last_modified == "2024-06-01T12:30:45Z"
+
+    def test_equality_with_file_info(self, file_infos):
+        """Test rows and tables compare equal to the FileInfo they hold."""
+        table = FileTable(file_infos)
+
+        assert table[0] == file_infos[0]
+        assert file_infos[0] == table[0]
+        assert table[0] != file_infos[1]
+        assert table == file_infos
+        assert FileTable() == []
+
+    def test_indexing(self, file_infos):
+        """Test negative indexes, slices and out-of-range access."""
+        table = FileTable(file_infos)
+
+        assert table[-1].path == PATHS[-1]
+        assert [row.path for row in table[1:3]] == PATHS[1:3]
+        with pytest.raises(IndexError):
+            table[len(PATHS)]
+
+    def test_extend_from_table(self, file_infos):
+        """Test extending from another table copies its rows."""
+        table = FileTable(file_infos[:2])
+        table.extend(FileTable(file_infos[2:]))
+
+        assert table == file_infos
+
+    def test_extend_merges_columns(self):
+        """Test extending remaps interned columns and keeps names chunked."""
+        first = [FileInfo(path=f"b/IMG_{i}.dng", size=i, last_modified="2024-01-01T00:00:00Z")
+                 for i in range(FileTable.NAME_CHUNK_SIZE + 3)]
+        second = [FileInfo(path=f"a/IMG_{i}.CR3", size=i, last_modified=f"2024-01-01 00:00:0{i % 10}")
+                  for i in range(FileTable.NAME_CHUNK_SIZE + 7)]
+        second.append(FileInfo(path="b/other.dng", size=1, last_modified="not a timestamp"))
+
+        table = FileTable(first)
+        table.extend(FileTable(second))
+        table.extend(table)
+
+        expected = first + second + first + second
+        assert table == expected
+        assert list(table.iter_split()) == list(iter_file_rows(expected))
+        assert table._directories == ["", "b/", "a/"]
+        assert table.total_size == sum(f.size for f in expected)
+
+    def test_row_pickles_as_file_info(self, file_infos):
+        """Test a row pickles as a plain FileInfo, not the whole table."""
+        row = FileTable(file_infos)[0]
+
+        restored = pickle.loads(pickle.dumps(row))
+
+        assert type(restored) is FileInfo
+        assert restored == file_infos[0]
+        assert isinstance(row, FileRow)
+
+    def test_rows_have_no_instance_dict(self, file_infos):
+        """Test FileInfo and FileRow are fully slotted."""
+        row = FileTable(file_infos)[0]
+
+        assert not hasattr(row, "__dict__")
+        assert not hasattr(file_infos[0], "__dict__")
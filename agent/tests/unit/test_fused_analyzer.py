@@ -0,0 +1,104 @@
+"""
+Unit tests for fused_analyzer module.
+
+Tests that ListingIndex, which walks a listing once for the PhotoStats
+analyses, gives the same results as the per-tool analyzers.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))  # For utils
+
+from src.analysis.fused_analyzer import ListingIndex
+from src.analysis.photostats_analyzer import analyze_pairing, calculate_stats
+from src.remote.base import FileInfo, FileTable
+
+PHOTO_EXTS = {'.cr3', '.dng'}
+METADATA_EXTS = {'.xmp'}
+
+
+@pytest.fixture
+def files():
+    """Mixed listing: pairs, orphans, separate images, invalid names, other files."""
+    return [
+        FileInfo(path="2024/AB3D0001.cr3", size=25000),
+        FileInfo(path="2024/AB3D0001.xmp", size=100),
+        FileInfo(path="2024/AB3D0001-HDR.DNG", size=40000),
+        FileInfo(path="2024/AB3D0001-2.cr3", size=24000),
+        FileInfo(path="2024/AB3D0002.cr3", size=26000),
+        FileInfo(path="2024/AB3D0003.xmp", size=120),
+        FileInfo(path="2024/XY9Z0010-BW.dng", size=30000),
+        FileInfo(path="2024/XY9Z0010-BW.xmp", size=90),
+        FileInfo(path="2024/invalid.cr3", size=1000),
+        FileInfo(path="2024/notes.txt", size=10),
+        FileInfo(path="README", size=5),
+    ]
+
+
+class TestListingIndex:
+    """Tests for ListingIndex."""
+
+    def test_split_matches_file_info(self, files):
+        """Test each path is split exactly like the FileInfo properties."""
+        index = ListingIndex(files)
+
+        assert index.file_count == len(files)
+        assert list(index.iter_entries()) == [(f.path, f.name, f.stem, f.extension) for f in files]
+
+    def test_streamed_listing_is_kept_as_file_table(self, files):
+        """Test a streamed listing is collected into a FileTable with the same results."""
+        index = ListingIndex(iter(files))
+
+        assert isinstance(index._files, FileTable)
+        assert index.file_count == len(files)
+        assert index.calculate_stats(PHOTO_EXTS, METADATA_EXTS) == \
+            calculate_stats(files, PHOTO_EXTS, METADATA_EXTS)
+        assert index.analyze_pairing(PHOTO_EXTS, METADATA_EXTS, {'.cr3'}) == \
+            analyze_pairing(files, PHOTO_EXTS, METADATA_EXTS, {'.cr3'})
+
+    def test_parts_are_built_on_demand(self, files):
+        """Test only the parts a tool reads are built."""
+        index = ListingIndex(FileTable(files))
+
+        index.calculate_stats(PHOTO_EXTS, METADATA_EXTS)
+        assert index._stem_groups is None
+
+        index.analyze_pairing(PHOTO_EXTS, METADATA_EXTS, {'.cr3'})
+        assert index._stem_groups is not None
+
+    @pytest.mark.parametrize("as_table", [False, True])
+    def test_stem_groups_match_dict_grouping(self, files, as_table):
+        """Test StemGroups equal grouping (path, extension) pairs in a dict."""
+        expected = {}
+        for f in files:
+            expected.setdefault(f.stem, []).append((f.path, f.extension))
+
+        index = ListingIndex(FileTable(files) if as_table else files)
+
+        assert list(index.stem_groups) == list(expected)
+        assert dict(index.stem_groups.items()) == expected
+
+    def test_count_files(self, files):
+        """Test counting files by extension is case-insensitive."""
+        index = ListingIndex(files)
+
+        assert index.count_files({'.CR3'}) == 4
+        assert index.count_files({'.xmp', '.dng'}) == 5
+
+    def test_calculate_stats_matches(self, files):
+        """Test PhotoStats counts match calculate_stats()."""
+        index = ListingIndex(files)
+
+        assert index.calculate_stats(PHOTO_EXTS, METADATA_EXTS) == \
+            calculate_stats(files, PHOTO_EXTS, METADATA_EXTS)
+
+    def test_analyze_pairing_matches(self, files):
+        """Test PhotoStats pairing matches analyze_pairing()."""
+        index = ListingIndex(files)
+
+        assert index.analyze_pairing(PHOTO_EXTS, METADATA_EXTS, {'.cr3'}) == \
+            analyze_pairing(files, PHOTO_EXTS, METADATA_EXTS, {'.cr3'})
@@ -17,7 +17,9 @@ import pytest
 from src.input_state import (
     InputStateComputer,
     check_no_change,
+    compute_directory_file_digests,
     get_input_state_computer,
+    roll_up_directory_digests,
 )
 from src.remote.base import FileInfo
 
@@ -161,6 +163,57 @@ class TestComputeFileListHashFromFileInfo:
         assert count == 1
 
 
+# ============================================================================
+# Test: directory digest tree
+# ============================================================================
+
+# Shared with backend/tests/unit/test_input_state_service.py
+TREE_FILES = [
+    ("a.dng", 10, 1704067200),
+    ("2024/trip/b.dng", 20, 1704067201.9),
+    ("2024/b.xmp", 30, 0),
+]
+TREE_HASH = "a28121b7f413e801adb3632649e137d30c085848de5c41f80006a30fd24a660a"
+
+
+class TestDirectoryDigestTree:
+    """Tests for the per-directory file list hash."""
+
+    def test_known_hash(self, computer):
+        """Should match the hash the backend computes for the same files."""
+        assert computer._compute_file_list_hash(TREE_FILES) == TREE_HASH
+
+    def test_groups_files_by_directory(self):
+        """Should compute one files digest per directory holding files."""
+        digests = compute_directory_file_digests(TREE_FILES)
+
+        assert sorted(digests) == ["", "2024/", "2024/trip/"]
+
+    def test_roll_up_includes_ancestors(self):
+        """Should include ancestors of directories holding files."""
+        trees = roll_up_directory_digests(compute_directory_file_digests([("x/y/z/a.dng", 1, 0)]))
+
+        assert sorted(trees) == ["", "x/", "x/y/", "x/y/z/"]
+
+    def test_change_only_rehashes_its_directory(self):
+        """Should change one files digest and the tree digests up to the root."""
+        changed = TREE_FILES[:1] + [("2024/trip/b.dng", 21, 1704067201)] + TREE_FILES[2:]
+        before = compute_directory_file_digests(TREE_FILES)
+        after = compute_directory_file_digests(changed)
+
+        assert [d for d in before if before[d] != after[d]] == ["2024/trip/"]
+        before_trees = roll_up_directory_digests(before)
+        after_trees = roll_up_directory_digests(after)
+        assert all(before_trees[d] != after_trees[d] for d in ["", "2024/", "2024/trip/"])
+
+    def test_directory_structure_is_hashed(self, computer):
+        """Should distinguish the same names in different directories."""
+        flat = computer._compute_file_list_hash([("a/b.dng", 1, 0)])
+        nested = computer._compute_file_list_hash([("a/b/b.dng", 1, 0)])
+
+        assert flat != nested
+
+
 # ============================================================================
 # Test: compute_configuration_hash
 # ============================================================================
@@ -468,6 +468,29 @@ class TestPhaseBPipeline:
         assert len(result.collection_file_info["col_test001"]) == 3
         assert len(result.collection_file_info["col_test002"]) == 0
 
+    def test_phase_b_nested_and_duplicate_folder_paths(self, mock_adapter, phase_a_result):
+        """Test collections with nested or identical folder paths each get their entries."""
+        tool = InventoryImportTool(
+            adapter=mock_adapter,
+            inventory_config={},
+            connector_type="s3"
+        )
+
+        collections_data = [
+            {"collection_guid": "col_test001", "folder_path": "2020/vacation"},
+            {"collection_guid": "col_test002", "folder_path": "2020/"},
+            {"collection_guid": "col_test003", "folder_path": "2020/vacation/"},
+            {"collection_guid": "col_test004", "folder_path": "2021/birthday/"},
+        ]
+
+        result = tool.execute_phase_b(phase_a_result, collections_data)
+
+        assert result.collections_processed == 4
+        assert len(result.collection_file_info["col_test001"]) == 3
+        assert len(result.collection_file_info["col_test002"]) == 5
+        assert len(result.collection_file_info["col_test003"]) == 3
+        assert len(result.collection_file_info["col_test004"]) == 1
+
     def test_phase_b_file_info_structure(self, mock_adapter, phase_a_result):
         """Test Phase B FileInfo has correct structure."""
         tool = InventoryImportTool(
@@ -17,15 +17,20 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.analysis.inventory_parser import (
     InventoryEntry,
+    InventoryTable,
     S3Manifest,
     GCSManifest,
     parse_s3_manifest,
     parse_gcs_manifest,
     parse_s3_csv_stream,
     parse_gcs_csv_stream,
+    read_s3_csv_table,
+    read_gcs_csv_table,
+    read_parquet_table,
     extract_folders,
     extract_folders_from_entries,
     count_files_by_folder,
+    summarize_folders,
 )
 
 
@@ -843,3 +848,169 @@ class TestParquetFormatDetection:
 
         # The declared format should be used
         assert manifest.file_format == "Parquet"
+
+
+class TestInventoryTable:
+    """Tests for columnar InventoryTable parsing and helpers."""
+
+    SCHEMA = ["Bucket", "Key", "Size", "LastModifiedDate", "ETag", "StorageClass"]
+
+    def test_read_s3_csv_table(self):
+        """Test S3 CSV rows are parsed into table columns."""
+        csv_data = (
+            b'bucket,2020/a.jpg,1000,2022-01-01T00:00:00.000Z,abc,STANDARD\n'
+            b'bucket,2020/,0,2022-01-01T00:00:00.000Z,,STANDARD\n'
+            b'bucket,2020/b.jpg,bad,,,\n'
+        )
+
+        table = read_s3_csv_table(gzip.compress(csv_data), self.SCHEMA)
+
+        assert isinstance(table, InventoryTable)
+        assert list(table) == [
+            InventoryEntry("2020/a.jpg", 1000, "2022-01-01T00:00:00.000Z", "abc", "STANDARD"),
+            InventoryEntry("2020/b.jpg", 0, None, None, None),
+        ]
+
+    def test_read_s3_csv_table_skips_wrong_column_count(self):
+        """Test rows whose column count does not match the schema are skipped."""
+        csv_data = b'bucket,a.jpg,1,x,y,z\nbucket,short\nbucket,b.jpg,2,x,y,z\n'
+
+        table = read_s3_csv_table(csv_data, self.SCHEMA, is_gzipped=False)
+
+        assert [entry.key for entry in table] == ["a.jpg", "b.jpg"]
+
+    @pytest.mark.parametrize("key", ["NA", "N/A", "null", "NULL", "NaN", "nan", "#N/A", "n/a", "None"])
+    def test_read_s3_csv_table_keeps_null_like_keys(self, key):
+        """Test keys that look like null tokens are kept (only empty fields are null)."""
+        csv_data = f'bucket,{key},10,,,\nbucket,"{key}",20,NA,null,N/A\n'.encode()
+
+        table = read_s3_csv_table(gzip.compress(csv_data), self.SCHEMA)
+
+        assert list(table) == [
+            InventoryEntry(key, 10, None, None, None),
+            InventoryEntry(key, 20, "NA", "null", "N/A"),
+        ]
+
+    def test_read_empty_csv(self):
+        """Test empty data files produce empty tables."""
+        assert len(read_s3_csv_table(gzip.compress(b""), self.SCHEMA)) == 0
+        assert len(read_gcs_csv_table(b"")) == 0
+
+    def test_read_gcs_csv_table_missing_columns(self):
+        """Test GCS columns missing from the header become None."""
+        csv_data = b"name,size\n2020/a.jpg,10\n"
+
+        table = read_gcs_csv_table(csv_data)
+
+        assert list(table) == [InventoryEntry("2020/a.jpg", 10, None, None, None)]
+
+    def test_read_parquet_table_formats_timestamps(self):
+        """Test Parquet timestamp columns become ISO 8601 UTC strings."""
+        import io
+        from datetime import datetime, timezone
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        modified = datetime(2022, 11, 25, 13, 30, 49, tzinfo=timezone.utc)
+        buf = io.BytesIO()
+        pq.write_table(pa.table({
+            "Key": ["2020/a.jpg"],
+            "Size": [100],
+            "LastModifiedDate": pa.array([modified], pa.timestamp("ms", tz="UTC")),
+        }), buf)
+
+        table = read_parquet_table(buf.getvalue(), provider="s3")
+
+        assert table[0].last_modified == "2022-11-25T13:30:49.000Z"
+
+    def test_from_entries_round_trip(self):
+        """Test InventoryEntry objects round-trip through a table."""
+        entries = [
+            InventoryEntry("a/1.jpg", 1, "2022-01-01T00:00:00Z", "e1", "STANDARD"),
+            InventoryEntry("b/2.jpg", 2),
+        ]
+
+        table = InventoryTable.from_entries(entries)
+
+        assert list(table) == entries
+        assert table[-1] == entries[-1]
+        assert len(InventoryTable.concat([table, table])) == 4
+        assert len(InventoryTable()) == 0
+
+    def test_total_size_and_filter_prefix(self):
+        """Test total size and key prefix filtering."""
+        table = InventoryTable.from_entries([
+            InventoryEntry("2020/a.jpg", 10),
+            InventoryEntry("2020b/b.jpg", 20),
+            InventoryEntry("2021/c.jpg", 30),
+        ])
+
+        assert table.total_size() == 60
+        assert InventoryTable().total_size() == 0
+        assert [entry.key for entry in table.filter_prefix("2020/")] == ["2020/a.jpg"]
+
+
+    def test_prefix_range_on_sorted_table(self):
+        """Test binary search finds the contiguous run of keys with a prefix."""
+        table = InventoryTable.from_entries([
+            InventoryEntry("2021/c.jpg", 3),
+            InventoryEntry("2020/b.jpg", 2),
+            InventoryEntry("2020-old/d.jpg", 4),
+            InventoryEntry("2020/a.jpg", 1),
+        ]).sort_by_key()
+
+        assert [entry.key for entry in table] == ["2020-old/d.jpg", "2020/a.jpg", "2020/b.jpg", "2021/c.jpg"]
+        assert table.prefix_range("2020/") == (1, 3)
+        assert table.prefix_range("2019/") == (0, 0)
+        assert table.prefix_range("2022/") == (4, 4)
+        assert [entry.key for entry in table.filter_prefix("2020/")] == ["2020/a.jpg", "2020/b.jpg"]
+
+    def test_prefix_range_requires_sorted_table(self):
+        """Test prefix_range() rejects unsorted tables."""
+        table = InventoryTable.from_entries([InventoryEntry("a.jpg", 1)])
+
+        with pytest.raises(ValueError, match="sorted by key"):
+            table.prefix_range("a")
+
+    def test_prefix_ranges_disjoint_and_nested(self):
+        """Test prefix ranges with disjoint, nested and duplicate prefixes."""
+        table = InventoryTable.from_entries([
+            InventoryEntry(f"{folder}/{i}.jpg", i)
+            for folder in ["2020/vacation", "2020/wedding", "2021/trip"]
+            for i in range(3)
+        ]).sort_by_key()
+
+        assert table.prefix_ranges(["2021/trip/", "2020/vacation/", "2020/vacation/", "2020/zoo/"]) == {
+            "2020/vacation/": (0, 3),
+            "2020/zoo/": (6, 6),
+            "2021/trip/": (6, 9),
+        }
+        assert table.prefix_ranges(["2020/", "2020/wedding/"]) == {
+            "2020/": (0, 6),
+            "2020/wedding/": (3, 6),
+        }
+
+
+class TestSummarizeFolders:
+    """Tests for summarize_folders()."""
+
+    def test_matches_extract_and_count(self):
+        """Test results match extract_folders() and count_files_by_folder()."""
+        entries = [
+            InventoryEntry("root.jpg", 5),
+            InventoryEntry("2020/a.jpg", 10),
+            InventoryEntry("2020/Event/b.jpg", 20),
+            InventoryEntry("2020/Event/c.jpg", 30),
+            InventoryEntry("2021/Trip/Day 1/d.jpg", 40),
+        ]
+
+        folders, folder_stats = summarize_folders(InventoryTable.from_entries(entries))
+
+        assert folders == extract_folders(entry.key for entry in entries)
+        assert folder_stats == count_files_by_folder(entries)
+        assert folder_stats["2020/"] == {"file_count": 3, "total_size": 60}
+
+    def test_empty_table(self):
+        """Test an empty table has no folders."""
+        assert summarize_folders(InventoryTable()) == (set(), {})
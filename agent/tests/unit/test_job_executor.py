@@ -280,6 +280,19 @@ class TestExecute:
         # Check that the reporter was created and is in closed state
         assert executor._progress_reporter._closed is True
 
+    @pytest.mark.asyncio
+    async def test_execute_clears_filename_parse_cache(self, mock_api_client, sample_job_claim_response):
+        """Parsed filename stems are not kept across jobs."""
+        executor = JobExecutor(mock_api_client)
+
+        with patch.object(executor, '_execute_tool', new_callable=AsyncMock) as mock_execute, \
+                patch("src.job_executor.FilenameParser.clear_parse_cache") as mock_clear:
+            mock_execute.return_value = JobResult(success=True, results={"total_files": 0})
+
+            await executor.execute(sample_job_claim_response)
+
+        mock_clear.assert_called_once()
+
 
 class TestSyncProgressCallback:
     """Tests for synchronous progress callback."""
@@ -468,6 +481,85 @@ class TestPipelineConfigCreation:
         assert config.branching_nodes[0].condition_description == "If HDR"
 
 
+class TestPhotoPairingGrouping:
+    """Tests for in-memory and out-of-core grouping in Photo Pairing jobs."""
+
+    @pytest.mark.asyncio
+    async def test_external_grouping_matches_in_memory(self, mock_api_client, tmp_path):
+        """Photo rows streamed into ExternalImageGroups give the same analytics."""
+        for name in ("AB3D0001.dng", "AB3D0001-HDR.dng", "AB3D0002.cr3", "AB3D0002.xmp", "bad.dng"):
+            (tmp_path / name).write_bytes(b"data")
+        config = {"photo_extensions": [".dng", ".cr3"], "metadata_extensions": [".xmp"]}
+
+        async def run():
+            executor = JobExecutor(mock_api_client)
+            executor._sync_progress_callback = MagicMock()
+            return await executor._run_photo_pairing(str(tmp_path), config)
+
+        in_memory = await run()
+        with patch("src.job_executor.EXTERNAL_SORT_MIN_FILES", 0), \
+                patch("src.job_executor.build_imagegroups") as mock_build:
+            external = await run()
+
+        mock_build.assert_not_called()
+        assert external.success, external.error_message
+        external.results.pop("scan_time")
+        in_memory.results.pop("scan_time")
+        assert external.results == in_memory.results
+        assert external.results["file_count"] == 3
+        assert external.results["invalid_files_count"] == 1
+
+
+class TestParallelPipelineValidation:
+    """Tests for pipeline validation jobs with validation_workers > 1."""
+
+    @pytest.mark.asyncio
+    async def test_collection_validated_in_worker_processes(self, mock_api_client, tmp_path):
+        """Parallel validation in spawned workers matches a serial run."""
+        pytest.importorskip("utils.pipeline_processor")
+        import src.analysis.pipeline_analyzer as pipeline_analyzer
+
+        for counter in range(1, 13):
+            (tmp_path / f"AB3D{counter:04d}.dng").write_bytes(b"raw")
+        config = {
+            "photo_extensions": [".dng"],
+            "metadata_extensions": [".xmp"],
+            "require_sidecar": [],
+            "pipeline": {
+                "name": "Test Pipeline",
+                "version": 1,
+                "guid": "pip_test123",
+                "nodes": [
+                    {"id": "n1", "type": "capture", "properties": {"name": "Camera"}},
+                    {"id": "n2", "type": "file", "properties": {"name": "RAW", "extension": ".dng"}},
+                    {"id": "n3", "type": "termination",
+                     "properties": {"name": "Done", "termination_type": "finished"}},
+                ],
+                "edges": [
+                    {"from": "n1", "to": "n2"},
+                    {"from": "n2", "to": "n3"},
+                ],
+            },
+        }
+
+        async def run(agent_config):
+            executor = JobExecutor(mock_api_client, agent_config)
+            executor._sync_progress_callback = MagicMock()
+            return await executor._run_pipeline_validation(str(tmp_path), "pip_test123", config)
+
+        serial = await run(None)
+        with patch.object(pipeline_analyzer, "PARALLEL_VALIDATION_MIN_IMAGES", 0), \
+                patch.object(pipeline_analyzer, "_validate_parallel",
+                             wraps=pipeline_analyzer._validate_parallel) as parallel_spy:
+            parallel = await run(MagicMock(validation_workers=2, validation_chunk_size=3))
+
+        parallel_spy.assert_called_once()
+        assert parallel.success, parallel.error_message
+        assert parallel.results["total_images"] == 12
+        for key in ("overall_status", "by_termination", "path_stats"):
+            assert parallel.results[key] == serial.results[key]
+
+
 # =============================================================================
 # T071: Cached FileInfo Usage Tests (Issue #107)
 # =============================================================================
@@ -650,6 +742,128 @@ class TestCachedFileInfo:
             assert call_args[0][3] is not None
             assert len(call_args[0][3]) == 1
 
+    @pytest.mark.asyncio
+    async def test_execute_tool_reads_listing_cache(self, mock_api_client, tmp_path):
+        """_execute_tool reads the listing from the listing cache when enabled."""
+        (tmp_path / "photos").mkdir()
+        (tmp_path / "photos" / "IMG_001.CR3").write_bytes(b"raw")
+        agent_config = MagicMock(listing_cache_max_age_hours=24)
+        executor = JobExecutor(mock_api_client, agent_config=agent_config)
+        job = {"guid": "job_test", "tool": "photostats", "collection_path": str(tmp_path / "photos")}
+
+        with patch("src.cache.listing_cache.get_cache_paths",
+                   return_value={"listing_cache_file": tmp_path / "listing-cache.sqlite3"}), \
+                patch.object(executor, '_run_photostats', new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = JobResult(success=True, results={})
+            await executor._execute_tool(job, {})
+
+            assert [f.path for f in mock_run.call_args[0][3]] == ["IMG_001.CR3"]
+
+            agent_config.listing_cache_max_age_hours = 0
+            await executor._execute_tool(job, {})
+            assert mock_run.call_args[0][3] is None
+
+
+class TestJobListingSnapshot:
+    """Tests for sharing one listing between NO_CHANGE detection and the tool."""
+
+    @pytest.mark.asyncio
+    async def test_local_listing_hashed_and_reused(self, mock_api_client, tmp_path):
+        """The local walk is hashed like before and handed to the tool."""
+        from src.input_state import get_input_state_computer
+        from src.remote.local_adapter import LocalAdapter
+
+        (tmp_path / "2024").mkdir()
+        (tmp_path / "IMG_001.CR3").write_bytes(b"raw")
+        (tmp_path / "2024" / "IMG_002.CR3").write_bytes(b"raw2")
+        executor = JobExecutor(mock_api_client)
+        job = {"guid": "job_test", "tool": "photostats", "collection_path": str(tmp_path)}
+
+        _, current_hash = await executor._check_no_change(job, {}, None)
+
+        computer = get_input_state_computer()
+        file_hash, _ = computer.compute_file_list_hash_from_path(str(tmp_path))
+        assert current_hash == computer.compute_input_state_hash(
+            file_hash, computer.compute_configuration_hash({}), "photostats"
+        )
+        expected = LocalAdapter({}).list_files_with_metadata(str(tmp_path))
+
+        with patch.object(executor, '_run_photostats', new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = JobResult(success=True, results={})
+            await executor._execute_tool(job, {})
+
+        assert mock_run.call_args[0][3] == expected
+        assert executor._job_listing is None
+
+    @pytest.mark.asyncio
+    async def test_listing_cache_hash_matches_walk(self, mock_api_client, tmp_path):
+        """The hash rolled up by the listing cache equals hashing a fresh walk."""
+        from src.input_state import get_input_state_computer
+
+        collection = tmp_path / "photos"
+        (collection / "2024").mkdir(parents=True)
+        (collection / "IMG_001.CR3").write_bytes(b"raw")
+        (collection / "2024" / "IMG_002.CR3").write_bytes(b"raw2")
+        executor = JobExecutor(mock_api_client, agent_config=MagicMock(listing_cache_max_age_hours=24))
+        job = {"guid": "job_test", "tool": "photostats", "collection_path": str(collection)}
+
+        with patch("src.cache.listing_cache.get_cache_paths",
+                   return_value={"listing_cache_file": tmp_path / "listing-cache.sqlite3"}), \
+                patch("src.input_state.InputStateComputer.compute_file_list_hash_from_file_info") as mock_hash:
+            file_hash, file_count, files = executor._hash_local_collection(job, str(collection))
+
+        mock_hash.assert_not_called()
+        assert (file_hash, file_count) == get_input_state_computer().compute_file_list_hash_from_path(str(collection))
+        assert len(files) == 2
+
+    @pytest.mark.asyncio
+    async def test_remote_collection_listed_once(self, mock_api_client):
+        """A changed remote collection is listed once for hash and tool."""
+        from src.remote.base import FileInfo, FileTable
+
+        adapter = MagicMock()
+        adapter.list_files_with_metadata.return_value = FileTable(
+            [FileInfo(path="IMG_001.CR3", size=3, last_modified="2024-01-01T00:00:00Z")]
+        )
+        executor = JobExecutor(mock_api_client)
+        job = {"guid": "job_test", "tool": "photo_pairing", "collection_path": "s3://bucket/photos"}
+        config = {"connector": {"guid": "con_test", "type": "s3", "name": "Test S3"}}
+
+        with patch.object(executor, '_get_storage_adapter', return_value=adapter), \
+                patch.object(executor, '_run_photo_pairing', new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = JobResult(success=True, results={})
+            no_change, current_hash = await executor._check_no_change(job, config, None)
+            await executor._execute_tool(job, config)
+
+        assert (no_change, current_hash is not None) == (False, True)
+        adapter.list_files_with_metadata.assert_called_once_with("bucket/photos")
+        assert [f.path for f in mock_run.call_args[0][3]] == ["IMG_001.CR3"]
+
+    @pytest.mark.asyncio
+    async def test_remote_no_change_hash_ignores_token_reuse(self, mock_api_client, tmp_path):
+        """A stored S3 listing is not reused by change token for the NO_CHANGE hash."""
+        from src.remote.base import FileInfo, FileTable
+
+        adapter = MagicMock(supports_directory_rescan=False)
+        adapter.listing_change_token.return_value = "v1"
+        adapter.list_files_with_metadata.return_value = FileTable([FileInfo(path="IMG_001.CR3", size=3)])
+        executor = JobExecutor(mock_api_client, agent_config=MagicMock(listing_cache_max_age_hours=24))
+        job = {"guid": "job_test", "tool": "photo_pairing", "collection_path": "s3://bucket/photos"}
+        config = {"connector": {"guid": "con_test", "type": "s3", "name": "Test S3"}}
+
+        with patch("src.cache.listing_cache.get_cache_paths",
+                   return_value={"listing_cache_file": tmp_path / "listing-cache.sqlite3"}), \
+                patch.object(executor, '_get_storage_adapter', return_value=adapter):
+            _, first_hash = await executor._check_no_change(job, config, None)
+            # New object inside an existing sub-prefix; the token is unchanged
+            adapter.list_files_with_metadata.return_value = FileTable(
+                [FileInfo(path="IMG_001.CR3", size=3), FileInfo(path="2024/IMG_002.CR3", size=4)]
+            )
+            _, second_hash = await executor._check_no_change(job, config, None)
+
+        assert adapter.list_files_with_metadata.call_count == 2
+        assert second_hash != first_hash
+
 
 # =============================================================================
 # T117: SC-007 - Zero Cloud API Calls with Cached FileInfo
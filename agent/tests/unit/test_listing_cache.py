@@ -0,0 +1,224 @@
+"""
+Unit tests for the persistent listing cache.
+
+Tests incremental directory rescans on a local tree, the max-age and
+force-refresh policy, and change-token reuse for object stores.
+"""
+
+import os
+import sys
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.cache.listing_cache import ListingCache
+from src.input_state import InputStateComputer
+from src.remote.base import FileInfo, FileTable, StorageAdapter
+from src.remote.local_adapter import LocalAdapter
+
+DAY = timedelta(days=1)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ListingCache(tmp_path / "listing-cache.sqlite3", workers=2)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Collection with nested directories."""
+    root = tmp_path / "photos"
+    for relative in ["a.dng", "2023/b.dng", "2023/b.xmp", "2024/c.cr3", "2024/trip/d.cr3", "2024/trip/d.xmp"]:
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x" * len(relative))
+    return root
+
+
+def touch_directory(path: Path) -> None:
+    """Move a directory's mtime forward (coarse filesystem clocks)."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class FakeObjectStore(StorageAdapter):
+    """Object store adapter with a controllable change token."""
+
+    def __init__(self, files):
+        super().__init__({})
+        self.files = files
+        self.token = "v1"
+        self.list_calls = 0
+
+    def list_files(self, location):
+        return [f.path for f in self.files]
+
+    def list_files_with_metadata(self, location):
+        self.list_calls += 1
+        return FileTable(self.files)
+
+    def listing_change_token(self, location):
+        return self.token
+
+    def test_connection(self):
+        return True, "ok"
+
+
+class TestListingCacheRescan:
+    """Tests for incremental directory rescans."""
+
+    def test_listing_matches_adapter(self, cache, tree):
+        """Test the first and cached listings equal a fresh adapter listing."""
+        adapter = LocalAdapter({})
+        expected = adapter.list_files_with_metadata(str(tree))
+
+        assert cache.get_listing("local|photos", adapter, str(tree), DAY) == expected
+        assert cache.get_listing("local|photos", adapter, str(tree), DAY) == expected
+
+    def test_unchanged_directories_are_not_rescanned(self, cache, tree):
+        """Test only directories with a new mtime are listed again."""
+        adapter = LocalAdapter({})
+        cache.get_listing("local|photos", adapter, str(tree), DAY)
+
+        (tree / "2024" / "trip" / "e.dng").write_bytes(b"new")
+        (tree / "2023" / "b.xmp").unlink()
+        touch_directory(tree / "2024" / "trip")
+        touch_directory(tree / "2023")
+
+        with patch.object(LocalAdapter, "scan_directory", autospec=True,
+                          side_effect=LocalAdapter.scan_directory) as mock_scan:
+            files = cache.get_listing("local|photos", adapter, str(tree), DAY)
+
+        assert sorted(call.args[2] for call in mock_scan.call_args_list) == ["2023/", "2024/trip/"]
+        assert files == adapter.list_files_with_metadata(str(tree))
+        assert "2024/trip/e.dng" in [f.path for f in files]
+        assert "2023/b.xmp" not in [f.path for f in files]
+
+    def test_removed_directory(self, cache, tree):
+        """Test files of a removed directory disappear from the listing."""
+        adapter = LocalAdapter({})
+        cache.get_listing("local|photos", adapter, str(tree), DAY)
+
+        for name in ["d.cr3", "d.xmp"]:
+            (tree / "2024" / "trip" / name).unlink()
+        (tree / "2024" / "trip").rmdir()
+        touch_directory(tree / "2024")
+
+        files = cache.get_listing("local|photos", adapter, str(tree), DAY)
+
+        assert files == adapter.list_files_with_metadata(str(tree))
+        assert not any(f.path.startswith("2024/trip/") for f in files)
+        assert cache.file_list_hash("local|photos") == InputStateComputer().compute_file_list_hash_from_file_info(files)[0]
+
+    @pytest.mark.parametrize("max_age, force_refresh", [(timedelta(0), False), (DAY, True)])
+    def test_full_refresh(self, cache, tree, max_age, force_refresh):
+        """Test expired snapshots and forced refreshes list every directory."""
+        adapter = LocalAdapter({})
+        cache.get_listing("local|photos", adapter, str(tree), DAY)
+
+        with patch.object(LocalAdapter, "scan_directory", autospec=True,
+                          side_effect=LocalAdapter.scan_directory) as mock_scan:
+            cache.get_listing("local|photos", adapter, str(tree), max_age, force_refresh=force_refresh)
+
+        assert mock_scan.call_count == 4
+
+    def test_rescan_failure_falls_back_to_adapter(self, cache, tree):
+        """Test a failing rescan returns the adapter's own listing."""
+        adapter = LocalAdapter({})
+        cache.get_listing("local|photos", adapter, str(tree), DAY)
+
+        with patch.object(LocalAdapter, "directory_mtime", side_effect=OSError("gone")):
+            files = cache.get_listing("local|photos", adapter, str(tree), DAY)
+
+        assert files == adapter.list_files_with_metadata(str(tree))
+
+
+class TestListingCacheFileListHash:
+    """Tests for the stored per-directory digests."""
+
+    def test_hash_matches_listing(self, cache, tree):
+        """Test the rolled-up hash equals hashing the returned listing."""
+        adapter = LocalAdapter({})
+        computer = InputStateComputer()
+        assert cache.file_list_hash("local|photos") is None
+
+        files = cache.get_listing("local|photos", adapter, str(tree), DAY)
+        assert cache.file_list_hash("local|photos") == computer.compute_file_list_hash_from_file_info(files)[0]
+
+        (tree / "2024" / "trip" / "e.dng").write_bytes(b"new")
+        (tree / "2023" / "b.xmp").unlink()
+        touch_directory(tree / "2024" / "trip")
+        touch_directory(tree / "2023")
+
+        files = cache.get_listing("local|photos", adapter, str(tree), DAY)
+        assert cache.file_list_hash("local|photos") == computer.compute_file_list_hash_from_file_info(files)[0]
+
+    def test_object_store_hash(self, cache):
+        """Test stored object listings are hashed by directory too."""
+        adapter = FakeObjectStore([
+            FileInfo(path="a.dng", size=1, last_modified="2024-01-01T00:00:00Z"),
+            FileInfo(path="2024/b.dng", size=2),
+        ])
+
+        files = cache.get_listing("con|bucket", adapter, "bucket", DAY)
+
+        assert cache.file_list_hash("con|bucket") == InputStateComputer().compute_file_list_hash_from_file_info(files)[0]
+
+
+class TestListingCacheObjectStore:
+    """Tests for change-token reuse."""
+
+    def test_reuses_listing_while_token_unchanged(self, cache):
+        """Test the stored listing is reused until the token changes."""
+        adapter = FakeObjectStore([FileInfo(path="a.dng", size=1, last_modified="2024-01-01T00:00:00Z")])
+
+        first = cache.get_listing("con|bucket", adapter, "bucket", DAY)
+        second = cache.get_listing("con|bucket", adapter, "bucket", DAY)
+        assert adapter.list_calls == 1
+        assert second == first
+
+        adapter.files = adapter.files + [FileInfo(path="b.dng", size=2)]
+        adapter.token = "v2"
+        third = cache.get_listing("con|bucket", adapter, "bucket", DAY)
+        assert adapter.list_calls == 2
+        assert [f.path for f in third] == ["a.dng", "b.dng"]
+
+    def test_token_reuse_can_be_refused(self, cache):
+        """Test callers that must see every change get a fresh listing."""
+        adapter = FakeObjectStore([FileInfo(path="a.dng", size=1)])
+
+        cache.get_listing("con|bucket", adapter, "bucket", DAY)
+        # Object added inside an existing sub-prefix: the token is unchanged
+        adapter.files = adapter.files + [FileInfo(path="2024/b.dng", size=2)]
+        files = cache.get_listing("con|bucket", adapter, "bucket", DAY, reuse_by_token=False)
+
+        assert adapter.list_calls == 2
+        assert [f.path for f in files] == ["a.dng", "2024/b.dng"]
+        assert cache.file_list_hash("con|bucket") == \
+            InputStateComputer().compute_file_list_hash_from_file_info(files)[0]
+
+    def test_no_token_always_lists(self, cache):
+        """Test adapters without a change check are listed every time."""
+        adapter = FakeObjectStore([FileInfo(path="a.dng", size=1)])
+        adapter.token = None
+
+        cache.get_listing("con|bucket", adapter, "bucket", DAY)
+        cache.get_listing("con|bucket", adapter, "bucket", DAY)
+
+        assert adapter.list_calls == 2
+
+    def test_invalidate(self, cache):
+        """Test invalidated collections are listed again."""
+        adapter = FakeObjectStore([FileInfo(path="a.dng", size=1)])
+
+        cache.get_listing("con|bucket", adapter, "bucket", DAY)
+        cache.invalidate("con|bucket")
+        cache.get_listing("con|bucket", adapter, "bucket", DAY)
+
+        assert adapter.list_calls == 2
@@ -13,7 +13,7 @@ import os
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.remote.local_adapter import LocalAdapter
+from src.remote.local_adapter import LocalAdapter, walk_local_files
 from src.remote.base import FileInfo
 
 
@@ -90,6 +90,56 @@ class TestLocalAdapter:
             os.unlink(temp_path)
 
 
+class TestWalkLocalFiles:
+    """Tests for the scandir-based walk_local_files()."""
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        """Nested tree with a symlinked directory and a symlinked file."""
+        for d in ["a", "a/x", "a/y", "b", "empty"]:
+            (tmp_path / d).mkdir()
+        for i, name in enumerate(["root.dng", "a/1.dng", "a/x/2.xmp", "a/y/3.cr3", "b/4.dng", ".hidden"]):
+            (tmp_path / name).write_bytes(b"x" * i)
+        (tmp_path / "linked").symlink_to(tmp_path / "a", target_is_directory=True)
+        (tmp_path / "link.dng").symlink_to(tmp_path / "b" / "4.dng")
+        return tmp_path
+
+    def test_matches_rglob(self, tree):
+        """Test the walk finds the same files, sizes and mtimes as rglob()."""
+        expected = sorted(
+            (str(p.relative_to(tree)), p.stat().st_size, p.stat().st_mtime)
+            for p in tree.rglob("*") if p.is_file()
+        )
+
+        assert sorted(walk_local_files(str(tree))) == expected
+        assert not any(path.startswith("linked") for path, _, _ in expected)
+
+    def test_parallel_order_matches_sequential(self, tree):
+        """Test parallel traversal yields files in the sequential order."""
+        sequential = list(walk_local_files(str(tree), workers=1))
+
+        assert list(walk_local_files(str(tree), workers=4)) == sequential
+        assert len(sequential) == 7
+
+    def test_iter_files_with_metadata(self, tree):
+        """Test streaming yields exactly the listed files."""
+        adapter = LocalAdapter({})
+
+        assert list(adapter.iter_files_with_metadata(str(tree))) == \
+            list(adapter.list_files_with_metadata(str(tree)))
+
+    def test_iter_files_checks_location_eagerly(self):
+        """Test a missing location raises before iteration starts."""
+        with pytest.raises(FileNotFoundError):
+            LocalAdapter({}).iter_files_with_metadata("/nonexistent/path/12345")
+
+    def test_adapter_uses_walk(self, tree):
+        """Test LocalAdapter lists exactly the walked files."""
+        adapter = LocalAdapter({})
+
+        assert sorted(adapter.list_files(str(tree))) == sorted(p for p, _, _ in walk_local_files(str(tree)))
+
+
 class TestFileInfoProperties:
     """Tests for FileInfo computed properties."""
 
@@ -10,9 +10,15 @@ from pathlib import Path
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))  # For utils
 
 from src.remote.base import FileInfo
-from src.analysis.photo_pairing_analyzer import build_imagegroups, calculate_analytics
+from src.analysis.photo_pairing_analyzer import (
+    ExternalImageGroups,
+    build_imagegroups,
+    calculate_analytics,
+)
+from utils.filename_parser import FilenameParser
 
 
 class TestBuildImagegroups:
@@ -128,6 +134,115 @@ class TestBuildImagegroups:
         assert any("2025/AB3D0001" in f for f in files_in_group)
 
 
+class TestExternalImageGroups:
+    """Tests for out-of-core ImageGroups (external sort)."""
+
+    @pytest.fixture
+    def files(self):
+        """Interleaved groups so every run holds parts of several groups."""
+        names = [
+            "AB3D0002-HDR.dng", "AB3D0001.dng", "XY1Z0001-2.cr3", "AB3D0002.dng",
+            "invalid_file.dng", "AB3D0001-2-BW.dng", "XY1Z0001.cr3", "AB3D0001-HDR.dng",
+            "AB3D0002-2.dng", "ab3d0003.dng", "XY1Z0001-2-HDR.cr3",
+        ]
+        return [FileInfo(path=f"2025/{name}", size=1000) for name in names]
+
+    @staticmethod
+    def _entries(files):
+        return ((f.path, f.name, f.stem) for f in files)
+
+    @pytest.mark.parametrize("run_size", [None, 1, 3])
+    def test_matches_build_imagegroups(self, files, run_size):
+        """Test groups and invalid files match the in-memory build."""
+        expected = build_imagegroups(files)
+
+        with ExternalImageGroups(self._entries(files), run_size=run_size) as groups:
+            assert list(groups) == expected['imagegroups']
+            assert list(groups) == expected['imagegroups']
+            assert groups.invalid_files == expected['invalid_files']
+            assert groups.file_count == len(files) - 2
+            assert groups.group_count == 3
+            assert groups.image_count == 6
+
+    def test_spills_runs_to_disk(self, files):
+        """Test listings larger than one run are sorted through temporary files."""
+        with ExternalImageGroups(self._entries(files), run_size=4) as groups:
+            assert groups.run_count == 3
+
+        assert groups.run_count == 0
+
+    def test_small_listing_stays_in_memory(self, files):
+        """Test a listing that fits in one run is not written to disk."""
+        with ExternalImageGroups(self._entries(files)) as groups:
+            assert groups.run_count == 0
+            assert len(list(groups)) == 3
+
+    def test_metadata_sorted_into_groups(self, files):
+        """Test metadata files are attached to their group, orphans dropped."""
+        metadata = [
+            ("2025/AB3D0001.xmp", "AB3D0001"),
+            ("2025/XY1Z0001-2.xmp", "XY1Z0001-2"),
+            ("2025/AB3D9999.xmp", "AB3D9999"),
+            ("2025/notes.xmp", "notes"),
+        ]
+
+        with ExternalImageGroups(self._entries(files), metadata_entries=metadata, run_size=2) as groups:
+            by_group = {group['group_id']: paths for group, paths in groups.iter_with_metadata()}
+
+        assert by_group == {
+            "AB3D0001": {"AB3D0001": ["2025/AB3D0001.xmp"]},
+            "AB3D0002": {},
+            "XY1Z0001": {"XY1Z0001-2": ["2025/XY1Z0001-2.xmp"]},
+        }
+
+    def test_calculate_analytics_streams(self, files):
+        """Test analytics over the stream match analytics over the list."""
+        expected = calculate_analytics(build_imagegroups(files)['imagegroups'], {})
+
+        with ExternalImageGroups(self._entries(files), run_size=2) as groups:
+            assert calculate_analytics(groups, {}) == expected
+
+
+class TestFilenameParserStems:
+    """Tests for FilenameParser.parse_stem() used by build_imagegroups."""
+
+    @pytest.mark.parametrize("filename", [
+        "AB3D0001.dng",
+        "AB3D0001-2-HDR_BW.cr3",
+        "XYZW0035-HDR.tiff",
+        "AB3D0001-B W.dng",
+        "AB3D0001.jp-g",
+        "ab3d0001.dng",
+        "AB3D0000.dng",
+        "AB3D0001--HDR.dng",
+        "AB3D0001-.dng",
+        "AB3D0001-x.y.dng",
+        "AB3.dng",
+    ])
+    def test_matches_parse_filename(self, filename):
+        """Test stem parsing agrees with parse_filename() on the full name."""
+        stem = filename.rsplit('.', 1)[0]
+        expected = FilenameParser.parse_filename(filename)
+
+        parsed = FilenameParser.parse_stem(stem)
+
+        if expected is None:
+            assert parsed is None
+        else:
+            assert parsed == (expected['camera_id'], expected['counter'], tuple(expected['properties']))
+
+    def test_parse_stem_is_cached_until_cleared(self):
+        """Test parse results are reused until the cache is cleared."""
+        FilenameParser.clear_parse_cache()
+
+        first = FilenameParser.parse_stem("AB3D0001-HDR")
+
+        assert first == ("AB3D", "0001", ("HDR",))
+        assert FilenameParser.parse_stem("AB3D0001-HDR") is first
+        FilenameParser.clear_parse_cache()
+        assert FilenameParser.parse_stem("AB3D0001-HDR") is not first
+
+
 class TestCalculateAnalytics:
     """Tests for calculate_analytics function."""
 
@@ -12,7 +12,12 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.remote.base import FileInfo
-from src.analysis.photostats_analyzer import calculate_stats, analyze_pairing
+from src.analysis.photostats_analyzer import (
+    SizeHistogram,
+    analyze_pairing,
+    calculate_stats,
+    size_bucket_bounds,
+)
 
 
 class TestCalculateStats:
@@ -25,7 +30,8 @@ class TestCalculateStats:
         assert result['total_files'] == 0
         assert result['total_size'] == 0
         assert result['file_counts'] == {}
-        assert result['file_sizes'] == {}
+        assert result['storage_by_type'] == {}
+        assert result['size_stats'] == {}
 
     def test_single_photo_file(self):
         """Test stats for single photo file."""
@@ -78,7 +84,7 @@ class TestCalculateStats:
         assert result['total_size'] == 1000
 
     def test_file_sizes_tracking(self):
-        """Test file sizes are tracked per extension."""
+        """Test file sizes are aggregated per extension."""
         files = [
             FileInfo(path="photo1.dng", size=1000),
             FileInfo(path="photo2.dng", size=2000),
@@ -86,7 +92,75 @@ class TestCalculateStats:
 
         result = calculate_stats(files, {'.dng'}, {'.xmp'})
 
-        assert result['file_sizes']['.dng'] == [1000, 2000]
+        assert result['storage_by_type']['.dng'] == 3000
+        stats = result['size_stats']['.dng']
+        assert (stats['count'], stats['total'], stats['min'], stats['max']) == (2, 3000, 1000, 2000)
+        assert sum(stats['buckets']) == 2
+
+    def test_image_size_stats_cover_photo_extensions_only(self):
+        """Test the image size distribution leaves out every metadata extension."""
+        files = [
+            FileInfo(path="photo1.dng", size=1000),
+            FileInfo(path="photo1.dop", size=10),
+            FileInfo(path="photo2.CR3", size=3000),
+            FileInfo(path="photo2.xmp", size=20),
+        ]
+
+        result = calculate_stats(files, {'.dng', '.cr3'}, {'.dop', '.xmp'})
+
+        image_stats = result['image_size_stats']
+        assert (image_stats['count'], image_stats['total'], image_stats['min'], image_stats['max']) == \
+            (2, 4000, 1000, 3000)
+        assert sum(image_stats['buckets']) == 2
+
+    def test_accepts_generator(self):
+        """Test the listing is consumed in one streaming pass."""
+        files = (FileInfo(path=f"photo{i}.dng", size=i) for i in range(10))
+
+        result = calculate_stats(files, {'.dng'}, {'.xmp'})
+
+        assert result['total_files'] == 10
+        assert result['total_size'] == 45
+
+
+class TestSizeHistogram:
+    """Tests for SizeHistogram."""
+
+    def test_log2_buckets(self):
+        """Test each size lands in the bucket whose bounds contain it."""
+        for size in [0, 1, 2, 3, 4, 1023, 1024, 25 * 1024 * 1024]:
+            histogram = SizeHistogram()
+            histogram.add(size)
+
+            bucket = len(histogram.to_dict()['buckets']) - 1
+            lower, upper = size_bucket_bounds(bucket)
+            assert lower <= size < upper
+
+    def test_last_bucket_is_open_ended(self):
+        """Test sizes beyond the largest bucket are counted in the last one."""
+        histogram = SizeHistogram()
+        histogram.add(1 << 60)
+
+        assert histogram.buckets[-1] == 1
+        assert size_bucket_bounds(len(histogram.buckets) - 1)[1] is None
+
+    def test_merge(self):
+        """Test merging gives the same aggregate as adding every size."""
+        sizes = [0, 5, 100, 4096, 70000, 3]
+        combined, left, right = SizeHistogram(), SizeHistogram(), SizeHistogram()
+        for size in sizes:
+            combined.add(size)
+        for size in sizes[:2]:
+            left.add(size)
+        for size in sizes[2:]:
+            right.add(size)
+
+        left.merge(right)
+        left.merge(SizeHistogram())
+
+        assert left.to_dict() == combined.to_dict()
+        assert combined.to_dict()['min'] == 0
+        assert combined.to_dict()['max'] == 70000
 
 
 class TestAnalyzePairing:
@@ -372,7 +372,7 @@ class TestPathStats:
         mock_enumerate.return_value = [SINGLE_PATH]
 
         # Each validation returns consistent with a Done termination
-        def validate_side_effect(specific_image, pipeline, show_progress=False):
+        def validate_side_effect(specific_image, pipeline, show_progress=False, plan=None, memo=None):
             term = _make_term_match(
                 termination_type="Done",
                 expected_files=[f"{specific_image.base_filename}.dng"],
@@ -434,7 +434,7 @@ class TestPathStats:
         mock_enumerate.return_value = [BRANCH_PATH_A, BRANCH_PATH_B]
 
         # Validation: images 1-3 match "Done" termination, images 4-5 match "Archive"
-        def validate_side_effect(specific_image, pipeline, show_progress=False):
+        def validate_side_effect(specific_image, pipeline, show_progress=False, plan=None, memo=None):
             counter_int = int(specific_image.counter)
             if counter_int <= 3:
                 term = _make_term_match(
@@ -504,7 +504,7 @@ class TestPathStats:
         # 3 consistent, 1 partial, 1 inconsistent
         call_count = [0]
 
-        def validate_side_effect(specific_image, pipeline, show_progress=False):
+        def validate_side_effect(specific_image, pipeline, show_progress=False, plan=None, memo=None):
             call_count[0] += 1
             idx = call_count[0]
 
@@ -0,0 +1,877 @@
+"""
+Unit tests for the compiled pipeline plan.
+
+Tests PipelinePlan compilation in utils.pipeline_processor and the
+per-version plan cache in the pipeline_analyzer module.
+"""
+
+import pickle
+import sys
+from pathlib import Path
+from types import MappingProxyType
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))  # For utils
+
+from utils.pipeline_processor import (
+    CollectionValidator,
+    FilenamePreviewGenerator,
+    ImageGroupStatus,
+    PathLimitExceededError,
+    PipelineGraph,
+    ReadinessCalculator,
+    SpecificImage,
+    ValidationMemo,
+    build_pipeline_plan,
+    build_pipeline_topology,
+    check_pipeline_path_count,
+    compile_pipeline_plan,
+    count_pipeline_paths,
+    enumerate_paths_with_pairing,
+    generate_expected_files,
+    iter_pipeline_paths,
+    validate_specific_image,
+)
+
+from src.analysis.pipeline_analyzer import (
+    clear_pipeline_plan_cache,
+    get_pipeline_plan,
+    iter_validation_results,
+    run_pipeline_validation,
+)
+from src.analysis.pipeline_config_builder import (
+    build_pipeline_config,
+    clear_compiled_pipeline_graph_cache,
+    compile_pipeline_json,
+    get_compiled_pipeline_graph,
+)
+from src.remote.base import FileInfo
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture
+def multi_method_pipeline():
+    """
+    Capture -> Raw(.cr3) -> XMP(.xmp) -> Develop[DxO_DeepPRIME, Edit] -> DNG(.dng)
+    -> Browsable Archive, plus Raw -> Black Box Archive.
+    """
+    nodes = [
+        {"id": "capture", "type": "capture", "properties": {"name": "Camera"}},
+        {"id": "raw", "type": "file", "properties": {"extension": ".cr3"}},
+        {"id": "xmp", "type": "file", "properties": {"extension": ".xmp"}},
+        {"id": "develop", "type": "process", "properties": {"method_ids": ["DxO_DeepPRIME", "Edit"]}},
+        {"id": "dng", "type": "file", "properties": {"extension": ".dng"}},
+        {"id": "blackbox", "type": "termination", "properties": {"termination_type": "Black Box Archive"}},
+        {"id": "browsable", "type": "termination", "properties": {"termination_type": "Browsable Archive"}},
+    ]
+    edges = [
+        {"from": "capture", "to": "raw"},
+        {"from": "raw", "to": "xmp"},
+        {"from": "xmp", "to": "blackbox"},
+        {"from": "xmp", "to": "develop"},
+        {"from": "develop", "to": "dng"},
+        {"from": "dng", "to": "browsable"},
+    ]
+    return build_pipeline_config(nodes, edges)
+
+
+@pytest.fixture(autouse=True)
+def _clear_plan_cache():
+    clear_pipeline_plan_cache()
+    yield
+    clear_pipeline_plan_cache()
+
+
+def _make_image(files, suffix=""):
+    base = "AB3D0001" + (f"-{suffix}" if suffix else "")
+    return SpecificImage(
+        base_filename=base,
+        camera_id="AB3D",
+        counter="0001",
+        suffix=suffix,
+        properties=[],
+        files=files,
+    )
+
+
+# =============================================================================
+# Tests for plan compilation
+# =============================================================================
+
+class TestBuildPipelinePlan:
+    """Tests for build_pipeline_plan / compile_pipeline_plan."""
+
+    def test_groups_paths_by_termination(self, multi_method_pipeline):
+        plan = compile_pipeline_plan(multi_method_pipeline)
+
+        assert plan.termination_types == ["Black Box Archive", "Browsable Archive"]
+        assert len(plan.paths_by_termination["Black Box Archive"]) == 1
+        # One path per method_id of the multi-method Process node
+        assert len(plan.paths_by_termination["Browsable Archive"]) == 2
+
+    def test_truncated_paths_counted_but_excluded(self):
+        paths = [
+            [{"id": "c", "type": "Capture"},
+             {"id": "f", "type": "File", "extension": ".dng"},
+             {"id": "t", "type": "Termination", "term_type": "Done"}],
+            [{"id": "c", "type": "Capture"},
+             {"id": None, "type": "Termination", "term_type": "TRUNCATED", "truncated": True}],
+        ]
+
+        plan = build_pipeline_plan(paths)
+
+        assert plan.total_paths == 2
+        assert plan.truncated_paths == 1
+        assert plan.termination_types == ["Done"]
+        assert plan.paths_by_termination["Done"][0].node_ids == ("c", "f", "t")
+        assert plan.paths_by_termination["Done"][0].length == 3
+
+    def test_plan_is_read_only(self, multi_method_pipeline):
+        plan = compile_pipeline_plan(multi_method_pipeline)
+
+        with pytest.raises(TypeError):
+            plan.paths_by_termination["Other"] = ()
+
+    @pytest.mark.parametrize("suffix", ["", "2"])
+    def test_expected_files_match_generate_expected_files(self, multi_method_pipeline, suffix):
+        plan = compile_pipeline_plan(multi_method_pipeline)
+        raw_paths = [
+            p for p in enumerate_paths_with_pairing(multi_method_pipeline)
+            if not p[-1].get("truncated")
+        ]
+
+        planned = [p for paths in plan.paths_by_termination.values() for p in paths]
+        assert len(planned) == len(raw_paths)
+        for planned_path, raw_path in zip(
+            sorted(planned, key=lambda p: str(list(p.nodes))),
+            sorted(raw_paths, key=str),
+            strict=True,
+        ):
+            assert planned_path.expected_files("AB3D0001", suffix) == \
+                generate_expected_files(raw_path, "AB3D0001", suffix)
+
+
+class TestValidateWithPlan:
+    """validate_specific_image must give identical results with a pre-compiled plan."""
+
+    @pytest.mark.parametrize("files", [
+        ["AB3D0001.cr3", "AB3D0001.xmp"],
+        ["AB3D0001.cr3", "AB3D0001.xmp", "AB3D0001-DxO_DeepPRIME.dng"],
+        ["AB3D0001.cr3"],
+        ["AB3D0001.cr3", "AB3D0001.xmp", "AB3D0001-Other.tif"],
+    ])
+    def test_same_result_as_uncompiled(self, multi_method_pipeline, files):
+        image = _make_image(files)
+        plan = compile_pipeline_plan(multi_method_pipeline)
+
+        assert validate_specific_image(image, multi_method_pipeline, plan=plan) == \
+            validate_specific_image(image, multi_method_pipeline)
+
+    def test_plan_skips_enumeration(self, multi_method_pipeline):
+        plan = compile_pipeline_plan(multi_method_pipeline)
+        image = _make_image(["AB3D0001.cr3", "AB3D0001.xmp"])
+
+        with patch("utils.pipeline_processor.enumerate_paths_with_pairing") as mock_enumerate:
+            validate_specific_image(image, multi_method_pipeline, plan=plan)
+
+        mock_enumerate.assert_not_called()
+
+
+# =============================================================================
+# Tests for the agent plan cache
+# =============================================================================
+
+class TestGetPipelinePlan:
+    """Tests for get_pipeline_plan caching by pipeline guid + version."""
+
+    def test_cached_by_guid_and_version(self, multi_method_pipeline):
+        first = get_pipeline_plan(multi_method_pipeline, "pip_abc", 3)
+        second = get_pipeline_plan(multi_method_pipeline, "pip_abc", 3)
+
+        assert first is second
+
+    def test_new_version_recompiles(self, multi_method_pipeline):
+        first = get_pipeline_plan(multi_method_pipeline, "pip_abc", 3)
+        second = get_pipeline_plan(multi_method_pipeline, "pip_abc", 4)
+
+        assert first is not second
+
+    def test_not_cached_without_identity(self, multi_method_pipeline):
+        first = get_pipeline_plan(multi_method_pipeline)
+        second = get_pipeline_plan(multi_method_pipeline)
+
+        assert first is not second
+        assert first == second
+
+    def test_cache_is_bounded(self, multi_method_pipeline):
+        with patch("src.analysis.pipeline_analyzer.PLAN_CACHE_MAX_ENTRIES", 2):
+            oldest = get_pipeline_plan(multi_method_pipeline, "pip_a", 1)
+            get_pipeline_plan(multi_method_pipeline, "pip_b", 1)
+            get_pipeline_plan(multi_method_pipeline, "pip_c", 1)
+
+            assert get_pipeline_plan(multi_method_pipeline, "pip_a", 1) is not oldest
+
+
+# =============================================================================
+# Tests for the signature reverse index
+# =============================================================================
+
+def _brute_force_best_expected(plan, image):
+    """Score every path of every termination, as validation did before the index."""
+    actual = {f.lower() for f in image.files}
+    base = f"{image.camera_id}{image.counter}"
+    best = {}
+    for term_type, paths in plan.paths_by_termination.items():
+        ranked = []
+        for order, path in enumerate(paths):
+            expected = {f.lower() for f in path.expected_files(base, image.suffix)}
+            matched = len(actual & expected)
+            ranked.append((-matched, path.length, len(expected - actual), order, path))
+        best[term_type] = min(ranked, key=lambda r: r[:4])[4].expected_files(base, image.suffix)
+    return best
+
+
+class TestSignatureIndex:
+    """Tests for PipelinePlan.match_candidates and index-driven validation."""
+
+    def test_candidates_for_processed_file(self, multi_method_pipeline):
+        plan = compile_pipeline_plan(multi_method_pipeline)
+
+        candidates = plan.match_candidates(
+            "AB3D0001", "", {"ab3d0001-dxo_deepprime.dng"}
+        )
+
+        browsable = plan.paths_by_termination["Browsable Archive"]
+        assert list(candidates) == ["Browsable Archive"]
+        (path_index, matched), = candidates["Browsable Archive"].items()
+        assert matched == 1
+        assert "-DxO_DeepPRIME" in [chain for chain, _ in browsable[path_index].file_templates]
+
+    def test_candidates_respect_suffix(self, multi_method_pipeline):
+        plan = compile_pipeline_plan(multi_method_pipeline)
+
+        assert plan.match_candidates("AB3D0001", "2", {"ab3d0001-2.cr3"})
+        assert not plan.match_candidates("AB3D0001", "2", {"ab3d0001.cr3"})
+        assert not plan.match_candidates("AB3D0001", "", {"ab3d0001-2.cr3"})
+
+    def test_unrelated_files_have_no_candidates(self, multi_method_pipeline):
+        plan = compile_pipeline_plan(multi_method_pipeline)
+
+        assert plan.match_candidates("AB3D0001", "", {"ab3d0001.tif", "zz990001.cr3"}) == {}
+
+    def test_no_match_uses_default_path(self, multi_method_pipeline):
+        plan = compile_pipeline_plan(multi_method_pipeline)
+        image = _make_image(["AB3D0001.tif"])
+
+        result = validate_specific_image(image, multi_method_pipeline, plan=plan)
+
+        assert {m.termination_type for m in result.termination_matches} == set(plan.termination_types)
+        assert result.overall_status.value == "INCONSISTENT"
+
+    @pytest.mark.parametrize("files,suffix", [
+        (["AB3D0001.cr3", "AB3D0001.xmp"], ""),
+        (["AB3D0001.cr3", "AB3D0001.xmp", "AB3D0001-Edit.dng"], ""),
+        (["AB3D0001-Edit.dng", "AB3D0001-DxO_DeepPRIME.dng"], ""),
+        (["AB3D0001-2.CR3", "AB3D0001-DxO_DeepPRIME-2.DNG"], "2"),
+        (["AB3D0001.tif"], ""),
+    ])
+    def test_matches_brute_force_selection(self, multi_method_pipeline, files, suffix):
+        plan = compile_pipeline_plan(multi_method_pipeline)
+        image = _make_image(files, suffix=suffix)
+
+        result = validate_specific_image(image, multi_method_pipeline, plan=plan)
+
+        expected = _brute_force_best_expected(plan, image)
+        assert {m.termination_type: m.expected_files for m in result.termination_matches} == expected
+
+
+# =============================================================================
+# Tests for ValidationMemo
+# =============================================================================
+
+def _make_counter_image(counter, files_tails, suffix=""):
+    base = f"AB3D{counter}"
+    return SpecificImage(
+        base_filename=base + (f"-{suffix}" if suffix else ""),
+        camera_id="AB3D",
+        counter=counter,
+        suffix=suffix,
+        properties=[],
+        files=[f"2025/{base}{tail}" for tail in files_tails],
+    )
+
+
+class TestValidationMemo:
+    """Tests for memoized validation of structurally identical images."""
+
+    def test_same_shape_reuses_result(self, multi_method_pipeline):
+        plan = compile_pipeline_plan(multi_method_pipeline)
+        memo = ValidationMemo(plan)
+        shape = [".CR3", ".xmp", "-DxO_DeepPRIME.dng"]
+
+        first = _make_counter_image("0001", shape)
+        second = _make_counter_image("0002", shape)
+        validate_specific_image(first, multi_method_pipeline, memo=memo)
+        memoized = validate_specific_image(second, multi_method_pipeline, memo=memo)
+
+        assert memo.hits == 1
+        assert memo.misses == 1
+        assert len(memo) == 1
+        assert memoized == validate_specific_image(second, multi_method_pipeline, plan=plan)
+
+    @pytest.mark.parametrize("shape,suffix", [
+        ([".cr3"], ""),
+        ([".cr3", ".xmp", "-Edit.dng", "-Other.tif"], ""),
+        (["-2.cr3", "-2.xmp"], "2"),
+    ])
+    def test_memoized_result_matches_direct(self, multi_method_pipeline, shape, suffix):
+        plan = compile_pipeline_plan(multi_method_pipeline)
+        memo = ValidationMemo(plan)
+
+        validate_specific_image(_make_counter_image("0001", shape, suffix), multi_method_pipeline, memo=memo)
+        image = _make_counter_image("0917", shape, suffix)
+        memoized = validate_specific_image(image, multi_method_pipeline, memo=memo)
+
+        assert memo.hits == 1
+        assert memoized == validate_specific_image(image, multi_method_pipeline, plan=plan)
+
+    def test_memoized_results_do_not_share_lists(self, multi_method_pipeline):
+        memo = ValidationMemo(compile_pipeline_plan(multi_method_pipeline))
+        shape = [".cr3"]
+
+        first = validate_specific_image(_make_counter_image("0001", shape), multi_method_pipeline, memo=memo)
+        second = validate_specific_image(_make_counter_image("0002", shape), multi_method_pipeline, memo=memo)
+        third = validate_specific_image(_make_counter_image("0003", shape), multi_method_pipeline, memo=memo)
+
+        second.termination_matches[0].missing_files.append("mutated")
+        assert "mutated" not in third.termination_matches[0].missing_files
+        assert first.termination_matches[0].expected_files[0].startswith("AB3D0001")
+
+    def test_foreign_file_is_not_memoized(self, multi_method_pipeline):
+        memo = ValidationMemo(compile_pipeline_plan(multi_method_pipeline))
+        image = _make_image(["AB3D0001.cr3", "OTHER.xmp"])
+
+        validate_specific_image(image, multi_method_pipeline, memo=memo)
+        validate_specific_image(image, multi_method_pipeline, memo=memo)
+
+        assert len(memo) == 0
+        assert memo.hits == 0
+
+    def test_lru_bound(self, multi_method_pipeline):
+        memo = ValidationMemo(compile_pipeline_plan(multi_method_pipeline), max_entries=2)
+
+        for shape in ([".cr3"], [".xmp"], [".cr3", ".xmp"]):
+            validate_specific_image(_make_counter_image("0001", shape), multi_method_pipeline, memo=memo)
+
+        assert len(memo) == 2
+        validate_specific_image(_make_counter_image("0002", [".cr3"]), multi_method_pipeline, memo=memo)
+        assert memo.hits == 0
+
+
+# =============================================================================
+# Tests for parallel validation
+# =============================================================================
+
+def _collection_files(count):
+    """Files for `count` images cycling through a few shapes and statuses."""
+    shapes = [
+        [".cr3", ".xmp", "-DxO_DeepPRIME.dng"],
+        [".cr3", ".xmp"],
+        [".cr3"],
+        [".cr3", ".xmp", "-Edit.dng", "-Other.dng"],
+    ]
+    files = []
+    for i in range(count):
+        base = f"AB3D{i + 1:04d}"
+        files.extend(FileInfo(path=f"2025/{base}{tail}", size=1000) for tail in shapes[i % len(shapes)])
+    return files
+
+
+class TestParallelValidation:
+    """Tests for process-pool validation in run_pipeline_validation."""
+
+    def test_plan_survives_pickling(self, multi_method_pipeline):
+        plan = compile_pipeline_plan(multi_method_pipeline)
+
+        restored = pickle.loads(pickle.dumps(plan))
+
+        assert restored == plan
+        assert isinstance(restored.paths_by_termination, MappingProxyType)
+
+    def test_parallel_matches_serial(self, multi_method_pipeline):
+        files = _collection_files(23)
+        args = (files, multi_method_pipeline, {".cr3", ".dng"}, {".xmp"})
+        progress = []
+
+        serial = run_pipeline_validation(*args)
+        with patch("src.analysis.pipeline_analyzer.PARALLEL_VALIDATION_MIN_IMAGES", 0):
+            parallel = run_pipeline_validation(
+                *args, workers=2, chunk_size=5,
+                progress_callback=lambda current, total, issues: progress.append((current, total, issues)),
+            )
+
+        assert parallel == serial
+        assert len(progress) == 5
+        assert progress[-1] == (23, 23, serial['status_counts']['partial'] + serial['status_counts']['inconsistent'])
+
+    def test_small_collection_stays_serial(self, multi_method_pipeline):
+        files = _collection_files(10)
+
+        with patch("src.analysis.pipeline_analyzer._validate_parallel") as mock_parallel:
+            result = run_pipeline_validation(
+                files, multi_method_pipeline, {".cr3", ".dng"}, {".xmp"}, workers=4, chunk_size=2
+            )
+
+        mock_parallel.assert_not_called()
+        assert result['total_images'] == 10
+
+    def test_progress_exception_stops_validation(self, multi_method_pipeline):
+        files = _collection_files(20)
+
+        def cancel(current, total, issues):
+            raise RuntimeError("cancelled")
+
+        with patch("src.analysis.pipeline_analyzer.PARALLEL_VALIDATION_MIN_IMAGES", 0):
+            with pytest.raises(RuntimeError, match="cancelled"):
+                run_pipeline_validation(
+                    files, multi_method_pipeline, {".cr3", ".dng"}, {".xmp"},
+                    progress_callback=cancel, workers=2, chunk_size=2,
+                )
+
+
+# =============================================================================
+# Tests for streaming validation
+# =============================================================================
+
+class TestStreamingValidation:
+    """Tests for run_pipeline_validation(retain_results=False) and iter_validation_results."""
+
+    ARGS = ({".cr3", ".dng"}, {".xmp"})
+
+    def test_streaming_keeps_aggregates(self, multi_method_pipeline):
+        files = _collection_files(16)
+
+        retained = run_pipeline_validation(files, multi_method_pipeline, *self.ARGS)
+        streamed = run_pipeline_validation(files, multi_method_pipeline, *self.ARGS, retain_results=False)
+
+        assert streamed['validation_results'] == []
+        assert len(retained['validation_results']) == 16
+        for key in ('status_counts', 'by_termination', 'path_stats', 'issue_samples'):
+            assert streamed[key] == retained[key]
+
+    def test_issue_samples_are_bounded_and_worst_first(self, multi_method_pipeline):
+        files = _collection_files(40)
+
+        result = run_pipeline_validation(
+            files, multi_method_pipeline, *self.ARGS, retain_results=False, sample_size=3
+        )
+
+        samples = result['issue_samples']
+        assert samples
+        for by_status in samples.values():
+            assert set(by_status) <= {"PARTIAL", "INCONSISTENT"}
+            for bucket in by_status.values():
+                assert 0 < len(bucket) <= 3
+                keys = [(s['completion_percentage'], s['base_filename']) for s in bucket]
+                assert keys == sorted(keys)
+
+    def test_parallel_streaming_matches_serial(self, multi_method_pipeline):
+        files = _collection_files(30)
+        serial = run_pipeline_validation(
+            files, multi_method_pipeline, *self.ARGS, retain_results=False, sample_size=2
+        )
+
+        with patch("src.analysis.pipeline_analyzer.PARALLEL_VALIDATION_MIN_IMAGES", 0):
+            parallel = run_pipeline_validation(
+                files, multi_method_pipeline, *self.ARGS,
+                workers=2, chunk_size=4, retain_results=False, sample_size=2,
+            )
+
+        assert parallel == serial
+
+    def test_iter_validation_results_is_lazy(self, multi_method_pipeline):
+        images = (_make_counter_image(f"{i:04d}", [".cr3"]) for i in range(1, 1000))
+
+        results = iter_validation_results(images, multi_method_pipeline)
+        first = next(results)
+
+        assert first.base_filename == "AB3D0001"
+        assert next(images).counter == "0002"
+
+
+class TestOutOfCoreValidation:
+    """Tests for run_pipeline_validation on listings grouped by ExternalImageGroups."""
+
+    ARGS = ({".cr3", ".dng"}, {".xmp"})
+
+    @pytest.fixture
+    def files(self):
+        # Shuffled so groups and their metadata files are spread across runs
+        files = _collection_files(25) + [
+            FileInfo(path="2025/AB3D0003-2.cr3", size=1000),
+            FileInfo(path="2025/AB3D0003-2.xmp", size=100),
+            FileInfo(path="2025/AB3D9000.xmp", size=100),
+            FileInfo(path="2025/bad_name.cr3", size=1000),
+        ]
+        return files[::2] + files[1::2]
+
+    def test_matches_in_memory(self, multi_method_pipeline, files):
+        in_memory = run_pipeline_validation(files, multi_method_pipeline, *self.ARGS)
+
+        with patch("src.analysis.pipeline_analyzer.EXTERNAL_SORT_MIN_FILES", 0), \
+                patch("src.analysis.photo_pairing_analyzer.EXTERNAL_SORT_RUN_SIZE", 7):
+            out_of_core = run_pipeline_validation(files, multi_method_pipeline, *self.ARGS)
+
+        assert out_of_core == in_memory
+
+    def test_parallel_matches_in_memory(self, multi_method_pipeline, files):
+        in_memory = run_pipeline_validation(files, multi_method_pipeline, *self.ARGS, retain_results=False)
+        progress = []
+
+        with patch("src.analysis.pipeline_analyzer.EXTERNAL_SORT_MIN_FILES", 0), \
+                patch("src.analysis.pipeline_analyzer.PARALLEL_VALIDATION_MIN_IMAGES", 0):
+            out_of_core = run_pipeline_validation(
+                files, multi_method_pipeline, *self.ARGS,
+                workers=2, chunk_size=4, retain_results=False,
+                progress_callback=lambda current, total, issues: progress.append((current, total)),
+            )
+
+        assert out_of_core == in_memory
+        assert progress[-1] == (26, 26)
+
+
+# =============================================================================
+# Path Enumeration Engine
+# =============================================================================
+
+@pytest.fixture
+def hdr_pipeline():
+    """
+    Capture -> Raw(.cr3) -> Branch -> [Black Box Archive | Bracket1, Bracket2]
+    -> HDR pairing -> Merge[HDR_A, HDR_B] -> TIF(.tif) -> Browsable Archive.
+    """
+    nodes = [
+        {"id": "capture", "type": "capture", "properties": {"name": "Camera"}},
+        {"id": "raw", "type": "file", "properties": {"extension": ".cr3"}},
+        {"id": "branch", "type": "branching", "properties": {"condition_description": "HDR?"}},
+        {"id": "bracket1", "type": "file", "properties": {"extension": ".dng"}},
+        {"id": "bracket2", "type": "file", "properties": {"extension": ".xmp"}},
+        {"id": "hdr", "type": "pairing", "properties": {"pairing_type": "HDR"}},
+        {"id": "merge", "type": "process", "properties": {"method_ids": ["HDR_A", "HDR_B"]}},
+        {"id": "tif", "type": "file", "properties": {"extension": ".tif"}},
+        {"id": "blackbox", "type": "termination", "properties": {"termination_type": "Black Box Archive"}},
+        {"id": "browsable", "type": "termination", "properties": {"termination_type": "Browsable Archive"}},
+    ]
+    edges = [
+        {"from": "capture", "to": "raw"},
+        {"from": "raw", "to": "branch"},
+        {"from": "branch", "to": "blackbox"},
+        {"from": "branch", "to": "bracket1"},
+        {"from": "branch", "to": "bracket2"},
+        {"from": "bracket1", "to": "hdr"},
+        {"from": "bracket2", "to": "hdr"},
+        {"from": "hdr", "to": "merge"},
+        {"from": "merge", "to": "tif"},
+        {"from": "tif", "to": "browsable"},
+    ]
+    return build_pipeline_config(nodes, edges)
+
+
+def _fan_out_pipeline(levels):
+    """Chain of branching nodes, each doubling the number of paths."""
+    nodes = [{"id": "capture", "type": "capture", "properties": {}}]
+    edges = [{"from": "capture", "to": "b0"}]
+    for level in range(levels):
+        nodes.append({"id": f"b{level}", "type": "branching", "properties": {}})
+        for side in ("x", "y"):
+            nodes.append({"id": f"f{level}{side}", "type": "file", "properties": {"extension": f".{side}{level}"}})
+            edges.append({"from": f"b{level}", "to": f"f{level}{side}"})
+            nxt = f"b{level + 1}" if level + 1 < levels else "done"
+            edges.append({"from": f"f{level}{side}", "to": nxt})
+    nodes.append({"id": "done", "type": "termination", "properties": {"termination_type": "Archive"}})
+    return build_pipeline_config(nodes, edges)
+
+
+class TestPathEnumeration:
+    """Tests for the topology-based path enumeration and path counting."""
+
+    def test_topology_order_and_predecessors(self, hdr_pipeline):
+        topology = build_pipeline_topology(hdr_pipeline)
+        order = {node_id: idx for idx, node_id in enumerate(topology.order)}
+        for node_id, successors in topology.successors.items():
+            for next_id in successors:
+                assert order[node_id] < order[next_id]
+        assert topology.predecessors["hdr"] == ("bracket1", "bracket2")
+        assert not topology.back_edges
+        assert not topology.cyclic_nodes
+
+    def test_loop_is_detected_as_back_edge(self):
+        nodes = [
+            {"id": "capture", "type": "capture", "properties": {}},
+            {"id": "raw", "type": "file", "properties": {"extension": ".cr3"}},
+            {"id": "edit", "type": "process", "properties": {"method_ids": ["Edit"]}},
+            {"id": "done", "type": "termination", "properties": {"termination_type": "Archive"}},
+        ]
+        edges = [
+            {"from": "capture", "to": "raw"},
+            {"from": "raw", "to": "edit"},
+            {"from": "edit", "to": "raw"},
+            {"from": "edit", "to": "done"},
+        ]
+        pipeline = build_pipeline_config(nodes, edges)
+        topology = build_pipeline_topology(pipeline)
+
+        assert topology.back_edges == frozenset({("edit", "raw")})
+        assert topology.cyclic_nodes == frozenset({"raw", "edit"})
+        paths = enumerate_paths_with_pairing(pipeline)
+        assert count_pipeline_paths(pipeline) == len(paths)
+        assert any(path[-1].get("truncated") for path in paths)
+
+    def test_pairing_paths(self, hdr_pipeline):
+        paths = enumerate_paths_with_pairing(hdr_pipeline)
+        by_nodes = sorted(tuple(node["id"] for node in path) for path in paths)
+
+        assert ("capture", "raw", "branch", "blackbox") in by_nodes
+        assert by_nodes.count(
+            ("capture", "raw", "branch", "bracket1", "bracket2", "hdr", "merge", "tif", "browsable")
+        ) == 2  # One per merge method
+
+    def test_iter_matches_list(self, hdr_pipeline):
+        assert list(iter_pipeline_paths(hdr_pipeline)) == enumerate_paths_with_pairing(hdr_pipeline)
+
+    def test_merged_paths_are_deduplicated(self, hdr_pipeline):
+        paths = enumerate_paths_with_pairing(hdr_pipeline)
+        signatures = [
+            (tuple(node["id"] for node in path), tuple(generate_expected_files(path, "AB3D0001")))
+            for path in paths
+        ]
+        assert len(signatures) == len(set(signatures))
+
+    def test_merged_paths_keep_process_methods(self):
+        """Merged paths differing only in a Process method before the Pairing node stay distinct."""
+        nodes = [
+            {"id": "capture", "type": "capture", "properties": {}},
+            {"id": "raw", "type": "file", "properties": {"extension": ".CR3"}},
+            {"id": "proc", "type": "process", "properties": {"method_ids": ["DxO", "Topaz"]}},
+            {"id": "check", "type": "branching", "properties": {"condition_description": "Keep?"}},
+            {"id": "pair", "type": "pairing", "properties": {"pairing_type": "HDR"}},
+            {"id": "tif", "type": "file", "properties": {"extension": ".TIF"}},
+            {"id": "done", "type": "termination", "properties": {"termination_type": "Archive"}},
+        ]
+        edges = [
+            {"from": "capture", "to": "raw"},
+            {"from": "raw", "to": "proc"},
+            {"from": "proc", "to": "check"},
+            {"from": "check", "to": "pair"},
+            {"from": "raw", "to": "pair"},
+            {"from": "pair", "to": "tif"},
+            {"from": "tif", "to": "done"},
+        ]
+        paths = enumerate_paths_with_pairing(build_pipeline_config(nodes, edges))
+
+        expected = sorted(tuple(generate_expected_files(path, "AB3D0001")) for path in paths)
+        assert expected == [
+            ("AB3D0001-DxO.TIF", "AB3D0001.CR3"),
+            ("AB3D0001-Topaz.TIF", "AB3D0001.CR3"),
+        ]
+
+    def test_pairing_node_loop_is_refused(self):
+        """A loop through a Pairing node is refused instead of enumerating forever."""
+        nodes = [
+            {"id": "capture", "type": "capture", "properties": {}},
+            {"id": "raw", "type": "file", "properties": {"extension": ".cr3"}},
+            {"id": "pair", "type": "pairing", "properties": {"pairing_type": "HDR"}},
+            {"id": "done", "type": "termination", "properties": {"termination_type": "Archive"}},
+        ]
+        edges = [
+            {"from": "capture", "to": "raw"},
+            {"from": "raw", "to": "pair"},
+            {"from": "pair", "to": "pair"},
+            {"from": "pair", "to": "done"},
+        ]
+        pipeline = build_pipeline_config(nodes, edges)
+
+        with pytest.raises(ValueError, match="part of a loop"):
+            enumerate_paths_with_pairing(pipeline)
+        with pytest.raises(ValueError, match="part of a loop"):
+            check_pipeline_path_count(pipeline)
+
+    def test_count_is_upper_bound(self, hdr_pipeline, multi_method_pipeline):
+        assert count_pipeline_paths(multi_method_pipeline) == len(enumerate_paths_with_pairing(multi_method_pipeline))
+        assert count_pipeline_paths(hdr_pipeline) >= len(enumerate_paths_with_pairing(hdr_pipeline))
+
+    def test_count_does_not_enumerate(self):
+        pipeline = _fan_out_pipeline(40)
+        assert count_pipeline_paths(pipeline) == 2 ** 40
+
+    def test_check_refuses_exploding_pipeline(self):
+        with pytest.raises(PathLimitExceededError):
+            check_pipeline_path_count(_fan_out_pipeline(20), max_paths=1000)
+        assert check_pipeline_path_count(_fan_out_pipeline(5), max_paths=1000) == 32
+
+    def test_plan_compilation_refuses_exploding_pipeline(self):
+        with pytest.raises(PathLimitExceededError):
+            get_pipeline_plan(_fan_out_pipeline(20))
+
+
+# =============================================================================
+# Compiled Pipeline Graph
+# =============================================================================
+
+HDR_NODES = [
+    {"id": "capture", "type": "capture", "properties": {
+        "filename_regex": "([A-Z0-9]{4})([0-9]{4})", "camera_id_group": "2",
+    }},
+    {"id": "raw", "type": "file", "properties": {"extension": ".cr3"}},
+    {"id": "xmp", "type": "file", "properties": {"extension": ".xmp"}},
+    {"id": "hdr", "type": "pairing", "properties": {"pairing_type": "HDR"}},
+    {"id": "done", "type": "termination", "properties": {"termination_type": "Archive"}},
+]
+HDR_EDGES = [
+    {"from": "capture", "to": "raw"},
+    {"from": "capture", "to": "xmp"},
+    {"from": "raw", "to": "hdr"},
+    {"from": "xmp", "to": "hdr"},
+    {"from": "hdr", "to": "done"},
+]
+
+
+class TestCompiledPipelineGraph:
+    """Tests for CompiledPipelineGraph and its per-version cache."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_graph_cache(self):
+        clear_compiled_pipeline_graph_cache()
+        yield
+        clear_compiled_pipeline_graph_cache()
+
+    def test_csr_adjacency(self):
+        graph = compile_pipeline_json(HDR_NODES, HDR_EDGES)
+
+        assert graph.node_ids == ("capture", "raw", "xmp", "hdr", "done")
+        assert graph.successors("capture") == ("raw", "xmp")
+        assert graph.predecessors("hdr") == ("raw", "xmp")
+        assert graph.successors("unknown") == ()
+        assert graph.has_edge("hdr", "done")
+        assert not graph.has_edge("raw", "xmp")
+        assert graph.pairing_inputs == (("hdr", ("raw", "xmp")),)
+        order = [graph.node_ids[idx] for idx in graph.topological_order]
+        assert order.index("raw") < order.index("hdr") < order.index("done")
+
+    def test_capture_settings(self):
+        graph = compile_pipeline_json(HDR_NODES, HDR_EDGES)
+
+        assert graph.capture_regex == "([A-Z0-9]{4})([0-9]{4})"
+        assert graph.camera_id_group == 2
+        assert graph.capture_pattern.match("AB3D0001")
+
+    def test_hashable_and_structural_equality(self):
+        first = compile_pipeline_json(HDR_NODES, HDR_EDGES)
+        second = compile_pipeline_json(HDR_NODES, HDR_EDGES)
+
+        assert first == second
+        assert len({first, second}) == 1
+
+    def test_paths_enumerated_once(self):
+        graph = compile_pipeline_json(HDR_NODES, HDR_EDGES)
+
+        assert graph.paths == enumerate_paths_with_pairing(graph.pipeline)
+        with patch("utils.pipeline_processor.enumerate_paths_with_pairing") as mock_enumerate:
+            FilenamePreviewGenerator(graph).generate_preview()
+            FilenamePreviewGenerator(graph).generate_preview()
+            mock_enumerate.assert_not_called()
+
+    def test_pipeline_graph_uses_compiled_adjacency(self):
+        graph = compile_pipeline_json(HDR_NODES, HDR_EDGES)
+        pipeline_graph = PipelineGraph(graph)
+
+        assert pipeline_graph.compiled is graph
+        assert pipeline_graph.get_parents("hdr") == ["raw", "xmp"]
+        sorted_nodes, has_cycle = pipeline_graph.topological_sort()
+        assert not has_cycle
+        assert sorted_nodes[0] == "capture"
+
+    def test_cached_by_guid_and_version(self):
+        first = get_compiled_pipeline_graph(HDR_NODES, HDR_EDGES, "pip_abc", 1)
+
+        assert get_compiled_pipeline_graph(HDR_NODES, HDR_EDGES, "pip_abc", 1) is first
+        assert get_compiled_pipeline_graph(HDR_NODES, HDR_EDGES, "pip_abc", 2) is not first
+        assert get_compiled_pipeline_graph(HDR_NODES, HDR_EDGES) is not first
+
+    def test_plan_reuses_graph_paths(self):
+        graph = compile_pipeline_json(HDR_NODES, HDR_EDGES)
+        assert graph.paths  # Enumerate up front
+
+        with patch("src.analysis.pipeline_analyzer.enumerate_paths_with_pairing") as mock_enumerate:
+            plan = get_pipeline_plan(graph.pipeline, "pip_abc", 1, graph=graph)
+            mock_enumerate.assert_not_called()
+        assert plan.total_paths == len(graph.paths)
+
+
+# =============================================================================
+# Collection Validation (web API path)
+# =============================================================================
+
+class TestCollectionValidator:
+    """Tests for CollectionValidator expected-suffix reuse and streaming readiness."""
+
+    FILES = [
+        "AB3D0001.cr3", "AB3D0001.xmp", "AB3D0001-DxO_DeepPRIME.dng", "AB3D0001-Edit.dng",
+        "AB3D0002.cr3",
+        "AB3D0003.txt",
+        "not_a_photo.jpg",
+    ]
+
+    def test_expected_suffixes(self, multi_method_pipeline):
+        suffixes = FilenamePreviewGenerator(multi_method_pipeline).expected_suffixes()
+
+        assert suffixes["Black Box Archive"] == [".cr3", ".xmp"]
+        assert suffixes["Browsable Archive"] == [
+            "-DxO_DeepPRIME.dng", "-Edit.dng", ".cr3", ".xmp",
+        ]
+
+    def test_preview_prefixes_suffixes(self, multi_method_pipeline):
+        preview = FilenamePreviewGenerator(multi_method_pipeline).generate_preview("XYZW", "0042")
+
+        assert preview["Black Box Archive"] == ["XYZW0042.cr3", "XYZW0042.xmp"]
+
+    def test_group_statuses(self, multi_method_pipeline):
+        results = CollectionValidator(multi_method_pipeline).validate(self.FILES)
+
+        assert list(results) == ["AB3D0001", "AB3D0002", "AB3D0003"]
+        assert results["AB3D0001"].status == ImageGroupStatus.CONSISTENT
+        assert results["AB3D0002"].status == ImageGroupStatus.PARTIAL
+        assert results["AB3D0002"].missing_files == [
+            "ab3d0002-dxo_deepprime.dng", "ab3d0002-edit.dng", "ab3d0002.xmp",
+        ]
+        assert results["AB3D0003"].status == ImageGroupStatus.INCONSISTENT
+
+    def test_paths_enumerated_once_per_validator(self, multi_method_pipeline):
+        validator = CollectionValidator(multi_method_pipeline)
+        with patch.object(
+            FilenamePreviewGenerator, "_find_all_paths",
+            autospec=True, side_effect=lambda generator: generator.graph.paths,
+        ) as mock_find:
+            validator.validate(self.FILES)
+            assert mock_find.call_count == 1
+
+    def test_streaming_readiness_matches_dict(self, multi_method_pipeline):
+        validator = CollectionValidator(multi_method_pipeline)
+        calculator = ReadinessCalculator(multi_method_pipeline)
+
+        streamed = calculator.calculate_from_groups(validator.iter_validate(self.FILES))
+
+        assert streamed == calculator.calculate(validator.validate(self.FILES))
+        assert streamed["total_groups"] == 3
+        assert streamed["consistent_groups"] == 1
+
+    def test_empty_readiness(self, multi_method_pipeline):
+        metrics = ReadinessCalculator(multi_method_pipeline).calculate({})
+
+        assert metrics["total_groups"] == 0
+        assert metrics["archival_ready_percentage"] == 0.0
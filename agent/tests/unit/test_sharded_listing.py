@@ -0,0 +1,163 @@
+"""
+Unit tests for prefix-sharded object store listing.
+
+Tests list_prefix_sharded() against a local fake bucket that follows
+S3/GCS listing semantics (lexicographic keys, "/" delimiter).
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.remote.base import FileTable, iter_prefix_sharded, list_prefix_sharded
+
+KEYS = sorted([
+    "photos/2023/a/IMG_0001.CR3",
+    "photos/2023/a/IMG_0001.xmp",
+    "photos/2023/b/IMG_0002.CR3",
+    "photos/2023-notes.txt",
+    "photos/2024/IMG_0003.dng",
+    "photos/2024/sub/IMG_0004.dng",
+    "photos/2024.txt",
+    "photos/README",
+    "photos/z/IMG_0005.dng",
+    "photos-archive/IMG_0006.dng",
+    "root.txt",
+])
+
+
+class FakeBucket:
+    """Lists keys like list_objects_v2 / list_blobs, recording calls."""
+
+    def __init__(self, keys, delay=0.0, fail_prefix=None):
+        self.keys = sorted(keys)
+        self.delay = delay
+        self.fail_prefix = fail_prefix
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def list_prefix(self, prefix, delimited):
+        with self._lock:
+            self.calls.append((prefix, delimited))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if prefix == self.fail_prefix:
+                raise ConnectionError(f"Failed to list '{prefix}'")
+            files = FileTable()
+            children = []
+            for i, key in enumerate(self.keys):
+                if not key.startswith(prefix):
+                    continue
+                rest = key[len(prefix):]
+                if delimited and "/" in rest:
+                    child = prefix + rest.split("/", 1)[0] + "/"
+                    if child not in children:
+                        children.append(child)
+                else:
+                    files.append(key, i, "2024-01-01T00:00:00+00:00")
+            return files, children
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class TestListPrefixSharded:
+    """Tests for list_prefix_sharded()."""
+
+    @pytest.mark.parametrize("prefix", ["", "photos/", "photos", "photos/2023/"])
+    @pytest.mark.parametrize("workers, depth", [(2, 1), (4, 2), (8, 3), (100, 5)])
+    def test_matches_sequential_listing(self, prefix, workers, depth):
+        """Test the merged listing equals one sequential listing, in order."""
+        bucket = FakeBucket(KEYS)
+
+        expected, _ = bucket.list_prefix(prefix, False)
+        files = list_prefix_sharded(bucket.list_prefix, prefix, workers, depth)
+
+        assert isinstance(files, FileTable)
+        assert files == list(expected)
+        assert [f.path for f in files] == [k for k in KEYS if k.startswith(prefix)]
+
+    def test_single_worker_lists_sequentially(self):
+        """Test one worker lists the prefix with one undelimited call."""
+        bucket = FakeBucket(KEYS)
+
+        files = list_prefix_sharded(bucket.list_prefix, "photos/", 1, 2)
+
+        assert bucket.calls == [("photos/", False)]
+        assert len(files) == 9
+
+    def test_flat_prefix_is_listed_once(self):
+        """Test a prefix without children is served by the discovery listing."""
+        bucket = FakeBucket(["flat/a.dng", "flat/b.dng"])
+
+        files = list_prefix_sharded(bucket.list_prefix, "flat/", 8, 2)
+
+        assert bucket.calls == [("flat/", True)]
+        assert [f.path for f in files] == ["flat/a.dng", "flat/b.dng"]
+
+    def test_shards_are_listed_concurrently(self):
+        """Test shards are listed in parallel, bounded by the worker count."""
+        keys = [f"p/{d:02d}/IMG_{i}.dng" for d in range(12) for i in range(3)]
+        bucket = FakeBucket(keys, delay=0.05)
+
+        files = list_prefix_sharded(bucket.list_prefix, "p/", 4, 1)
+
+        assert [f.path for f in files] == sorted(keys)
+        assert 1 < bucket.max_active <= 4
+        assert sum(1 for _, delimited in bucket.calls if not delimited) == 12
+
+    def test_discovery_stops_at_depth(self):
+        """Test child prefixes are expanded at most discovery_depth levels."""
+        bucket = FakeBucket(KEYS)
+
+        list_prefix_sharded(bucket.list_prefix, "", 100, 2)
+
+        delimited = [prefix for prefix, d in bucket.calls if d]
+        assert max(prefix.count("/") for prefix in delimited) == 1
+
+    def test_shard_errors_propagate(self):
+        """Test an error listing one shard fails the whole listing."""
+        bucket = FakeBucket(KEYS, fail_prefix="photos/2024/")
+
+        with pytest.raises(ConnectionError, match="photos/2024/"):
+            list_prefix_sharded(bucket.list_prefix, "photos/", 4, 1)
+
+
+class TestIterPrefixSharded:
+    """Tests for iter_prefix_sharded()."""
+
+    @pytest.mark.parametrize("prefix", ["", "photos/", "flat/"])
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_matches_list_prefix_sharded(self, prefix, workers):
+        """Test streaming yields the same files, in the same order."""
+        bucket = FakeBucket(KEYS + ["flat/a.dng", "flat/b.dng"])
+
+        streamed = list(iter_prefix_sharded(bucket.list_prefix, prefix, workers, 2))
+
+        assert streamed == list(list_prefix_sharded(bucket.list_prefix, prefix, workers, 2))
+
+    def test_streams_before_listing_completes(self):
+        """Test the first shard is yielded while later shards are still listing."""
+        keys = [f"p/{d:02d}/IMG_{i}.dng" for d in range(8) for i in range(3)]
+        release = threading.Event()
+        bucket = FakeBucket(keys)
+
+        def list_prefix(prefix, delimited):
+            if not delimited and prefix != "p/00/":
+                release.wait(5)
+            return bucket.list_prefix(prefix, delimited)
+
+        files = iter_prefix_sharded(list_prefix, "p/", 2, 1)
+
+        assert next(files).path == "p/00/IMG_0.dng"
+        release.set()
+        assert len(list(files)) == len(keys) - 1
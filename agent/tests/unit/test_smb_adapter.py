@@ -0,0 +1,223 @@
+"""
+Unit tests for SMBAdapter directory walking.
+
+Tests the concurrent walker against a fake share served through a
+patched smbclient.scandir().
+"""
+
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+pytest.importorskip("smbclient")
+
+from smbprotocol.exceptions import SMBConnectionClosed
+
+from src.remote.base import FileInfo, FileTable
+from src.remote.smb_adapter import SMBAdapter
+
+MTIME = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+# Directory path (relative to the share) -> entries; dicts are directories
+SHARE = {
+    "photos": {
+        "IMG_0001.CR3": 100,
+        "2023": {
+            "IMG_0002.CR3": 200,
+            "IMG_0002.xmp": 2,
+            "raw": {"IMG_0003.dng": 300},
+        },
+        "empty": {},
+        "IMG_0004.dng": 400,
+        "2024": {"IMG_0005.dng": 500},
+    },
+}
+
+
+class FakeEntry:
+    """Directory entry with the enumeration info smbclient provides."""
+
+    def __init__(self, name, value):
+        self.name = name
+        self._is_dir = isinstance(value, dict)
+        self.smb_info = SimpleNamespace(last_write_time=MTIME, end_of_file=0 if self._is_dir else value)
+
+    def is_dir(self):
+        return self._is_dir
+
+
+class FakeShare:
+    """Serves SHARE through scandir(), recording sessions and concurrency."""
+
+    def __init__(self, tree, delay=0.0):
+        self.tree = tree
+        self.delay = delay
+        self.sessions = set()
+        self.listed = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def scandir(self, path, connection_cache=None, **kwargs):
+        with self._lock:
+            self.sessions.add(id(connection_cache))
+            self.listed.append(path)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            node = self.tree
+            for part in path.split("/")[4:]:
+                node = node[part]
+            return [FakeEntry(name, value) for name, value in node.items()]
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def expected_files(tree, prefix=""):
+    """Depth-first listing: a directory's files, then its subdirectories."""
+    files = [
+        FileInfo(path=f"{prefix}{name}", size=value,
+                 last_modified=datetime.fromtimestamp(MTIME.timestamp()).isoformat())
+        for name, value in tree.items() if not isinstance(value, dict)
+    ]
+    for name, value in tree.items():
+        if isinstance(value, dict):
+            files.extend(expected_files(value, f"{prefix}{name}/"))
+    return files
+
+
+@pytest.fixture
+def adapter():
+    with patch("src.remote.smb_adapter.register_session"), \
+            patch.dict("src.remote.smb_adapter._SESSION_POOLS", clear=True):
+        yield SMBAdapter({"server": "nas", "share": "share", "username": "u", "password": "p"})
+
+
+class TestSMBWalk:
+    """Tests for SMBAdapter listing via the concurrent walker."""
+
+    def test_list_files_with_metadata(self, adapter):
+        """Test files come from enumeration info, one listing per directory."""
+        share = FakeShare(SHARE)
+
+        with patch("src.remote.smb_adapter.scandir", side_effect=share.scandir):
+            files = adapter.list_files_with_metadata("/photos")
+
+        assert isinstance(files, FileTable)
+        assert files == expected_files(SHARE["photos"], "photos/")
+        assert sorted(share.listed) == sorted(
+            "//nas/share/photos" + sub for sub in ["", "/2023", "/2023/raw", "/empty", "/2024"]
+        )
+
+    def test_list_files(self, adapter):
+        """Test list_files returns the same paths without metadata."""
+        share = FakeShare(SHARE)
+
+        with patch("src.remote.smb_adapter.scandir", side_effect=share.scandir):
+            paths = adapter.list_files("photos")
+
+        assert paths == [f.path for f in expected_files(SHARE["photos"], "photos/")]
+
+    def test_directories_listed_concurrently_on_pooled_sessions(self, adapter):
+        """Test subdirectories are listed in parallel, reusing pooled sessions."""
+        tree = {"p": {f"d{i}": {f"IMG_{i}.dng": i} for i in range(12)}}
+        share = FakeShare(tree, delay=0.05)
+
+        with patch("src.remote.smb_adapter.scandir", side_effect=share.scandir):
+            first = adapter.list_files_with_metadata("p")
+            adapter.list_files_with_metadata("p")
+
+        assert [f.path for f in first] == [f"p/d{i}/IMG_{i}.dng" for i in range(12)]
+        assert 1 < share.max_active <= SMBAdapter.WALK_WORKERS
+        assert len(share.sessions) <= SMBAdapter.WALK_WORKERS
+
+    def test_adapters_share_session_pool(self, adapter):
+        """Test new adapters for the same server and user reuse the pooled sessions."""
+        tree = {"p": {f"d{i}": {f"IMG_{i}.dng": i} for i in range(12)}}
+        share = FakeShare(tree, delay=0.01)
+
+        with patch("src.remote.smb_adapter.register_session"), \
+                patch("src.remote.smb_adapter.scandir", side_effect=share.scandir):
+            for _ in range(3):
+                SMBAdapter({"server": "nas", "share": "share", "username": "u", "password": "p"}) \
+                    .list_files_with_metadata("p")
+            other = SMBAdapter({"server": "nas", "share": "share", "username": "v", "password": "p"})
+
+        assert len(share.sessions) <= SMBAdapter.WALK_WORKERS
+        assert other._sessions is not adapter._sessions
+
+    def test_connection_closed_retries(self, adapter):
+        """Test a dropped connection resets the session pool and retries."""
+        share = FakeShare(SHARE)
+        calls = {"count": 0}
+
+        def flaky_scandir(path, **kwargs):
+            calls["count"] += 1
+            if calls["count"] == 2:
+                raise SMBConnectionClosed()
+            return share.scandir(path, **kwargs)
+
+        with patch("src.remote.smb_adapter.scandir", side_effect=flaky_scandir), \
+                patch("src.remote.smb_adapter.reset_connection_cache") as mock_reset, \
+                patch("src.remote.smb_adapter.time.sleep"):
+            files = adapter.list_files_with_metadata("photos")
+
+        assert files == expected_files(SHARE["photos"], "photos/")
+        assert mock_reset.call_count == SMBAdapter.WALK_WORKERS
+
+    def test_iter_files_resumes_without_duplicates(self, adapter):
+        """Test a drop mid-stream restarts the walk without repeating files."""
+        share = FakeShare(SHARE)
+        calls = {"count": 0}
+
+        def flaky_scandir(path, **kwargs):
+            calls["count"] += 1
+            if calls["count"] == 4:
+                raise SMBConnectionClosed()
+            return share.scandir(path, **kwargs)
+
+        with patch("src.remote.smb_adapter.scandir", side_effect=flaky_scandir), \
+                patch("src.remote.smb_adapter.reset_connection_cache"), \
+                patch("src.remote.smb_adapter.time.sleep"), \
+                patch.object(SMBAdapter, "WALK_WORKERS", 1):
+            files = list(adapter.iter_files_with_metadata("photos"))
+
+        assert files == expected_files(SHARE["photos"], "photos/")
+
+    def test_resume_skips_listed_directories_by_path(self, adapter):
+        """Test files added to a listed directory before a retry do not shift the resumed walk."""
+        tree = {"photos": {"a": {"IMG_0001.dng": 1, "sub": {"IMG_0002.dng": 2}}, "b": {"IMG_0003.dng": 3}}}
+        share = FakeShare(tree)
+        consumed_a = threading.Event()
+        dropped = []
+
+        def flaky_scandir(path, **kwargs):
+            if path.endswith("/a/sub") and not dropped:
+                # Directory "a" gains a file after its files were yielded,
+                # then the connection drops
+                consumed_a.wait(timeout=5)
+                tree["photos"]["a"]["IMG_0000.dng"] = 0
+                dropped.append(path)
+                raise SMBConnectionClosed()
+            return share.scandir(path, **kwargs)
+
+        paths = []
+        with patch("src.remote.smb_adapter.scandir", side_effect=flaky_scandir), \
+                patch("src.remote.smb_adapter.reset_connection_cache"), \
+                patch("src.remote.smb_adapter.time.sleep"):
+            for file_info in adapter.iter_files_with_metadata("photos"):
+                paths.append(file_info.path)
+                consumed_a.set()
+
+        assert dropped
+        assert paths == ["photos/a/IMG_0001.dng", "photos/a/sub/IMG_0002.dng", "photos/b/IMG_0003.dng"]
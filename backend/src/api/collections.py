@@ -1546,6 +1546,7 @@ async def clear_inventory_cache(
         collection.file_info_source = None
         collection.file_info_updated_at = None
         collection.file_info_delta = None
+        collection.file_info_hash = None
 
         db.commit()
 
@@ -30,6 +30,9 @@ class AppSettings(BaseSettings):
         SHUSAI_GEOIP_ALLOWED_COUNTRIES: Comma-separated allowed country codes (default: "" = none)
         SHUSAI_GEOIP_FAIL_OPEN: Allow unknown IPs through when True (default: False)
         SHUSAI_AGENT_DIST_DIR: Path to agent binary distribution directory (default: "" = disabled)
+        SHUSAI_FILE_CACHE_MAX_BYTES: Byte budget for cached collection file listings (default: 256 MiB)
+        SHUSAI_FILE_CACHE_DIR: Directory for file listing cache entries shared by workers
+            (default: "" = per-process memory)
     """
 
     # JWT settings for API tokens
@@ -147,6 +150,23 @@ class AppSettings(BaseSettings):
         description="Comma-separated list of tool types to run in-memory on server (default: empty = all jobs go to agents)"
     )
 
+    # Collection file listing cache (FileListingCache)
+    # Listings are evicted least-recently-used beyond the byte budget.
+    # By default each worker process keeps its own listings in memory; set
+    # SHUSAI_FILE_CACHE_DIR to a directory all workers can reach to share them.
+    file_cache_max_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        validation_alias="SHUSAI_FILE_CACHE_MAX_BYTES",
+        ge=0,
+        description="Byte budget for cached collection file listings (default: 256 MiB)"
+    )
+
+    file_cache_dir: str = Field(
+        default="",
+        validation_alias="SHUSAI_FILE_CACHE_DIR",
+        description="Directory for file listing cache entries shared by workers. Empty = per-process memory."
+    )
+
     class Config:
         env_file = ".env"
         extra = "ignore"
@@ -0,0 +1,30 @@
+"""Add file_info_hash column to collections table.
+
+Revision ID: 076_collection_file_info_hash
+Revises: 075_agent_runtime_table
+Create Date: 2026-10-16
+
+Stores the file list hash of inventory-sourced file_info, computed when
+an inventory import stores it, so server-side no-change detection during
+job claim does not rehash the whole file_info array. Existing collections
+keep NULL until their next import; the claim path hashes file_info for them.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = '076_collection_file_info_hash'
+down_revision = '075_agent_runtime_table'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'collections',
+        sa.Column('file_info_hash', sa.String(64), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_column('collections', 'file_info_hash')
@@ -43,7 +43,7 @@ from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
-from backend.src.utils.cache import FileListingCache
+from backend.src.utils.cache import create_file_listing_cache
 from backend.src.utils.job_queue import JobQueue
 from backend.src.utils.crypto import CredentialEncryptor
 from backend.src.utils.logging_config import init_logging, get_logger
@@ -445,7 +445,12 @@ async def lifespan(app: FastAPI):
 
     # Initialize application state
     logger.info("Initializing application state (cache, job queue, encryptor, websocket)")
-    app.state.file_cache = FileListingCache()
+    from backend.src.config.settings import get_settings
+    _settings = get_settings()
+    app.state.file_cache = create_file_listing_cache(
+        max_bytes=_settings.file_cache_max_bytes,
+        directory=_settings.file_cache_dir,
+    )
     app.state.job_queue = JobQueue()
     app.state.credential_encryptor = CredentialEncryptor()
     app.state.websocket_manager = get_connection_manager()
@@ -455,8 +460,6 @@ async def lifespan(app: FastAPI):
     logger.info(f"CORS allowed origins: {cors_origins}")
 
     # Validate Web Push (VAPID) configuration
-    from backend.src.config.settings import get_settings
-    _settings = get_settings()
     if _settings.vapid_configured:
         try:
             from pywebpush import webpush  # noqa: F401
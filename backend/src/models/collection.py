@@ -192,6 +192,9 @@ class Collection(Base, GuidMixin, AuditMixin):
     file_info_source = Column(String(20), nullable=True)
     # Delta summary from last inventory import: {new_count, modified_count, deleted_count, computed_at}
     file_info_delta = Column(JSONBType, nullable=True)
+    # File list hash of file_info (InputStateService.compute_inventory_file_hash),
+    # computed when file_info is stored so job claims do not rehash it
+    file_info_hash = Column(String(64), nullable=True)
 
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -7,13 +7,15 @@ Issue #107 Phase 7: Server-Side No-Change Detection
 Provides deterministic hash computation for Input State comparison.
 
 The Input State hash is computed from:
-1. File list hash: SHA-256 of sorted (relative_path, size, mtime) tuples
+1. File list hash: root of a directory tree of SHA-256 digests over
+   (relative_path, size, mtime) tuples (see roll_up_directory_digests)
 2. Configuration hash: SHA-256 of sorted tool configuration
 
 This allows detecting when a collection has changed since the last analysis.
 
 Phase 7 adds server-side detection for inventory-sourced FileInfo:
-- Server can compute hash from Collection.file_info (inventory source)
+- Server can compute hash from Collection.file_info (inventory source);
+  inventory imports store it in Collection.file_info_hash
 - During job claim, server compares hash to previous result
 - If match, job is auto-completed without sending to agent
 """
@@ -21,7 +23,7 @@ Phase 7 adds server-side detection for inventory-sourced FileInfo:
 import hashlib
 import json
 from datetime import datetime
-from typing import List, Tuple, Dict, Any, Optional, TYPE_CHECKING
+from typing import Iterable, List, Tuple, Dict, Any, Optional, TYPE_CHECKING
 
 from backend.src.utils.logging_config import get_logger
 
@@ -30,6 +32,86 @@ if TYPE_CHECKING:
 
 logger = get_logger("services")
 
+# Files digest of a directory without files of its own
+_EMPTY_DIGEST = hashlib.sha256(b"").hexdigest()
+
+
+# Must match agent/src/input_state.py compute_directory_file_digests
+def compute_directory_file_digests(
+    files: Iterable[Tuple[str, int, float]]
+) -> Dict[str, str]:
+    """
+    Compute the files digest of every directory holding files.
+
+    Files are grouped by directory ("" for the collection root, otherwise
+    the path prefix up to and including the last "/"). A directory's
+    digest is the SHA-256 of its sorted "name|size|mtime\n" lines, with
+    mtime truncated to an integer.
+
+    Args:
+        files: (relative_path, size, mtime) tuples, in any order
+
+    Returns:
+        Dict of directory -> 64-character hex SHA-256 digest
+    """
+    lines: Dict[str, List[str]] = {}
+    for path, size, mtime in files:
+        slash = path.rfind("/")
+        lines.setdefault(path[:slash + 1], []).append(f"{path[slash + 1:]}|{size}|{int(mtime)}\n")
+
+    digests: Dict[str, str] = {}
+    for directory, directory_lines in lines.items():
+        directory_lines.sort()
+        digest = hashlib.sha256()
+        for line in directory_lines:
+            digest.update(line.encode("utf-8"))
+        digests[directory] = digest.hexdigest()
+    return digests
+
+
+def _parent_directory(directory: str) -> Tuple[str, str]:
+    """Split a non-root directory ("a/b/") into its parent ("a/") and name ("b")."""
+    slash = directory.rfind("/", 0, len(directory) - 1)
+    return directory[:slash + 1], directory[slash + 1:-1]
+
+
+# Must match agent/src/input_state.py roll_up_directory_digests
+def roll_up_directory_digests(files_digests: Dict[str, str]) -> Dict[str, str]:
+    """
+    Roll per-directory files digests up into tree digests.
+
+    A directory's tree digest is the SHA-256 of its files digest (or the
+    digest of no files) followed by "\n" and its sorted "name|tree_digest\n"
+    child lines. Only directories holding files, their ancestors and the
+    root ("") take part. The root's tree digest is the file list hash.
+
+    Args:
+        files_digests: Directory -> files digest, from
+            compute_directory_file_digests()
+
+    Returns:
+        Dict of directory -> tree digest, always including the root ""
+    """
+    children: Dict[str, List[str]] = {"": []}
+    for directory in files_digests:
+        while directory not in children:
+            children[directory] = []
+            directory = _parent_directory(directory)[0]
+
+    trees: Dict[str, str] = {}
+    # Deeper directories first, so children are done before their parent
+    for directory in sorted(children, key=lambda d: d.count("/"), reverse=True):
+        child_lines = children[directory]
+        child_lines.sort()
+        digest = hashlib.sha256(f"{files_digests.get(directory, _EMPTY_DIGEST)}\n".encode("utf-8"))
+        for line in child_lines:
+            digest.update(line.encode("utf-8"))
+        trees[directory] = digest.hexdigest()
+        if directory:
+            parent, name = _parent_directory(directory)
+            children[parent].append(f"{name}|{trees[directory]}\n")
+    return trees
+
 
 class InputStateService:
     """
@@ -53,8 +135,10 @@ class InputStateService:
         """
         Compute SHA-256 hash of file list.
 
-        The file list is sorted by path to ensure deterministic ordering.
-        Each file is represented as (relative_path, size_bytes, mtime_timestamp).
+        Each file is represented as (relative_path, size_bytes, mtime_timestamp),
+        with mtime rounded down to an integer to avoid floating point issues.
+        The hash is the root of the directory digest tree, so it does not
+        depend on the order of the files.
 
         Args:
             files: List of (path, size, mtime) tuples
@@ -69,20 +153,7 @@ class InputStateService:
             ... ]
             >>> hash = service.compute_file_list_hash(files)
         """
-        # Sort by path for deterministic ordering
-        sorted_files = sorted(files, key=lambda f: f[0])
-
-        # Build canonical representation
-        # Format: "path|size|mtime\n" for each file
-        lines = []
-        for path, size, mtime in sorted_files:
-            # Round mtime to integer to avoid floating point issues
-            lines.append(f"{path}|{size}|{int(mtime)}")
-
-        content = "\n".join(lines)
-
-        # Compute SHA-256
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return roll_up_directory_digests(compute_directory_file_digests(files))[""]
 
     # Configuration keys relevant for analysis hash computation
     # Must match agent/src/input_state.py _extract_relevant_config
@@ -300,6 +371,27 @@ class InputStateService:
             logger.warning(f"Failed to parse ISO8601 timestamp: {iso_string}")
             return None
 
+    def get_collection_file_hash(
+        self,
+        collection: "Collection"
+    ) -> str:
+        """
+        Get the file list hash of a collection's inventory FileInfo.
+
+        Uses Collection.file_info_hash, stored when the inventory import
+        wrote file_info, and only hashes file_info for collections
+        imported before the column existed.
+
+        Args:
+            collection: Collection with file_info from inventory
+
+        Returns:
+            64-character hex SHA-256 hash
+        """
+        if collection.file_info_hash:
+            return collection.file_info_hash
+        return self.compute_inventory_file_hash(collection.file_info)
+
     def can_compute_server_side_hash(
         self,
         collection: "Collection"
@@ -350,8 +442,8 @@ class InputStateService:
         if not self.can_compute_server_side_hash(collection):
             return None
 
-        # Compute file hash from inventory FileInfo
-        file_hash = self.compute_inventory_file_hash(collection.file_info)
+        # File hash of the inventory FileInfo (precomputed at import)
+        file_hash = self.get_collection_file_hash(collection)
 
         # Compute configuration hash
         config_hash = self.compute_configuration_hash(configuration)
@@ -28,6 +28,7 @@ from backend.src.schemas.inventory import (
 )
 from backend.src.services.exceptions import NotFoundError, ValidationError, ConflictError
 from backend.src.services.guid import GuidService
+from backend.src.services.input_state_service import get_input_state_service
 from backend.src.utils.logging_config import get_logger
 
 
@@ -1430,7 +1431,7 @@ class InventoryService:
         Store FileInfo on a collection from inventory import.
 
         Updates the collection's file_info JSONB, file_info_updated_at,
-        and file_info_source fields.
+        file_info_source and file_info_hash fields.
 
         Args:
             collection_id: Internal collection ID
@@ -1459,6 +1460,7 @@ class InventoryService:
         collection.file_info = file_info
         collection.file_info_updated_at = datetime.utcnow()
         collection.file_info_source = "inventory"
+        collection.file_info_hash = self._compute_file_info_hash(file_info)
 
         self.db.commit()
 
@@ -1564,6 +1566,7 @@ class InventoryService:
                     collection.file_info = file_info
                     collection.file_info_updated_at = now
                     collection.file_info_source = "inventory"
+                    collection.file_info_hash = self._compute_file_info_hash(file_info)
                     updated_count += 1
             except ValueError:
                 # Skip invalid GUIDs
@@ -1583,6 +1586,24 @@ class InventoryService:
 
         return updated_count
 
+    def _compute_file_info_hash(self, file_info: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        Compute the file list hash stored alongside file_info.
+
+        Job claims compare it against previous results instead of hashing
+        the whole file_info array (see InputStateService.get_collection_file_hash).
+
+        Args:
+            file_info: List of FileInfo dicts being stored
+
+        Returns:
+            64-character hex SHA-256 hash, or None for an empty file_info
+            (server-side no-change detection does not apply to it)
+        """
+        if not file_info:
+            return None
+        return get_input_state_service().compute_inventory_file_hash(file_info)
+
     # =========================================================================
     # Scheduled Import (Phase 6 - Issue #107)
     # =========================================================================
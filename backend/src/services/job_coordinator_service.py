@@ -642,7 +642,7 @@ class JobCoordinatorService:
         from backend.src.services.input_state_service import get_input_state_service
         input_state_service = get_input_state_service()
 
-        # Compute hash from inventory FileInfo
+        # Compute hash from the file list hash stored at inventory import
         computed_hash = input_state_service.compute_collection_input_state_hash(
             collection=collection,
             configuration=config or {},
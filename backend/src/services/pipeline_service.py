@@ -36,6 +36,13 @@ from backend.src.schemas.pipelines import (
 from backend.src.services.exceptions import NotFoundError, ConflictError, ValidationError as ServiceValidationError
 from backend.src.services.guid import GuidService
 from backend.src.utils.logging_config import get_logger
+from backend.src.utils.pipeline_adapter import compile_db_pipeline, get_compiled_pipeline_graph
+from utils.pipeline_processor import (
+    CompiledPipelineGraph,
+    PathLimitExceededError,
+    check_pairing_node_loops,
+    check_pipeline_path_count,
+)
 
 
 logger = get_logger("services")
@@ -338,7 +345,8 @@ class PipelineService:
 
         is_valid, error_messages = self._validate_structure(
             pipeline.nodes_json,
-            pipeline.edges_json
+            pipeline.edges_json,
+            graph=self._get_compiled_graph(pipeline)
         )
 
         # Update pipeline validation status
@@ -361,7 +369,8 @@ class PipelineService:
     def _validate_structure(
         self,
         nodes: List[Dict[str, Any]],
-        edges: List[Dict[str, Any]]
+        edges: List[Dict[str, Any]],
+        graph: Optional[CompiledPipelineGraph] = None
     ) -> Tuple[bool, Optional[List[str]]]:
         """
         Validate pipeline graph structure.
@@ -369,6 +378,7 @@ class PipelineService:
         Args:
             nodes: Node definitions
             edges: Edge connections
+            graph: Compiled graph of nodes/edges (compiled here if omitted)
 
         Returns:
             Tuple of (is_valid, error_messages)
@@ -440,6 +450,22 @@ class PipelineService:
 
         # Note: Cycles ARE allowed in pipelines - the CLI pipeline_validation tool
         # handles loop execution limits to prevent infinite loops at runtime.
+        # Only loops through Pairing nodes, which have no such limit, are refused.
+
+        # Refuse pipelines whose path enumeration would explode (counted
+        # without enumerating, only once the graph itself is well-formed)
+        if not errors:
+            if graph is None:
+                graph = compile_db_pipeline(nodes, edges)
+            try:
+                check_pairing_node_loops(graph.topology)
+            except ValueError as e:
+                errors.append(str(e))
+        if not errors:
+            try:
+                check_pipeline_path_count(graph.pipeline, topology=graph.topology)
+            except PathLimitExceededError as e:
+                errors.append(f"Too many paths: {e}")
 
         is_valid = len(errors) == 0
         return is_valid, errors if errors else None
@@ -660,6 +686,7 @@ class PipelineService:
         base_filename = capture_node.get("properties", {}).get("sample_filename", "UNKNOWN0000")
 
         expected_files = []
+        graph = self._get_compiled_graph(pipeline)
 
         # Traverse the pipeline graph to find all file nodes
         for node in pipeline.nodes_json:
@@ -668,7 +695,7 @@ class PipelineService:
                 optional = node.get("properties", {}).get("optional", False)
 
                 # Build path from capture to this node
-                path = self._build_path_to_node(pipeline, node["id"])
+                path = self._build_path_to_node(graph, node["id"])
 
                 expected_files.append(ExpectedFile(
                     path=path,
@@ -699,12 +726,29 @@ class PipelineService:
                 return node
         raise ServiceValidationError("Pipeline missing Capture node")
 
-    def _build_path_to_node(self, pipeline: Pipeline, target_id: str) -> str:
+    def _get_compiled_graph(self, pipeline: Pipeline) -> CompiledPipelineGraph:
         """
-        Build path string from root to target node.
+        Get the compiled graph of a pipeline's current version.
 
         Args:
             pipeline: Pipeline model
+
+        Returns:
+            CompiledPipelineGraph, cached per (guid, version)
+        """
+        return get_compiled_pipeline_graph(
+            pipeline.nodes_json or [],
+            pipeline.edges_json or [],
+            pipeline_guid=pipeline.guid,
+            pipeline_version=pipeline.version
+        )
+
+    def _build_path_to_node(self, graph: CompiledPipelineGraph, target_id: str) -> str:
+        """
+        Build path string from root to target node.
+
+        Args:
+            graph: Compiled pipeline graph
             target_id: Target node ID
 
         Returns:
@@ -712,10 +756,7 @@ class PipelineService:
         """
         # Simple implementation - just show direct path
         # Find parent node(s)
-        parents = []
-        for edge in pipeline.edges_json:
-            if edge.get("to") == target_id:
-                parents.append(edge.get("from", ""))
+        parents = graph.predecessors(target_id)
 
         if parents:
             return f"{parents[0]} -> {target_id}"
@@ -1038,9 +1079,7 @@ class PipelineService:
         #  2. When a consecutive pair is NOT a real edge (phantom from merge),
         #     resolve it to the actual edges it replaced by looking for pipeline
         #     edges FROM src to later path nodes and TO dst from earlier ones.
-        pipeline_edge_set = {
-            (e["from"], e["to"]) for e in (pipeline.edges_json or [])
-        }
+        graph = self._get_compiled_graph(pipeline)
 
         node_counts: Dict[str, int] = {}
         edge_counts: Dict[str, int] = {}  # "from->to" → count
@@ -1057,20 +1096,23 @@ class PipelineService:
 
             for i in range(len(path_nodes) - 1):
                 src, dst = path_nodes[i], path_nodes[i + 1]
-                if (src, dst) in pipeline_edge_set:
+                if graph.has_edge(src, dst):
                     if (src, dst) not in counted:
                         edge_key = f"{src}->{dst}"
                         edge_counts[edge_key] = edge_counts.get(edge_key, 0) + count
                         counted.add((src, dst))
                 else:
-                    # Phantom pair from merge linearisation — resolve to real edges
-                    for from_n, to_n in pipeline_edge_set:
-                        if (from_n, to_n) in counted:
-                            continue
-                        if from_n == src and to_n in node_pos and node_pos[to_n] > i:
-                            edge_counts[f"{from_n}->{to_n}"] = edge_counts.get(f"{from_n}->{to_n}", 0) + count
-                            counted.add((from_n, to_n))
-                        elif to_n == dst and from_n in node_pos and node_pos[from_n] < i + 1:
+                    # Phantom pair from merge linearisation — resolve to the real
+                    # edges leaving src or entering dst
+                    real_edges = [
+                        (src, to_n) for to_n in graph.successors(src)
+                        if to_n in node_pos and node_pos[to_n] > i
+                    ] + [
+                        (from_n, dst) for from_n in graph.predecessors(dst)
+                        if from_n in node_pos and node_pos[from_n] < i + 1
+                    ]
+                    for from_n, to_n in real_edges:
+                        if (from_n, to_n) not in counted:
                             edge_counts[f"{from_n}->{to_n}"] = edge_counts.get(f"{from_n}->{to_n}", 0) + count
                             counted.add((from_n, to_n))
 
@@ -3,7 +3,7 @@ Utility modules for ShutterSense backend.
 
 This package contains shared utilities used across the application:
 - crypto: Credential encryption/decryption (Fernet)
-- cache: File listing cache with collection-aware TTL
+- cache: File listing cache with collection-aware TTL and a byte budget
 - job_queue: Job queue for sequential analysis execution
 - logging_config: Structured logging setup with JSON format
 """
@@ -16,6 +16,10 @@ from backend.src.utils.crypto import (
 from backend.src.utils.cache import (
     CachedFileListing,
     FileListingCache,
+    FileListingCacheBackend,
+    MemoryCacheBackend,
+    FileCacheBackend,
+    create_file_listing_cache,
     get_file_listing_cache,
     init_file_listing_cache,
     get_ttl_for_state,
@@ -45,6 +49,10 @@ __all__ = [
     # Cache
     "CachedFileListing",
     "FileListingCache",
+    "FileListingCacheBackend",
+    "MemoryCacheBackend",
+    "FileCacheBackend",
+    "create_file_listing_cache",
     "get_file_listing_cache",
     "init_file_listing_cache",
     "get_ttl_for_state",
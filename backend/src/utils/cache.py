@@ -7,12 +7,31 @@ TTL based on collection state (Live/Closed/Archived).
 
 Based on research.md Task 3 decision: Use in-memory cache with collection-aware
 TTL to achieve 80% API call reduction.
+
+Entries are held by a pluggable FileListingCacheBackend with a byte budget
+and least-recently-used eviction:
+- MemoryCacheBackend: per-process (default)
+- FileCacheBackend: JSON files in a directory shared by every worker
+  process that points at it (SHUSAI_FILE_CACHE_DIR)
 """
 
+import json
+import logging
+import os
+import sys
+import tempfile
 import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Default byte budget for cached listings (256 MiB)
+DEFAULT_FILE_CACHE_MAX_BYTES = 256 * 1024 * 1024
 
 
 @dataclass
@@ -27,6 +46,8 @@ class CachedFileListing:
         files: List of file paths in the collection
         cached_at: Timestamp when the listing was cached
         ttl_seconds: Time-to-live in seconds before cache expires
+        size_bytes: Estimated memory held by the listing
+            (see estimate_listing_bytes())
 
     Task: T018 - CachedFileListing dataclass
     """
@@ -34,6 +55,7 @@ class CachedFileListing:
     files: List[str]
     cached_at: datetime
     ttl_seconds: int
+    size_bytes: int = 0
 
     def is_expired(self) -> bool:
         """
@@ -65,6 +87,269 @@ class CachedFileListing:
         return expiry - datetime.utcnow()
 
 
+def estimate_listing_bytes(files: List[str]) -> int:
+    """
+    Estimate the memory held by a file listing.
+
+    Counts the list and every path string (CPython object sizes).
+
+    Args:
+        files: List of file paths
+
+    Returns:
+        int: Estimated size in bytes
+    """
+    return sys.getsizeof(files) + sum(sys.getsizeof(path) for path in files)
+
+
+class FileListingCacheBackend(ABC):
+    """
+    Storage for FileListingCache entries.
+
+    A backend holds at most max_bytes of listings and evicts the least
+    recently used entries to stay within it; a listing larger than the
+    whole budget is not stored. FileListingCache serializes calls within a
+    process, but backends shared between processes must tolerate other
+    processes writing concurrently.
+
+    Attributes:
+        max_bytes: Byte budget for stored listings
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+
+    @abstractmethod
+    def get(self, collection_id: int) -> Optional[CachedFileListing]:
+        """Get an entry (expired or not) and mark it as recently used."""
+
+    @abstractmethod
+    def peek(self, collection_id: int) -> Optional[CachedFileListing]:
+        """Get an entry without marking it as recently used."""
+
+    @abstractmethod
+    def put(self, collection_id: int, entry: CachedFileListing) -> int:
+        """
+        Store an entry, replacing any previous entry for the collection.
+
+        Returns:
+            int: Number of other entries evicted to stay within max_bytes
+        """
+
+    @abstractmethod
+    def delete(self, collection_id: int) -> None:
+        """Remove an entry if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        """
+        Get storage statistics.
+
+        Returns:
+            dict: entries, total_files and total_bytes
+        """
+
+
+class MemoryCacheBackend(FileListingCacheBackend):
+    """
+    In-process LRU storage, accounted by CachedFileListing.size_bytes.
+
+    Each worker process has its own entries.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_FILE_CACHE_MAX_BYTES):
+        super().__init__(max_bytes)
+        self._entries: "OrderedDict[int, CachedFileListing]" = OrderedDict()
+        self._total_bytes = 0
+        self._total_files = 0
+
+    def get(self, collection_id: int) -> Optional[CachedFileListing]:
+        entry = self._entries.get(collection_id)
+        if entry is not None:
+            self._entries.move_to_end(collection_id)
+        return entry
+
+    def peek(self, collection_id: int) -> Optional[CachedFileListing]:
+        return self._entries.get(collection_id)
+
+    def put(self, collection_id: int, entry: CachedFileListing) -> int:
+        self.delete(collection_id)
+        if entry.size_bytes > self.max_bytes:
+            return 0
+
+        self._entries[collection_id] = entry
+        self._total_bytes += entry.size_bytes
+        self._total_files += len(entry.files)
+
+        evicted = 0
+        while self._total_bytes > self.max_bytes:
+            _, oldest = self._entries.popitem(last=False)
+            self._total_bytes -= oldest.size_bytes
+            self._total_files -= len(oldest.files)
+            evicted += 1
+        return evicted
+
+    def delete(self, collection_id: int) -> None:
+        entry = self._entries.pop(collection_id, None)
+        if entry is not None:
+            self._total_bytes -= entry.size_bytes
+            self._total_files -= len(entry.files)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._total_bytes = 0
+        self._total_files = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'entries': len(self._entries),
+            'total_files': self._total_files,
+            'total_bytes': self._total_bytes,
+        }
+
+
+class FileCacheBackend(FileListingCacheBackend):
+    """
+    LRU storage in a directory shared by worker processes.
+
+    Each entry is one {collection_id}.json file: a header line (cached_at,
+    ttl_seconds, size_bytes, file_count) followed by the JSON file list.
+    Files are replaced atomically, reads bump the file mtime, and the
+    budget (on size_bytes, like MemoryCacheBackend) is enforced by deleting
+    the files with the oldest mtime. Every process pointing at the same
+    directory shares the entries.
+    """
+
+    _HEADER_KEYS = frozenset({"cached_at", "ttl_seconds", "size_bytes", "file_count"})
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_FILE_CACHE_MAX_BYTES):
+        super().__init__(max_bytes)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, collection_id: int) -> Path:
+        return self.directory / f"{int(collection_id)}.json"
+
+    def _read(self, path: Path, header_only: bool = False) -> Optional[Tuple[dict, List[str]]]:
+        """Read an entry file; missing or unreadable files are treated as absent."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                header = json.loads(f.readline())
+                if not isinstance(header, dict) or not self._HEADER_KEYS <= header.keys():
+                    raise ValueError("invalid header")
+                files = [] if header_only else json.loads(f.readline())
+            return header, files
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable file listing cache entry {path.name}: {e}")
+            self._unlink(path)
+            return None
+
+    def _load(self, collection_id: int, touch: bool) -> Optional[CachedFileListing]:
+        path = self._path(collection_id)
+        data = self._read(path)
+        if data is None:
+            return None
+        if touch:
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        header, files = data
+        return CachedFileListing(
+            files=files,
+            cached_at=datetime.fromisoformat(header["cached_at"]),
+            ttl_seconds=header["ttl_seconds"],
+            size_bytes=header["size_bytes"],
+        )
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _entry_headers(self) -> List[Tuple[Path, int, dict]]:
+        """(path, mtime_ns, header) per entry file (vanished files skipped)."""
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                mtime_ns = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+            data = self._read(path, header_only=True)
+            if data is not None:
+                entries.append((path, mtime_ns, data[0]))
+        return entries
+
+    def get(self, collection_id: int) -> Optional[CachedFileListing]:
+        return self._load(collection_id, touch=True)
+
+    def peek(self, collection_id: int) -> Optional[CachedFileListing]:
+        return self._load(collection_id, touch=False)
+
+    def put(self, collection_id: int, entry: CachedFileListing) -> int:
+        path = self._path(collection_id)
+        if entry.size_bytes > self.max_bytes:
+            self._unlink(path)
+            return 0
+
+        header = {
+            "cached_at": entry.cached_at.isoformat(),
+            "ttl_seconds": entry.ttl_seconds,
+            "size_bytes": entry.size_bytes,
+            "file_count": len(entry.files),
+        }
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(json.dumps(header) + "\n")
+                f.write(json.dumps(entry.files) + "\n")
+            os.replace(tmp_name, path)
+        except BaseException:
+            self._unlink(Path(tmp_name))
+            raise
+
+        entries = self._entry_headers()
+        total_bytes = sum(header["size_bytes"] for _, _, header in entries)
+        if total_bytes <= self.max_bytes:
+            return 0
+
+        # Over budget: drop the least recently used other entries
+        entries.sort(key=lambda item: item[1])
+        evicted = 0
+        for entry_path, _, header in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            if entry_path == path:
+                continue
+            self._unlink(entry_path)
+            total_bytes -= header["size_bytes"]
+            evicted += 1
+        return evicted
+
+    def delete(self, collection_id: int) -> None:
+        self._unlink(self._path(collection_id))
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.json"):
+            self._unlink(path)
+
+    def stats(self) -> Dict[str, int]:
+        entries = self._entry_headers()
+        return {
+            'entries': len(entries),
+            'total_files': sum(header["file_count"] for _, _, header in entries),
+            'total_bytes': sum(header["size_bytes"] for _, _, header in entries),
+        }
+
+
 # TTL mapping for collection states (from research.md Task 3)
 # Task: T021 - TTL mapping for collection states
 COLLECTION_STATE_TTL: Dict[str, int] = {
@@ -76,18 +361,26 @@ COLLECTION_STATE_TTL: Dict[str, int] = {
 
 class FileListingCache:
     """
-    In-memory cache for remote collection file listings.
+    Cache for remote collection file listings.
 
     Provides thread-safe caching of file listings with collection-aware TTL.
     Supports manual invalidation and automatic expiry based on TTL.
 
     The cache is keyed by collection ID and maintains separate cache entries
-    for each collection. Each entry includes the file list, timestamp, and TTL.
+    for each collection. Each entry includes the file list, timestamp, TTL
+    and estimated size. Entries live in a FileListingCacheBackend with a
+    byte budget (least recently used entries are evicted); the default
+    MemoryCacheBackend is per-process, a FileCacheBackend is shared by all
+    workers using the same directory.
 
     Thread Safety:
         All operations are protected by a threading.Lock to ensure safe
         concurrent access from multiple FastAPI request handlers.
 
+    Monitoring:
+        Hit, miss and eviction counters (per process) are reported by
+        get_stats().
+
     Performance Target:
         Achieve 80% reduction in API calls to remote storage services
         (research.md NFR1.3).
@@ -119,14 +412,25 @@ class FileListingCache:
         cache.invalidate(collection_id=1)
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_FILE_CACHE_MAX_BYTES,
+        backend: Optional[FileListingCacheBackend] = None
+    ):
         """
         Initialize the file listing cache.
 
+        Args:
+            max_bytes: Byte budget for the default in-memory backend
+            backend: Storage backend (default: MemoryCacheBackend(max_bytes))
+
         Task: T019 - FileListingCache initialization with thread safety
         """
-        self._cache: Dict[int, CachedFileListing] = {}
+        self._backend = backend if backend is not None else MemoryCacheBackend(max_bytes)
         self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
 
     def get(self, collection_id: int) -> Optional[List[str]]:
         """
@@ -145,24 +449,30 @@ class FileListingCache:
         Task: T020 - get() method implementation
         """
         with self._lock:
-            cached = self._cache.get(collection_id)
+            cached = self._backend.get(collection_id)
 
             if cached is None:
                 # Cache miss
+                self._misses += 1
                 return None
 
             if cached.is_expired():
                 # Cache expired - remove entry
-                del self._cache[collection_id]
+                self._backend.delete(collection_id)
+                self._misses += 1
                 return None
 
             # Cache hit - return files
+            self._hits += 1
             return cached.files
 
     def set(self, collection_id: int, files: List[str], ttl_seconds: int):
         """
         Store file listing with TTL.
 
+        Evicts least recently used listings when the byte budget is
+        exceeded. A listing larger than the whole budget is not cached.
+
         Args:
             collection_id: ID of the collection
             files: List of file paths to cache
@@ -181,11 +491,29 @@ class FileListingCache:
 
         Task: T020 - set() method implementation
         """
+        entry = CachedFileListing(
+            files=files,
+            cached_at=datetime.utcnow(),
+            ttl_seconds=ttl_seconds,
+            size_bytes=estimate_listing_bytes(files)
+        )
         with self._lock:
-            self._cache[collection_id] = CachedFileListing(
-                files=files,
-                cached_at=datetime.utcnow(),
-                ttl_seconds=ttl_seconds
+            evicted = self._backend.put(collection_id, entry)
+            self._evictions += evicted
+
+        if evicted:
+            logger.info(
+                "Evicted file listings to stay within cache budget",
+                extra={"collection_id": collection_id, "evicted": evicted}
+            )
+        if entry.size_bytes > self._backend.max_bytes:
+            logger.warning(
+                "File listing exceeds cache budget and was not cached",
+                extra={
+                    "collection_id": collection_id,
+                    "size_bytes": entry.size_bytes,
+                    "max_bytes": self._backend.max_bytes,
+                }
             )
 
     def invalidate(self, collection_id: int):
@@ -210,7 +538,7 @@ class FileListingCache:
         Task: T020 - invalidate() method implementation
         """
         with self._lock:
-            self._cache.pop(collection_id, None)
+            self._backend.delete(collection_id)
 
     def clear(self):
         """
@@ -225,25 +553,29 @@ class FileListingCache:
         Task: T020 - clear() method implementation
         """
         with self._lock:
-            self._cache.clear()
+            self._backend.clear()
 
     def get_stats(self) -> Dict[str, int]:
         """
         Get cache statistics for monitoring.
 
         Returns:
-            dict: Statistics including entry count and total files cached
+            dict: Entry count, total files and bytes cached, the byte
+            budget, and this process's hit/miss/eviction counters
 
         Example:
             >>> stats = cache.get_stats()
             >>> print(stats)
-            {'entries': 10, 'total_files': 150000}
+            {'entries': 10, 'total_files': 150000, 'total_bytes': 12000000,
+             'max_bytes': 268435456, 'hits': 42, 'misses': 10, 'evictions': 0}
         """
         with self._lock:
-            total_files = sum(len(cached.files) for cached in self._cache.values())
             return {
-                'entries': len(self._cache),
-                'total_files': total_files
+                **self._backend.stats(),
+                'max_bytes': self._backend.max_bytes,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
             }
 
     def get_entry_info(self, collection_id: int) -> Optional[Dict]:
@@ -254,7 +586,7 @@ class FileListingCache:
             collection_id: ID of the collection
 
         Returns:
-            dict: Entry details (file_count, cached_at, ttl, expires_in)
+            dict: Entry details (file_count, size_bytes, cached_at, ttl, expires_in)
             None: If entry not found
 
         Example:
@@ -262,6 +594,7 @@ class FileListingCache:
             >>> print(info)
             {
                 'file_count': 1000,
+                'size_bytes': 80000,
                 'cached_at': '2025-12-29T17:30:00',
                 'ttl_seconds': 3600,
                 'expires_in_seconds': 2400,
@@ -269,7 +602,7 @@ class FileListingCache:
             }
         """
         with self._lock:
-            cached = self._cache.get(collection_id)
+            cached = self._backend.peek(collection_id)
 
             if cached is None:
                 return None
@@ -278,6 +611,7 @@ class FileListingCache:
 
             return {
                 'file_count': len(cached.files),
+                'size_bytes': cached.size_bytes,
                 'cached_at': cached.cached_at.isoformat(),
                 'ttl_seconds': cached.ttl_seconds,
                 'expires_in_seconds': int(time_until_expiry.total_seconds()),
@@ -336,6 +670,26 @@ def init_file_listing_cache() -> FileListingCache:
     return _cache_instance
 
 
+def create_file_listing_cache(
+    max_bytes: int = DEFAULT_FILE_CACHE_MAX_BYTES,
+    directory: str = ""
+) -> FileListingCache:
+    """
+    Create a FileListingCache from settings.
+
+    Args:
+        max_bytes: Byte budget for cached listings (SHUSAI_FILE_CACHE_MAX_BYTES)
+        directory: Shared cache directory (SHUSAI_FILE_CACHE_DIR); empty
+            keeps listings in process memory
+
+    Returns:
+        FileListingCache: Cache with a FileCacheBackend or MemoryCacheBackend
+    """
+    if directory:
+        return FileListingCache(backend=FileCacheBackend(directory, max_bytes))
+    return FileListingCache(max_bytes=max_bytes)
+
+
 def get_ttl_for_state(collection_state: str, custom_ttl: Optional[int] = None) -> int:
     """
     Get TTL (seconds) for a collection based on its state.
@@ -20,13 +20,21 @@ Edge Handling:
 - Backend: edges_json = [{"from": "node1", "to": "node2"}, ...]
 - CLI: Each node has an "output" list of node IDs it connects to
 
+Compiled graphs (CompiledPipelineGraph) are cached per pipeline version, so
+pipeline pages and analytics reuse one adjacency/topology instead of
+re-deriving it from nodes_json/edges_json on every request.
+
 Author: ShutterSense project
 License: AGPL-3.0
 """
 
-from typing import List, Dict, Any
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 
 from utils.pipeline_processor import (
+    CompiledPipelineGraph,
+    compile_pipeline_graph,
     PipelineConfig,
     CaptureNode,
     FileNode,
@@ -176,3 +184,83 @@ def convert_db_pipeline_to_config(
         branching_nodes=branching_nodes,
         termination_nodes=termination_nodes
     )
+
+
+# Pipeline versions are immutable, so compiled graphs never go stale;
+# the bound only caps memory for teams with many pipelines.
+COMPILED_GRAPH_CACHE_MAX_ENTRIES = 128
+
+_compiled_graph_cache: "OrderedDict[Tuple[str, int], CompiledPipelineGraph]" = OrderedDict()
+_compiled_graph_cache_lock = threading.Lock()
+
+
+def compile_db_pipeline(
+    nodes_json: List[Dict[str, Any]],
+    edges_json: List[Dict[str, Any]]
+) -> CompiledPipelineGraph:
+    """
+    Convert database pipeline format to a CompiledPipelineGraph.
+
+    Args:
+        nodes_json: List of node dictionaries from database
+        edges_json: List of edge dictionaries from database
+
+    Returns:
+        CompiledPipelineGraph including the Capture node's filename settings
+    """
+    capture_properties = next(
+        (node.get("properties", {}) for node in nodes_json if node.get("type", "").lower() == "capture"),
+        {}
+    )
+    return compile_pipeline_graph(
+        convert_db_pipeline_to_config(nodes_json, edges_json),
+        capture_properties=capture_properties
+    )
+
+
+def get_compiled_pipeline_graph(
+    nodes_json: List[Dict[str, Any]],
+    edges_json: List[Dict[str, Any]],
+    pipeline_guid: Optional[str] = None,
+    pipeline_version: Optional[int] = None
+) -> CompiledPipelineGraph:
+    """
+    Get the CompiledPipelineGraph for a pipeline version, compiling on a miss.
+
+    Without a guid or version (e.g. unsaved pipelines being validated) the
+    graph is compiled but not cached.
+
+    Args:
+        nodes_json: List of node dictionaries from database
+        edges_json: List of edge dictionaries from database
+        pipeline_guid: Pipeline GUID (pip_xxx)
+        pipeline_version: Pipeline version number
+
+    Returns:
+        CompiledPipelineGraph for the pipeline version
+    """
+    if not pipeline_guid or pipeline_version is None:
+        return compile_db_pipeline(nodes_json, edges_json)
+
+    key = (pipeline_guid, pipeline_version)
+    with _compiled_graph_cache_lock:
+        graph = _compiled_graph_cache.get(key)
+        if graph is not None:
+            _compiled_graph_cache.move_to_end(key)
+            return graph
+
+    graph = compile_db_pipeline(nodes_json, edges_json)
+
+    with _compiled_graph_cache_lock:
+        _compiled_graph_cache[key] = graph
+        _compiled_graph_cache.move_to_end(key)
+        while len(_compiled_graph_cache) > COMPILED_GRAPH_CACHE_MAX_ENTRIES:
+            _compiled_graph_cache.popitem(last=False)
+
+    return graph
+
+
+def clear_compiled_pipeline_graph_cache() -> None:
+    """Drop all cached compiled pipeline graphs."""
+    with _compiled_graph_cache_lock:
+        _compiled_graph_cache.clear()
@@ -15,6 +15,7 @@ from backend.src.services.inventory_service import (
     InventoryValidationStatus,
 )
 from backend.src.services.exceptions import NotFoundError, ValidationError
+from backend.src.services.input_state_service import get_input_state_service
 from backend.src.models import Connector, ConnectorType
 from backend.src.models.connector import CredentialLocation
 from backend.src.models.inventory_folder import InventoryFolder
@@ -967,6 +968,7 @@ class TestFileInfoStorage:
         assert len(collection.file_info) == 2
         assert collection.file_info_source == "inventory"
         assert collection.file_info_updated_at is not None
+        assert collection.file_info_hash == get_input_state_service().compute_inventory_file_hash(file_info)
 
     def test_store_file_info_updates_timestamp(self, test_db_session, test_team, test_connector):
         """Test that storing FileInfo updates the timestamp."""
@@ -1078,6 +1080,9 @@ class TestFileInfoStorage:
             assert coll.file_info is not None
             assert coll.file_info_source == "inventory"
             assert coll.file_info_updated_at is not None
+            assert coll.file_info_hash == get_input_state_service().compute_inventory_file_hash(
+                collections_data[i]["file_info"]
+            )
 
     def test_store_file_info_batch_skips_invalid_guid(self, test_db_session, test_team, test_connector):
         """Test batch storage skips invalid collection GUIDs."""
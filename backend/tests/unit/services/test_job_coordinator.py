@@ -1151,6 +1151,50 @@ class TestServerSideNoChangeDetection:
         assert result.server_completed is True
         assert result.job.status == JobStatus.COMPLETED
 
+    def test_server_detection_uses_stored_file_info_hash(
+        self, test_db_session, test_team, test_user, create_agent, create_job,
+        create_inventory_collection, create_previous_result
+    ):
+        """Claim compares the file list hash stored at import without rehashing file_info."""
+        from unittest.mock import patch
+
+        from backend.src.services.input_state_service import (
+            InputStateService,
+            get_input_state_service,
+        )
+
+        agent = create_agent(test_team, test_user)
+        collection = create_inventory_collection(test_team, bound_agent=agent)
+        input_state_service = get_input_state_service()
+        collection.file_info_hash = input_state_service.compute_inventory_file_hash(collection.file_info)
+        test_db_session.commit()
+
+        service = JobCoordinatorService(test_db_session)
+        job = create_job(
+            test_team,
+            tool="photostats",
+            status=JobStatus.PENDING,
+            collection=collection,
+            bound_agent=agent,
+        )
+        current_hash = input_state_service.compute_collection_input_state_hash(
+            collection, service._get_tool_config(job) or {}, "photostats"
+        )
+        create_previous_result(
+            test_team, collection, "photostats", input_state_hash=current_hash
+        )
+
+        with patch.object(InputStateService, "compute_inventory_file_hash") as mock_hash:
+            result = service.claim_job(
+                agent_id=agent.id,
+                team_id=test_team.id,
+                agent_capabilities=["local_filesystem"],
+            )
+
+        mock_hash.assert_not_called()
+        assert result is not None
+        assert result.server_completed is True
+
     def test_server_detection_when_files_changed(
         self, test_db_session, test_team, test_user, create_agent, create_job,
         create_inventory_collection, create_previous_result
@@ -8,10 +8,12 @@ Tests the FileListingCache and CachedFileListing for:
 - Thread safety
 - Collection state-aware TTL
 - Cache statistics
+- Byte budget with LRU eviction, memory and shared file backends
 
 Task: T104b - Unit tests for cache module
 """
 
+import os
 import time
 import threading
 from datetime import datetime, timedelta
@@ -21,7 +23,12 @@ from freezegun import freeze_time
 from backend.src.utils.cache import (
     CachedFileListing,
     FileListingCache,
+    FileCacheBackend,
+    MemoryCacheBackend,
     COLLECTION_STATE_TTL,
+    DEFAULT_FILE_CACHE_MAX_BYTES,
+    create_file_listing_cache,
+    estimate_listing_bytes,
     get_ttl_for_state,
     get_file_listing_cache,
     init_file_listing_cache
@@ -111,7 +118,8 @@ class TestFileListingCacheBasics:
         """Test initializing an empty cache."""
         cache = FileListingCache()
 
-        assert cache.get_stats() == {'entries': 0, 'total_files': 0}
+        stats = cache.get_stats()
+        assert (stats['entries'], stats['total_files'], stats['total_bytes']) == (0, 0, 0)
 
     def test_set_and_get_cache_hit(self):
         """Test setting and getting a cached file listing."""
@@ -256,7 +264,15 @@ class TestCacheStatistics:
 
         stats = cache.get_stats()
 
-        assert stats == {'entries': 0, 'total_files': 0}
+        assert stats == {
+            'entries': 0,
+            'total_files': 0,
+            'total_bytes': 0,
+            'max_bytes': DEFAULT_FILE_CACHE_MAX_BYTES,
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+        }
 
     def test_get_stats_with_entries(self):
         """Test statistics with cached entries."""
@@ -536,3 +552,120 @@ class TestCacheEdgeCases:
         cached_files = cache.get(collection_id=-1)
 
         assert cached_files == ['photo1.dng']
+
+
+class TestCacheBudget:
+    """Tests for the byte budget and LRU eviction."""
+
+    @staticmethod
+    def listing(collection_id):
+        return [f'collection{collection_id}_photo{i:04d}.dng' for i in range(100)]
+
+    def test_counts_hits_misses(self):
+        """Test hit and miss counters (expired entries count as misses)."""
+        cache = FileListingCache()
+
+        with freeze_time("2025-01-01 12:00:00"):
+            cache.set(collection_id=1, files=['photo1.dng'], ttl_seconds=3600)
+            cache.get(collection_id=1)
+            cache.get(collection_id=2)
+        with freeze_time("2025-01-01 13:00:01"):
+            cache.get(collection_id=1)
+
+        stats = cache.get_stats()
+        assert (stats['hits'], stats['misses']) == (1, 2)
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used listing is evicted beyond the budget."""
+        size = estimate_listing_bytes(self.listing(1))
+        cache = FileListingCache(max_bytes=size * 2)
+
+        cache.set(collection_id=1, files=self.listing(1), ttl_seconds=3600)
+        cache.set(collection_id=2, files=self.listing(2), ttl_seconds=3600)
+        cache.get(collection_id=1)
+        cache.set(collection_id=3, files=self.listing(3), ttl_seconds=3600)
+
+        assert cache.get(collection_id=2) is None
+        assert cache.get(collection_id=1) == self.listing(1)
+        assert cache.get(collection_id=3) == self.listing(3)
+        stats = cache.get_stats()
+        assert (stats['entries'], stats['total_bytes'], stats['evictions']) == (2, size * 2, 1)
+
+    def test_listing_larger_than_budget_not_cached(self):
+        """Test a listing larger than the whole budget is not cached."""
+        cache = FileListingCache(max_bytes=100)
+
+        cache.set(collection_id=1, files=self.listing(1), ttl_seconds=3600)
+
+        assert cache.get(collection_id=1) is None
+        assert cache.get_stats()['entries'] == 0
+
+    def test_entry_info_reports_size(self):
+        """Test entry info includes the estimated size."""
+        cache = FileListingCache()
+        cache.set(collection_id=1, files=self.listing(1), ttl_seconds=3600)
+
+        assert cache.get_entry_info(collection_id=1)['size_bytes'] == estimate_listing_bytes(self.listing(1))
+
+
+class TestFileCacheBackend:
+    """Tests for the shared file-backed storage."""
+
+    @staticmethod
+    def listing(collection_id):
+        return [f'collection{collection_id}/photo{i:04d}.dng' for i in range(100)]
+
+    def test_shared_between_caches(self, tmp_path):
+        """Test caches using the same directory share entries and invalidations."""
+        worker1 = FileListingCache(backend=FileCacheBackend(str(tmp_path)))
+        worker2 = FileListingCache(backend=FileCacheBackend(str(tmp_path)))
+
+        with freeze_time("2025-01-01 12:00:00"):
+            worker1.set(collection_id=1, files=self.listing(1), ttl_seconds=3600)
+            assert worker2.get(collection_id=1) == self.listing(1)
+            assert worker2.get_entry_info(collection_id=1)['cached_at'] == '2025-01-01T12:00:00'
+
+            worker2.invalidate(collection_id=1)
+            assert worker1.get(collection_id=1) is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test the least recently read entry file is evicted beyond the budget."""
+        size = estimate_listing_bytes(self.listing(1))
+        cache = FileListingCache(backend=FileCacheBackend(str(tmp_path), max_bytes=size * 2))
+
+        cache.set(collection_id=1, files=self.listing(1), ttl_seconds=3600)
+        cache.set(collection_id=2, files=self.listing(2), ttl_seconds=3600)
+        os.utime(tmp_path / "2.json", ns=(0, 0))
+        cache.set(collection_id=3, files=self.listing(3), ttl_seconds=3600)
+
+        assert cache.get(collection_id=2) is None
+        assert cache.get(collection_id=1) == self.listing(1)
+        stats = cache.get_stats()
+        assert (stats['entries'], stats['total_files'], stats['evictions']) == (2, 200, 1)
+
+    def test_unreadable_entry_is_discarded(self, tmp_path):
+        """Test a corrupt entry file is treated as a miss and removed."""
+        cache = FileListingCache(backend=FileCacheBackend(str(tmp_path)))
+        (tmp_path / "1.json").write_text("not json")
+
+        assert cache.get(collection_id=1) is None
+        assert not (tmp_path / "1.json").exists()
+
+    def test_clear(self, tmp_path):
+        """Test clearing removes every entry file."""
+        cache = FileListingCache(backend=FileCacheBackend(str(tmp_path)))
+        cache.set(collection_id=1, files=['a.dng'], ttl_seconds=3600)
+        cache.set(collection_id=2, files=['b.dng'], ttl_seconds=3600)
+
+        cache.clear()
+
+        assert cache.get_stats()['entries'] == 0
+        assert list(tmp_path.iterdir()) == []
+
+    def test_create_file_listing_cache(self, tmp_path):
+        """Test the factory picks the backend from settings."""
+        assert isinstance(create_file_listing_cache(1024)._backend, MemoryCacheBackend)
+
+        cache = create_file_listing_cache(1024, directory=str(tmp_path / "listings"))
+        assert isinstance(cache._backend, FileCacheBackend)
+        assert cache.get_stats()['max_bytes'] == 1024
@@ -388,15 +388,34 @@ class TestAgentBackendConsistency:
 
         hash1 = service.compute_file_list_hash(files)
 
-        # Manually compute what the agent would produce
-        sorted_files = sorted(files, key=lambda f: f[0])
-        lines = [f"{p}|{s}|{int(m)}" for p, s, m in sorted_files]
-        content = "\n".join(lines)
+        # Manually compute what the agent would produce: a files digest
+        # per directory, rolled up with child lines to the root
         import hashlib
-        expected_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+        def sha(text):
+            return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+        photos_files = sha("IMG_001.dng|25000000|1704067200\nIMG_001.xmp|4096|1704067201\n")
+        photos_tree = sha(f"{photos_files}\n")
+        expected_hash = sha(f"{sha('')}\nphotos|{photos_tree}\n")
 
         assert hash1 == expected_hash
 
+    def test_file_list_hash_known_vector(self, service):
+        """Backend file list hash should equal the agent test's known vector.
+
+        Shared with agent/tests/unit/test_input_state.py (TREE_HASH).
+        """
+        files = [
+            ("a.dng", 10, 1704067200),
+            ("2024/trip/b.dng", 20, 1704067201.9),
+            ("2024/b.xmp", 30, 0),
+        ]
+
+        assert service.compute_file_list_hash(files) == (
+            "a28121b7f413e801adb3632649e137d30c085848de5c41f80006a30fd24a660a"
+        )
+
     def test_input_state_hash_matches_agent_implementation(self, service):
         """Backend input state hash should match agent's implementation."""
         file_hash = "a" * 64
@@ -662,6 +681,7 @@ class TestComputeCollectionInputStateHash:
             {"key": "2020/IMG_001.xmp", "size": 4096, "last_modified": "2022-11-25T13:30:50.000Z"},
         ]
         collection.file_info_source = "inventory"
+        collection.file_info_hash = None
         return collection
 
     @pytest.fixture
@@ -738,12 +758,14 @@ class TestComputeCollectionInputStateHash:
             {"key": "2020/IMG_001.dng", "size": 25000000, "last_modified": "2022-11-25T13:30:49.000Z"},
         ]
         collection1.file_info_source = "inventory"
+        collection1.file_info_hash = None
 
         collection2 = MagicMock()
         collection2.file_info = [
             {"key": "2020/IMG_002.dng", "size": 25000000, "last_modified": "2022-11-25T13:30:49.000Z"},
         ]
         collection2.file_info_source = "inventory"
+        collection2.file_info_hash = None
 
         hash1 = service.compute_collection_input_state_hash(
             collection1, sample_config, "photostats"
@@ -753,3 +775,22 @@ class TestComputeCollectionInputStateHash:
         )
 
         assert hash1 != hash2
+
+    def test_uses_stored_file_info_hash(self, service, inventory_collection, sample_config):
+        """Should use the file list hash stored at inventory import."""
+        from unittest.mock import patch
+
+        expected = service.compute_collection_input_state_hash(
+            inventory_collection, sample_config, "photostats"
+        )
+        inventory_collection.file_info_hash = service.compute_inventory_file_hash(
+            inventory_collection.file_info
+        )
+
+        with patch.object(service, "compute_inventory_file_hash") as mock_hash:
+            result = service.compute_collection_input_state_hash(
+                inventory_collection, sample_config, "photostats"
+            )
+
+        mock_hash.assert_not_called()
+        assert result == expected
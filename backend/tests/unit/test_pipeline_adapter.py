@@ -0,0 +1,85 @@
+"""
+Unit tests for the pipeline adapter.
+
+Tests conversion of database pipeline JSON into a CompiledPipelineGraph
+and the per-version compiled graph cache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from backend.src.utils import pipeline_adapter
+from backend.src.utils.pipeline_adapter import (
+    clear_compiled_pipeline_graph_cache,
+    compile_db_pipeline,
+    get_compiled_pipeline_graph,
+)
+
+NODES = [
+    {"id": "capture", "type": "capture", "properties": {
+        "sample_filename": "AB3D0001",
+        "filename_regex": "([A-Z0-9]{4})([0-9]{4})",
+        "camera_id_group": "1",
+    }},
+    {"id": "raw", "type": "file", "properties": {"extension": ".dng"}},
+    {"id": "xmp", "type": "file", "properties": {"extension": ".xmp"}},
+    {"id": "hdr", "type": "pairing", "properties": {"pairing_type": "HDR"}},
+    {"id": "done", "type": "termination", "properties": {"termination_type": "Black Box Archive"}},
+]
+
+EDGES = [
+    {"from": "capture", "to": "raw"},
+    {"from": "capture", "to": "xmp"},
+    {"from": "raw", "to": "hdr"},
+    {"from": "xmp", "to": "hdr"},
+    {"from": "hdr", "to": "done"},
+]
+
+
+@pytest.fixture(autouse=True)
+def _clear_graph_cache():
+    clear_compiled_pipeline_graph_cache()
+    yield
+    clear_compiled_pipeline_graph_cache()
+
+
+class TestCompileDbPipeline:
+    """Tests for compile_db_pipeline()."""
+
+    def test_adjacency(self):
+        graph = compile_db_pipeline(NODES, EDGES)
+
+        assert graph.successors("capture") == ("raw", "xmp")
+        assert graph.predecessors("hdr") == ("raw", "xmp")
+        assert graph.has_edge("hdr", "done")
+        assert graph.pairing_inputs == (("hdr", ("raw", "xmp")),)
+
+    def test_capture_settings(self):
+        graph = compile_db_pipeline(NODES, EDGES)
+
+        assert graph.capture_regex == "([A-Z0-9]{4})([0-9]{4})"
+        assert graph.camera_id_group == 1
+
+
+class TestCompiledGraphCache:
+    """Tests for get_compiled_pipeline_graph() caching."""
+
+    def test_cached_by_guid_and_version(self):
+        first = get_compiled_pipeline_graph(NODES, EDGES, "pip_abc", 1)
+
+        assert get_compiled_pipeline_graph(NODES, EDGES, "pip_abc", 1) is first
+        assert get_compiled_pipeline_graph(NODES, EDGES, "pip_abc", 2) is not first
+
+    def test_not_cached_without_identity(self):
+        first = get_compiled_pipeline_graph(NODES, EDGES)
+
+        assert get_compiled_pipeline_graph(NODES, EDGES) is not first
+
+    def test_cache_is_bounded(self):
+        with patch.object(pipeline_adapter, "COMPILED_GRAPH_CACHE_MAX_ENTRIES", 2):
+            oldest = get_compiled_pipeline_graph(NODES, EDGES, "pip_a", 1)
+            get_compiled_pipeline_graph(NODES, EDGES, "pip_b", 1)
+            get_compiled_pipeline_graph(NODES, EDGES, "pip_c", 1)
+
+            assert get_compiled_pipeline_graph(NODES, EDGES, "pip_a", 1) is not oldest
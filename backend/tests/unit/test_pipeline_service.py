@@ -253,6 +253,32 @@ class TestPipelineServiceValidation:
         assert result.is_valid is True
         assert len(result.errors) == 0
 
+    def test_validate_pipeline_pairing_loop_refused(self, pipeline_service, sample_pipeline):
+        """Test that loops through a Pairing node are refused (they have no iteration limit)."""
+        nodes = [
+            {"id": "capture", "type": "capture", "properties": {"sample_filename": "AB3D0001", "filename_regex": "([A-Z0-9]{4})([0-9]{4})", "camera_id_group": "1"}},
+            {"id": "file", "type": "file", "properties": {"extension": ".dng"}},
+            {"id": "pair", "type": "pairing", "properties": {"pairing_type": "HDR"}},
+            {"id": "done", "type": "termination", "properties": {"termination_type": "Black Box Archive"}},
+        ]
+        edges = [
+            {"from": "capture", "to": "file"},
+            {"from": "file", "to": "pair"},
+            {"from": "pair", "to": "pair"},  # Pairing node feeding itself
+            {"from": "pair", "to": "done"},
+        ]
+        pipeline = sample_pipeline(
+            name="Pairing Loop Test",
+            nodes=nodes,
+            edges=edges,
+            is_valid=True
+        )
+
+        result = pipeline_service.validate(pipeline.id)
+
+        assert result.is_valid is False
+        assert any("part of a loop" in str(e.message) for e in result.errors)
+
     def test_validate_pipeline_orphaned_node(self, pipeline_service, sample_pipeline):
         """Test validation detects orphaned nodes."""
         nodes_with_orphan = [
@@ -27,6 +27,7 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
 import re
+from functools import lru_cache
 
 
 class FilenameParser:
@@ -49,6 +50,15 @@ class FilenameParser:
         r'^[A-Z0-9]{4}(000[1-9]|00[1-9][0-9]|0[1-9][0-9]{2}|[1-9][0-9]{3})(-[A-Za-z0-9 _]+)*\.[a-zA-Z0-9]+$'
     )
 
+    # Stem pattern: VALID_FILENAME_PATTERN without the extension, capturing
+    # camera ID, counter and the dash-prefixed properties in one match
+    VALID_STEM_PATTERN = re.compile(
+        r'^([A-Z0-9]{4})(000[1-9]|00[1-9][0-9]|0[1-9][0-9]{2}|[1-9][0-9]{3})((?:-[A-Za-z0-9 _]+)*)$'
+    )
+
+    # Maximum number of stems kept by the parse_stem() cache
+    PARSE_CACHE_MAX_ENTRIES = 1 << 18
+
     @staticmethod
     def validate_filename(filename):
         """
@@ -146,6 +156,30 @@ class FilenameParser:
             'extension': extension
         }
 
+    @staticmethod
+    def parse_stem(stem):
+        """
+        Parse a filename stem (filename without extension) into its components.
+
+        Gives the same camera ID, counter and properties as parse_filename()
+        on any filename with that stem, using a single regex match. Results
+        are kept in a bounded cache keyed by stem, so analyzers parsing the
+        same listing within a job share them (see clear_parse_cache()).
+
+        Args:
+            stem: The filename without path and extension
+
+        Returns:
+            tuple: (camera_id, counter, properties) with properties as a tuple
+            of strings (without dashes), or None if the stem is invalid
+        """
+        return _parse_stem(stem)
+
+    @staticmethod
+    def clear_parse_cache():
+        """Drop every cached parse_stem() result (called when a job ends)."""
+        _parse_stem.cache_clear()
+
     @staticmethod
     def detect_property_type(property_str):
         """
@@ -158,3 +192,13 @@ class FilenameParser:
             str: 'separate_image' if all-numeric, 'processing_method' otherwise
         """
         return 'separate_image' if property_str.isdigit() else 'processing_method'
+
+
+@lru_cache(maxsize=FilenameParser.PARSE_CACHE_MAX_ENTRIES)
+def _parse_stem(stem):
+    """Cached implementation of FilenameParser.parse_stem()."""
+    match = FilenameParser.VALID_STEM_PATTERN.match(stem)
+    if match is None:
+        return None
+    camera_id, counter, properties = match.groups()
+    return camera_id, counter, tuple(properties[1:].split('-')) if properties else ()
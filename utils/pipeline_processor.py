@@ -16,10 +16,15 @@ License: AGPL-3.0
 Version: 1.0.0
 """
 
+import itertools
+import re
 import yaml
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any, Union
+from functools import cached_property
+from types import MappingProxyType
+from collections import OrderedDict, deque
+from typing import List, Dict, Optional, Any, Union, Tuple, Mapping, Iterator, Iterable
 from enum import Enum
 
 # Import shared configuration manager
@@ -34,6 +39,13 @@ from utils.config_manager import PhotoAdminConfig
 # Applied to all node types except Capture and Termination nodes
 MAX_ITERATIONS = 5
 
+# Pipelines enumerating to more paths than this are refused for validation
+# (see count_pipeline_paths() / check_pipeline_path_count())
+MAX_PIPELINE_PATHS = 100000
+
+# Default number of distinct image shapes remembered by ValidationMemo
+DEFAULT_MEMO_SIZE = 4096
+
 
 # =============================================================================
 # Data Structures - Pipeline Configuration
@@ -449,7 +461,257 @@ class PathState:
     iteration_counts: Dict[str, int]
 
 
-def enumerate_all_paths(pipeline: PipelineConfig) -> List[List[Dict[str, Any]]]:
+class PathLimitExceededError(ValueError):
+    """Raised when a pipeline enumerates to more paths than allowed."""
+    pass
+
+
+@dataclass(frozen=True)
+class PipelineTopology:
+    """
+    Adjacency view of a pipeline graph, computed once per enumeration.
+
+    Path enumeration and pairing-node ordering only ever need successors,
+    predecessors and a topological order; building them once avoids
+    re-scanning pipeline.nodes for every pairing input and every loop.
+    """
+    nodes: Dict[str, PipelineNode]  # Node lookup by ID
+    successors: Dict[str, Tuple[str, ...]]  # Node ID -> output node IDs (as declared)
+    predecessors: Dict[str, Tuple[str, ...]]  # Node ID -> input node IDs (pipeline.nodes order)
+    order: Tuple[str, ...]  # Topological order, ignoring back edges
+    back_edges: frozenset  # (from_id, to_id) edges that close a loop
+    cyclic_nodes: frozenset  # Node IDs that can appear more than once in a path
+
+
+def build_pipeline_topology(pipeline: PipelineConfig) -> PipelineTopology:
+    """
+    Precompute adjacency, reverse adjacency and topological order of a pipeline.
+
+    Loops are allowed in pipelines: edges closing a loop (found by DFS from the
+    Capture nodes, then from any unreached node) are reported as back edges and
+    ignored for the topological order.
+
+    Args:
+        pipeline: PipelineConfig instance
+
+    Returns:
+        PipelineTopology for the pipeline
+    """
+    nodes = {node.id: node for node in pipeline.nodes}
+    successors = {node_id: tuple(node.output) for node_id, node in nodes.items()}
+
+    predecessors: Dict[str, List[str]] = {node_id: [] for node_id in nodes}
+    for node in pipeline.nodes:
+        for output_id in dict.fromkeys(node.output):
+            if output_id in predecessors:
+                predecessors[output_id].append(node.id)
+
+    # Iterative DFS: classify back edges and record finish order
+    state: Dict[str, int] = {}  # 1 = on stack, 2 = finished
+    back_edges = set()
+    finish_order: List[str] = []
+    roots = [node.id for node in pipeline.capture_nodes] + list(nodes)
+    for root in roots:
+        if root not in nodes or root in state:
+            continue
+        state[root] = 1
+        stack = [(root, iter(successors[root]))]
+        while stack:
+            node_id, children = stack[-1]
+            for child_id in children:
+                if child_id not in nodes:
+                    continue
+                child_state = state.get(child_id)
+                if child_state is None:
+                    state[child_id] = 1
+                    stack.append((child_id, iter(successors[child_id])))
+                    break
+                if child_state == 1:
+                    back_edges.add((node_id, child_id))
+            else:
+                state[node_id] = 2
+                finish_order.append(node_id)
+                stack.pop()
+
+    # Nodes on a cycle: strongly connected components with more than one node,
+    # or with a self-loop (second pass of Kosaraju over the reverse graph)
+    cyclic_nodes = set()
+    assigned = set()
+    for root in reversed(finish_order):
+        if root in assigned:
+            continue
+        component = [root]
+        assigned.add(root)
+        stack = [root]
+        while stack:
+            for pred_id in predecessors[stack.pop()]:
+                if pred_id not in assigned:
+                    assigned.add(pred_id)
+                    component.append(pred_id)
+                    stack.append(pred_id)
+        if len(component) > 1 or root in successors[root]:
+            cyclic_nodes.update(component)
+
+    # Reverse DFS finish order is a topological order once back edges are removed
+    return PipelineTopology(
+        nodes=nodes,
+        successors=successors,
+        predecessors={node_id: tuple(preds) for node_id, preds in predecessors.items()},
+        order=tuple(reversed(finish_order)),
+        back_edges=frozenset(back_edges),
+        cyclic_nodes=frozenset(cyclic_nodes),
+    )
+
+
+def _materialize_path(prefix: List[Dict[str, Any]], chain: Optional[tuple]) -> List[Dict[str, Any]]:
+    """Turn a (node_info, parent) chain into a path list appended to prefix."""
+    tail = []
+    while chain is not None:
+        node_info, chain = chain
+        tail.append(node_info)
+    tail.reverse()
+    return prefix + tail
+
+
+def _iter_dfs_paths(
+    topology: PipelineTopology,
+    start_node_id: str,
+    target_node_id: Optional[str] = None,
+    prefix: Optional[List[Dict[str, Any]]] = None,
+    stop_at_pairing: bool = False,
+    pairing_supported: bool = True
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Lazily enumerate paths from a node using an explicit DFS stack.
+
+    Paths are built as shared (node_info, parent) chains and only turned into
+    lists when yielded, so each step costs O(1) instead of copying the path.
+    Paths are yielded in the same order as a recursive DFS over node outputs.
+
+    Semantics:
+    - File, Process and Branching nodes on a loop may be visited at most
+      MAX_ITERATIONS times per path; the next visit truncates the path
+    - Process nodes with several method_ids fork one path per method
+    - Termination nodes end the path
+    - When target_node_id is set, paths end at (and include) the target,
+      except a Pairing target which is reached but not included
+    - When stop_at_pairing is set, paths do not enter Pairing nodes; with no
+      target, the path leading to a Pairing node is yielded as-is
+
+    Args:
+        topology: Precomputed PipelineTopology
+        start_node_id: Node to start from
+        target_node_id: Optional node to stop at (None = go to termination)
+        prefix: Path already walked before start_node_id
+        stop_at_pairing: Whether to stop at Pairing nodes
+        pairing_supported: If False, reaching a Pairing node raises
+            NotImplementedError (enumerate_all_paths() semantics)
+
+    Yields:
+        Paths as lists of node info dicts
+    """
+    prefix = list(prefix) if prefix else []
+    nodes = topology.nodes
+    info_cache: Dict[Any, Dict[str, Any]] = {}
+
+    def node_info(node, method_id=None):
+        key = (node.id, method_id)
+        info = info_cache.get(key)
+        if info is None:
+            info = {'id': node.id, 'type': node.type}
+            if isinstance(node, FileNode):
+                info['extension'] = node.extension
+            elif isinstance(node, ProcessNode):
+                info['method_id'] = method_id
+            elif isinstance(node, BranchingNode):
+                info['condition'] = node.condition_description
+            elif isinstance(node, TerminationNode):
+                info['term_type'] = node.termination_type
+            elif isinstance(node, PairingNode):
+                info['pairing_type'] = node.pairing_type
+            info_cache[key] = info
+        return info
+
+    # Stack entries: (node_id, chain, iteration_counts) to visit,
+    # or (None, chain, None) to yield chain as a path
+    stack: List[tuple] = [(start_node_id, None, {})]
+    while stack:
+        node_id, chain, iteration_counts = stack.pop()
+        if node_id is None:
+            yield _materialize_path(prefix, chain)
+            continue
+
+        node = nodes.get(node_id)
+        if node is None:
+            continue
+
+        # Only nodes on a loop can be revisited, so only they need counting
+        if node_id in topology.cyclic_nodes and isinstance(node, (FileNode, ProcessNode, BranchingNode)):
+            iterations = iteration_counts.get(node_id, 0)
+            if iterations >= MAX_ITERATIONS:
+                # Hit iteration limit - truncate path
+                truncation_info = {
+                    'id': None,
+                    'type': 'Termination',
+                    'term_type': 'TRUNCATED',
+                    'truncated': True
+                }
+                yield _materialize_path(prefix, (truncation_info, chain))
+                continue
+            iteration_counts = {**iteration_counts, node_id: iterations + 1}
+
+        if isinstance(node, ProcessNode) and len(node.method_ids) > 1:
+            # Multiple methods - one branch per method_id, each output visited directly
+            children = [
+                (next_node_id, (node_info(node, method_id), chain), iteration_counts)
+                for method_id in node.method_ids
+                for next_node_id in node.output
+            ]
+            stack.extend(reversed(children))
+            continue
+
+        if isinstance(node, ProcessNode):
+            chain = (node_info(node, node.method_ids[0] if node.method_ids else ""), chain)
+        elif isinstance(node, TerminationNode):
+            yield _materialize_path(prefix, (node_info(node), chain))
+            continue
+        elif isinstance(node, PairingNode):
+            if node_id == target_node_id:
+                # This pairing node is the target - path ends before it
+                yield _materialize_path(prefix, chain)
+                continue
+            if stop_at_pairing:
+                continue
+            if not pairing_supported:
+                raise NotImplementedError(
+                    f"Pairing node '{node_id}' found. Use enumerate_paths_with_pairing() "
+                    "for pipelines with pairing nodes."
+                )
+            chain = (node_info(node), chain)
+        else:
+            # Capture, File and Branching nodes
+            chain = (node_info(node), chain)
+
+        if target_node_id and node_id == target_node_id:
+            yield _materialize_path(prefix, chain)
+            continue
+
+        children = []
+        for next_node_id in node.output:
+            if stop_at_pairing and isinstance(nodes.get(next_node_id), PairingNode):
+                # Don't continue into the pairing node; without a target the
+                # path leading to it is a result of its own
+                if target_node_id is None:
+                    children.append((None, chain, None))
+                continue
+            children.append((next_node_id, chain, iteration_counts))
+        stack.extend(reversed(children))
+
+
+def enumerate_all_paths(
+    pipeline: PipelineConfig,
+    topology: Optional[PipelineTopology] = None
+) -> List[List[Dict[str, Any]]]:
     """
     Enumerate all paths through the pipeline using DFS.
 
@@ -469,95 +731,17 @@ def enumerate_all_paths(pipeline: PipelineConfig) -> List[List[Dict[str, Any]]]:
 
     Args:
         pipeline: PipelineConfig instance
+        topology: Optional precomputed PipelineTopology
 
     Returns:
         List of paths, where each path is a list of node info dicts
     """
-    all_paths = []
-    node_lookup = {node.id: node for node in pipeline.nodes}
-
-    def dfs(current_node_id: str, current_path: List[Dict[str, Any]], iteration_counts: Dict[str, int]):
-        """
-        Depth-first search through pipeline graph.
+    if topology is None:
+        topology = build_pipeline_topology(pipeline)
 
-        Args:
-            current_node_id: ID of current node
-            current_path: Path so far (list of node info dicts)
-            iteration_counts: Iteration count for each node ID in this path
-        """
-        if current_node_id not in node_lookup:
-            return
-
-        current_node = node_lookup[current_node_id]
-
-        # Check iteration limit for File, Process, Branching nodes
-        if isinstance(current_node, (FileNode, ProcessNode, BranchingNode)):
-            iterations = iteration_counts.get(current_node_id, 0)
-            if iterations >= MAX_ITERATIONS:
-                # Hit iteration limit - truncate path
-                truncation_info = {
-                    'id': None,
-                    'type': 'Termination',
-                    'term_type': 'TRUNCATED',
-                    'truncated': True
-                }
-                all_paths.append(current_path + [truncation_info])
-                return
-            iteration_counts = {**iteration_counts, current_node_id: iterations + 1}
-
-        # Build node info for this step
-        node_info = {'id': current_node.id, 'type': current_node.type}
-
-        if isinstance(current_node, FileNode):
-            node_info['extension'] = current_node.extension
-            current_path = current_path + [node_info]
-
-        elif isinstance(current_node, ProcessNode):
-            # Process nodes with multiple method_ids create parallel paths
-            # Each method_id becomes a separate branch
-            if len(current_node.method_ids) > 1:
-                # Multiple methods - create separate path for each
-                for method_id in current_node.method_ids:
-                    method_node_info = {**node_info, 'method_id': method_id}
-                    method_path = current_path + [method_node_info]
-                    # Continue DFS for each method path
-                    for next_node_id in current_node.output:
-                        dfs(next_node_id, method_path, iteration_counts.copy())
-                return  # Don't continue DFS here, it's handled in loop
-            else:
-                # Single method or empty - standard processing
-                method_id = current_node.method_ids[0] if current_node.method_ids else ""
-                node_info['method_id'] = method_id
-                current_path = current_path + [node_info]
-
-        elif isinstance(current_node, BranchingNode):
-            node_info['condition'] = current_node.condition_description
-            current_path = current_path + [node_info]
-
-        elif isinstance(current_node, TerminationNode):
-            node_info['term_type'] = current_node.termination_type
-            current_path = current_path + [node_info]
-            all_paths.append(current_path)
-            return
-
-        elif isinstance(current_node, CaptureNode):
-            current_path = current_path + [node_info]
-
-        elif isinstance(current_node, PairingNode):
-            # This function does NOT support Pairing nodes
-            # Use enumerate_paths_with_pairing() instead
-            raise NotImplementedError(
-                f"Pairing node '{current_node.id}' found. Use enumerate_paths_with_pairing() "
-                "for pipelines with pairing nodes."
-            )
-
-        # Continue DFS to output nodes
-        for next_node_id in current_node.output:
-            dfs(next_node_id, current_path, iteration_counts.copy())
-
-    # Start DFS from each Capture node
+    all_paths = []
     for capture_node in pipeline.capture_nodes:
-        dfs(capture_node.id, [], {})
+        all_paths.extend(_iter_dfs_paths(topology, capture_node.id, pairing_supported=False))
 
     return all_paths
 
@@ -566,15 +750,20 @@ def enumerate_all_paths(pipeline: PipelineConfig) -> List[List[Dict[str, Any]]]:
 # Pairing Node Support - Cartesian Product Logic
 # =============================================================================
 
-def find_pairing_nodes_in_topological_order(pipeline: PipelineConfig) -> List[PairingNode]:
+def find_pairing_nodes_in_topological_order(
+    pipeline: PipelineConfig,
+    topology: Optional[PipelineTopology] = None
+) -> List[PairingNode]:
     """
     Find all pairing nodes and sort them in topological order (earliest to latest).
 
     Uses longest-path algorithm: distance from Capture node determines order.
-    Pairing nodes closer to Capture are processed first.
+    Pairing nodes closer to Capture are processed first. Distances are computed
+    in a single pass over the topological order (loops are ignored).
 
     Args:
         pipeline: PipelineConfig instance
+        topology: Optional precomputed PipelineTopology
 
     Returns:
         List of PairingNode instances sorted by topological order
@@ -582,64 +771,38 @@ def find_pairing_nodes_in_topological_order(pipeline: PipelineConfig) -> List[Pa
     if not pipeline.pairing_nodes:
         return []
 
-    # Build adjacency list (reverse graph for distance calculation)
-    node_lookup = {node.id: node for node in pipeline.nodes}
-    reverse_edges = {node.id: [] for node in pipeline.nodes}
+    if topology is None:
+        topology = build_pipeline_topology(pipeline)
 
-    for node in pipeline.nodes:
-        for output_id in node.output:
-            if output_id in reverse_edges:
-                reverse_edges[output_id].append(node.id)
-
-    # Calculate longest distance from any Capture node using dynamic programming
-    distances = {node.id: -1 for node in pipeline.nodes}
-
-    # Initialize: Capture nodes have distance 0
+    # Longest distance from any Capture node (-1 = unreachable)
+    distances = {node_id: -1 for node_id in topology.nodes}
     for capture_node in pipeline.capture_nodes:
         distances[capture_node.id] = 0
 
-    # Iteratively update distances (relaxation)
-    changed = True
-    iterations = 0
-    max_iterations = len(pipeline.nodes) + 1  # Prevent infinite loop
-
-    while changed and iterations < max_iterations:
-        changed = False
-        iterations += 1
-
-        for node in pipeline.nodes:
-            if distances[node.id] == -1:
-                # Check if any predecessor has been assigned a distance
-                for pred_id in reverse_edges[node.id]:
-                    if distances[pred_id] >= 0:
-                        # Take maximum distance from predecessors + 1
-                        new_distance = distances[pred_id] + 1
-                        if distances[node.id] < new_distance:
-                            distances[node.id] = new_distance
-                            changed = True
-            else:
-                # Already has distance - check if we can improve it
-                for pred_id in reverse_edges[node.id]:
-                    if distances[pred_id] >= 0:
-                        new_distance = distances[pred_id] + 1
-                        if distances[node.id] < new_distance:
-                            distances[node.id] = new_distance
-                            changed = True
-
-    # Sort pairing nodes by distance
-    pairing_with_distance = [(distances[pn.id], pn) for pn in pipeline.pairing_nodes]
-    pairing_with_distance.sort(key=lambda x: x[0])
+    for node_id in topology.order:
+        distance = distances[node_id]
+        if distance < 0:
+            continue
+        for next_node_id in topology.successors[node_id]:
+            if next_node_id in distances and (node_id, next_node_id) not in topology.back_edges:
+                distances[next_node_id] = max(distances[next_node_id], distance + 1)
 
-    return [pn for _, pn in pairing_with_distance]
+    # Sort pairing nodes by distance (stable for equal distances)
+    return sorted(pipeline.pairing_nodes, key=lambda pn: distances.get(pn.id, -1))
 
 
-def validate_pairing_node_inputs(pairing_node: PairingNode, pipeline: PipelineConfig) -> tuple:
+def validate_pairing_node_inputs(
+    pairing_node: PairingNode,
+    pipeline: PipelineConfig,
+    topology: Optional[PipelineTopology] = None
+) -> tuple:
     """
     Validate that a pairing node has exactly 2 input branches.
 
     Args:
         pairing_node: PairingNode to validate
         pipeline: PipelineConfig instance
+        topology: Optional precomputed PipelineTopology
 
     Returns:
         Tuple of (input1_id, input2_id) - the two input node IDs
@@ -647,11 +810,11 @@ def validate_pairing_node_inputs(pairing_node: PairingNode, pipeline: PipelineCo
     Raises:
         ValueError: If pairing node doesn't have exactly 2 inputs
     """
-    # Find all nodes that output to this pairing node
-    input_node_ids = []
-    for node in pipeline.nodes:
-        if pairing_node.id in node.output:
-            input_node_ids.append(node.id)
+    if topology is None:
+        topology = build_pipeline_topology(pipeline)
+
+    # All nodes that output to this pairing node
+    input_node_ids = list(topology.predecessors.get(pairing_node.id, ()))
 
     if len(input_node_ids) != 2:
         raise ValueError(
@@ -662,6 +825,28 @@ def validate_pairing_node_inputs(pairing_node: PairingNode, pipeline: PipelineCo
     return input_node_ids[0], input_node_ids[1]
 
 
+def check_pairing_node_loops(topology: PipelineTopology) -> None:
+    """
+    Refuse loops that pass through a Pairing node.
+
+    Unlike File, Process and Branching nodes, Pairing nodes are not
+    iteration-limited, so path enumeration around such a loop (e.g. a
+    Pairing node feeding itself) would never end.
+
+    Args:
+        topology: Precomputed PipelineTopology
+
+    Raises:
+        ValueError: If a Pairing node is on a loop
+    """
+    for node_id in sorted(topology.cyclic_nodes):
+        if isinstance(topology.nodes.get(node_id), PairingNode):
+            raise ValueError(
+                f"Pairing node '{node_id}' is part of a loop; "
+                "loops must not pass through Pairing nodes"
+            )
+
+
 def merge_two_paths(path1: List[Dict[str, Any]], path2: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Merge two paths at a pairing node using Cartesian product semantics.
@@ -692,173 +877,70 @@ def merge_two_paths(path1: List[Dict[str, Any]], path2: List[Dict[str, Any]]) ->
     return merged_path
 
 
-def enumerate_paths_with_pairing(pipeline: PipelineConfig) -> List[List[Dict[str, Any]]]:
+def _path_signature(path: List[Dict[str, Any]]) -> tuple:
     """
-    Enumerate all paths through pipeline with support for Pairing nodes.
+    Full node info of a path, in order - paths sharing it are identical.
 
-    This is the primary path enumeration function that should be used when
-    pipeline contains pairing nodes. Falls back to enumerate_all_paths() if
-    no pairing nodes are present.
+    Includes each Process node's method_id, so merged paths that differ
+    only in the method a Process node took are kept apart even when no
+    File node records the difference before the Pairing node.
+    """
+    return tuple(tuple(sorted(node.items())) for node in path)
+
+
+def iter_pipeline_paths(
+    pipeline: PipelineConfig,
+    topology: Optional[PipelineTopology] = None
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Lazily enumerate all paths through the pipeline, with Pairing node support.
+
+    Yields the same paths, in the same order, as enumerate_paths_with_pairing().
+    Consumers that only need a prefix of the paths (e.g. sampling) avoid
+    materializing the rest.
 
     Algorithm:
     1. Find all pairing nodes in topological order
     2. For each pairing node (earliest to latest):
        a. Find paths to the pairing node from both inputs
        b. Compute Cartesian product of input paths
-       c. Merge each pair using merge_two_paths()
+       c. Merge each pair using merge_two_paths(), skipping merged paths with
+          the same nodes (and methods) as an earlier one
        d. Continue enumeration from pairing node to termination
     3. Handle Process nodes with multiple method_ids as branching
 
     Args:
         pipeline: PipelineConfig instance
+        topology: Optional precomputed PipelineTopology
 
-    Returns:
-        List of paths, where each path is a list of node info dicts
+    Yields:
+        Paths, where each path is a list of node info dicts
+
+    Raises:
+        ValueError: If a pairing node doesn't have exactly 2 inputs or is
+            part of a loop
     """
-    # Check if pipeline has pairing nodes
-    pairing_nodes = find_pairing_nodes_in_topological_order(pipeline)
+    if topology is None:
+        topology = build_pipeline_topology(pipeline)
+    pairing_nodes = find_pairing_nodes_in_topological_order(pipeline, topology)
+    check_pairing_node_loops(topology)
 
     if not pairing_nodes:
-        # No pairing nodes - use standard enumeration
-        return enumerate_all_paths(pipeline)
+        # No pairing nodes - standard enumeration
+        for capture_node in pipeline.capture_nodes:
+            yield from _iter_dfs_paths(topology, capture_node.id, pairing_supported=False)
+        return
 
     # Validate pairing nodes
     for pn in pairing_nodes:
-        validate_pairing_node_inputs(pn, pipeline)
-
-    # Build node lookup
-    node_lookup = {node.id: node for node in pipeline.nodes}
-
-    # Find all nodes that input to pairing nodes
-    pairing_input_nodes = set()
-    for pn in pairing_nodes:
-        for node in pipeline.nodes:
-            if pn.id in node.output:
-                pairing_input_nodes.add(node.id)
-
-    # Process pairing nodes one at a time in topological order
-    # Start with paths from Capture to first pairing node
+        validate_pairing_node_inputs(pn, pipeline, topology)
 
-    # Helper function: DFS to target node (pairing node or termination)
-    def dfs_to_target(
-        current_node_id: str,
-        target_node_id: Optional[str],
-        current_path: List[Dict[str, Any]],
-        iteration_counts: Dict[str, int],
-        stop_at_pairing: bool = False
-    ) -> List[List[Dict[str, Any]]]:
-        """
-        DFS to target node, collecting all paths.
-
-        If target_node_id is None, goes to termination.
-        If stop_at_pairing is True, stops when hitting ANY pairing node.
-        """
-        paths = []
-
-        if current_node_id not in node_lookup:
-            return paths
-
-        current_node = node_lookup[current_node_id]
-
-        # Check iteration limit
-        if isinstance(current_node, (FileNode, ProcessNode, BranchingNode)):
-            iterations = iteration_counts.get(current_node_id, 0)
-            if iterations >= MAX_ITERATIONS:
-                truncation_info = {
-                    'id': None,
-                    'type': 'Termination',
-                    'term_type': 'TRUNCATED',
-                    'truncated': True
-                }
-                return [current_path + [truncation_info]]
-            iteration_counts = {**iteration_counts, current_node_id: iterations + 1}
-
-        # Build node info
-        node_info = {'id': current_node.id, 'type': current_node.type}
-
-        if isinstance(current_node, FileNode):
-            node_info['extension'] = current_node.extension
-            current_path = current_path + [node_info]
-
-        elif isinstance(current_node, ProcessNode):
-            # Handle multiple method_ids as branching
-            if len(current_node.method_ids) > 1:
-                for method_id in current_node.method_ids:
-                    method_node_info = {**node_info, 'method_id': method_id}
-                    method_path = current_path + [method_node_info]
-                    for next_node_id in current_node.output:
-                        paths.extend(dfs_to_target(
-                            next_node_id, target_node_id, method_path,
-                            iteration_counts.copy(), stop_at_pairing
-                        ))
-                return paths
-            else:
-                method_id = current_node.method_ids[0] if current_node.method_ids else ""
-                node_info['method_id'] = method_id
-                current_path = current_path + [node_info]
-
-        elif isinstance(current_node, BranchingNode):
-            node_info['condition'] = current_node.condition_description
-            current_path = current_path + [node_info]
-
-        elif isinstance(current_node, TerminationNode):
-            node_info['term_type'] = current_node.termination_type
-            current_path = current_path + [node_info]
-            return [current_path]
-
-        elif isinstance(current_node, CaptureNode):
-            current_path = current_path + [node_info]
-
-        elif isinstance(current_node, PairingNode):
-            # Reached a pairing node
-            if current_node_id == target_node_id:
-                # This pairing node is the target - return path without adding it
-                return [current_path]
-            elif stop_at_pairing:
-                # Hit a pairing node before reaching target
-                # Return current path (which is the path before this pairing node)
-                # This allows us to stop at nodes that input to this pairing
-                return []  # We'll handle this differently - stop DFS here
-            else:
-                # Continue through pairing node (shouldn't happen in this algorithm)
-                node_info['pairing_type'] = current_node.pairing_type
-                current_path = current_path + [node_info]
-
-        # Check if we reached target
-        if target_node_id and current_node_id == target_node_id:
-            return [current_path]
-
-        # Continue DFS
-        for next_node_id in current_node.output:
-            next_node = node_lookup.get(next_node_id)
-
-            # If stop_at_pairing and next node is a pairing node, stop here
-            if stop_at_pairing and next_node and isinstance(next_node, PairingNode):
-                # Don't continue into the pairing node
-                # Only collect this path if we don't have a specific target
-                # (If we have a target, we only want paths that reach it)
-                if target_node_id is None:
-                    paths.append(current_path)
-                continue
-
-            paths.extend(dfs_to_target(
-                next_node_id, target_node_id, current_path,
-                iteration_counts.copy(), stop_at_pairing
-            ))
-
-        return paths
-
-    # Process each pairing node in topological order
-    # Maintain a frontier of partial paths that need further processing
-    all_final_paths = []
+    # Process pairing nodes one at a time in topological order, maintaining
+    # a frontier of partial paths that need further processing
     frontier_paths = None  # None means start from Capture
 
     for pairing_idx, pairing_node in enumerate(pairing_nodes):
-        # Find the two input nodes to this pairing node
-        input_node_ids = [node.id for node in pipeline.nodes if pairing_node.id in node.output]
-
-        if len(input_node_ids) != 2:
-            continue  # Already validated, but double-check
+        input_node_ids = topology.predecessors[pairing_node.id]
 
         input1_paths = []
         input2_paths = []
@@ -866,113 +948,495 @@ def enumerate_paths_with_pairing(pipeline: PipelineConfig) -> List[List[Dict[str
         if frontier_paths is None:
             # First pairing node - start from Capture
             for capture_node in pipeline.capture_nodes:
-                input1_paths.extend(dfs_to_target(
-                    capture_node.id, input_node_ids[0], [], {}, stop_at_pairing=True
+                input1_paths.extend(_iter_dfs_paths(
+                    topology, capture_node.id, input_node_ids[0], stop_at_pairing=True
                 ))
-                input2_paths.extend(dfs_to_target(
-                    capture_node.id, input_node_ids[1], [], {}, stop_at_pairing=True
+                input2_paths.extend(_iter_dfs_paths(
+                    topology, capture_node.id, input_node_ids[1], stop_at_pairing=True
                 ))
         else:
-            # Subsequent pairing node - start from frontier paths
+            # Subsequent pairing node - continue each frontier path to both inputs
             for frontier_path in frontier_paths:
                 if not frontier_path:
                     continue
-
-                # Start DFS from the frontier path (not removing last node)
-                # Find paths from the frontier to each input node
-                # We need to check if the frontier already ends at an input node
                 last_node_id = frontier_path[-1].get('id')
 
-                if last_node_id == input_node_ids[0]:
-                    # Already at input1 - just use this path
-                    input1_paths.append(frontier_path)
-                else:
-                    # Need to DFS to input1
-                    paths_to_input1 = dfs_to_target(
-                        last_node_id, input_node_ids[0], frontier_path[:-1], {}, stop_at_pairing=True
-                    )
-                    input1_paths.extend(paths_to_input1)
-
-                if last_node_id == input_node_ids[1]:
-                    # Already at input2 - just use this path
-                    input2_paths.append(frontier_path)
-                else:
-                    # Need to DFS to input2
-                    paths_to_input2 = dfs_to_target(
-                        last_node_id, input_node_ids[1], frontier_path[:-1], {}, stop_at_pairing=True
-                    )
-                    input2_paths.extend(paths_to_input2)
-
-        # Compute Cartesian product: merge all combinations
-        merged_paths = []
-        for path1 in input1_paths:
-            for path2 in input2_paths:
-                merged = merge_two_paths(path1, path2)
-                merged_paths.append(merged)
+                for input_node_id, input_paths in zip(input_node_ids, (input1_paths, input2_paths), strict=True):
+                    if last_node_id == input_node_id:
+                        # Already at this input - just use this path
+                        input_paths.append(frontier_path)
+                    else:
+                        input_paths.extend(_iter_dfs_paths(
+                            topology, last_node_id, input_node_id, frontier_path[:-1], stop_at_pairing=True
+                        ))
 
         # Continue from pairing node - either to next pairing or to termination
         next_pairing_node = pairing_nodes[pairing_idx + 1] if pairing_idx + 1 < len(pairing_nodes) else None
+        next_pairing_input_ids = topology.predecessors[next_pairing_node.id] if next_pairing_node else ()
+        pairing_info = {
+            'id': pairing_node.id,
+            'type': 'Pairing',
+            'pairing_type': pairing_node.pairing_type
+        }
         new_frontier = []
+        merged_signatures = set()
 
-        for merged_path in merged_paths:
-            # Add pairing node to path
-            pairing_info = {
-                'id': pairing_node.id,
-                'type': 'Pairing',
-                'pairing_type': pairing_node.pairing_type
-            }
-            path_with_pairing = merged_path + [pairing_info]
+        # Cartesian product: merge all combinations of input paths
+        for path1 in input1_paths:
+            for path2 in input2_paths:
+                merged_path = merge_two_paths(path1, path2)
+                signature = _path_signature(merged_path)
+                if signature in merged_signatures:
+                    continue
+                merged_signatures.add(signature)
 
-            # Continue from pairing node output
-            for next_node_id in pairing_node.output:
-                if next_pairing_node:
-                    # There's another pairing node - DFS and collect paths that reach
-                    # either termination OR inputs of next pairing
-                    next_pairing_input_ids = [n.id for n in pipeline.nodes if next_pairing_node.id in n.output]
+                path_with_pairing = merged_path + [pairing_info]
 
-                    partial_paths = dfs_to_target(
-                        next_node_id, None, path_with_pairing, {}, stop_at_pairing=True
-                    )
-                    for partial_path in partial_paths:
-                        if not partial_path:
-                            continue
-                        last_node = partial_path[-1]
-                        last_id = last_node.get('id')
+                for next_node_id in pairing_node.output:
+                    if next_pairing_node is None:
+                        # No more pairing nodes - go to termination
+                        yield from _iter_dfs_paths(topology, next_node_id, prefix=path_with_pairing)
+                        continue
 
+                    # Collect paths reaching either termination or an input of
+                    # the next pairing node
+                    for partial_path in _iter_dfs_paths(
+                        topology, next_node_id, prefix=path_with_pairing, stop_at_pairing=True
+                    ):
+                        last_node = partial_path[-1]
                         if last_node.get('type') == 'Termination':
                             # Early termination before next pairing
-                            all_final_paths.append(partial_path)
-                        elif last_id in next_pairing_input_ids:
+                            yield partial_path
+                        elif last_node.get('id') in next_pairing_input_ids:
                             # Reached an input to the next pairing - add to frontier
                             new_frontier.append(partial_path)
-                        # Otherwise path was truncated by hitting a pairing node - ignore it
-                else:
-                    # No more pairing nodes - go to termination
-                    final_paths = dfs_to_target(
-                        next_node_id, None, path_with_pairing, {}, stop_at_pairing=False
-                    )
-                    all_final_paths.extend(final_paths)
+                        # Otherwise path stopped at another pairing node - ignore it
 
-        # Update frontier for next pairing node
         frontier_paths = new_frontier
 
-    # Also need to handle paths that don't go through pairing nodes
-    # (early termination before reaching pairing node)
-    non_pairing_paths = []
+    # Paths that terminate without going through any pairing node
     for capture_node in pipeline.capture_nodes:
-        # DFS with stop_at_pairing=True to find early terminations
-        paths_before_pairing = dfs_to_target(
-            capture_node.id, None, [], {}, stop_at_pairing=True
-        )
-        for path in paths_before_pairing:
-            # Check if this path ends at a Termination node
+        for path in _iter_dfs_paths(topology, capture_node.id, stop_at_pairing=True):
             if path and path[-1].get('type') == 'Termination':
-                non_pairing_paths.append(path)
+                yield path
+
+
+def enumerate_paths_with_pairing(
+    pipeline: PipelineConfig,
+    topology: Optional[PipelineTopology] = None
+) -> List[List[Dict[str, Any]]]:
+    """
+    Enumerate all paths through pipeline with support for Pairing nodes.
+
+    This is the primary path enumeration function that should be used when
+    pipeline contains pairing nodes. Pipelines without pairing nodes are
+    enumerated exactly like enumerate_all_paths(). See iter_pipeline_paths()
+    for the algorithm and a lazy variant.
+
+    Args:
+        pipeline: PipelineConfig instance
+        topology: Optional precomputed PipelineTopology
+
+    Returns:
+        List of paths, where each path is a list of node info dicts
+    """
+    return list(iter_pipeline_paths(pipeline, topology))
+
+
+def count_pipeline_paths(
+    pipeline: PipelineConfig,
+    limit: Optional[int] = None,
+    topology: Optional[PipelineTopology] = None
+) -> int:
+    """
+    Count the paths enumerate_paths_with_pairing() would return, without enumerating them.
+
+    - Without pairing nodes the count is exact, computed by dynamic
+      programming over (node, loop iteration counts), so it costs about one
+      pass over the graph per loop iteration instead of one per path.
+    - With pairing nodes and no loops the count is taken before merged paths
+      are de-duplicated (an upper bound), with one pass over the topological
+      order per pipeline segment between pairing nodes.
+    - With pairing nodes and loops, paths are enumerated lazily and counting
+      stops as soon as limit is exceeded.
+
+    Use it to refuse or sample pipelines whose path count would explode
+    before spending time and memory on enumeration.
+
+    Args:
+        pipeline: PipelineConfig instance
+        limit: Optional count above which the exact value is not needed
+        topology: Optional precomputed PipelineTopology
+
+    Returns:
+        Number of paths (any value above limit means "more than limit")
+
+    Raises:
+        ValueError: If a pairing node doesn't have exactly 2 inputs or is
+            part of a loop
+    """
+    if topology is None:
+        topology = build_pipeline_topology(pipeline)
+    check_pairing_node_loops(topology)
+    nodes = topology.nodes
+
+    def fan_out(node) -> int:
+        if isinstance(node, ProcessNode) and len(node.method_ids) > 1:
+            return len(node.method_ids)
+        return 1
+
+    if not pipeline.pairing_nodes:
+        memo: Dict[tuple, int] = {}
+
+        def count_from(node_id: str, loop_counts: tuple) -> int:
+            key = (node_id, loop_counts)
+            if key in memo:
+                return memo[key]
+            node = nodes.get(node_id)
+            if node is None:
+                return 0
+            if isinstance(node, TerminationNode):
+                return 1
+            if node_id in topology.cyclic_nodes and isinstance(node, (FileNode, ProcessNode, BranchingNode)):
+                counts = dict(loop_counts)
+                iterations = counts.get(node_id, 0)
+                if iterations >= MAX_ITERATIONS:
+                    return 1  # Truncated path
+                counts[node_id] = iterations + 1
+                loop_counts = tuple(sorted(counts.items()))
+            total = fan_out(node) * sum(count_from(next_id, loop_counts) for next_id in node.output)
+            memo[key] = total
+            return total
+
+        return sum(count_from(capture_node.id, ()) for capture_node in pipeline.capture_nodes)
+
+    if topology.back_edges:
+        paths = iter_pipeline_paths(pipeline, topology)
+        if limit is not None:
+            paths = itertools.islice(paths, limit + 1)
+        return sum(1 for _ in paths)
+
+    counts_by_start = {}
+
+    def segment_counts(start_node_id: str, target_node_id: Optional[str] = None,
+                       stop_at_pairing: bool = True) -> Dict[str, int]:
+        key = (start_node_id, target_node_id, stop_at_pairing)
+        if key not in counts_by_start:
+            counts_by_start[key] = _count_dag_paths(topology, start_node_id, target_node_id, stop_at_pairing)
+        return counts_by_start[key]
+
+    pairing_nodes = find_pairing_nodes_in_topological_order(pipeline, topology)
+    total = 0
+
+    # Mirrors iter_pipeline_paths(): count input paths of each pairing node,
+    # multiply them (Cartesian product) and carry the frontier forward
+    frontier: Optional[Dict[str, int]] = None  # Last node ID -> partial path count
+    for pairing_idx, pairing_node in enumerate(pairing_nodes):
+        input_node_ids = topology.predecessors[pairing_node.id]
+        if len(input_node_ids) != 2:
+            raise ValueError(
+                f"Pairing node '{pairing_node.id}' must have exactly 2 input nodes, "
+                f"found {len(input_node_ids)}: {list(input_node_ids)}"
+            )
+
+        input_counts = []
+        for input_node_id in input_node_ids:
+            if frontier is None:
+                input_counts.append(sum(
+                    sum(segment_counts(capture_node.id, input_node_id).values())
+                    for capture_node in pipeline.capture_nodes
+                ))
+            else:
+                input_counts.append(sum(
+                    count if last_node_id == input_node_id
+                    else count * sum(segment_counts(last_node_id, input_node_id).values())
+                    for last_node_id, count in frontier.items()
+                ))
+        merged_count = input_counts[0] * input_counts[1]
+
+        next_pairing_node = pairing_nodes[pairing_idx + 1] if pairing_idx + 1 < len(pairing_nodes) else None
+        new_frontier: Dict[str, int] = {}
+        for next_node_id in pairing_node.output:
+            if next_pairing_node is None:
+                total += merged_count * sum(segment_counts(next_node_id, stop_at_pairing=False).values())
+                continue
+            for last_node_id, count in segment_counts(next_node_id).items():
+                if isinstance(nodes[last_node_id], TerminationNode):
+                    total += merged_count * count
+                elif last_node_id in topology.predecessors[next_pairing_node.id]:
+                    new_frontier[last_node_id] = new_frontier.get(last_node_id, 0) + merged_count * count
+        frontier = new_frontier
+
+        if limit is not None and total > limit:
+            return total
+
+    # Paths that terminate without going through any pairing node
+    for capture_node in pipeline.capture_nodes:
+        for last_node_id, count in segment_counts(capture_node.id).items():
+            if isinstance(nodes[last_node_id], TerminationNode):
+                total += count
+
+    return total
+
+
+def _count_dag_paths(
+    topology: PipelineTopology,
+    start_node_id: str,
+    target_node_id: Optional[str] = None,
+    stop_at_pairing: bool = False
+) -> Dict[str, int]:
+    """
+    Count the paths _iter_dfs_paths() would yield on a loop-free pipeline.
+
+    Runs one pass over the topological order, accumulating the number of
+    partial paths arriving at each node instead of walking them.
+
+    Args:
+        topology: Precomputed PipelineTopology (without back edges)
+        start_node_id: Node to start from
+        target_node_id: Optional node to stop at
+        stop_at_pairing: Whether to stop at Pairing nodes
+
+    Returns:
+        Dict mapping the ID of the last node of yielded paths to their count
+    """
+    nodes = topology.nodes
+    arrivals = dict.fromkeys(nodes, 0)
+    results: Dict[str, int] = {}
+
+    def add_result(node_id: str, count: int) -> None:
+        results[node_id] = results.get(node_id, 0) + count
+
+    def visit_pairing(from_node_id: str, pairing_id: str, count: int) -> None:
+        # Visiting a Pairing node: the target ends the path before it
+        if pairing_id == target_node_id:
+            add_result(from_node_id, count)
+        elif not stop_at_pairing:
+            arrivals[pairing_id] += count
+
+    if start_node_id not in nodes:
+        return results
+    arrivals[start_node_id] = 1
+
+    for node_id in topology.order:
+        count = arrivals[node_id]
+        if not count:
+            continue
+        node = nodes[node_id]
+
+        if isinstance(node, ProcessNode) and len(node.method_ids) > 1:
+            # One branch per method_id, each output visited directly
+            for next_node_id in node.output:
+                next_node = nodes.get(next_node_id)
+                if isinstance(next_node, PairingNode):
+                    visit_pairing(node_id, next_node_id, count * len(node.method_ids))
+                elif next_node is not None:
+                    arrivals[next_node_id] += count * len(node.method_ids)
+            continue
+        if isinstance(node, TerminationNode):
+            add_result(node_id, count)
+            continue
+        if isinstance(node, PairingNode) and (node_id == target_node_id or stop_at_pairing):
+            # Only reachable as the start node - the DFS does not enter it
+            continue
+        if target_node_id and node_id == target_node_id:
+            add_result(node_id, count)
+            continue
+
+        for next_node_id in node.output:
+            next_node = nodes.get(next_node_id)
+            if next_node is None:
+                continue
+            if isinstance(next_node, PairingNode):
+                if stop_at_pairing:
+                    if target_node_id is None:
+                        add_result(node_id, count)
+                else:
+                    visit_pairing(node_id, next_node_id, count)
+                continue
+            arrivals[next_node_id] += count
+
+    return results
+
+
+def check_pipeline_path_count(
+    pipeline: PipelineConfig,
+    max_paths: int = MAX_PIPELINE_PATHS,
+    topology: Optional[PipelineTopology] = None
+) -> int:
+    """
+    Refuse pipelines that would enumerate to more than max_paths paths.
+
+    Args:
+        pipeline: PipelineConfig instance
+        max_paths: Maximum number of paths allowed
+        topology: Optional precomputed PipelineTopology
+
+    Returns:
+        Path count (see count_pipeline_paths())
 
-    # Combine all paths
-    all_final_paths.extend(non_pairing_paths)
+    Raises:
+        PathLimitExceededError: If the pipeline has more than max_paths paths
+        ValueError: If a Pairing node is part of a loop
+    """
+    path_count = count_pipeline_paths(pipeline, limit=max_paths, topology=topology)
+    if path_count > max_paths:
+        raise PathLimitExceededError(
+            f"Pipeline has more than {max_paths} paths ({path_count} counted). "
+            "Reduce branching, processing methods per node or pairing combinations."
+        )
+    return path_count
+
+
+# =============================================================================
+# Compiled Pipeline Graph
+# =============================================================================
+
+@dataclass(frozen=True)
+class CompiledPipelineGraph:
+    """
+    Compiled, hashable graph IR of one pipeline version.
+
+    Node IDs are interned: node i is node_ids[i], and adjacency is stored
+    CSR-style - the successors of node i are
+    successor_indices[successor_offsets[i]:successor_offsets[i + 1]].
+    Edges to unknown node IDs are dropped; duplicate edges are kept.
+
+    Built once by compile_pipeline_graph() and cached per pipeline version by
+    the backend and the agent, so consumers stop re-deriving structure from
+    nodes_json/edges_json. Equality and hashing only cover the graph and the
+    capture settings; pipeline and topology ride along for path enumeration.
+    """
+    node_ids: Tuple[str, ...]
+    node_types: Tuple[str, ...]
+    successor_offsets: Tuple[int, ...]
+    successor_indices: Tuple[int, ...]
+    predecessor_offsets: Tuple[int, ...]
+    predecessor_indices: Tuple[int, ...]
+    topological_order: Tuple[int, ...]  # Ignoring loop back edges
+    pairing_inputs: Tuple[Tuple[str, Tuple[str, ...]], ...]  # (pairing ID, input IDs)
+    capture_regex: Optional[str]  # Capture node filename_regex, if any
+    camera_id_group: int  # Capture group holding the camera ID (1 or 2)
+    pipeline: PipelineConfig = field(compare=False, repr=False)
+    topology: PipelineTopology = field(compare=False, repr=False)
+
+    @cached_property
+    def node_index(self) -> Dict[str, int]:
+        """Node ID -> interned index."""
+        return {node_id: idx for idx, node_id in enumerate(self.node_ids)}
+
+    @cached_property
+    def edge_set(self) -> frozenset:
+        """All (from_id, to_id) edges."""
+        return frozenset(
+            (self.node_ids[idx], self.node_ids[target])
+            for idx in range(len(self.node_ids))
+            for target in self.successor_indices[self.successor_offsets[idx]:self.successor_offsets[idx + 1]]
+        )
+
+    @cached_property
+    def capture_pattern(self) -> Optional['re.Pattern']:
+        """Compiled capture_regex (None without a capture_regex)."""
+        return re.compile(self.capture_regex) if self.capture_regex else None
+
+    @cached_property
+    def paths(self) -> List[List[Dict[str, Any]]]:
+        """
+        All paths (see enumerate_paths_with_pairing()), enumerated on first use.
 
-    return all_final_paths
+        Shared by every consumer of this graph - do not modify.
+        """
+        try:
+            return enumerate_paths_with_pairing(self.pipeline, self.topology)
+        except NotImplementedError:
+            return enumerate_all_paths(self.pipeline, self.topology)
+
+    def successors(self, node_id: str) -> Tuple[str, ...]:
+        """Output node IDs of a node (empty for unknown IDs)."""
+        idx = self.node_index.get(node_id)
+        if idx is None:
+            return ()
+        start, end = self.successor_offsets[idx], self.successor_offsets[idx + 1]
+        return tuple(self.node_ids[target] for target in self.successor_indices[start:end])
+
+    def predecessors(self, node_id: str) -> Tuple[str, ...]:
+        """Input node IDs of a node (empty for unknown IDs)."""
+        idx = self.node_index.get(node_id)
+        if idx is None:
+            return ()
+        start, end = self.predecessor_offsets[idx], self.predecessor_offsets[idx + 1]
+        return tuple(self.node_ids[source] for source in self.predecessor_indices[start:end])
+
+    def has_edge(self, from_id: str, to_id: str) -> bool:
+        """Whether the pipeline has an edge from_id -> to_id."""
+        return (from_id, to_id) in self.edge_set
+
+    def node_ids_of_type(self, node_type: str) -> List[str]:
+        """Node IDs of one type ("Capture", "File", ...), in pipeline order."""
+        return [node_id for node_id, type_ in zip(self.node_ids, self.node_types, strict=True) if type_ == node_type]
+
+
+def compile_pipeline_graph(
+    pipeline: PipelineConfig,
+    capture_properties: Optional[Mapping[str, Any]] = None
+) -> CompiledPipelineGraph:
+    """
+    Compile a PipelineConfig into a CompiledPipelineGraph.
+
+    Args:
+        pipeline: PipelineConfig instance
+        capture_properties: Optional properties of the Capture node
+            (filename_regex, camera_id_group), e.g. from nodes_json
+
+    Returns:
+        CompiledPipelineGraph for the pipeline
+    """
+    topology = build_pipeline_topology(pipeline)
+    node_ids = tuple(node.id for node in pipeline.nodes)
+    node_index = {node_id: idx for idx, node_id in enumerate(node_ids)}
+
+    successor_offsets = [0]
+    successor_indices: List[int] = []
+    incoming: List[List[int]] = [[] for _ in node_ids]
+    for idx, node in enumerate(pipeline.nodes):
+        for output_id in node.output:
+            target = node_index.get(output_id)
+            if target is not None:
+                successor_indices.append(target)
+                incoming[target].append(idx)
+        successor_offsets.append(len(successor_indices))
+
+    predecessor_offsets = [0]
+    predecessor_indices: List[int] = []
+    for sources in incoming:
+        predecessor_indices.extend(sources)
+        predecessor_offsets.append(len(predecessor_indices))
+
+    capture_properties = capture_properties or {}
+    try:
+        camera_id_group = int(capture_properties.get("camera_id_group", 1))
+    except (ValueError, TypeError):
+        camera_id_group = 1
+    if camera_id_group not in (1, 2):
+        camera_id_group = 1
+
+    return CompiledPipelineGraph(
+        node_ids=node_ids,
+        node_types=tuple(node.type for node in pipeline.nodes),
+        successor_offsets=tuple(successor_offsets),
+        successor_indices=tuple(successor_indices),
+        predecessor_offsets=tuple(predecessor_offsets),
+        predecessor_indices=tuple(predecessor_indices),
+        topological_order=tuple(node_index[node_id] for node_id in topology.order),
+        pairing_inputs=tuple(
+            (pairing_node.id, topology.predecessors.get(pairing_node.id, ()))
+            for pairing_node in pipeline.pairing_nodes
+        ),
+        capture_regex=capture_properties.get("filename_regex") or None,
+        camera_id_group=camera_id_group,
+        pipeline=pipeline,
+        topology=topology,
+    )
 
 
 # =============================================================================
@@ -1055,6 +1519,413 @@ def generate_sample_base_filename(config: PhotoAdminConfig) -> str:
     return "ABCD0001"
 
 
+# =============================================================================
+# Compiled Pipeline Plan
+# =============================================================================
+
+@dataclass(frozen=True)
+class PlannedPath:
+    """
+    A single non-truncated Capture → Termination path, pre-compiled for validation.
+
+    The file templates capture everything generate_expected_files() derives from
+    the path, so expected filenames for an image are obtained by prefixing the
+    base and inserting the suffix instead of re-walking the path nodes.
+    """
+    node_ids: Tuple[str, ...]  # Node IDs along the path (used for path_stats)
+    nodes: Tuple[Dict[str, Any], ...]  # Original node info dicts
+    file_templates: Tuple[Tuple[str, str], ...]  # (method_chain, extension) pairs, deduplicated
+    length: int  # Number of nodes in the path (shorter paths win ties)
+
+    def expected_files(self, base_filename: str, suffix: str = '') -> List[str]:
+        """
+        Instantiate expected filenames for a base filename and suffix.
+
+        Equivalent to generate_expected_files(self.nodes, base_filename, suffix).
+
+        Args:
+            base_filename: Base filename WITHOUT suffix (e.g., "AB3D0001")
+            suffix: Numerical suffix for counter looping (e.g., "" or "2")
+
+        Returns:
+            List of expected filenames (deduplicated, sorted)
+        """
+        suffix_part = f"-{suffix}" if suffix else ""
+        return sorted({
+            f"{base_filename}{chain}{suffix_part}{extension}"
+            for chain, extension in self.file_templates
+        })
+
+
+@dataclass(frozen=True)
+class PipelinePlan:
+    """
+    Immutable, pre-compiled view of a pipeline used for image validation.
+
+    Path enumeration is by far the most expensive part of validating an image,
+    yet it only depends on the pipeline definition. A plan is compiled once per
+    pipeline version and shared by every SpecificImage validated against it.
+    """
+    paths_by_termination: Mapping[str, Tuple[PlannedPath, ...]]  # Non-truncated paths per termination type
+    total_paths: int  # All enumerated paths, including truncated ones
+    truncated_paths: int  # Paths that hit MAX_ITERATIONS
+    # Reverse index: lowercase (method_chain, extension) -> (termination_type, path_index) entries
+    signature_index: Mapping[Tuple[str, str], Tuple[Tuple[str, int], ...]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    extensions: Tuple[str, ...] = ()  # Distinct lowercase extensions used by any File node
+    # Path index to report per termination when none of an image's files match any path
+    default_paths: Mapping[str, int] = field(default_factory=lambda: MappingProxyType({}))
+
+    @property
+    def termination_types(self) -> List[str]:
+        """Termination types reachable through at least one complete path."""
+        return list(self.paths_by_termination.keys())
+
+    def __reduce__(self):
+        # MappingProxyType cannot be pickled - ship plain dicts so a plan can
+        # be sent to worker processes, and re-wrap them on the other side
+        return (_restore_pipeline_plan, (
+            dict(self.paths_by_termination),
+            self.total_paths,
+            self.truncated_paths,
+            dict(self.signature_index),
+            self.extensions,
+            dict(self.default_paths),
+        ))
+
+    def match_candidates(
+        self,
+        base_filename: str,
+        suffix: str,
+        actual_files: set
+    ) -> Dict[str, Dict[int, int]]:
+        """
+        Find the paths that can produce at least one of an image's actual files.
+
+        Each actual file is reduced to its (method_chain, extension) signature
+        by stripping the base, suffix and extension, and votes for every path
+        whose templates contain that signature. Cost is proportional to the
+        number of files rather than to the number of pipeline paths.
+
+        Args:
+            base_filename: Base filename WITHOUT suffix (e.g., "AB3D0001")
+            suffix: Numerical suffix for counter looping (e.g., "" or "2")
+            actual_files: Set of lowercase filenames (no directory) for the image
+
+        Returns:
+            Dict mapping termination_type to {path_index: matched_file_count}
+        """
+        base_lower = base_filename.lower()
+        suffix_part = f"-{suffix}".lower() if suffix else ""
+        candidates: Dict[str, Dict[int, int]] = {}
+
+        for filename in actual_files:
+            if not filename.startswith(base_lower):
+                continue
+            rest = filename[len(base_lower):]
+
+            voted = set()
+            for extension in self.extensions:
+                if not rest.endswith(extension):
+                    continue
+                chain = rest[:len(rest) - len(extension)]
+                if suffix_part:
+                    if not chain.endswith(suffix_part):
+                        continue
+                    chain = chain[:len(chain) - len(suffix_part)]
+                voted.update(self.signature_index.get((chain, extension), ()))
+
+            for term_type, path_index in voted:
+                term_candidates = candidates.setdefault(term_type, {})
+                term_candidates[path_index] = term_candidates.get(path_index, 0) + 1
+
+        return candidates
+
+
+def _compile_file_templates(path: List[Dict[str, Any]]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Compile a path into (method_chain, extension) templates.
+
+    Mirrors generate_expected_files(): Process nodes append "-{method_id}" to
+    the chain, File nodes emit the chain accumulated so far.
+
+    Args:
+        path: List of node info dicts representing a path through pipeline
+
+    Returns:
+        Deduplicated tuple of (method_chain, extension) pairs in path order
+    """
+    templates = []
+    seen = set()
+    chain = ""
+
+    for node_info in path:
+        node_type = node_info.get('type')
+        if node_type == 'Process':
+            method_id = node_info.get('method_id', '')
+            if method_id:
+                chain += f"-{method_id}"
+        elif node_type == 'File':
+            extension = node_info.get('extension', '')
+            if extension and (chain, extension) not in seen:
+                seen.add((chain, extension))
+                templates.append((chain, extension))
+
+    return tuple(templates)
+
+
+def _restore_pipeline_plan(
+    paths_by_termination: Dict[str, Tuple[PlannedPath, ...]],
+    total_paths: int,
+    truncated_paths: int,
+    signature_index: Dict[Tuple[str, str], Tuple[Tuple[str, int], ...]],
+    extensions: Tuple[str, ...],
+    default_paths: Dict[str, int]
+) -> PipelinePlan:
+    """Rebuild an unpickled PipelinePlan with read-only mappings."""
+    return PipelinePlan(
+        paths_by_termination=MappingProxyType(paths_by_termination),
+        total_paths=total_paths,
+        truncated_paths=truncated_paths,
+        signature_index=MappingProxyType(signature_index),
+        extensions=extensions,
+        default_paths=MappingProxyType(default_paths),
+    )
+
+
+def build_pipeline_plan(all_paths: List[List[Dict[str, Any]]]) -> PipelinePlan:
+    """
+    Build a PipelinePlan from already-enumerated paths.
+
+    Truncated paths (MAX_ITERATIONS reached) are counted but excluded from
+    validation, matching validate_specific_image() semantics.
+
+    Args:
+        all_paths: Output of enumerate_paths_with_pairing() / enumerate_all_paths()
+
+    Returns:
+        PipelinePlan with paths grouped by termination type
+    """
+    grouped: Dict[str, List[PlannedPath]] = {}
+    signature_index: Dict[Tuple[str, str], List[Tuple[str, int]]] = {}
+    extensions = set()
+    truncated = 0
+
+    for path in all_paths:
+        if not path:
+            continue
+
+        last_node = path[-1]
+        if last_node.get('type') != 'Termination':
+            continue
+        if last_node.get('truncated', False):
+            truncated += 1
+            continue
+
+        term_type = last_node.get('term_type', 'Unknown')
+        planned = PlannedPath(
+            node_ids=tuple(n['id'] for n in path if n.get('id')),
+            nodes=tuple(path),
+            file_templates=_compile_file_templates(path),
+            length=len(path),
+        )
+        term_paths = grouped.setdefault(term_type, [])
+        path_index = len(term_paths)
+        term_paths.append(planned)
+
+        for chain, extension in planned.file_templates:
+            signature = (chain.lower(), extension.lower())
+            signature_index.setdefault(signature, []).append((term_type, path_index))
+            extensions.add(signature[1])
+
+    # With no matched files every path ties on matched count and status
+    # (INCONSISTENT), so the winner is the shortest path with fewest expected
+    # files - first one wins, same as the tie-breaking in validate_specific_image
+    default_paths = {
+        term_type: min(
+            range(len(paths)),
+            key=lambda i, paths=paths: (paths[i].length, len(paths[i].file_templates))
+        )
+        for term_type, paths in grouped.items()
+    }
+
+    return PipelinePlan(
+        paths_by_termination=MappingProxyType({
+            term_type: tuple(paths) for term_type, paths in grouped.items()
+        }),
+        total_paths=len(all_paths),
+        truncated_paths=truncated,
+        signature_index=MappingProxyType({
+            signature: tuple(entries) for signature, entries in signature_index.items()
+        }),
+        extensions=tuple(sorted(extensions)),
+        default_paths=MappingProxyType(default_paths),
+    )
+
+
+def compile_pipeline_plan(pipeline: PipelineConfig) -> PipelinePlan:
+    """
+    Enumerate all pipeline paths once and compile them into a PipelinePlan.
+
+    Args:
+        pipeline: PipelineConfig instance
+
+    Returns:
+        PipelinePlan to pass to validate_specific_image() / validate_all_images()
+    """
+    try:
+        all_paths = enumerate_paths_with_pairing(pipeline)
+    except NotImplementedError:
+        # Fallback to basic enumeration if pairing not supported
+        all_paths = enumerate_all_paths(pipeline)
+
+    return build_pipeline_plan(all_paths)
+
+
+@dataclass(frozen=True)
+class _MatchTemplate:
+    """TerminationMatchResult with filenames stored relative to the image base."""
+    termination_type: str
+    status: ValidationStatus
+    expected_tails: Tuple[str, ...]  # Original case, base stripped
+    missing_tails: Tuple[str, ...]  # Lowercase, base stripped
+    extra_tails: Tuple[str, ...]  # Lowercase, base stripped
+    completion_percentage: float
+    is_archival_ready: bool
+
+
+class ValidationMemo:
+    """
+    LRU memo of validation outcomes keyed by image shape.
+
+    Most images in a collection share the same shape - e.g. ".cr3 + .xmp +
+    -DxO_DeepPRIME.dng" - and differ only by camera_id/counter. The outcome
+    of validate_specific_image() depends only on the suffix and on the file
+    names with the base stripped, so it is computed once per shape and
+    re-prefixed with each image's base.
+
+    A memo is bound to one PipelinePlan and must not be shared across pipelines.
+    """
+
+    def __init__(self, plan: PipelinePlan, max_entries: int = DEFAULT_MEMO_SIZE):
+        """
+        Initialize memo.
+
+        Args:
+            plan: Compiled plan of the pipeline being validated
+            max_entries: Maximum number of distinct shapes to remember
+        """
+        self.plan = plan
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def signature(base: str, suffix: str, actual_files: set) -> Optional[tuple]:
+        """
+        Compute the camera/counter-independent signature of an image.
+
+        Args:
+            base: camera_id + counter (e.g., "AB3D0001")
+            suffix: Numerical suffix for counter looping (e.g., "" or "2")
+            actual_files: Set of lowercase filenames (no directory) for the image
+
+        Returns:
+            Hashable signature, or None if a file does not start with the base
+            (such images are validated without memoization)
+        """
+        base_lower = base.lower()
+        tails = []
+        for filename in actual_files:
+            if not filename.startswith(base_lower):
+                return None
+            tails.append(filename[len(base_lower):])
+        return (suffix, tuple(sorted(tails)))
+
+    def get(self, signature: tuple, specific_image: SpecificImage) -> Optional[ValidationResult]:
+        """
+        Instantiate the memoized result for an image, if its shape is known.
+
+        Args:
+            signature: Output of signature() for this image
+            specific_image: Image to build the result for
+
+        Returns:
+            ValidationResult for specific_image, or None on a miss
+        """
+        entry = self._entries.get(signature)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(signature)
+        self.hits += 1
+
+        templates, overall_status, overall_archival_ready = entry
+        base = f"{specific_image.camera_id}{specific_image.counter}"
+        base_lower = base.lower()
+
+        termination_matches = [
+            TerminationMatchResult(
+                termination_type=t.termination_type,
+                status=t.status,
+                expected_files=[base + tail for tail in t.expected_tails],
+                missing_files=[base_lower + tail for tail in t.missing_tails],
+                extra_files=[base_lower + tail for tail in t.extra_tails],
+                actual_files=specific_image.files,
+                completion_percentage=t.completion_percentage,
+                is_archival_ready=t.is_archival_ready,
+                is_truncated=False
+            )
+            for t in templates
+        ]
+
+        return ValidationResult(
+            base_filename=specific_image.base_filename,
+            camera_id=specific_image.camera_id,
+            counter=specific_image.counter,
+            suffix=specific_image.suffix,
+            properties=specific_image.properties,
+            actual_files=specific_image.files,
+            termination_matches=termination_matches,
+            overall_status=overall_status,
+            overall_archival_ready=overall_archival_ready
+        )
+
+    def put(self, signature: tuple, base: str, result: ValidationResult) -> None:
+        """
+        Remember a freshly computed result as the template for its shape.
+
+        Args:
+            signature: Output of signature() for the validated image
+            base: camera_id + counter of the validated image
+            result: ValidationResult computed by validate_specific_image()
+        """
+        cut = len(base)
+        templates = tuple(
+            _MatchTemplate(
+                termination_type=match.termination_type,
+                status=match.status,
+                expected_tails=tuple(f[cut:] for f in match.expected_files),
+                missing_tails=tuple(f[cut:] for f in match.missing_files),
+                extra_tails=tuple(f[cut:] for f in match.extra_files),
+                completion_percentage=match.completion_percentage,
+                is_archival_ready=match.is_archival_ready,
+            )
+            for match in result.termination_matches
+        )
+
+        self._entries[signature] = (templates, result.overall_status, result.overall_archival_ready)
+        self._entries.move_to_end(signature)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
 # =============================================================================
 # Validation Logic
 # =============================================================================
@@ -1106,7 +1977,9 @@ def classify_validation_status(actual_files: set, expected_files: set) -> Valida
 def validate_specific_image(
     specific_image: SpecificImage,
     pipeline: PipelineConfig,
-    show_progress: bool = False
+    show_progress: bool = False,
+    plan: Optional[PipelinePlan] = None,
+    memo: Optional[ValidationMemo] = None
 ) -> ValidationResult:
     """
     Validate a single SpecificImage against the pipeline.
@@ -1114,8 +1987,11 @@ def validate_specific_image(
     Algorithm:
     1. Enumerate all paths through pipeline (to all terminations)
     2. Group paths by termination_type
+       (steps 1-2 are skipped when a pre-compiled PipelinePlan is provided)
     3. For each termination type:
-       a. Generate expected files for each path
+       a. Generate expected files for each candidate path - paths whose file
+          signatures match at least one actual file (see
+          PipelinePlan.match_candidates), or the default path if none match
        b. Classify status (CONSISTENT/PARTIAL/etc.)
        c. Select best path using these criteria (in priority order):
           - Most actual files matched (prefer paths that explain our files)
@@ -1129,36 +2005,18 @@ def validate_specific_image(
         specific_image: SpecificImage instance to validate
         pipeline: PipelineConfig instance
         show_progress: If True, print progress indicator
+        plan: Optional pre-compiled PipelinePlan for this pipeline. Callers
+            validating many images should compile it once with
+            compile_pipeline_plan() and pass it here.
+        memo: Optional ValidationMemo. Images with the same shape as a
+            previously validated image reuse its result (re-prefixed).
 
     Returns:
         ValidationResult with status for each termination type
     """
-    # Enumerate paths (with pairing support if needed)
-    try:
-        all_paths = enumerate_paths_with_pairing(pipeline)
-    except NotImplementedError:
-        # Fallback to basic enumeration if pairing not supported
-        all_paths = enumerate_all_paths(pipeline)
-
-    # Group paths by termination type
-    paths_by_termination = {}
-    for path in all_paths:
-        # Find termination node at end of path
-        if not path:
-            continue
-
-        last_node = path[-1]
-        if last_node.get('type') == 'Termination':
-            term_type = last_node.get('term_type', 'Unknown')
-            is_truncated = last_node.get('truncated', False)
-
-            # Skip truncated paths (they don't represent complete workflows)
-            if is_truncated:
-                continue
-
-            if term_type not in paths_by_termination:
-                paths_by_termination[term_type] = []
-            paths_by_termination[term_type].append(path)
+    # Enumerate and group paths by termination type (truncated paths excluded)
+    if plan is None:
+        plan = memo.plan if memo is not None else compile_pipeline_plan(pipeline)
 
     # Prepare actual files set
     # Extract just filename (not path) and normalize to lowercase for case-insensitive comparison
@@ -1172,7 +2030,30 @@ def validate_specific_image(
     # Validate against each termination type
     termination_matches = []
 
-    for term_type, paths in paths_by_termination.items():
+    # Pass camera_id+counter (without suffix) and suffix separately
+    base = f"{specific_image.camera_id}{specific_image.counter}"
+
+    # Reuse the outcome of a structurally identical image when memoizing
+    signature = None
+    if memo is not None:
+        signature = memo.signature(base, specific_image.suffix, actual_files_set)
+        if signature is not None:
+            memoized = memo.get(signature, specific_image)
+            if memoized is not None:
+                return memoized
+
+    # Only paths that explain at least one actual file can beat the others on
+    # matched count, so score those; otherwise fall back to the default path
+    candidates = plan.match_candidates(base, specific_image.suffix, actual_files_set)
+
+    for term_type, paths in plan.paths_by_termination.items():
+        term_candidates = candidates.get(term_type)
+        if term_candidates:
+            # Keep original path order so ties resolve exactly as before
+            path_indices = sorted(term_candidates)
+        else:
+            path_indices = [plan.default_paths[term_type]]
+
         # Find best path for this termination
         best_status = ValidationStatus.INCONSISTENT
         best_expected = []
@@ -1183,11 +2064,10 @@ def validate_specific_image(
         best_path_length = float('inf')
         best_matched_count = 0
 
-        for path in paths:
-            # Generate expected files for this path
-            # Pass camera_id+counter (without suffix) and suffix separately
-            base = f"{specific_image.camera_id}{specific_image.counter}"
-            expected_files = generate_expected_files(path, base, specific_image.suffix)
+        for path_index in path_indices:
+            path = paths[path_index]
+            # Generate expected files for this path from its compiled templates
+            expected_files = path.expected_files(base, specific_image.suffix)
             # Normalize expected files to lowercase for comparison
             expected_files_set = set(f.lower() for f in expected_files)
 
@@ -1207,7 +2087,7 @@ def validate_specific_image(
             else:
                 completion = 0.0
 
-            path_length = len(path)
+            path_length = path.length
 
             # Select best path using these criteria (in priority order):
             # 1. Most actual files matched (prefer paths that explain our files)
@@ -1282,6 +2162,9 @@ def validate_specific_image(
         overall_archival_ready=overall_archival_ready
     )
 
+    if signature is not None:
+        memo.put(signature, base, result)
+
     return result
 
 
@@ -1304,8 +2187,12 @@ def validate_all_images(
     results = []
     total = len(specific_images)
 
+    # Paths only depend on the pipeline - enumerate them once for all images,
+    # and validate each distinct image shape only once
+    memo = ValidationMemo(compile_pipeline_plan(pipeline))
+
     for idx, specific_image in enumerate(specific_images, 1):
-        result = validate_specific_image(specific_image, pipeline, show_progress=False)
+        result = validate_specific_image(specific_image, pipeline, show_progress=False, memo=memo)
         results.append(result)
 
         if show_progress and idx % 10 == 0:
@@ -1414,44 +2301,43 @@ class ImageGroup:
 class PipelineGraph:
     """
     Graph representation of pipeline for structural validation.
-    Wraps PipelineConfig with graph-theoretic operations for cycle detection,
-    orphaned node finding, and other structural validations.
+    Wraps a CompiledPipelineGraph with graph-theoretic operations for cycle
+    detection, orphaned node finding, and other structural validations.
     """
     
-    def __init__(self, config: Union[PipelineConfig, Dict]):
+    def __init__(self, config: Union[PipelineConfig, CompiledPipelineGraph, Dict]):
         """
-        Initialize from PipelineConfig or raw dict.
+        Initialize from CompiledPipelineGraph, PipelineConfig or raw dict.
         
         Args:
-            config: PipelineConfig instance or dict configuration
+            config: CompiledPipelineGraph (reused as-is), PipelineConfig
+                instance or dict configuration
         """
-        if isinstance(config, PipelineConfig):
+        if isinstance(config, CompiledPipelineGraph):
+            self.compiled = config
+            self.config = config.pipeline
+        elif isinstance(config, PipelineConfig):
             self.config = config
+            self.compiled = compile_pipeline_graph(config)
         elif isinstance(config, dict):
             # For dict input, we'd need to parse it
             # For now, require PipelineConfig
             raise ValueError("Dict input not yet supported - use PipelineConfig")
         else:
             self.config = config
+            self.compiled = compile_pipeline_graph(config)
         
         self._build_adjacency_lists()
     
     def _build_adjacency_lists(self):
-        """Build forward and reverse adjacency lists from pipeline config."""
-        self.children: Dict[str, List[str]] = {}
-        self.parents: Dict[str, List[str]] = {}
-        
-        # Initialize all nodes
-        for node in self.config.nodes:
-            self.children[node.id] = []
-            self.parents[node.id] = []
-        
-        # Build edges
-        for node in self.config.nodes:
-            for output_id in node.output:
-                if output_id in self.children:  # Validate output exists
-                    self.children[node.id].append(output_id)
-                    self.parents[output_id].append(node.id)
+        """Expose the compiled adjacency as forward and reverse adjacency lists."""
+        compiled = self.compiled
+        self.children: Dict[str, List[str]] = {
+            node_id: list(compiled.successors(node_id)) for node_id in compiled.node_ids
+        }
+        self.parents: Dict[str, List[str]] = {
+            node_id: list(compiled.predecessors(node_id)) for node_id in compiled.node_ids
+        }
     
     def get_children(self, node_id: str) -> List[str]:
         """Get child node IDs (outputs)."""
@@ -1484,26 +2370,29 @@ class PipelineGraph:
         
         Task: T028 - Kahn's algorithm implementation
         """
-        # Calculate in-degrees
-        in_degree = {node.id: 0 for node in self.config.nodes}
-        for node in self.config.nodes:
-            for child_id in node.output:
-                if child_id in in_degree:
-                    in_degree[child_id] += 1
+        compiled = self.compiled
+        offsets = compiled.successor_offsets
+        targets = compiled.successor_indices
+
+        # Calculate in-degrees over interned node indices
+        in_degree = [
+            compiled.predecessor_offsets[idx + 1] - compiled.predecessor_offsets[idx]
+            for idx in range(len(compiled.node_ids))
+        ]
         
         # Queue nodes with in-degree 0
-        queue = [node_id for node_id, degree in in_degree.items() if degree == 0]
+        queue = deque(idx for idx, degree in enumerate(in_degree) if degree == 0)
         sorted_nodes = []
         
         while queue:
-            current_id = queue.pop(0)
-            sorted_nodes.append(current_id)
+            current = queue.popleft()
+            sorted_nodes.append(compiled.node_ids[current])
             
             # Reduce in-degree of children
-            for child_id in self.get_children(current_id):
-                in_degree[child_id] -= 1
-                if in_degree[child_id] == 0:
-                    queue.append(child_id)
+            for child in targets[offsets[current]:offsets[current + 1]]:
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    queue.append(child)
         
         # Check for cycle
         has_cycle = len(sorted_nodes) != len(self.config.nodes)
@@ -1796,14 +2685,41 @@ class FilenamePreviewGenerator:
     Used by web UI to show example filenames for each termination path.
     """
     
-    def __init__(self, pipeline: PipelineConfig):
+    def __init__(self, pipeline: Union[PipelineConfig, CompiledPipelineGraph]):
         """
         Initialize generator.
         
         Args:
-            pipeline: PipelineConfig instance
+            pipeline: CompiledPipelineGraph (paths enumerated once and shared)
+                or PipelineConfig instance
         """
-        self.pipeline = pipeline
+        if not isinstance(pipeline, CompiledPipelineGraph):
+            pipeline = compile_pipeline_graph(pipeline)
+        self.graph = pipeline
+        self.pipeline = pipeline.pipeline
+        self._expected_suffixes: Optional[Dict[str, List[str]]] = None
+    
+    def expected_suffixes(self) -> Dict[str, List[str]]:
+        """
+        Expected filename suffixes (method chain + extension) per termination type.
+        
+        Every expected filename is the base filename followed by one of these
+        suffixes, so they are computed once and reused for every base.
+        
+        Returns:
+            Dict mapping termination_type to sorted suffixes
+            (e.g., ".cr3", "-DxO_DeepPRIME.dng")
+        """
+        if self._expected_suffixes is None:
+            suffixes: Dict[str, set] = {}
+            for path in self._find_all_paths():
+                term_type = self._get_termination_type(path)
+                if term_type:
+                    suffixes.setdefault(term_type, set()).update(generate_expected_files(path, ""))
+            self._expected_suffixes = {
+                term_type: sorted(term_suffixes) for term_type, term_suffixes in suffixes.items()
+            }
+        return self._expected_suffixes
     
     def generate_preview(
         self,
@@ -1822,60 +2738,27 @@ class FilenamePreviewGenerator:
         
         Task: T034 - Main preview generation
         """
-        paths = self._find_all_paths()
-        previews = {}
-        
-        for path in paths:
-            term_type = self._get_termination_type(path)
-            if term_type:
-                filenames = self._apply_path_transformations(path, camera_id, counter)
-                if term_type not in previews:
-                    previews[term_type] = []
-                previews[term_type].extend(filenames)
-        
-        # Deduplicate and sort
-        for term_type in previews:
-            previews[term_type] = sorted(set(previews[term_type]))
-        
-        return previews
+        # Suffixes are already deduplicated and sorted; a common base keeps that order
+        base = f"{camera_id}{counter}"
+        return {
+            term_type: [base + suffix for suffix in suffixes]
+            for term_type, suffixes in self.expected_suffixes().items()
+        }
     
     def _find_all_paths(self) -> List[List[Dict[str, Any]]]:
         """
         Find all Capture → Termination paths.
-        Delegates to existing enumerate_paths_with_pairing().
+        Enumerated once per CompiledPipelineGraph (see CompiledPipelineGraph.paths).
         
         Task: T035 - Path finding
         """
-        return enumerate_paths_with_pairing(self.pipeline)
+        return self.graph.paths
     
     def _get_termination_type(self, path: List[Dict[str, Any]]) -> Optional[str]:
         """Extract termination type from path."""
         if path and path[-1].get('type') == 'Termination':
             return path[-1].get('term_type')
         return None
-    
-    def _apply_path_transformations(
-        self,
-        path: List[Dict[str, Any]],
-        camera_id: str,
-        counter: str
-    ) -> List[str]:
-        """
-        Build filename from path node properties.
-        Delegates to existing generate_expected_files().
-        
-        Args:
-            path: Path through pipeline
-            camera_id: Camera ID
-            counter: Counter value
-        
-        Returns:
-            List of filenames for this path
-        
-        Task: T036 - Filename transformation
-        """
-        base = f"{camera_id}{counter}"
-        return generate_expected_files(path, base, suffix="")
 
 
 # -----------------------------------------------------------------------------
@@ -1888,14 +2771,19 @@ class CollectionValidator:
     Aggregates SpecificImage validations into ImageGroups for API.
     """
     
-    def __init__(self, pipeline: PipelineConfig):
+    def __init__(self, pipeline: Union[PipelineConfig, CompiledPipelineGraph]):
         """
         Initialize validator.
         
         Args:
-            pipeline: PipelineConfig instance
+            pipeline: CompiledPipelineGraph or PipelineConfig instance
         """
-        self.pipeline = pipeline
+        if not isinstance(pipeline, CompiledPipelineGraph):
+            pipeline = compile_pipeline_graph(pipeline)
+        self.graph = pipeline
+        self.pipeline = pipeline.pipeline
+        self.preview_generator = FilenamePreviewGenerator(pipeline)
+        self._all_expected_suffixes: Optional[frozenset] = None
     
     def validate(
         self,
@@ -1920,8 +2808,8 @@ class CollectionValidator:
         # Validate each group
         results = {}
         total = len(grouped)
-        for idx, (base, group_files) in enumerate(grouped.items(), 1):
-            results[base] = self._validate_group(base, group_files)
+        for idx, group in enumerate(self._iter_groups(grouped), 1):
+            results[group.base] = group
             
             if show_progress and idx % 10 == 0:
                 print(f"  Validating groups: {idx}/{total} ({100.0 * idx / total:.1f}%)", end='\r')
@@ -1931,6 +2819,26 @@ class CollectionValidator:
         
         return results
     
+    def iter_validate(self, files: List[str]) -> Iterator[ImageGroup]:
+        """
+        Validate collection files, yielding one ImageGroup at a time.
+        
+        Use with ReadinessCalculator.calculate_from_groups() to compute
+        readiness without keeping every ImageGroup in memory.
+        
+        Args:
+            files: List of filenames in collection
+        
+        Yields:
+            ImageGroup per base filename, in first-seen order
+        """
+        return self._iter_groups(self._group_files(files))
+    
+    def _iter_groups(self, grouped: Dict[str, List[str]]) -> Iterator[ImageGroup]:
+        """Validate grouped files lazily."""
+        for base, group_files in grouped.items():
+            yield self._validate_group(base, group_files)
+    
     def _group_files(self, files: List[str]) -> Dict[str, List[str]]:
         """
         Group files by base filename (camera_id + counter).
@@ -1952,15 +2860,22 @@ class CollectionValidator:
                     grouped[base].append(filename)
             return grouped
         
-        # Use FilenameParser if available
+        # Use FilenameParser if available. Most filenames match its pattern,
+        # which fixes the base to the first 8 characters (camera_id + counter)
+        # in a single regex pass; only the rest go through parse_filename()
+        match = FilenameParser.VALID_FILENAME_PATTERN.match
         grouped = {}
         for filename in files:
-            parsed = FilenameParser.parse_filename(filename)
-            if parsed:
+            if match(filename):
+                base = filename[:8]
+            else:
+                parsed = FilenameParser.parse_filename(filename)
+                if not parsed:
+                    continue
                 base = f"{parsed['camera_id']}{parsed['counter']}"
-                if base not in grouped:
-                    grouped[base] = []
-                grouped[base].append(filename)
+            if base not in grouped:
+                grouped[base] = []
+            grouped[base].append(filename)
         
         return grouped
     
@@ -1970,13 +2885,16 @@ class CollectionValidator:
         
         Task: T039 - Group validation
         """
-        # Get expected files for this base
-        expected_by_termination = self._get_expected_files_for_base(base)
-        
-        # Flatten expected files (all terminations combined)
-        all_expected = set()
-        for term_files in expected_by_termination.values():
-            all_expected.update(f.lower() for f in term_files)
+        # Expected files for this base (all terminations combined): the
+        # pipeline's expected suffixes, computed once, prefixed by the base
+        if self._all_expected_suffixes is None:
+            self._all_expected_suffixes = frozenset(
+                suffix.lower()
+                for suffixes in self.preview_generator.expected_suffixes().values()
+                for suffix in suffixes
+            )
+        preview_base = self._preview_base(base).lower()
+        all_expected = {preview_base + suffix for suffix in self._all_expected_suffixes}
         
         # Normalize actual files
         actual_files_set = set(f.lower() for f in files)
@@ -2024,19 +2942,22 @@ class CollectionValidator:
         
         Task: T040 - Expected files calculation
         """
-        # Parse base into camera_id and counter
-        # Assume format: 4 char camera_id + 4 char counter
-        if len(base) >= 8:
-            camera_id = base[:4]
-            counter = base[4:8]
-        else:
-            # Fallback
-            camera_id = "ABCD"
-            counter = "0001"
+        preview_base = self._preview_base(base)
+        
+        # Use FilenamePreviewGenerator (suffixes are computed once per validator)
+        return self.preview_generator.generate_preview(preview_base[:4], preview_base[4:8])
+    
+    @staticmethod
+    def _preview_base(base: str) -> str:
+        """
+        Camera ID + counter used to build expected filenames for a base.
         
-        # Use FilenamePreviewGenerator
-        generator = FilenamePreviewGenerator(self.pipeline)
-        return generator.generate_preview(camera_id, counter)
+        Assume format: 4 char camera_id + 4 char counter
+        """
+        if len(base) >= 8:
+            return base[:8]
+        # Fallback
+        return "ABCD0001"
 
 
 # -----------------------------------------------------------------------------
@@ -2079,44 +3000,36 @@ class ReadinessCalculator:
         
         Task: T041 - Main calculation
         """
-        if not validation_results:
-            return {
-                'total_groups': 0,
-                'consistent_groups': 0,
-                'partial_groups': 0,
-                'inconsistent_groups': 0,
-                'archival_ready_percentage': 0.0,
-                'node_completion': {}
-            }
+        return self.calculate_from_groups(validation_results.values())
+    
+    def calculate_from_groups(self, groups: Iterable[ImageGroup]) -> Dict[str, Any]:
+        """
+        Calculate readiness metrics in a single pass over streamed groups.
         
-        total = len(validation_results)
-        consistent = sum(1 for g in validation_results.values() if g.status == ImageGroupStatus.CONSISTENT)
-        partial = sum(1 for g in validation_results.values() if g.status == ImageGroupStatus.PARTIAL)
-        inconsistent = sum(1 for g in validation_results.values() if g.status == ImageGroupStatus.INCONSISTENT)
+        Accepts any iterable of ImageGroup (e.g. CollectionValidator.iter_validate()),
+        so groups need not be materialized in a dict first.
+        
+        Args:
+            groups: ImageGroup instances
+        
+        Returns:
+            Same metrics as calculate()
+        """
+        status_counts = {status: 0 for status in ImageGroupStatus}
+        node_completion: Dict[str, int] = {}
+        for group in groups:
+            status_counts[group.status] += 1
+            for node_id in group.completed_nodes:
+                node_completion[node_id] = node_completion.get(node_id, 0) + 1
+        
+        total = sum(status_counts.values())
+        consistent = status_counts[ImageGroupStatus.CONSISTENT]
         
         return {
             'total_groups': total,
             'consistent_groups': consistent,
-            'partial_groups': partial,
-            'inconsistent_groups': inconsistent,
+            'partial_groups': status_counts[ImageGroupStatus.PARTIAL],
+            'inconsistent_groups': status_counts[ImageGroupStatus.INCONSISTENT],
             'archival_ready_percentage': (consistent / total * 100) if total > 0 else 0.0,
-            'node_completion': self._count_groups_reaching_node(validation_results)
+            'node_completion': node_completion
         }
-    
-    def _count_groups_reaching_node(
-        self,
-        validation_results: Dict[str, ImageGroup]
-    ) -> Dict[str, int]:
-        """
-        Count how many groups reached each node.
-        
-        Returns:
-            Dict mapping node_id to count
-        
-        Task: T041 - Node completion counting
-        """
-        counts = {}
-        for group in validation_results.values():
-            for node_id in group.completed_nodes:
-                counts[node_id] = counts.get(node_id, 0) + 1
-        return counts